@@ -4,5 +4,9 @@
 """本 package 主要包含处理 PyInstaller 参数、子进程等功能（后端）的类与函数"""
 
 from .packaging import Packaging
+from .packaging_queue import PackagingJob, PackagingQueue
 from .packaging_task import PackagingTask
+from .pyenv_discovery import PyEnvDiscovery
+from .pyenv_prober import PyEnvProber
+from .pyenv_watcher import PyEnvWatcher
 from .validators import FilePathValidator, InterpreterValidator
@@ -0,0 +1,240 @@
+# Licensed under the GPLv3 License: https://www.gnu.org/licenses/gpl-3.0.html
+# For details: https://github.com/muziing/Py2exe-GUI/blob/main/README.md#license
+
+"""此模块主要包含在后台线程中计算打包任务指纹、记录成功构建、统计输出大小的类 `BuildChecker`
+
+计算指纹需要读取入口脚本、本地模块与全部 --add-data/--add-binary 文件的内容，判断输出是否完好、
+记录成功构建与统计输出大小又需要遍历输出目录，数据文件很多时若在 GUI 线程中进行会导致界面卡死。
+`BuildChecker` 将这些操作提交至线程池中执行，完成后通过信号将结果传回 GUI 线程。
+"""
+
+__all__ = ["BuildChecker"]
+
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Optional
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from ..Constants import PyInstOpt
+from ..Utilities import PyEnv
+from .build_fingerprint import BUILD_RECORDS, compute_build_fingerprint
+from .validators import InterpreterValidator
+from .workpath_cache import dir_size
+
+
+def _read_packages(python_path: str, timeout: float) -> Optional[list[dict]]:
+    """在工作线程中获取解释器已安装的包列表，缓存中没有时扫描 site-packages，尚未内省过的环境则先运行一次内省
+
+    :param python_path: Python 解释器路径
+    :param timeout: 运行内省脚本的超时时间，单位为秒
+    :return: 包列表，无法获取时为 None
+    """
+
+    try:
+        pyenv = PyEnv(python_path)
+        if not pyenv.is_probed:
+            pyenv.probe(timeout=timeout)
+        return pyenv.installed_packages
+    except Exception:
+        return None
+
+
+class _CheckRunnable(QRunnable):
+    """在线程池中计算指纹并判断能否跳过构建的任务"""
+
+    def __init__(
+        self,
+        checker: "BuildChecker",
+        token: object,
+        options: Mapping[PyInstOpt, Any],
+        python_path: str,
+        packages: Optional[list[dict]],
+        distpath: Path,
+        name: str,
+    ) -> None:
+        """
+        :param checker: 发起检查的 BuildChecker 对象，用于回传结果
+        :param token: 调用者用于区分各次检查的对象，原样随结果传回
+        :param options: 打包选项
+        :param python_path: 打包所用的 Python 解释器路径
+        :param packages: 该解释器中已安装的包列表，未知时为 None，此时在工作线程中获取
+        :param distpath: 输出目录
+        :param name: 输出程序名称
+        """
+
+        super().__init__()
+
+        self._checker = checker
+        self._token = token
+        self._options = dict(options)  # 复制一份，检查期间调用者修改选项不受影响
+        self._python_path = python_path
+        self._packages = packages
+        self._distpath = distpath
+        self._name = name
+
+    def run(self) -> None:
+        """在工作线程中计算指纹并与构建记录比较"""
+
+        packages = self._packages
+        if packages is None:
+            # 如命令行模式下从未探测过该环境，缓存中没有包列表
+            packages = _read_packages(self._python_path, self._checker.probe_timeout)
+        fingerprint = compute_build_fingerprint(
+            self._options, self._python_path, packages
+        )
+        up_to_date = BUILD_RECORDS.is_up_to_date(
+            self._distpath, self._name, fingerprint
+        )
+
+        try:
+            self._checker.check_done.emit(self._token, (fingerprint, up_to_date))
+        except RuntimeError:
+            # 应用程序退出时 BuildChecker 可能已先于工作线程被销毁，此时结果已无人接收
+            pass
+
+
+class _RecordRunnable(QRunnable):
+    """在线程池中记录一次成功构建的任务"""
+
+    def __init__(
+        self,
+        checker: "BuildChecker",
+        token: object,
+        distpath: Path,
+        name: str,
+        fingerprint: Optional[str],
+    ) -> None:
+        """
+        :param checker: 发起记录的 BuildChecker 对象，用于回传结果
+        :param token: 调用者用于区分各次记录的对象，原样随结果传回
+        :param distpath: 输出目录
+        :param name: 输出程序名称
+        :param fingerprint: 本次构建的指纹
+        """
+
+        super().__init__()
+
+        self._checker = checker
+        self._token = token
+        self._distpath = distpath
+        self._name = name
+        self._fingerprint = fingerprint
+
+    def run(self) -> None:
+        """在工作线程中生成输出清单并写入构建记录"""
+
+        BUILD_RECORDS.record_success(self._distpath, self._name, self._fingerprint)
+
+        try:
+            self._checker.record_done.emit(self._token)
+        except RuntimeError:
+            pass
+
+
+class _MeasureRunnable(QRunnable):
+    """在线程池中统计输出目录大小的任务"""
+
+    def __init__(self, checker: "BuildChecker", token: object, path: Path) -> None:
+        """
+        :param checker: 发起统计的 BuildChecker 对象，用于回传结果
+        :param token: 调用者用于区分各次统计的对象，原样随结果传回
+        :param path: 输出目录
+        """
+
+        super().__init__()
+
+        self._checker = checker
+        self._token = token
+        self._path = path
+
+    def run(self) -> None:
+        """在工作线程中遍历输出目录"""
+
+        size = dir_size(self._path)
+
+        try:
+            self._checker.measure_done.emit(self._token, size)
+        except RuntimeError:
+            pass
+
+
+class BuildChecker(QObject):
+    """在后台线程池中计算打包任务指纹、判断能否跳过构建、记录成功构建，以及统计输出大小的服务类
+
+    调用 `check()`、`record()` 或 `measure()` 后立即返回，不阻塞 GUI 线程；
+    完成后发射 `check_done`、`record_done` 或 `measure_done` 信号。
+    """
+
+    # 自定义信号
+    # 指纹计算完成，(token, (指纹, 能否跳过构建))，指纹无法计算时为 None
+    check_done = Signal(object, tuple)
+    record_done = Signal(object)  # 成功构建已记录，实际类型为 token
+    measure_done = Signal(object, int)  # 输出大小已统计，(token, 总字节数)
+
+    def __init__(
+        self,
+        parent: Optional[QObject] = None,
+        *,
+        max_thread_count: int = 2,
+        probe_timeout: float = InterpreterValidator.DEFAULT_TIMEOUT,
+    ) -> None:
+        """
+        :param parent: 父对象
+        :param max_thread_count: 同时进行检查的最大线程数，检查以读取文件为主，无需太多线程
+        :param probe_timeout: 包列表未知、需要内省解释器时的超时时间，单位为秒
+        """
+
+        super().__init__(parent)
+
+        self.probe_timeout = probe_timeout
+
+        self._thread_pool = QThreadPool(self)
+        self._thread_pool.setMaxThreadCount(max_thread_count)
+
+    def check(
+        self,
+        token: object,
+        options: Mapping[PyInstOpt, Any],
+        python_path: str,
+        packages: Optional[list[dict]],
+        distpath: Path,
+        name: str,
+    ) -> None:
+        """请求在后台计算打包任务的指纹，并判断其与该输出位置上次成功构建时是否相同、且输出完好
+
+        :param token: 调用者用于区分各次检查的对象，如 PackagingJob，原样随 `check_done` 信号传回
+        :param options: 打包选项
+        :param python_path: 打包所用的 Python 解释器路径
+        :param packages: 该解释器中已安装的包列表，未知时传入 None，此时在后台获取；仍无法获取时总是无法跳过
+        :param distpath: 输出目录
+        :param name: 输出程序名称
+        """
+
+        self._thread_pool.start(
+            _CheckRunnable(self, token, options, python_path, packages, distpath, name)
+        )
+
+    def record(
+        self, token: object, distpath: Path, name: str, fingerprint: Optional[str]
+    ) -> None:
+        """请求在后台记录一次成功的构建，见 `BuildRecords.record_success()`
+
+        :param token: 调用者用于区分各次记录的对象，原样随 `record_done` 信号传回
+        :param distpath: 输出目录
+        :param name: 输出程序名称
+        :param fingerprint: 本次构建的指纹，为 None 时不做记录
+        """
+
+        self._thread_pool.start(
+            _RecordRunnable(self, token, distpath, name, fingerprint)
+        )
+
+    def measure(self, token: object, path: Path) -> None:
+        """请求在后台统计输出目录的总大小
+
+        :param token: 调用者用于区分各次统计的对象，原样随 `measure_done` 信号传回
+        :param path: 输出目录
+        """
+
+        self._thread_pool.start(_MeasureRunnable(self, token, path))
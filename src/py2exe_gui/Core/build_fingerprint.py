@@ -0,0 +1,375 @@
+# Licensed under the GPLv3 License: https://www.gnu.org/licenses/gpl-3.0.html
+# For details: https://github.com/muziing/Py2exe-GUI/blob/main/README.md#license
+
+"""此模块主要包含计算打包任务“指纹”的函数 `compute_build_fingerprint()`
+与记录上次成功构建的类 `BuildRecords`、全局变量 `BUILD_RECORDS`
+
+指纹由以下内容共同计算得出：打包选项、入口脚本及其导入的本地模块的内容、
+--add-data/--add-binary 指定的文件内容、图标文件内容，以及所用解释器的路径与已安装的包集合。
+若指纹与该输出位置上次成功构建时相同，且输出文件未被改动，则可以跳过此次构建、直接沿用上次的输出。
+"""
+
+__all__ = [
+    "find_local_imports",
+    "compute_build_fingerprint",
+    "dist_outputs",
+    "BuildRecords",
+    "BUILD_RECORDS",
+]
+
+import ast
+import hashlib
+import json
+import os
+import threading
+import time
+import warnings
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from ..Constants import AppConstant, PyInstOpt
+from ..Utilities import get_user_cache_dir
+
+# 读取文件计算哈希时的块大小
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def _hash_file(hasher: "hashlib._Hash", path: Path) -> None:
+    """将文件内容更新至哈希对象中，文件无法读取时以特殊标记代替
+
+    :param hasher: 哈希对象
+    :param path: 文件路径
+    """
+
+    try:
+        with open(path, "rb") as f:
+            while chunk := f.read(_HASH_CHUNK_SIZE):
+                hasher.update(chunk)
+    except OSError:
+        hasher.update(b"<unreadable>")
+
+
+def _hash_path(hasher: "hashlib._Hash", path: Path) -> None:
+    """将文件或目录（递归包含其中所有文件的相对路径与内容）更新至哈希对象中
+
+    :param hasher: 哈希对象
+    :param path: 文件或目录路径
+    """
+
+    if path.is_dir():
+        for root, dirs, files in os.walk(path):
+            dirs.sort()  # 保证遍历顺序稳定
+            for file_name in sorted(files):
+                file_path = Path(root, file_name)
+                hasher.update(file_path.relative_to(path).as_posix().encode())
+                _hash_file(hasher, file_path)
+    elif path.is_file():
+        _hash_file(hasher, path)
+    else:
+        hasher.update(b"<missing>")
+
+
+def _resolve_module(
+    module: str, search_dir: Path, level: int, current_dir: Path
+) -> list[Path]:
+    """将导入语句中的模块名解析为本地源文件
+
+    :param module: 模块名，如 "utils.helper"，相对导入时可为空字符串
+    :param search_dir: 绝对导入的搜索目录，即入口脚本所在目录
+    :param level: 相对导入的层级，0 表示绝对导入
+    :param current_dir: 发起导入的文件所在目录
+    :return: 找到的本地源文件，包括途经的各级包的 __init__.py；不是本地模块时为空列表
+    """
+
+    if level > 0:
+        base_dir = current_dir
+        for _ in range(level - 1):
+            base_dir = base_dir.parent
+    else:
+        base_dir = search_dir
+
+    found: list[Path] = []
+    parts = [part for part in module.split(".") if part]
+    for index, part in enumerate(parts):
+        package_dir = base_dir / part
+        if (package_dir / "__init__.py").is_file():
+            found.append(package_dir / "__init__.py")
+            base_dir = package_dir
+        elif (base_dir / f"{part}.py").is_file() and index == len(parts) - 1:
+            found.append(base_dir / f"{part}.py")
+            break
+        else:
+            break
+    return found
+
+
+def find_local_imports(script_path: Union[str, Path]) -> list[Path]:
+    """通过静态分析（ast）递归查找入口脚本导入的所有本地模块，即位于脚本所在目录中的 .py 文件
+
+    不会执行任何代码；条件导入、动态导入（如 `importlib.import_module()`）同样按静态出现的语句处理或无法识别
+
+    :param script_path: 入口脚本路径
+    :return: 本地模块源文件列表（不包括入口脚本本身），按路径排序
+    """
+
+    script = Path(script_path).absolute()
+    search_dir = script.parent
+    seen: set[Path] = {script}
+    queue = [script]
+
+    while queue:
+        source_path = queue.pop()
+        try:
+            tree = ast.parse(source_path.read_bytes(), filename=str(source_path))
+        except (OSError, SyntaxError, ValueError):
+            continue
+
+        for node in ast.walk(tree):
+            candidates: list[Path] = []
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    candidates.extend(
+                        _resolve_module(alias.name, search_dir, 0, source_path.parent)
+                    )
+            elif isinstance(node, ast.ImportFrom):
+                module = node.module or ""
+                candidates.extend(
+                    _resolve_module(module, search_dir, node.level, source_path.parent)
+                )
+                # from package import submodule
+                for alias in node.names:
+                    candidates.extend(
+                        _resolve_module(
+                            f"{module}.{alias.name}" if module else alias.name,
+                            search_dir,
+                            node.level,
+                            source_path.parent,
+                        )[-1:]
+                    )
+
+            for candidate in candidates:
+                candidate = candidate.absolute()
+                if candidate not in seen:
+                    seen.add(candidate)
+                    queue.append(candidate)
+
+    seen.discard(script)
+    return sorted(seen)
+
+
+def _normalize_option(value: Any) -> Any:
+    """将选项值转换为可稳定序列化的形式
+
+    :param value: 选项值，可能为 Path、列表、元组等
+    :return: 可被 json 序列化的值
+    """
+
+    if isinstance(value, Path):
+        return str(value.absolute())
+    if isinstance(value, (list, tuple)):
+        return [_normalize_option(item) for item in value]
+    return value
+
+
+def compute_build_fingerprint(
+    options: Mapping[PyInstOpt, Any],
+    python_path: str,
+    packages: Optional[list[dict]],
+) -> Optional[str]:
+    """计算打包任务的指纹
+
+    :param options: 打包选项，如 `PackagingTask.using_option`
+    :param python_path: 打包所用的 Python 解释器路径
+    :param packages: 该解释器中已安装的包列表；未知时传入 None，此时无法判断环境是否变化，返回 None
+    :return: 十六进制指纹字符串，无法计算时返回 None
+    """
+
+    script_value = options.get(PyInstOpt.script_path)
+    if not script_value or packages is None:
+        return None
+    script_path = Path(script_value).absolute()
+
+    hasher = hashlib.sha256()
+
+    normalized_options = {
+        option.name: _normalize_option(value)
+        for option, value in options.items()
+        if value not in (None, "", [])
+    }
+    hasher.update(json.dumps(normalized_options, sort_keys=True).encode())
+
+    hasher.update(python_path.encode())
+    package_set = sorted(f"{pkg['name']}=={pkg['version']}" for pkg in packages)
+    hasher.update("\n".join(package_set).encode())
+
+    for source_path in [script_path] + find_local_imports(script_path):
+        hasher.update(str(source_path).encode())
+        _hash_file(hasher, source_path)
+
+    if options.get(PyInstOpt.icon_path):
+        _hash_path(hasher, Path(options[PyInstOpt.icon_path]))
+
+    for option in (PyInstOpt.add_data, PyInstOpt.add_binary):
+        for src, dest in options.get(option) or []:
+            hasher.update(f"{option.name}:{src}:{dest}".encode())
+            # 相对路径以入口脚本所在目录（打包子进程的工作目录）为基准
+            _hash_path(hasher, script_path.parent / src)
+
+    return hasher.hexdigest()
+
+
+def dist_outputs(distpath: Path, name: str) -> list[Path]:
+    """获取输出目录中属于某个打包任务的输出，如 onedir 模式的目录、onefile 模式的 name.exe、macOS 的 name.app
+
+    :param distpath: 输出目录（--distpath）
+    :param name: 输出程序名称（--name）
+    :return: 输出路径列表
+    """
+
+    try:
+        return sorted(
+            entry
+            for entry in distpath.iterdir()
+            if entry.name == name or entry.stem == name
+        )
+    except OSError:
+        return []
+
+
+def _dist_manifest(distpath: Path, name: str) -> dict[str, list[int]]:
+    """生成打包输出的清单，{相对路径: [大小, 修改时间（纳秒）]}，用于判断输出是否被改动或删除
+
+    :param distpath: 输出目录
+    :param name: 输出程序名称
+    :return: 输出清单
+    """
+
+    manifest: dict[str, list[int]] = {}
+    for output in dist_outputs(distpath, name):
+        paths = [output]
+        if output.is_dir():
+            paths = [Path(root, f) for root, _, files in os.walk(output) for f in files]
+        for path in paths:
+            try:
+                stat_result = path.stat()
+            except OSError:
+                continue
+            relative_path = path.relative_to(distpath).as_posix()
+            manifest[relative_path] = [stat_result.st_size, stat_result.st_mtime_ns]
+    return manifest
+
+
+class BuildRecords:
+    """记录每个输出位置上次成功构建的指纹与输出清单，持久化保存在用户缓存目录中
+
+    记录文件为 json 格式，结构形如：
+    {"/path/to/dist|app": {"fingerprint": "...", "manifest": {...}, "time": 1700000000.0}, ...}
+    """
+
+    def __init__(self, records_file: Union[str, Path]) -> None:
+        """
+        :param records_file: 记录文件路径
+        """
+
+        self._records_file = Path(records_file)
+        self._data: dict[str, dict[str, Any]] = {}
+        self._loaded = False
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _key(distpath: Path, name: str) -> str:
+        """生成记录的键
+
+        :param distpath: 输出目录
+        :param name: 输出程序名称
+        :return: 键
+        """
+
+        return f"{os.path.normcase(str(Path(distpath).absolute()))}|{name}"
+
+    def _load(self) -> None:
+        """从磁盘加载记录文件，调用者应持有锁"""
+
+        self._loaded = True
+
+        try:
+            with open(self._records_file, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            warnings.warn(
+                f"Failed to load build records: {e}", RuntimeWarning, stacklevel=2
+            )
+            return
+
+        if isinstance(data, dict):
+            self._data = data
+
+    def _save(self) -> None:
+        """将记录写入磁盘，先写入临时文件再替换，调用者应持有锁"""
+
+        tmp_file = self._records_file.with_suffix(".tmp")
+        try:
+            self._records_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(self._data, f, ensure_ascii=False)
+            os.replace(tmp_file, self._records_file)
+        except OSError as e:
+            warnings.warn(
+                f"Failed to save build records: {e}", RuntimeWarning, stacklevel=2
+            )
+
+    def is_up_to_date(
+        self, distpath: Path, name: str, fingerprint: Optional[str]
+    ) -> bool:
+        """判断该输出位置是否已有相同指纹的成功构建，且其输出完好无损
+
+        :param distpath: 输出目录
+        :param name: 输出程序名称
+        :param fingerprint: 本次构建的指纹，为 None 时总是返回 False
+        :return: 是否可以跳过本次构建
+        """
+
+        if fingerprint is None:
+            return False
+
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            record = self._data.get(self._key(distpath, name))
+
+        if record is None or record.get("fingerprint") != fingerprint:
+            return False
+        manifest = record.get("manifest")
+        return bool(manifest) and manifest == _dist_manifest(distpath, name)
+
+    def record_success(
+        self, distpath: Path, name: str, fingerprint: Optional[str]
+    ) -> None:
+        """记录一次成功的构建，并立即保存至磁盘
+
+        :param distpath: 输出目录
+        :param name: 输出程序名称
+        :param fingerprint: 本次构建的指纹，为 None 时不做记录
+        """
+
+        if fingerprint is None:
+            return
+
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            self._data[self._key(distpath, name)] = {
+                "fingerprint": fingerprint,
+                "manifest": _dist_manifest(distpath, name),
+                "time": time.time(),
+            }
+            self._save()
+
+
+# 全局变量，Py2exe-GUI 的构建记录
+BUILD_RECORDS = BuildRecords(
+    get_user_cache_dir() / AppConstant.NAME / "build_records.json"
+)
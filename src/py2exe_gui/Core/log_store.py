@@ -0,0 +1,439 @@
+# Licensed under the GPLv3 License: https://www.gnu.org/licenses/gpl-3.0.html
+# For details: https://github.com/muziing/Py2exe-GUI/blob/main/README.md#license
+
+"""此模块主要包含以磁盘文件保存子进程输出的行存储类 `LogLineStore` 与日志级别枚举 `LogLevel`，
+以及管理历次打包日志的 `BuildLogArchive` 与全局变量 `BUILD_LOGS`
+
+日志正文以 UTF-8 逐行写入磁盘，内存中只保存每行的起始偏移量与日志级别（每行 9 字节），
+数十万行的调试日志也不会占用大量内存；按行号读取、按级别过滤与全文搜索均基于这两个数组进行，
+只读取需要的部分文件内容。
+
+保存至指定路径时，偏移量与级别同时追加写入同名的 .idx 索引文件，之后重新打开该日志时无需读取整个正文即可定位任意一行。
+"""
+
+__all__ = [
+    "LogLevel",
+    "detect_level",
+    "LogLineStore",
+    "BuildLogArchive",
+    "BUILD_LOGS",
+]
+
+import re
+import struct
+import tempfile
+import time
+import warnings
+from array import array
+from collections.abc import Iterable, Iterator
+from enum import IntEnum
+from pathlib import Path
+from typing import Optional, Union
+
+from ..Constants import AppConstant
+from ..Utilities import get_user_cache_dir
+
+
+class LogLevel(IntEnum):
+    """枚举值：日志行的级别，数值与标准库 logging 一致，便于按“不低于某级别”过滤"""
+
+    OTHER = 0  # 无法识别级别的行，如打包开始前的输出
+    DEBUG = 10
+    INFO = 20
+    WARNING = 30
+    ERROR = 40
+
+
+# PyInstaller 日志行的格式形如 "1234 INFO: PyInstaller: 6.3.0"，开头为自启动以来的毫秒数
+_LEVEL_RE = re.compile(
+    r"^\d+\s+(TRACE|DEBUG|INFO|DEPRECATION|WARNING|ERROR|FATAL|CRITICAL):"
+)
+_LEVEL_NAMES = {
+    "TRACE": LogLevel.DEBUG,
+    "DEBUG": LogLevel.DEBUG,
+    "INFO": LogLevel.INFO,
+    "DEPRECATION": LogLevel.WARNING,
+    "WARNING": LogLevel.WARNING,
+    "ERROR": LogLevel.ERROR,
+    "FATAL": LogLevel.ERROR,
+    "CRITICAL": LogLevel.ERROR,
+}
+
+
+# 索引文件的文件头，及其中每条记录的格式：(该行起始偏移量, 日志级别)
+_INDEX_MAGIC = b"P2G-LOG-IDX-1\n"
+_INDEX_RECORD = struct.Struct("<QB")
+
+
+def detect_level(line: str, previous: LogLevel = LogLevel.OTHER) -> LogLevel:
+    """识别一行输出的日志级别
+
+    :param line: 一行输出，不含换行符
+    :param previous: 上一行的级别；没有级别标记的行（如多行消息的后续行）沿用上一行的级别
+    :return: 日志级别
+    """
+
+    match = _LEVEL_RE.match(line)
+    if match is not None:
+        return _LEVEL_NAMES[match.group(1)]
+    if line.startswith("Traceback (most recent call last):"):
+        return LogLevel.ERROR
+    return previous
+
+
+class LogLineStore:
+    """以磁盘文件保存的日志行存储，只追加写入"""
+
+    SEARCH_BLOCK_LINES = 16384  # 搜索时每次从文件中读取的行数
+
+    def __init__(
+        self, path: Optional[Union[str, Path]] = None, mode: str = "w"
+    ) -> None:
+        """
+        :param path: 日志文件路径，索引保存在同名的 .idx 文件中；为 None 时使用匿名临时文件，关闭后自动删除
+        :param mode: "w" 表示新建（覆盖已有文件），"r" 表示只读打开已有的日志
+        :raise OSError: 无法创建或打开日志文件时抛出
+        """
+
+        self.path: Optional[Path] = None if path is None else Path(path)
+        self._size = 0  # 文件已写入的字节数
+        self._offsets = array("Q")  # 每行在文件中的起始偏移量
+        self._levels = bytearray()  # 每行的日志级别
+        self._last_level = LogLevel.OTHER
+        self._index_file = None
+
+        if self.path is None:
+            self._file = tempfile.TemporaryFile("w+b")
+        elif mode == "r":
+            self._file = open(self.path, "rb")
+            self._load_index()
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "w+b")
+            self._index_file = open(self.index_path(self.path), "wb")
+            self._index_file.write(_INDEX_MAGIC)
+
+    @staticmethod
+    def index_path(path: Union[str, Path]) -> Path:
+        """获取日志文件对应的索引文件路径
+
+        :param path: 日志文件路径
+        :return: 索引文件路径，如 build.log 对应 build.idx
+        """
+
+        return Path(path).with_suffix(".idx")
+
+    def _load_index(self) -> None:
+        """读取已有日志的索引；索引缺失、损坏或落后于正文（如写入时程序异常退出）时，扫描正文补全"""
+
+        self._file.seek(0, 2)
+        self._size = self._file.tell()
+
+        try:
+            data = self.index_path(self.path).read_bytes()  # type: ignore
+        except OSError:
+            data = b""
+        if data.startswith(_INDEX_MAGIC):
+            body = memoryview(data)[len(_INDEX_MAGIC) :]
+            body = body[: len(body) - len(body) % _INDEX_RECORD.size]
+            for offset, level in _INDEX_RECORD.iter_unpack(body):
+                if offset >= self._size:
+                    break
+                self._offsets.append(offset)
+                self._levels.append(level)
+
+        # 最后一条索引对应的行可能尚未写完整，从该行开始重新扫描其后的正文
+        scan_from = 0
+        if self._offsets:
+            scan_from = self._offsets.pop()
+            self._levels.pop()
+            if self._levels:
+                self._last_level = LogLevel(self._levels[-1])
+        self._file.seek(scan_from)
+        offset = scan_from
+        for raw_line in self._file:
+            line = raw_line.rstrip(b"\n").decode("utf-8", errors="replace")
+            self._last_level = detect_level(line, self._last_level)
+            self._offsets.append(offset)
+            self._levels.append(self._last_level)
+            offset += len(raw_line)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    @property
+    def size(self) -> int:
+        """日志正文的总字节数（实例属性，只读）"""
+
+        return self._size
+
+    def append_text(self, text: str) -> tuple[int, int]:
+        """追加一段输出，按换行符拆分为行
+
+        :param text: 输出文本，末尾的换行符可有可无
+        :return: 新增行的行号范围 (起始行号, 结束行号)，左闭右开
+        """
+
+        start = len(self._offsets)
+        if not text:
+            return start, start
+        if text.endswith("\n"):
+            text = text[:-1]
+
+        data = bytearray()
+        index_data = bytearray()
+        for line in text.split("\n"):
+            self._last_level = detect_level(line, self._last_level)
+            offset = self._size + len(data)
+            self._offsets.append(offset)
+            self._levels.append(self._last_level)
+            index_data += _INDEX_RECORD.pack(offset, self._last_level)
+            data += line.encode("utf-8", errors="replace") + b"\n"
+
+        # 直接写入文件（由操作系统缓冲），不在内存中积累正文
+        self._file.seek(0, 2)
+        self._file.write(data)
+        self._size += len(data)
+        if self._index_file is not None:
+            self._index_file.write(index_data)
+        return start, len(self._offsets)
+
+    def level(self, index: int) -> LogLevel:
+        """获取某一行的日志级别
+
+        :param index: 行号
+        :return: 日志级别
+        """
+
+        return LogLevel(self._levels[index])
+
+    def _read_range(self, start: int, end: int) -> list[str]:
+        """从文件中读取连续的若干行
+
+        :param start: 起始行号
+        :param end: 结束行号（不含）
+        :return: 各行文本，不含换行符
+        """
+
+        if start >= end:
+            return []
+        begin = self._offsets[start]
+        stop = self._offsets[end] if end < len(self._offsets) else self._size
+        self._file.flush()
+        self._file.seek(begin)
+        data = self._file.read(stop - begin)
+        return data.decode("utf-8", errors="replace").split("\n")[: end - start]
+
+    def lines(self, indices: Iterable[int]) -> Iterator[str]:
+        """按行号读取若干行，相邻的行号合并为一次读取
+
+        :param indices: 升序排列的行号
+        :return: 各行文本的迭代器，不含换行符
+        """
+
+        run_start: Optional[int] = None
+        run_end = 0
+        for index in indices:
+            if run_start is not None and index == run_end:
+                run_end += 1
+                continue
+            if run_start is not None:
+                yield from self._read_range(run_start, run_end)
+            run_start, run_end = index, index + 1
+        if run_start is not None:
+            yield from self._read_range(run_start, run_end)
+
+    def filter(self, min_level: LogLevel = LogLevel.OTHER) -> list[int]:
+        """按日志级别过滤，不读取文件
+
+        :param min_level: 最低级别，为 OTHER 时不过滤
+        :return: 级别不低于 min_level 的行号列表
+        """
+
+        if min_level == LogLevel.OTHER:
+            return list(range(len(self._levels)))
+        return [i for i, level in enumerate(self._levels) if level >= min_level]
+
+    def search(self, keyword: str, min_level: LogLevel = LogLevel.OTHER) -> list[int]:
+        """在全部历史输出中搜索关键字（不区分大小写），分块读取文件
+
+        :param keyword: 关键字，为空时等同于 `filter()`
+        :param min_level: 最低级别，只在级别不低于此值的行中搜索
+        :return: 匹配行的行号列表
+        """
+
+        if not keyword:
+            return self.filter(min_level)
+
+        keyword = keyword.casefold()
+        matches: list[int] = []
+        for block_start in range(0, len(self._offsets), self.SEARCH_BLOCK_LINES):
+            block_end = min(block_start + self.SEARCH_BLOCK_LINES, len(self._offsets))
+            for index, line in enumerate(
+                self._read_range(block_start, block_end), block_start
+            ):
+                if self._levels[index] >= min_level and keyword in line.casefold():
+                    matches.append(index)
+        return matches
+
+    def clear(self) -> None:
+        """清空所有行"""
+
+        self._file.seek(0)
+        self._file.truncate()
+        self._size = 0
+        self._offsets = array("Q")
+        self._levels = bytearray()
+        self._last_level = LogLevel.OTHER
+        if self._index_file is not None:
+            self._index_file.seek(0)
+            self._index_file.truncate()
+            self._index_file.write(_INDEX_MAGIC)
+
+    def flush(self) -> None:
+        """将缓冲区中的正文与索引写入磁盘"""
+
+        self._file.flush()
+        if self._index_file is not None:
+            self._index_file.flush()
+
+    @property
+    def closed(self) -> bool:
+        """是否已关闭"""
+
+        return self._file.closed
+
+    def close(self) -> None:
+        """关闭文件（临时文件会被删除），之后不可再使用此对象"""
+
+        self._file.close()
+        if self._index_file is not None:
+            self._index_file.close()
+
+
+class BuildLogArchive:
+    """历次打包日志的存档目录，按数量与总大小轮换（删除最早的日志）
+
+    由 `new_log()` 创建、尚未关闭的日志（无论属于主窗口还是批量打包队列）在轮换时总会保留。
+    """
+
+    DEFAULT_MAX_COUNT = 50  # 默认最多保留的日志数量
+    DEFAULT_MAX_SIZE = 256 * 1024**2  # 默认日志总大小上限，256 MiB
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        *,
+        max_count: int = DEFAULT_MAX_COUNT,
+        max_size: int = DEFAULT_MAX_SIZE,
+    ) -> None:
+        """
+        :param root: 存档目录
+        :param max_count: 最多保留的日志数量
+        :param max_size: 日志（不含索引）总大小上限（字节）
+        """
+
+        self.root = Path(root)
+        self.max_count = max_count
+        self.max_size = max_size
+        self._open_logs: dict[Path, LogLineStore] = {}  # 由 new_log() 创建的日志
+
+    def new_log(self, name: str) -> LogLineStore:
+        """为一次打包创建新的日志，创建失败时退回匿名临时文件，本次打包的日志不会被保存
+
+        :param name: 日志名称，如输出程序名称，会与当前时间一同组成文件名
+        :return: 新日志
+        """
+
+        safe_name = re.sub(r"[^\w.-]+", "_", name) or "build"
+        stem = f"{time.strftime('%Y%m%d-%H%M%S')}-{safe_name}"
+        path = self.root / f"{stem}.log"
+        serial = 1
+        while path.exists():
+            serial += 1
+            path = self.root / f"{stem}-{serial}.log"
+
+        try:
+            store = LogLineStore(path)
+        except OSError as e:
+            warnings.warn(
+                f"Failed to create build log {path}: {e}", RuntimeWarning, stacklevel=2
+            )
+            return LogLineStore()
+        self._open_logs[path] = store
+        return store
+
+    def open_logs(self) -> list[Path]:
+        """列出由 `new_log()` 创建且尚未关闭的日志，即仍在写入或显示中的日志
+
+        :return: 日志文件路径列表
+        """
+
+        self._open_logs = {
+            path: store for path, store in self._open_logs.items() if not store.closed
+        }
+        return list(self._open_logs)
+
+    def logs(self) -> list[Path]:
+        """列出所有日志文件
+
+        :return: 日志文件路径列表，按修改时间从新到旧排列
+        """
+
+        try:
+            paths = [path for path in self.root.glob("*.log") if path.is_file()]
+        except OSError:
+            return []
+        return sorted(paths, key=_mtime, reverse=True)
+
+    def rotate(self, keep: Iterable[Path] = ()) -> list[Path]:
+        """删除超出数量或总大小上限的最早的日志及其索引，尚未关闭的日志（见 `open_logs()`）与无法删除的文件会被跳过
+
+        :param keep: 额外指定的不可删除的日志
+        :return: 被删除的日志文件路径列表
+        """
+
+        keep_paths = {Path(path) for path in keep}
+        keep_paths.update(self.open_logs())
+        count = total = 0
+        removed: list[Path] = []
+        for path in self.logs():  # 从最新的日志开始累计
+            try:
+                size = path.stat().st_size
+            except OSError:
+                continue
+            count += 1
+            total += size
+            if path in keep_paths:
+                continue
+            if count > self.max_count or total > self.max_size:
+                try:
+                    path.unlink(missing_ok=True)
+                except OSError:
+                    # 如 Windows 上日志仍被其他进程打开时，删除会引发 PermissionError，留待下次轮换
+                    continue
+                try:
+                    LogLineStore.index_path(path).unlink(missing_ok=True)
+                except OSError:
+                    pass
+                removed.append(path)
+                count -= 1
+                total -= size
+        return removed
+
+
+def _mtime(path: Path) -> float:
+    """获取文件修改时间，文件不存在时返回 0
+
+    :param path: 文件路径
+    :return: 修改时间（时间戳）
+    """
+
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+# 全局变量，历次打包日志的存档
+BUILD_LOGS = BuildLogArchive(get_user_cache_dir() / AppConstant.NAME / "build_logs")
@@ -1,17 +1,180 @@
 # Licensed under the GPLv3 License: https://www.gnu.org/licenses/gpl-3.0.html
 # For details: https://github.com/muziing/Py2exe-GUI/blob/main/README.md#license
 
-"""此模块包含实际执行打包子进程的类 `Packaging`"""
-
-__all__ = ["Packaging"]
-
+"""此模块包含实际执行打包子进程的类 `Packaging`
+
+`build_option_fragment()`、`build_pyinstaller_args()` 与 `build_subprocess_args()` 是不依赖任何对象状态的纯函数，
+`Packaging` 与 `PackagingQueue` 均使用它们拼接命令。
+`Packaging` 为每个选项缓存其命令参数片段，只重新生成发生变化的片段；
+可用 `Packaging.batch_update()` 将多次修改合并为一次拼接与一次 `args_settled` 信号。
+选项很多时，`build_subprocess_args()` 会改用按内容哈希缓存的 JSON 参数文件传递命令参数。
+两者均在每次成功打包后记录该任务的指纹（见 `build_fingerprint` 模块），以便之后判断能否跳过重复构建，
+计算指纹与记录均由 `BuildChecker` 在后台线程中进行；
+并将 --workpath 指向 `WORKPATH_CACHE` 中该项目的目录，使重复打包能复用 PyInstaller 缓存的分析结果。
+启用 `Packaging.use_warm_worker` 后，打包作业交给预先导入了 PyInstaller 的常驻进程（见 `warm_worker` 模块）执行
+"""
+
+__all__ = [
+    "build_option_fragment",
+    "build_pyinstaller_args",
+    "build_subprocess_args",
+    "Packaging",
+]
+
+import hashlib
+import json
+import os
+import warnings
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from PySide6 import QtCore
 
+from ..Constants import AppConstant
 from ..Constants.packaging_constants import PyInstOpt
+from ..Utilities import PyEnv, get_user_cache_dir
+from .build_checker import BuildChecker
 from .subprocess_tool import SubProcessTool
+from .warm_worker import WarmWorker
+from .workpath_cache import WORKPATH_CACHE
+
+# 子进程参数总长度超过此值（字符数）时，改用 JSON 参数文件传递 PyInstaller 命令参数
+_ARGFILE_THRESHOLD = 8000
+# 参数文件的保存目录与保留数量
+_ARGFILE_DIR = get_user_cache_dir() / AppConstant.NAME / "argfiles"
+_ARGFILE_KEEP = 32
+
+# 各选项在 PyInstaller 命令中的先后顺序
+_OPTION_ORDER = (
+    PyInstOpt.script_path,
+    PyInstOpt.icon_path,
+    PyInstOpt.add_data,
+    PyInstOpt.add_binary,
+    PyInstOpt.FD,
+    PyInstOpt.console,
+    PyInstOpt.hidden_import,
+    PyInstOpt.out_name,
+    PyInstOpt.clean,
+)
+
+
+def build_option_fragment(option: PyInstOpt, value: Any) -> list[str]:
+    """生成单个选项对应的 PyInstaller 命令参数片段
+
+    :param option: 选项
+    :param value: 选项值，为空（空字符串、None、空列表等）时返回空列表；入口脚本除外，总是占据第一个参数
+    :return: 命令参数片段
+    """
+
+    if option == PyInstOpt.script_path:
+        return [str(value or "")]
+    if not value:
+        return []
+
+    if option == PyInstOpt.icon_path:
+        return ["--icon", str(value)]
+    if option in (PyInstOpt.add_data, PyInstOpt.add_binary):
+        flag = "--add-data" if option == PyInstOpt.add_data else "--add-binary"
+        fragment: list[str] = []
+        for item in value:
+            fragment.extend([flag, f"{item[0]}:{item[1]}"])
+        return fragment
+    if option == PyInstOpt.hidden_import:
+        fragment = []
+        for item in value:
+            fragment.extend(["--hidden-import", item])
+        return fragment
+    if option == PyInstOpt.out_name:
+        return ["--name", value]
+    # FD、console、clean 的值本身即为命令行开关，如 "--onefile"
+    return [value]
+
+
+def build_pyinstaller_args(options: Mapping[PyInstOpt, Any]) -> list[str]:
+    """将选项字典中的参数按顺序拼接为 PyInstaller 命令参数列表
+
+    :param options: 选项字典，如 `Packaging.args_dict` 或 `PackagingTask.using_option`，
+        值为空（空字符串、None、空列表等）的选项会被忽略
+    :return: PyInstaller 命令参数列表
+    """
+
+    args: list[str] = []
+    for option in _OPTION_ORDER:
+        args.extend(build_option_fragment(option, options.get(option)))
+    return args
+
+
+def _write_argfile(pyinstaller_args: list[str]) -> Path:
+    """将 PyInstaller 命令参数写入 JSON 参数文件，以内容哈希命名，内容未变化时直接复用已有文件
+
+    :param pyinstaller_args: PyInstaller 命令参数列表
+    :return: 参数文件路径
+    :raise OSError: 写入失败时抛出
+    """
+
+    content = json.dumps(pyinstaller_args, ensure_ascii=False)
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+    argfile = _ARGFILE_DIR / f"{digest}.json"
+    if argfile.exists():
+        os.utime(argfile)  # 更新修改时间，使其不会被当作旧文件清理
+        return argfile
+
+    _ARGFILE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_file = argfile.with_suffix(".tmp")
+    tmp_file.write_text(content, encoding="utf-8")
+    os.replace(tmp_file, argfile)
+
+    # 只保留最近使用的若干个参数文件
+    argfiles = sorted(
+        _ARGFILE_DIR.glob("*.json"), key=lambda path: path.stat().st_mtime
+    )
+    for old_file in argfiles[:-_ARGFILE_KEEP]:
+        old_file.unlink(missing_ok=True)
+
+    return argfile
+
+
+def build_subprocess_args(pyinstaller_args: list[str]) -> list[str]:
+    """生成以 Python 解释器运行 PyInstaller 时的子进程参数
+
+    从 Python 内启动 Pyinstaller，
+    参见 https://pyinstaller.org/en/stable/usage.html#running-pyinstaller-from-python-code
+
+    参数较少时直接嵌入 `-c` 代码中；参数总长度较大时（如数千个 --add-data），先写入 JSON 参数文件，
+    由一段简短的引导代码读取后再交给 PyInstaller，避免超出 Windows 约 32K 字符的命令行长度上限
+
+    :param pyinstaller_args: PyInstaller 命令参数列表
+    :return: 传递给 Python 解释器的参数列表
+    """
+
+    if sum(len(arg) + 3 for arg in pyinstaller_args) <= _ARGFILE_THRESHOLD:
+        return [
+            "-c",
+            f"import PyInstaller.__main__;PyInstaller.__main__.run({pyinstaller_args})",
+        ]
+
+    try:
+        argfile = _write_argfile(pyinstaller_args)
+    except OSError as e:
+        warnings.warn(
+            f"Failed to write argument file, passing arguments inline: {e}",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+        return [
+            "-c",
+            f"import PyInstaller.__main__;PyInstaller.__main__.run({pyinstaller_args})",
+        ]
+
+    # `python -c code argfile` 时，argfile 即 sys.argv[1]
+    return [
+        "-c",
+        "import json,sys,PyInstaller.__main__;"
+        "PyInstaller.__main__.run(json.load(open(sys.argv[1],encoding='utf-8')))",
+        str(argfile),
+    ]
 
 
 class Packaging(QtCore.QObject):
@@ -21,6 +184,8 @@ class Packaging(QtCore.QObject):
 
     # 自定义信号
     args_settled = QtCore.Signal(list)  # 所有选项完成设置，直接将命令行参数传出
+    # check_up_to_date() 完成，实际类型为 bool，表示本次打包能否跳过
+    up_to_date_checked = QtCore.Signal(bool)
 
     def __init__(self, parent: Optional[QtCore.QObject] = None) -> None:
         """
@@ -31,7 +196,55 @@ class Packaging(QtCore.QObject):
 
         self.args_dict: dict = dict.fromkeys(PyInstOpt, "")
         self._args: list[str] = []  # PyInstaller 命令
+        self._python_path = ""
+        self._working_dir = "./"
+        self._fingerprint: Optional[str] = None  # 本次打包任务的指纹，成功后记录
+        # 本次打包使用的 WORKPATH_CACHE 条目，结束后释放
+        self._workpath: Optional[Path] = None
+        self._checker = BuildChecker(self)
+        self._checker.check_done.connect(self._handle_check_done)
+        self._checking = False  # 是否正在后台计算指纹
         self.subprocess: SubProcessTool = SubProcessTool("", parent=self)
+        self.subprocess.output.connect(self._handle_subprocess_output)
+
+        # 是否使用预热工作进程执行打包，及每个 Python 环境的工作进程
+        self.use_warm_worker = False
+        self._workers: dict[str, WarmWorker] = {}
+        self._active_worker: Optional[WarmWorker] = None  # 正在执行打包作业的工作进程
+        # 已被替换、但仍在执行打包作业的工作进程，作业结束后再结束
+        self._retired_workers: list[WarmWorker] = []
+
+        # 每个选项对应的命令参数片段，及自上次拼接以来发生变化、需要重新生成片段的选项
+        self._fragments: dict[PyInstOpt, list[str]] = {
+            option: build_option_fragment(option, "") for option in PyInstOpt
+        }
+        self._dirty: set[PyInstOpt] = set()
+        self._batch_depth = 0  # batch_update() 的嵌套层数
+
+        # 批量修改之外的多次修改，合并到下一次事件循环中统一拼接并发射一次 args_settled
+        self._settle_timer = QtCore.QTimer(self)
+        self._settle_timer.setSingleShot(True)
+        self._settle_timer.setInterval(0)
+        self._settle_timer.timeout.connect(self._flush)
+
+    @contextmanager
+    def batch_update(self) -> Iterator[None]:
+        """批量修改选项的上下文管理器，退出时（最外层）只拼接一次命令参数、发射一次 `args_settled` 信号
+
+        用法::
+
+            with packager.batch_update():
+                for option in options:
+                    packager.set_pyinstaller_args(option)
+        """
+
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._flush()
 
     @QtCore.Slot(tuple)
     def set_pyinstaller_args(self, arg: tuple[PyInstOpt, str]) -> None:
@@ -43,71 +256,235 @@ class Packaging(QtCore.QObject):
         arg_key, arg_value = arg
         if isinstance(arg_key, PyInstOpt):
             self.args_dict[arg_key] = arg_value
-            self._add_pyinstaller_args()
-            self._set_subprocess_working_dir()
+            self._mark_dirty(arg_key)
+
+    @QtCore.Slot(object)
+    def set_pyinstaller_options(self, options: dict[PyInstOpt, Any]) -> None:
+        """一次性替换所有 PyInstaller 选项，只重新拼接一次命令参数
+
+        :param options: 选项字典，值为 None 的选项视为未设置
+        """
+
+        with self.batch_update():
+            for option in PyInstOpt:
+                value = options.get(option)
+                self.set_pyinstaller_args((option, "" if value is None else value))
 
     def set_python_path(self, python_path: str) -> None:
-        """为内部管理的 SubProcessTool 设置新的 Python 程序路径
+        """为内部管理的 SubProcessTool 设置新的 Python 程序路径，及按该解释器解码输出所用的编码
 
         :param python_path: Python 可执行文件路径
         """
 
+        changed = python_path != self._python_path
+        self._python_path = python_path
         self.subprocess.set_program(python_path)
+        self.subprocess.set_encoding(PyEnv(python_path).output_encoding)
+        if changed and self.args_dict[PyInstOpt.script_path]:
+            # --workpath 按解释器区分，需随之重新拼接
+            self._mark_dirty(PyInstOpt.script_path)
 
-    def _add_pyinstaller_args(self) -> None:
-        """将命令参数字典中的参数按顺序添加到PyInstaller命令参数列表中"""
+    @property
+    def pyinstaller_args(self) -> list[str]:
+        """当前完整的 PyInstaller 命令参数（实例属性，只读），若有尚未拼接的修改则立即拼接并发射 `args_settled` 信号"""
 
-        self._args = []  # 避免重复添加
+        self._flush()
+        return self._args
 
-        self._args.append(self.args_dict[PyInstOpt.script_path])
+    def _mark_dirty(self, option: PyInstOpt) -> None:
+        """标记选项已变化；若不在批量修改中，则安排在下一次事件循环中拼接
 
-        if self.args_dict[PyInstOpt.icon_path]:
-            self._args.extend(["--icon", self.args_dict[PyInstOpt.icon_path]])
-
-        if self.args_dict[PyInstOpt.add_data]:
-            for item in self.args_dict[PyInstOpt.add_data]:
-                self._args.extend(["--add-data", f"{item[0]}:{item[1]}"])
-
-        if self.args_dict[PyInstOpt.add_binary]:
-            for item in self.args_dict[PyInstOpt.add_binary]:
-                self._args.extend(["--add-binary", f"{item[0]}:{item[1]}"])
+        :param option: 发生变化的选项
+        """
 
-        if self.args_dict[PyInstOpt.FD]:
-            self._args.append(self.args_dict[PyInstOpt.FD])
+        self._dirty.add(option)
+        if self._batch_depth == 0:
+            self._settle_timer.start()
 
-        if self.args_dict[PyInstOpt.console]:
-            self._args.append(self.args_dict[PyInstOpt.console])
+    def _flush(self) -> None:
+        """拼接所有已变化的选项并发射 `args_settled` 信号；没有变化时什么也不做"""
 
-        if self.args_dict[PyInstOpt.hidden_import]:
-            for item in self.args_dict[PyInstOpt.hidden_import]:
-                self._args.extend(["--hidden-import", item])
+        self._settle_timer.stop()
+        if self._dirty:
+            self._rebuild_args()
+            self.args_settled.emit(self._args)
 
-        if self.args_dict[PyInstOpt.out_name]:
-            self._args.extend(["--name", self.args_dict[PyInstOpt.out_name]])
+    def _rebuild_args(self) -> None:
+        """只重新生成已变化选项的片段，再按顺序拼接为PyInstaller命令参数列表"""
 
-        if self.args_dict[PyInstOpt.clean]:
-            self._args.append(self.args_dict[PyInstOpt.clean])
+        for option in self._dirty:
+            self._fragments[option] = build_option_fragment(
+                option, self.args_dict[option]
+            )
 
-        self.args_settled.emit(self._args)
+        if PyInstOpt.script_path in self._dirty:
+            self._set_subprocess_working_dir()
+        self._dirty.clear()
+
+        args: list[str] = []
+        for option in _OPTION_ORDER:
+            args.extend(self._fragments[option])
+        if self.args_dict[PyInstOpt.script_path]:
+            # 以解释器路径区分，不同解释器打包同一脚本时不会共用（或覆盖）PyInstaller 的分析缓存
+            workpath = WORKPATH_CACHE.path_for(
+                self.args_dict[PyInstOpt.script_path], self._python_path
+            )
+            args.extend(["--workpath", str(workpath)])
+        self._args = args
 
     def _set_subprocess_working_dir(self) -> None:
         """设置子进程工作目录"""
 
         script_path = self.args_dict[PyInstOpt.script_path]
         # 工作目录设置为脚本所在目录
-        self.subprocess.set_working_dir(str(Path(script_path).parent))
+        self._working_dir = str(Path(script_path).parent.absolute())
+        self.subprocess.set_working_dir(self._working_dir)
 
-    def run_packaging_process(self) -> None:
-        """使用给定的参数启动打包子进程"""
+    def dist_target(self) -> tuple[Path, str]:
+        """获取本次打包的输出位置，即入口脚本所在目录下的 dist/ 与输出程序名称
 
-        # 从 Python 内启动 Pyinstaller，
-        # 参见 https://pyinstaller.org/en/stable/usage.html#running-pyinstaller-from-python-code
-        cmd = [
-            "-c",
-            f"import PyInstaller.__main__;PyInstaller.__main__.run({self._args})",
-        ]
+        :return: (输出目录, 输出程序名称)
+        """
+
+        script_path = Path(self.args_dict[PyInstOpt.script_path]).absolute()
+        name = self.args_dict[PyInstOpt.out_name] or script_path.stem
+        return script_path.parent / "dist", name
+
+    def check_up_to_date(self, packages: Optional[list[dict]]) -> None:
+        """在后台计算当前任务的指纹，判断其与上次成功打包时是否相同、且输出完好，即本次打包可以跳过。
+        不阻塞，完成后发射 `up_to_date_checked` 信号；上一次检查尚未完成时什么也不做
 
-        self.subprocess.set_arguments(cmd)
-        self.subprocess.start_process(
-            time_out=500, mode=QtCore.QIODeviceBase.OpenModeFlag.ReadOnly
+        :param packages: 打包所用环境中已安装的包列表，未知时传入 None，此时在后台获取
+        """
+
+        if self._checking:
+            return
+        self._checking = True
+        self._checker.check(
+            None, self.args_dict, self._python_path, packages, *self.dist_target()
         )
+
+    @QtCore.Slot(object, tuple)
+    def _handle_check_done(self, _: object, result: tuple[Optional[str], bool]) -> None:
+        """后台指纹计算完成，保存指纹以便成功打包后记录
+
+        :param result: (指纹, 能否跳过本次打包)
+        """
+
+        self._checking = False
+        self._fingerprint, up_to_date = result
+        self.up_to_date_checked.emit(up_to_date)
+
+    @QtCore.Slot(tuple)
+    def _handle_subprocess_output(
+        self, output: tuple[SubProcessTool.OutputType, str]
+    ) -> None:
+        """打包子进程成功结束时，记录本次打包的指纹
+
+        :param output: 子进程输出，(输出类型, 文本)
+        """
+
+        output_type, output_text = output
+        if output_type in (
+            SubProcessTool.OutputType.FINISHED,
+            SubProcessTool.OutputType.ERROR,
+        ):
+            self._release_workpath()
+        if output_type == SubProcessTool.OutputType.FINISHED:
+            if self._active_worker in self._retired_workers:
+                self._retired_workers.remove(self._active_worker)
+                self._active_worker.stop()
+            self._active_worker = None
+            if output_text == "0":
+                self._checker.record(None, *self.dist_target(), self._fingerprint)
+
+    def _release_workpath(self) -> None:
+        """本次打包结束（或未能启动），释放其使用的 WORKPATH_CACHE 条目"""
+
+        if self._workpath is not None:
+            WORKPATH_CACHE.release(self._workpath)
+            self._workpath = None
+
+    def prewarm(self, python_path: Optional[str] = None) -> None:
+        """为某个 Python 环境启动预热工作进程（不阻塞），使之后的打包无需再等待 PyInstaller 导入。
+        同一时间只为一个环境保留工作进程，其他环境的工作进程会被结束。当前平台不支持预热工作进程时什么也不做。
+        工作进程启动失败（如环境中未安装 PyInstaller）的环境会被记住，不再重新启动，直到 `restart_worker()` 被调用
+
+        :param python_path: Python 可执行文件路径，默认为当前设置的路径
+        """
+
+        python_path = python_path or self._python_path
+        if not python_path or not WarmWorker.is_supported():
+            return
+        for other_path, worker in list(self._workers.items()):
+            # 启动失败的工作进程没有在运行的进程，保留下来以免切换回该环境时再次启动
+            if other_path != python_path and not worker.start_failed:
+                self._retire_worker(other_path)
+        if python_path not in self._workers:
+            self._workers[python_path] = WarmWorker(python_path, parent=self)
+        self._workers[python_path].start()
+
+    def restart_worker(self, python_path: str) -> None:
+        """重启某个 Python 环境的预热工作进程，使其重新导入 PyInstaller，如环境中的包发生变化（升级 PyInstaller 等）后。
+        该环境没有工作进程时什么也不做；工作进程正在执行打包作业时，待作业结束后再结束旧进程
+
+        :param python_path: Python 可执行文件路径
+        """
+
+        if python_path in self._workers:
+            self._retire_worker(python_path)
+            self.prewarm(python_path)
+
+    def stop_workers(self) -> None:
+        """结束所有预热工作进程"""
+
+        for worker in [*self._workers.values(), *self._retired_workers]:
+            worker.stop()
+        self._workers.clear()
+        self._retired_workers.clear()
+        self._active_worker = None
+
+    def _retire_worker(self, python_path: str) -> None:
+        """不再使用某个 Python 环境的工作进程：空闲时立即结束，正在执行打包作业时待作业结束后再结束
+
+        :param python_path: Python 可执行文件路径
+        """
+
+        worker = self._workers.pop(python_path)
+        if worker.is_busy:
+            self._retired_workers.append(worker)
+        else:
+            worker.stop()
+
+    def run_packaging_process(self) -> None:
+        """使用给定的参数启动打包子进程；启用预热工作进程且其已就绪时，交给工作进程执行"""
+
+        self._release_workpath()
+        self._workpath = WORKPATH_CACHE.acquire(
+            self.args_dict[PyInstOpt.script_path], self._python_path
+        )
+        WORKPATH_CACHE.evict_in_background()
+
+        if self.use_warm_worker:
+            worker = self._workers.get(self._python_path)
+            if worker is not None and worker.run_job(
+                self.pyinstaller_args, self._working_dir, self.subprocess
+            ):
+                self._active_worker = worker
+                return
+            # 工作进程尚未就绪（仍在导入 PyInstaller）、未启动或启动失败，本次冷启动，同时为下次打包预热（启动失败时不再重试）
+            self.prewarm()
+
+        self.subprocess.set_arguments(build_subprocess_args(self.pyinstaller_args))
+        self.subprocess.start_process(mode=QtCore.QIODeviceBase.OpenModeFlag.ReadOnly)
+
+    def abort_process(self, timeout: int = 5000) -> None:
+        """中止正在运行的打包，无论其运行在子进程还是预热工作进程中，不阻塞
+
+        :param timeout: 超时时间，单位为毫秒，超时后杀死打包进程及其全部子进程
+        """
+
+        if self._active_worker is not None:
+            self._active_worker.abort_job(timeout)
+        else:
+            self.subprocess.abort_process(timeout)
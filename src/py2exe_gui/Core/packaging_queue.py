@@ -0,0 +1,528 @@
+# Licensed under the GPLv3 License: https://www.gnu.org/licenses/gpl-3.0.html
+# For details: https://github.com/muziing/Py2exe-GUI/blob/main/README.md#license
+
+"""此模块主要包含批量打包队列类 `PackagingQueue` 与打包作业类 `PackagingJob`
+
+`Packaging` 只管理一个子进程，同一时间只能运行一次打包。`PackagingQueue` 接收任意多个打包作业，
+以至多 N 个并发的 PyInstaller 子进程依次运行（N 默认为 CPU 核心数）。
+每个作业使用独立的 `--workpath`、`--distpath` 与 `--specpath`，并发运行时互不干扰；
+默认的 `--workpath` 位于 `WORKPATH_CACHE` 中，以作业名称区分，下次以相同名称打包时可复用 PyInstaller 的分析缓存。
+
+`PackagingQueue.add_matrix_jobs()` 可将同一打包任务分别以多个 Python 环境打包（矩阵构建），
+各环境的输出目录以环境类型与 Python 版本命名，便于比较各版本的耗时与输出大小。
+
+启动作业前会在后台线程中计算其指纹（见 `BuildChecker`），若与该输出目录上次成功构建时相同且输出完好，
+则直接跳过，沿用上次的输出。
+每个作业的输出在到达时直接写入 `BUILD_LOGS` 中的日志文件，不在内存中保存。
+"""
+
+__all__ = [
+    "PackagingJob",
+    "PackagingQueue",
+]
+
+import os
+import time
+from collections.abc import Iterable, Mapping
+from enum import IntEnum
+from pathlib import Path
+from typing import Any, Optional
+
+from PySide6 import QtCore
+
+from ..Constants import PyInstOpt
+from ..Utilities import PyEnv
+from .build_checker import BuildChecker
+from .log_store import BUILD_LOGS, LogLineStore
+from .packaging import build_pyinstaller_args, build_subprocess_args
+from .subprocess_tool import SubProcessTool
+from .workpath_cache import WORKPATH_CACHE
+
+
+class PackagingJob:
+    """批量打包队列中的单个作业，保存作业的选项、输出位置与运行状态"""
+
+    class State(IntEnum):
+        """枚举值：作业状态"""
+
+        PENDING = 1
+        RUNNING = 2
+        SUCCEEDED = 3
+        FAILED = 4
+        CANCELLED = 5
+        SKIPPED = 6  # 输入未变化，沿用上次的输出
+
+    def __init__(
+        self,
+        name: str,
+        python_path: str,
+        options: Mapping[PyInstOpt, Any],
+        *,
+        workpath: Path,
+        distpath: Path,
+    ) -> None:
+        """
+        :param name: 作业名称，在同一队列中唯一
+        :param python_path: 运行 PyInstaller 的 Python 解释器路径
+        :param options: 打包选项，如 `PackagingTask.using_option`，会复制一份，之后修改原字典不影响作业
+        :param workpath: 该作业独立的 PyInstaller 临时文件目录
+        :param distpath: 该作业独立的输出目录
+        """
+
+        self.name = name
+        self.python_path = python_path
+        self.options: dict[PyInstOpt, Any] = dict(options)
+        self.workpath = workpath
+        self.distpath = distpath
+
+        self.state = self.State.PENDING
+        self.exit_code: Optional[int] = None
+        # 成功或跳过后输出目录的总大小（字节），在后台统计，完成前为 None
+        self.output_size: Optional[int] = None
+        self.last_message = ""  # 最近一行输出，用于显示进度
+        # 子进程的全部输出，开始运行时创建，保存于 BUILD_LOGS 中
+        self.log: Optional[LogLineStore] = None
+        self.start_time: Optional[float] = None
+        self.end_time: Optional[float] = None
+        self.fingerprint: Optional[str] = None  # 开始运行前计算，未知时为 None
+
+    def __repr__(self) -> str:
+        return f"PackagingJob object (name={self.name}, state={self.state.name})"
+
+    @property
+    def duration(self) -> Optional[float]:
+        """运行耗时，单位为秒；尚未开始时为 None，运行中则为已运行的时间"""
+
+        if self.start_time is None:
+            return None
+        end_time = self.end_time if self.end_time is not None else time.monotonic()
+        return end_time - self.start_time
+
+    @property
+    def is_done(self) -> bool:
+        """作业是否已经结束（成功、失败、被取消或被跳过）"""
+
+        return self.state in (
+            self.State.SUCCEEDED,
+            self.State.FAILED,
+            self.State.CANCELLED,
+            self.State.SKIPPED,
+        )
+
+    @property
+    def working_dir(self) -> Path:
+        """子进程工作目录，即入口脚本所在目录"""
+
+        return Path(self.options[PyInstOpt.script_path]).absolute().parent
+
+    @property
+    def output_name(self) -> str:
+        """输出程序名称，即 --name 选项，未指定时 PyInstaller 使用脚本名"""
+
+        script_path = Path(self.options[PyInstOpt.script_path])
+        return self.options.get(PyInstOpt.out_name) or script_path.stem
+
+    def pyinstaller_args(self) -> list[str]:
+        """生成该作业的完整 PyInstaller 命令参数，包括独立的输出目录
+
+        :return: PyInstaller 命令参数列表
+        """
+
+        return build_pyinstaller_args(self.options) + [
+            "--workpath",
+            str(self.workpath),
+            "--distpath",
+            str(self.distpath),
+            "--specpath",
+            str(self.workpath),
+            "--noconfirm",  # 输出目录已存在时直接覆盖，子进程中无法交互确认
+        ]
+
+
+class PackagingQueue(QtCore.QObject):
+    """批量打包队列，以有限的并发数运行多个打包作业
+
+    调用 `add_job()` 添加作业，调用 `start()` 开始运行；每个作业开始、产生输出、结束时均发射对应信号，
+    队列中所有作业均结束后发射 `drained` 信号。运行过程中仍可继续添加作业。
+    """
+
+    # 自定义信号
+    job_added = QtCore.Signal(object)  # 添加了新作业，实际类型为 PackagingJob
+    job_started = QtCore.Signal(object)  # 作业开始运行，实际类型为 PackagingJob
+    # 作业子进程产生输出，(PackagingJob, tuple[SubProcessTool.OutputType, str])
+    job_output = QtCore.Signal(object, tuple)
+    job_finished = QtCore.Signal(object)  # 作业结束，实际类型为 PackagingJob
+    job_updated = QtCore.Signal(object)  # 作业的输出大小已统计，实际类型为 PackagingJob
+    drained = QtCore.Signal(list)  # 所有作业均已结束，实际类型为 list[PackagingJob]
+
+    def __init__(
+        self,
+        parent: Optional[QtCore.QObject] = None,
+        *,
+        max_jobs: Optional[int] = None,
+        skip_unchanged: bool = True,
+    ) -> None:
+        """
+        :param parent: 父对象
+        :param max_jobs: 最大并发作业数，默认为 CPU 核心数
+        :param skip_unchanged: 是否跳过输入未变化且输出完好的作业
+        """
+
+        super().__init__(parent)
+
+        self.jobs: list[PackagingJob] = []
+        self.skip_unchanged = skip_unchanged
+        self._max_jobs = max_jobs or os.cpu_count() or 1
+        self._running: dict[int, SubProcessTool] = {}  # {id(PackagingJob): 子进程}
+        # 正在后台计算指纹、记录成功构建、统计输出大小的作业，id(PackagingJob)
+        self._checking: set[int] = set()
+        self._recording: set[int] = set()
+        self._measuring: set[int] = set()
+        self._started = False
+
+        self._checker = BuildChecker(self)
+        self._checker.check_done.connect(self._handle_check_done)
+        self._checker.record_done.connect(self._handle_record_done)
+        self._checker.measure_done.connect(self._handle_measure_done)
+
+    @property
+    def max_jobs(self) -> int:
+        """最大并发作业数"""
+
+        return self._max_jobs
+
+    @max_jobs.setter
+    def max_jobs(self, value: int) -> None:
+        """设置最大并发作业数，调大后若队列正在运行则立即启动更多作业
+
+        :param value: 最大并发作业数，至少为 1
+        """
+
+        self._max_jobs = max(1, value)
+        if self._started:
+            self._start_pending()
+
+    @property
+    def is_running(self) -> bool:
+        """是否有正在运行（包括正在检查能否跳过）的作业"""
+
+        return bool(self._running or self._checking)
+
+    def add_job(
+        self,
+        python_path: str,
+        options: Mapping[PyInstOpt, Any],
+        *,
+        name: Optional[str] = None,
+        output_dir: Optional[Path] = None,
+        distpath: Optional[Path] = None,
+    ) -> PackagingJob:
+        """向队列中添加一个打包作业
+
+        :param python_path: 运行 PyInstaller 的 Python 解释器路径
+        :param options: 打包选项，必须包含有效的入口脚本路径
+        :param name: 作业名称，默认为输出程序名称或脚本名；与已有作业重名时自动添加序号
+        :param output_dir: 该作业的根输出目录，其中将创建 dist/ 与 build/；
+            默认输出至入口脚本所在目录下的 dist/<作业名称>，临时文件位于 `WORKPATH_CACHE` 中
+        :param distpath: 直接指定输出目录（--distpath），临时文件位于 `WORKPATH_CACHE` 中；
+            与 `output_dir` 同时指定时以 `output_dir` 为准
+        :return: 新添加的作业
+        """
+
+        script_path = Path(options[PyInstOpt.script_path]).absolute()
+        base_name = name or options.get(PyInstOpt.out_name) or script_path.stem
+        job_name = self._unique_name(base_name)
+
+        if output_dir is None:
+            distpath = distpath or script_path.parent / "dist" / job_name
+            workpath = WORKPATH_CACHE.path_for(script_path, job_name)
+        else:
+            distpath = Path(output_dir) / "dist"
+            workpath = Path(output_dir) / "build"
+
+        job = PackagingJob(
+            job_name, python_path, options, workpath=workpath, distpath=distpath
+        )
+        self.jobs.append(job)
+        self.job_added.emit(job)
+
+        if self._started:
+            self._start_pending()
+        return job
+
+    def add_matrix_jobs(
+        self, pyenvs: Iterable[PyEnv], options: Mapping[PyInstOpt, Any]
+    ) -> list[PackagingJob]:
+        """以多个 Python 环境分别打包同一任务（矩阵构建），每个环境添加一个作业
+
+        各作业的名称与输出目录名由 `matrix_label()` 生成，如 dist/venv-3.11.7、build/venv-3.11.7
+
+        :param pyenvs: 用于打包的 Python 环境
+        :param options: 打包选项，必须包含有效的入口脚本路径
+        :return: 新添加的作业列表
+        """
+
+        return [
+            self.add_job(pyenv.exe_path, options, name=self.matrix_label(pyenv))
+            for pyenv in pyenvs
+        ]
+
+    @staticmethod
+    def matrix_label(pyenv: PyEnv) -> str:
+        """生成矩阵构建中用于区分各环境的标签，由环境类型与 Python 版本组成
+
+        :param pyenv: Python 环境，若尚未完成内省，则版本显示为 "unknown"，不会触发内省
+        :return: 标签，如 "conda-3.11.7"
+        """
+
+        version = pyenv.pyversion if pyenv.is_probed else "unknown"
+        return f"{pyenv.type.name}-{version}"
+
+    def _unique_name(self, base_name: str) -> str:
+        """生成在队列中唯一的作业名称
+
+        :param base_name: 期望的名称
+        :return: 唯一的名称，如 "app"、"app-2"
+        """
+
+        existing_names = {job.name for job in self.jobs}
+        job_name = base_name
+        index = 2
+        while job_name in existing_names:
+            job_name = f"{base_name}-{index}"
+            index += 1
+        return job_name
+
+    def start(self) -> None:
+        """开始运行队列中的作业"""
+
+        self._started = True
+        self._start_pending()
+        self._check_drained()
+
+    def cancel(self, timeout: int = 2000) -> None:
+        """取消所有尚未开始的作业，并中止正在运行的作业（不阻塞，作业在其子进程退出后结束）
+
+        :param timeout: 超时时间，单位为毫秒，超时后杀死作业子进程及其全部子进程；不大于 0 时立即杀死
+        """
+
+        for job in self.jobs:
+            if job.state == PackagingJob.State.PENDING:
+                job.state = PackagingJob.State.CANCELLED
+                self.job_finished.emit(job)
+
+        for job in [job for job in self.jobs if id(job) in self._running]:
+            job.state = PackagingJob.State.CANCELLED
+            self._running[id(job)].abort_process(timeout)
+
+        self._check_drained()
+
+    def clear_finished(self) -> None:
+        """从队列中移除所有已结束的作业"""
+
+        for job in self.jobs:
+            if job.is_done and job.log is not None:
+                job.log.close()  # 日志文件仍保留在 BUILD_LOGS 中
+                job.log = None
+        self.jobs = [job for job in self.jobs if not job.is_done]
+
+    def _start_pending(self) -> None:
+        """在并发数允许的范围内启动尚未开始的作业"""
+
+        for job in self.jobs:
+            if len(self._running) + len(self._checking) >= self._max_jobs:
+                break
+            if (
+                job.state == PackagingJob.State.PENDING
+                and id(job) not in self._checking
+            ):
+                self._check_job(job)
+
+    def _check_job(self, job: PackagingJob) -> None:
+        """在后台计算作业的指纹，完成后再决定跳过还是启动该作业，见 `_handle_check_done()`
+
+        环境的包列表优先从缓存中获取，未知时（如命令行模式下）由 `BuildChecker` 在后台扫描或内省获取
+
+        :param job: 待启动的作业
+        """
+
+        self._checking.add(id(job))
+        packages = PyEnv(job.python_path).known_installed_packages
+        self._checker.check(
+            job, job.options, job.python_path, packages, job.distpath, job.output_name
+        )
+
+    @QtCore.Slot(object, tuple)
+    def _handle_check_done(
+        self, job: PackagingJob, result: tuple[Optional[str], bool]
+    ) -> None:
+        """作业指纹计算完成，若该输出目录上次成功构建时指纹相同且输出完好，则将作业标记为跳过，否则启动作业
+
+        :param job: 完成检查的作业
+        :param result: (指纹, 能否跳过)
+        """
+
+        self._checking.discard(id(job))
+        job.fingerprint, up_to_date = result
+        if job.state != PackagingJob.State.PENDING:
+            pass  # 检查期间作业已被取消
+        elif self.skip_unchanged and up_to_date:
+            self._skip_job(job)
+        elif self._started:
+            self._start_job(job)
+
+        if self._started:
+            self._start_pending()
+        self._check_drained()
+
+    def _skip_job(self, job: PackagingJob) -> None:
+        """将作业标记为跳过，沿用上次的输出
+
+        :param job: 输入未变化且输出完好的作业
+        """
+
+        job.state = PackagingJob.State.SKIPPED
+        job.start_time = job.end_time = time.monotonic()
+        job.last_message = "Inputs unchanged, reusing previous output."
+        self._measure_output(job)
+        self.job_finished.emit(job)
+
+    def _start_job(self, job: PackagingJob) -> None:
+        """为作业创建独立的子进程并启动
+
+        :param job: 待启动的作业
+        """
+
+        if job.workpath.parent == WORKPATH_CACHE.root:
+            WORKPATH_CACHE.acquire(job.options[PyInstOpt.script_path], job.name)
+            WORKPATH_CACHE.evict_in_background()
+
+        job.log = BUILD_LOGS.new_log(job.name)
+        subprocess = SubProcessTool(job.python_path, parent=self)
+        subprocess.set_encoding(PyEnv(job.python_path).output_encoding)
+        subprocess.set_working_dir(job.working_dir)
+        subprocess.set_arguments(build_subprocess_args(job.pyinstaller_args()))
+        subprocess.output.connect(
+            lambda output, job_=job: self._handle_job_output(job_, output)
+        )
+
+        job.state = PackagingJob.State.RUNNING
+        job.start_time = time.monotonic()
+        self._running[id(job)] = subprocess
+        self.job_started.emit(job)
+
+        # 不阻塞，启动失败时子进程会发出 ERROR 输出，作业随之结束
+        subprocess.start_process(mode=QtCore.QIODeviceBase.OpenModeFlag.ReadOnly)
+
+    def _handle_job_output(
+        self, job: PackagingJob, output: tuple[SubProcessTool.OutputType, str]
+    ) -> None:
+        """处理单个作业子进程的输出
+
+        :param job: 产生输出的作业
+        :param output: 子进程输出，(输出类型, 文本)
+        """
+
+        output_type, output_text = output
+
+        if output_type in (
+            SubProcessTool.OutputType.STDOUT,
+            SubProcessTool.OutputType.STDERR,
+        ):
+            if job.log is not None:
+                job.log.append_text(output_text)
+            lines = output_text.strip().splitlines()
+            if lines:
+                job.last_message = lines[-1]
+
+        self.job_output.emit(job, output)
+
+        if output_type == SubProcessTool.OutputType.FINISHED:
+            self._finish_job(job, int(output_text))
+        elif output_type == SubProcessTool.OutputType.ERROR:
+            job.last_message = output_text
+            if job.log is not None:
+                job.log.append_text(output_text)
+            self._finish_job(job, -1)
+
+    def _finish_job(self, job: PackagingJob, exit_code: int) -> None:
+        """记录作业结果，释放其子进程，并启动下一个作业
+
+        :param job: 已结束的作业
+        :param exit_code: 子进程退出码，无法启动时为 -1
+        """
+
+        subprocess = self._running.pop(id(job), None)
+        if subprocess is None:
+            return  # 已处理过（如出错后又收到结束输出）
+        subprocess.deleteLater()
+        if job.workpath.parent == WORKPATH_CACHE.root:
+            WORKPATH_CACHE.release(job.workpath)
+
+        job.end_time = time.monotonic()
+        job.exit_code = exit_code
+        if job.state != PackagingJob.State.CANCELLED:
+            job.state = (
+                PackagingJob.State.SUCCEEDED
+                if exit_code == 0
+                else PackagingJob.State.FAILED
+            )
+        if job.state == PackagingJob.State.SUCCEEDED:
+            self._measure_output(job)
+            self._recording.add(id(job))
+            self._checker.record(job, job.distpath, job.output_name, job.fingerprint)
+        if job.log is not None:
+            job.log.flush()
+            BUILD_LOGS.rotate()  # 尚未关闭的日志（包括主窗口的）不会被删除
+        self.job_finished.emit(job)
+
+        if self._started:
+            self._start_pending()
+        self._check_drained()
+
+    @QtCore.Slot(object)
+    def _handle_record_done(self, job: PackagingJob) -> None:
+        """作业的成功构建已记录
+
+        :param job: 已记录的作业
+        """
+
+        self._recording.discard(id(job))
+        self._check_drained()
+
+    def _measure_output(self, job: PackagingJob) -> None:
+        """在后台统计作业输出目录的总大小，完成后发射 `job_updated` 信号
+
+        :param job: 成功或被跳过的作业
+        """
+
+        self._measuring.add(id(job))
+        self._checker.measure(job, job.distpath)
+
+    @QtCore.Slot(object, int)
+    def _handle_measure_done(self, job: PackagingJob, size: int) -> None:
+        """作业的输出大小已统计
+
+        :param job: 已统计的作业
+        :param size: 输出目录的总字节数
+        """
+
+        self._measuring.discard(id(job))
+        job.output_size = size
+        self.job_updated.emit(job)
+        self._check_drained()
+
+    def _check_drained(self) -> None:
+        """若所有作业均已结束，且后台的指纹检查、记录与大小统计均已完成，则发射 `drained` 信号"""
+
+        if (
+            not self._started
+            or self._running
+            or self._checking
+            or self._recording
+            or self._measuring
+        ):
+            return
+        if all(job.is_done for job in self.jobs):
+            self._started = False
+            self.drained.emit(list(self.jobs))
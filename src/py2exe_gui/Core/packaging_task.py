@@ -8,6 +8,7 @@
 
 __all__ = ["PackagingTask"]
 
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Any, Optional
 
@@ -31,6 +32,8 @@ class PackagingTask(QtCore.QObject):
     # option_set 实际类型为 tuple[PyInstOpt, Any]
     option_error = QtCore.Signal(PyInstOpt)  # 用户输入选项有误，需要进一步处理
     ready_to_pack = QtCore.Signal(bool)  # 是否已经可以运行该打包任务
+    # 一次性应用了多个选项（如从任务文件导入），实际类型为 dict[PyInstOpt, Any]，包含全部选项
+    options_applied = QtCore.Signal(object)
 
     def __init__(self, parent: Optional[QtCore.QObject] = None) -> None:
         """
@@ -95,3 +98,41 @@ class PackagingTask(QtCore.QObject):
 
         else:
             raise TypeError(f"'{arg_key}' is not a instance of {PyInstOpt}.")
+
+    def apply_options(self, options: Mapping[PyInstOpt, Any]) -> None:
+        """一次性应用多个选项（如从任务文件导入的选项），替换当前所有选项
+
+        与逐个调用 `on_opt_selected()` 不同，无论选项中有多少条目，都只发射一次 `options_applied` 信号，
+        由接收者一次性刷新界面与命令参数。入口脚本或图标无效时发射 `option_error` 信号，该选项视为未设置。
+
+        :param options: 选项字典，未包含的选项视为未设置
+        """
+
+        new_options: dict[PyInstOpt, Any] = {value: None for value in PyInstOpt}
+        new_options.update(options)
+        errors: list[PyInstOpt] = []
+
+        script_path = new_options[PyInstOpt.script_path]
+        if script_path is not None:
+            if FilePathValidator.validate_script(script_path):
+                new_options[PyInstOpt.script_path] = Path(script_path)
+                if not new_options[PyInstOpt.out_name]:
+                    # 输出名默认与脚本名相同
+                    new_options[PyInstOpt.out_name] = Path(script_path).stem
+            else:
+                new_options[PyInstOpt.script_path] = None
+                errors.append(PyInstOpt.script_path)
+
+        icon_path = new_options[PyInstOpt.icon_path]
+        if icon_path is not None:
+            if FilePathValidator.validate_icon(icon_path):
+                new_options[PyInstOpt.icon_path] = Path(icon_path)
+            else:
+                new_options[PyInstOpt.icon_path] = None
+                errors.append(PyInstOpt.icon_path)
+
+        self.using_option = new_options
+        self.ready_to_pack.emit(new_options[PyInstOpt.script_path] is not None)
+        self.options_applied.emit(dict(new_options))
+        for option in errors:
+            self.option_error.emit(option)
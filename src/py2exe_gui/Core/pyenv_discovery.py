@@ -0,0 +1,341 @@
+# Licensed under the GPLv3 License: https://www.gnu.org/licenses/gpl-3.0.html
+# For details: https://github.com/muziing/Py2exe-GUI/blob/main/README.md#license
+
+"""此模块主要包含自动发现本机 Python 环境的类 `PyEnvDiscovery`
+
+`find_interpreter_candidates()` 仅通过文件系统在 PATH（Windows 下还有注册表）、~/.virtualenvs、Poetry 虚拟环境缓存、
+conda 的 envs/ 目录、pyenv 的 versions/ 目录以及入口脚本旁的 .venv 等位置查找可能的解释器；
+`PyEnvDiscovery` 通过 `InterpreterValidator.validate_batch()` 在后台并发验证这些候选项，每验证成功一个即发射信号，
+使界面可以逐步填充，而不必等待全部完成。
+"""
+
+__all__ = [
+    "find_interpreter_candidates",
+    "PyEnvDiscovery",
+]
+
+import os
+import threading
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from PySide6.QtCore import QCoreApplication, QObject, QRunnable, QThreadPool, Signal
+
+from ..Constants import RUNTIME_INFO, Platform
+from ..Utilities import (
+    PyEnv,
+    get_poetry_virtualenvs_dir,
+    get_sys_python_candidates,
+)
+from .validators import InterpreterValidator
+
+
+def _env_pythons(prefix: Path) -> list[Path]:
+    """获取某个环境根目录中的 Python 可执行文件，兼容 venv 与 conda 在各平台上的目录布局
+
+    :param prefix: 环境根目录
+    :return: 存在的可执行文件路径列表（通常至多一项）
+    """
+
+    if RUNTIME_INFO.platform == Platform.windows:
+        candidates = [prefix / "Scripts" / "python.exe", prefix / "python.exe"]
+    else:
+        candidates = [prefix / "bin" / "python3", prefix / "bin" / "python"]
+
+    for candidate in candidates:
+        if candidate.is_file():
+            return [candidate]
+    return []
+
+
+def _subdir_pythons(parent: Path) -> list[Path]:
+    """获取某目录下每个子目录（均视为一个环境根目录）中的 Python 可执行文件
+
+    :param parent: 包含多个环境的目录，如 ~/.virtualenvs、conda 的 envs/
+    :return: 可执行文件路径列表
+    """
+
+    try:
+        subdirs = [entry for entry in parent.iterdir() if entry.is_dir()]
+    except OSError:
+        return []
+
+    pythons: list[Path] = []
+    for subdir in sorted(subdirs):
+        pythons.extend(_env_pythons(subdir))
+    return pythons
+
+
+def _conda_roots() -> list[Path]:
+    """获取常见的 conda 安装根目录
+
+    :return: conda 根目录列表
+    """
+
+    home = Path.home()
+    roots = [
+        home / name for name in ("anaconda3", "miniconda3", "miniforge3", "mambaforge")
+    ]
+    for env_var in ("CONDA_PREFIX", "CONDA_ROOT"):
+        if os.environ.get(env_var):
+            roots.append(Path(os.environ[env_var]))
+    if RUNTIME_INFO.platform == Platform.windows:
+        roots.extend(
+            Path(os.environ.get("PROGRAMDATA", "C:/ProgramData")) / name
+            for name in ("anaconda3", "miniconda3")
+        )
+    return [root for root in roots if (root / "conda-meta").is_dir()]
+
+
+def find_interpreter_candidates(
+    project_dir: Optional[Union[str, Path]] = None,
+) -> list[str]:
+    """仅通过文件系统查找本机上可能的 Python 解释器，不启动任何子进程
+
+    :param project_dir: 项目目录（通常为入口脚本所在目录），将在其中及其上级目录查找 .venv 等虚拟环境
+    :return: 去重后的候选解释器路径列表，尚未经过验证
+    """
+
+    home = Path.home()
+    candidates: list[Path] = []
+
+    # 项目本地虚拟环境
+    if project_dir is not None:
+        project_path = Path(project_dir).absolute()
+        for directory in (project_path, project_path.parent):
+            for name in (".venv", "venv", "env"):
+                if (directory / name / "pyvenv.cfg").is_file():
+                    candidates.extend(_env_pythons(directory / name))
+
+    # PATH 与 Windows 注册表中的系统解释器
+    candidates.extend(Path(exe_path) for exe_path in get_sys_python_candidates())
+
+    # virtualenvwrapper
+    candidates.extend(
+        _subdir_pythons(Path(os.environ.get("WORKON_HOME", home / ".virtualenvs")))
+    )
+
+    # Poetry
+    candidates.extend(_subdir_pythons(get_poetry_virtualenvs_dir()))
+
+    # conda
+    for conda_root in _conda_roots():
+        candidates.extend(_env_pythons(conda_root))
+        candidates.extend(_subdir_pythons(conda_root / "envs"))
+    candidates.extend(_subdir_pythons(home / ".conda" / "envs"))
+
+    # pyenv
+    pyenv_root = Path(os.environ.get("PYENV_ROOT", home / ".pyenv"))
+    candidates.extend(_subdir_pythons(pyenv_root / "versions"))
+    if RUNTIME_INFO.platform == Platform.windows:
+        candidates.extend(_subdir_pythons(pyenv_root / "pyenv-win" / "versions"))
+
+    # 去重：解析目录中的符号链接，但保留可执行文件本身的名称，
+    # 因为虚拟环境中的 python 通常是指向基础解释器的符号链接，完全解析会将其与基础解释器混为一谈
+    unique: dict[str, str] = {}
+    for candidate in candidates:
+        key = os.path.normcase(str(candidate.parent.resolve() / candidate.name))
+        unique.setdefault(key, str(candidate.absolute()))
+    return list(unique.values())
+
+
+class _DiscoverRunnable(QRunnable):
+    """在线程池中批量验证一轮候选解释器的任务"""
+
+    def __init__(
+        self,
+        discovery: "PyEnvDiscovery",
+        exe_paths: list[str],
+        cancel_event: threading.Event,
+    ) -> None:
+        """
+        :param discovery: 发起验证的 PyEnvDiscovery 对象，用于回传结果
+        :param exe_paths: 候选解释器路径
+        :param cancel_event: 取消标志
+        """
+
+        super().__init__()
+
+        self._discovery = discovery
+        self._exe_paths = exe_paths
+        self._cancel_event = cancel_event
+
+    def run(self) -> None:
+        """已有内省缓存的候选项直接上报，其余通过 `InterpreterValidator.validate_batch()` 并发验证，
+        验证时得到的内省结果直接交给 PyEnv，无需再次启动解释器
+        """
+
+        uncached: list[str] = []
+        for exe_path in self._exe_paths:
+            pyenv = PyEnv(exe_path, type_=None)
+            if pyenv.is_probed:
+                self._emit(self._discovery.candidate_done, (exe_path, pyenv))
+            else:
+                uncached.append(exe_path)
+
+        for exe_path, info in InterpreterValidator.validate_batch(
+            uncached,
+            timeout=self._discovery.probe_timeout,
+            cancel_event=self._cancel_event,
+            max_workers=self._discovery.max_thread_count,
+        ):
+            found: Optional[PyEnv] = None
+            if info is not None:
+                found = PyEnv(exe_path, type_=None)
+                try:
+                    found.load_probe_result(
+                        info,
+                        timeout=self._discovery.probe_timeout,
+                        cancel_event=self._cancel_event,
+                    )
+                except RuntimeError:
+                    # 解释器有效，只是未能获取已安装的包（如没有 pip），包列表留待之后按需获取
+                    found.restore_probe_info(info)
+            self._emit(self._discovery.candidate_done, (exe_path, found))
+
+        self._emit(self._discovery.batch_done, None)
+
+    @staticmethod
+    def _emit(signal: Any, value: Any) -> None:
+        """发射信号
+
+        :param signal: PyEnvDiscovery 的信号
+        :param value: 信号参数
+        """
+
+        try:
+            signal.emit(value)
+        except RuntimeError:
+            # 应用程序退出时 PyEnvDiscovery 可能已先于工作线程被销毁
+            pass
+
+
+class PyEnvDiscovery(QObject):
+    """自动发现本机 Python 环境的服务类
+
+    调用 `start()` 后立即返回，候选解释器在后台并发验证，每个候选项都有超时限制；
+    每发现一个有效且不重复的环境即发射 `pyenv_found` 信号，全部验证完成后发射 `finished` 信号。
+    调用 `cancel()` 或应用程序退出时，正在进行的验证会被终止。
+    """
+
+    # 自定义信号
+    pyenv_found = Signal(object)  # 发现新的有效环境，实际类型为 PyEnv
+    finished = Signal()  # 所有轮次的候选项均已验证完成（或已取消）
+    # 内部信号，由工作线程发射，实际类型为 tuple[str, Optional[PyEnv]]
+    candidate_done = Signal(tuple)
+    # 内部信号，由工作线程在一轮验证结束后发射
+    batch_done = Signal(object)
+
+    def __init__(
+        self,
+        parent: Optional[QObject] = None,
+        *,
+        max_thread_count: int = min(8, os.cpu_count() or 2),
+        probe_timeout: float = InterpreterValidator.DEFAULT_TIMEOUT,
+    ) -> None:
+        """
+        :param parent: 父对象
+        :param max_thread_count: 同时验证的最大候选项数
+        :param probe_timeout: 单个候选解释器的验证超时时间，单位为秒
+        """
+
+        super().__init__(parent)
+
+        self.max_thread_count = max_thread_count
+        self.probe_timeout = probe_timeout
+        self._thread_pool = QThreadPool(self)
+        self._cancel_event = threading.Event()
+        self._seen_paths: set[str] = set()  # 已提交验证过的候选路径
+        # 已发现环境的 (真实路径, prefix)
+        self._found_keys: set[tuple[str, str]] = set()
+        self._pending_batches = 0
+
+        self.candidate_done.connect(self._handle_candidate_done)
+        self.batch_done.connect(self._handle_batch_done)
+
+        app = QCoreApplication.instance()
+        if app is not None:
+            # 退出时终止仍在运行的验证子进程，避免拖慢退出
+            app.aboutToQuit.connect(self.cancel)
+
+    @property
+    def is_running(self) -> bool:
+        """是否有正在进行的验证"""
+
+        return self._pending_batches > 0
+
+    @staticmethod
+    def env_key(pyenv: PyEnv) -> tuple[str, str]:
+        """计算用于去重的键：解释器真实路径与环境 prefix 均相同的视为同一环境
+
+        :param pyenv: 已完成内省的 Python 环境
+        :return: (真实路径, prefix)
+        """
+
+        info = pyenv.probe_info
+        executable = info.get("executable") or pyenv.exe_path
+        return (
+            os.path.normcase(os.path.realpath(executable)),
+            os.path.normcase(info.get("prefix", "")),
+        )
+
+    def mark_known(self, pyenv: PyEnv) -> None:
+        """将已有的环境登记为已知，之后发现的相同环境不会再次上报
+
+        :param pyenv: Python 环境
+        """
+
+        self._seen_paths.add(os.path.normcase(pyenv.exe_path))
+        if pyenv.is_probed:
+            self._found_keys.add(self.env_key(pyenv))
+
+    def start(self, project_dir: Optional[Union[str, Path]] = None) -> None:
+        """开始（或追加）一轮环境发现
+
+        :param project_dir: 项目目录，将额外查找其中的 .venv 等项目本地虚拟环境
+        """
+
+        if self._cancel_event.is_set():
+            self._cancel_event = threading.Event()
+
+        exe_paths: list[str] = []
+        for exe_path in find_interpreter_candidates(project_dir):
+            key = os.path.normcase(exe_path)
+            if key in self._seen_paths:
+                continue
+            self._seen_paths.add(key)
+            exe_paths.append(exe_path)
+
+        if exe_paths:
+            self._pending_batches += 1
+            self._thread_pool.start(
+                _DiscoverRunnable(self, exe_paths, self._cancel_event)
+            )
+        elif self._pending_batches == 0:
+            self.finished.emit()
+
+    def cancel(self) -> None:
+        """取消正在进行的验证，已启动的验证子进程会被终止"""
+
+        self._cancel_event.set()
+
+    def _handle_candidate_done(self, result: tuple[str, Optional[PyEnv]]) -> None:
+        """在 GUI 线程中处理单个候选项的验证结果
+
+        :param result: (候选路径, 验证成功的 PyEnv 或 None)
+        """
+
+        _, pyenv = result
+
+        if pyenv is not None:
+            key = self.env_key(pyenv)
+            if key not in self._found_keys:
+                self._found_keys.add(key)
+                self.pyenv_found.emit(pyenv)
+
+    def _handle_batch_done(self, _: Any) -> None:
+        """在 GUI 线程中处理一轮验证结束"""
+
+        self._pending_batches -= 1
+        if self._pending_batches == 0:
+            self.finished.emit()
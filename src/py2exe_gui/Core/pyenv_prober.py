@@ -0,0 +1,155 @@
+# Licensed under the GPLv3 License: https://www.gnu.org/licenses/gpl-3.0.html
+# For details: https://github.com/muziing/Py2exe-GUI/blob/main/README.md#license
+
+"""此模块主要包含在后台线程中探测 Python 环境信息的类 `PyEnvProber`
+
+获取 Python 版本、已安装的包等操作需要运行子进程，若在 GUI 线程中进行会导致界面卡死。
+`PyEnvProber` 将这些操作提交至线程池中执行，完成后通过信号将结果传回 GUI 线程。
+"""
+
+__all__ = ["PyEnvProber"]
+
+from enum import IntEnum
+from typing import Optional
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from ..Utilities import PyEnv
+from .validators import InterpreterValidator
+
+
+class _ProbeRunnable(QRunnable):
+    """在线程池中执行单次探测的任务"""
+
+    def __init__(self, prober: "PyEnvProber", pyenv: PyEnv, kind: int) -> None:
+        """
+        :param prober: 发起探测的 PyEnvProber 对象，用于回传结果
+        :param pyenv: 待探测的 Python 环境
+        :param kind: 探测类型，PyEnvProber.ProbeKind 枚举值
+        """
+
+        super().__init__()
+
+        self._prober = prober
+        self._pyenv = pyenv
+        self._kind = kind
+
+    def run(self) -> None:
+        """在工作线程中访问 PyEnv 的懒加载属性，结果会缓存在 PyEnv 实例中"""
+
+        error = ""
+        try:
+            if not self._pyenv.is_probed:
+                # 尚无内省信息，先在超时限制内运行一次内省，避免挂起的解释器永久占用工作线程
+                self._pyenv.probe(timeout=self._prober.probe_timeout)
+            if self._kind == PyEnvProber.ProbeKind.PYVERSION:
+                _ = self._pyenv.pyversion
+            elif self._kind == PyEnvProber.ProbeKind.PACKAGES:
+                _ = self._pyenv.installed_packages
+        except Exception as e:
+            error = str(e) or repr(e)
+
+        try:
+            self._prober.probe_done.emit((self._pyenv, self._kind, error))
+        except RuntimeError:
+            # 应用程序退出时 PyEnvProber 可能已先于工作线程被销毁，此时结果已无人接收
+            pass
+
+
+class PyEnvProber(QObject):
+    """在后台线程池中探测 Python 环境信息的服务类
+
+    调用 `request_pyversion()` 或 `request_packages()` 后立即返回，不阻塞 GUI 线程；
+    探测完成后发射 `pyversion_ready` 或 `packages_ready` 信号，此时再访问 PyEnv 对应的
+    属性即可直接得到已缓存的结果。对同一环境的重复请求会被合并。
+    """
+
+    class ProbeKind(IntEnum):
+        """枚举值：探测类型"""
+
+        PYVERSION = 1
+        PACKAGES = 2
+
+    # 自定义信号
+    pyversion_ready = Signal(object)  # Python 版本已获取，实际类型为 PyEnv
+    packages_ready = Signal(object)  # 已安装的包列表已获取，实际类型为 PyEnv
+    probe_failed = Signal(object, str)  # 探测失败，(PyEnv, 错误信息)
+    # 内部信号，由工作线程发射，实际类型为 tuple[PyEnv, ProbeKind, str]
+    probe_done = Signal(tuple)
+
+    def __init__(
+        self,
+        parent: Optional[QObject] = None,
+        *,
+        max_thread_count: int = 4,
+        probe_timeout: float = InterpreterValidator.DEFAULT_TIMEOUT,
+    ) -> None:
+        """
+        :param parent: 父对象
+        :param max_thread_count: 同时进行探测的最大线程数
+        :param probe_timeout: 运行内省脚本的超时时间，单位为秒
+        """
+
+        super().__init__(parent)
+
+        self.probe_timeout = probe_timeout
+        self._thread_pool = QThreadPool(self)
+        self._thread_pool.setMaxThreadCount(max_thread_count)
+        # 正在进行中的探测，(id(PyEnv), kind)
+        self._pending: set[tuple[int, int]] = set()
+
+        self.probe_done.connect(self._handle_probe_done)
+
+    def request_pyversion(self, pyenv: PyEnv) -> None:
+        """请求在后台获取 Python 版本
+
+        :param pyenv: Python 环境
+        """
+
+        self._request(pyenv, self.ProbeKind.PYVERSION)
+
+    def request_packages(self, pyenv: PyEnv) -> None:
+        """请求在后台获取已安装的包列表
+
+        :param pyenv: Python 环境
+        """
+
+        self._request(pyenv, self.ProbeKind.PACKAGES)
+
+    def is_pending(self, pyenv: PyEnv) -> bool:
+        """该环境是否有尚未完成的探测
+
+        :param pyenv: Python 环境
+        :return: 是否正在探测
+        """
+
+        return any(key[0] == id(pyenv) for key in self._pending)
+
+    def _request(self, pyenv: PyEnv, kind: "PyEnvProber.ProbeKind") -> None:
+        """提交探测任务至线程池，若相同的探测已在进行中则忽略
+
+        :param pyenv: Python 环境
+        :param kind: 探测类型
+        """
+
+        key = (id(pyenv), kind)
+        if key in self._pending:
+            return
+        self._pending.add(key)
+        self._thread_pool.start(_ProbeRunnable(self, pyenv, kind))
+
+    def _handle_probe_done(self, result: tuple[PyEnv, int, str]) -> None:
+        """在 GUI 线程中处理探测结果，转发为对应的公开信号
+
+        :param result: (PyEnv, 探测类型, 错误信息)，错误信息为空字符串表示探测成功
+        """
+
+        pyenv, kind, error = result
+        self._pending.discard((id(pyenv), kind))
+
+        if error:
+            self.probe_failed.emit(pyenv, error)
+        elif kind == self.ProbeKind.PYVERSION:
+            self.pyversion_ready.emit(pyenv)
+        elif kind == self.ProbeKind.PACKAGES:
+            self.packages_ready.emit(pyenv)
@@ -0,0 +1,150 @@
+# Licensed under the GPLv3 License: https://www.gnu.org/licenses/gpl-3.0.html
+# For details: https://github.com/muziing/Py2exe-GUI/blob/main/README.md#license
+
+"""此模块主要包含监视 Python 环境 site-packages 目录变化的类 `PyEnvWatcher`
+
+用户在 Py2exe-GUI 之外通过 pip 安装或卸载包后，对应 site-packages 目录中的 dist-info 目录会增删。
+`PyEnvWatcher` 使用 `QFileSystemWatcher` 监视这些目录，只读取新增的 dist-info 元数据、移除已删除的条目，
+增量更新 `PyEnv` 中的包列表，而无需重新内省整个环境。
+"""
+
+__all__ = ["PyEnvWatcher"]
+
+import os
+from typing import Optional
+
+from PySide6.QtCore import QFileSystemWatcher, QObject, QTimer, Signal
+
+from ..Utilities import PyEnv
+from ..Utilities.dist_info import is_dist_entry, normalize_pkg_name, read_dist_entry
+
+
+def _list_dist_entries(site_dir: str) -> set[str]:
+    """列出目录中所有的 dist-info/egg-info 条目名称
+
+    :param site_dir: site-packages 目录
+    :return: 条目名称集合，目录无法访问时为空集合
+    """
+
+    try:
+        with os.scandir(site_dir) as it:
+            return {entry.name for entry in it if is_dist_entry(entry.name)}
+    except OSError:
+        return set()
+
+
+def _entry_pkg_key(entry_name: str) -> str:
+    """从 dist-info/egg-info 条目名称中解析出规范化包名
+
+    条目名称形如 "typing_extensions-4.9.0.dist-info"，包名中的 "-" 已被转义为 "_"
+
+    :param entry_name: 条目名称
+    :return: 规范化包名
+    """
+
+    stem = entry_name.rsplit(".", 1)[0]  # 去除 ".dist-info" 或 ".egg-info" 后缀
+    return normalize_pkg_name(stem.split("-", 1)[0])
+
+
+class PyEnvWatcher(QObject):
+    """监视 Python 环境 site-packages 目录，增量刷新已安装的包列表"""
+
+    # 自定义信号，包列表已增量更新，(PyEnv, 新增的包列表, 被移除的包的规范化名称列表)
+    packages_changed = Signal(object, list, list)
+
+    def __init__(self, parent: Optional[QObject] = None, *, delay: int = 500) -> None:
+        """
+        :param parent: 父对象
+        :param delay: 目录变化后等待的时间（毫秒），pip 安装过程中目录会连续变化多次，合并后统一处理
+        """
+
+        super().__init__(parent)
+
+        self._fs_watcher = QFileSystemWatcher(self)
+        # {site-packages 目录: dist-info 条目名称集合}
+        self._snapshots: dict[str, set[str]] = {}
+        # {site-packages 目录: 使用该目录的环境}
+        self._dir_pyenvs: dict[str, list[PyEnv]] = {}
+        self._changed_dirs: set[str] = set()
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay)
+        self._timer.timeout.connect(self._process_changes)
+
+        self._fs_watcher.directoryChanged.connect(self._handle_dir_changed)
+
+    def watch(self, pyenv: PyEnv) -> None:
+        """开始监视该环境的 site-packages 目录，该环境应已完成内省
+
+        :param pyenv: Python 环境
+        """
+
+        for site_dir in pyenv.site_dirs:
+            pyenvs = self._dir_pyenvs.setdefault(site_dir, [])
+            if any(env is pyenv for env in pyenvs):
+                continue
+            pyenvs.append(pyenv)
+
+            if site_dir not in self._snapshots:
+                self._snapshots[site_dir] = _list_dist_entries(site_dir)
+                self._fs_watcher.addPath(site_dir)
+
+    def _handle_dir_changed(self, site_dir: str) -> None:
+        """目录发生变化的槽函数，记录下来并（重新）开始计时
+
+        :param site_dir: 发生变化的目录
+        """
+
+        self._changed_dirs.add(site_dir)
+        self._timer.start()
+
+    def _process_changes(self) -> None:
+        """对比各变化目录的新旧快照，只读取新增的条目，并更新相关环境的包列表"""
+
+        changed_dirs, self._changed_dirs = self._changed_dirs, set()
+
+        # 先更新全部变化目录的快照，再判断被移除的包是否仍由同一环境的其他目录提供
+        changes: dict[str, tuple[list[dict], set[str]]] = {}
+        for site_dir in changed_dirs:
+            # 目录被删除后重建时 QFileSystemWatcher 会停止监视，需要重新添加
+            if site_dir not in self._fs_watcher.directories() and os.path.isdir(
+                site_dir
+            ):
+                self._fs_watcher.addPath(site_dir)
+
+            old_entries = self._snapshots.get(site_dir, set())
+            new_entries = _list_dist_entries(site_dir)
+            self._snapshots[site_dir] = new_entries
+
+            removed = {_entry_pkg_key(name) for name in old_entries - new_entries}
+            added = []
+            for entry_name in new_entries - old_entries:
+                pkg = read_dist_entry(site_dir, entry_name)
+                if pkg is not None:
+                    added.append(pkg)
+
+            if removed or added:
+                changes[site_dir] = (added, removed)
+
+        for site_dir, (added, removed) in changes.items():
+            for pyenv in self._dir_pyenvs.get(site_dir, []):
+                pyenv_removed = sorted(removed - self._provided_keys(pyenv, site_dir))
+                if not added and not pyenv_removed:
+                    continue
+                pyenv.update_packages(added, pyenv_removed)
+                self.packages_changed.emit(pyenv, added, pyenv_removed)
+
+    def _provided_keys(self, pyenv: PyEnv, excluded_dir: str) -> set[str]:
+        """获取该环境中除某目录以外、其他受监视的 site-packages 目录仍提供的包
+
+        :param pyenv: Python 环境
+        :param excluded_dir: 排除的目录
+        :return: 规范化包名集合
+        """
+
+        keys: set[str] = set()
+        for site_dir in pyenv.site_dirs:
+            if site_dir != excluded_dir and site_dir in self._snapshots:
+                keys.update(_entry_pkg_key(name) for name in self._snapshots[site_dir])
+        return keys
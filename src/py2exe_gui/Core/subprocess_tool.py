@@ -3,20 +3,40 @@
 
 """此模块包含辅助 QProcess 使用的工具类 `SubProcessTool`
 
+子进程的标准输出/标准错误不会每读到一块就发射一次信号，而是先合并进有界的待发送队列，
+每隔 `FLUSH_INTERVAL` 毫秒（或积累超过 `FLUSH_SIZE` 个字符时）统一发射，使界面在输出极多时也不至于跟不上子进程。
+待发送的输出超过 `MAX_PENDING` 个字符时按整行丢弃最早的部分，并在下次发射时以一行提示说明丢弃了多少字符。
+两个输出流各有一个增量解码器，跨数据块的多字节字符能被正确解码，且只发出完整的行（末尾不完整的行留待下次或进程结束时发出）。
+
+子进程的启动与中止完全由信号与定时器驱动，不调用任何 `waitFor*()` 阻塞界面：
+IDLE → STARTING → RUNNING →（中止时）TERMINATING → FINISHED 或 KILLED，每次状态变化都发射 `state_changed` 信号。
+非 Windows 平台下子进程在新会话中运行，中止时结束整个进程组，包括 PyInstaller 启动的孙进程。
+
 待考量：是否有必要使用此类，还是仅需使用其他技巧创建单例QProcess、自行处理信号
 """
 
 __all__ = ["SubProcessTool"]
 
+import codecs
+import locale
 from collections.abc import Sequence
 from enum import IntEnum
 from pathlib import Path
 from typing import Optional, Union
 from warnings import warn
 
-from PySide6.QtCore import QIODeviceBase, QObject, QProcess, Signal
+from PySide6.QtCore import (
+    QByteArray,
+    QElapsedTimer,
+    QIODeviceBase,
+    QObject,
+    QProcess,
+    QTimer,
+    Signal,
+)
 
-from ..Utilities.open_qfile import qba_to_str
+from ..Constants import RUNTIME_INFO, Platform
+from ..Utilities import signal_process_tree
 
 
 class SubProcessTool(QObject):
@@ -24,6 +44,12 @@ class SubProcessTool(QObject):
 
     # 自定义信号，类型为 tuple[SubProcessTool.OutputType, str]
     output = Signal(tuple)
+    # 子进程生命周期状态变化信号，类型为 SubProcessTool.ProcessState
+    state_changed = Signal(object)
+
+    FLUSH_INTERVAL = 50  # 两次发射输出之间的最短间隔，单位为毫秒
+    FLUSH_SIZE = 64 * 1024  # 待发送的输出超过此字符数时，不必等到定时器触发即可发射
+    MAX_PENDING = 4 * 1024 * 1024  # 待发送的输出字符数上限，超出时丢弃最早的输出
 
     # output_types
     class OutputType(IntEnum):
@@ -36,6 +62,16 @@ class SubProcessTool(QObject):
         FINISHED = 5
         ERROR = 6
 
+    class ProcessState(IntEnum):
+        """枚举值：子进程生命周期状态"""
+
+        IDLE = 0  # 尚未启动
+        STARTING = 1  # 已请求启动，等待操作系统创建进程
+        RUNNING = 2
+        TERMINATING = 3  # 已请求中止，等待子进程自行退出，超时后杀死
+        FINISHED = 4  # 已退出（包括中止请求后自行退出）或无法启动
+        KILLED = 5  # 超时未退出，已被杀死
+
     def __init__(
         self,
         program: str,
@@ -59,6 +95,32 @@ class SubProcessTool(QObject):
         self._process: Optional[QProcess] = None
         self.exit_code: int = 0
         self.exit_status: QProcess.ExitStatus = QProcess.ExitStatus.NormalExit
+        self._state = self.ProcessState.IDLE
+        self._pid: Optional[int] = None  # 子进程 ID，在新会话中运行时也是其进程组 ID
+        self._new_session = False  # 子进程是否在新会话中运行（可以结束整个进程组）
+
+        # 中止子进程时，超时仍未退出则杀死
+        self._kill_timer = QTimer(self)
+        self._kill_timer.setSingleShot(True)
+        self._kill_timer.timeout.connect(self._kill_process)
+
+        # 子进程输出的编码，及每个输出流的增量解码器与尚不完整的最后一行
+        self.encoding: str = locale.getpreferredencoding(False)
+        self._decoders: dict[SubProcessTool.OutputType, codecs.IncrementalDecoder] = {}
+        self._partial_lines: dict[SubProcessTool.OutputType, str] = {}
+        self._reset_decoders()
+
+        # 待发送的输出队列，相邻的同类型输出合并为一项
+        self._pending: list[list] = []  # [[输出类型, [文本块, ...]], ...]
+        self._pending_size = 0  # 待发送的总字符数
+        self._dropped_since_flush = 0  # 上次发射以来因超出上限而丢弃的字符数
+        # 背压统计，每次启动子进程时清零
+        self.merged_chunks = 0  # 被合并进同一次发射的输出块数
+        self.dropped_chars = 0  # 因超出上限而丢弃的字符数
+        self._last_flush = QElapsedTimer()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self.flush_output)
 
     def _connect_signals(self) -> None:
         """连接信号"""
@@ -70,47 +132,108 @@ class SubProcessTool(QObject):
         self._process.finished.connect(self._process_finished)  # type: ignore
         self._process.errorOccurred.connect(self._handle_error)  # type: ignore
 
+    @property
+    def process_state(self) -> "SubProcessTool.ProcessState":
+        """子进程当前的生命周期状态"""
+
+        return self._state
+
+    def set_state(self, state: "SubProcessTool.ProcessState") -> None:
+        """更新生命周期状态并发射 `state_changed` 信号；进入 TERMINATING、KILLED 时还会发出一条 STATE 输出。
+        `WarmWorker` 等代替 QProcess 运行作业的对象也通过此方法更新状态
+
+        :param state: 新状态
+        """
+
+        if state == self._state:
+            return
+        self._state = state
+        self.state_changed.emit(state)
+        state_texts = {
+            self.ProcessState.TERMINATING: "The process is terminating...",
+            self.ProcessState.KILLED: "The process has been killed.",
+        }
+        if state in state_texts:
+            self.forward_output(self.OutputType.STATE, state_texts[state])
+
     def start_process(
         self,
         *,
         mode: QIODeviceBase.OpenModeFlag = QIODeviceBase.OpenModeFlag.ReadWrite,
-        time_out: int = 1000,
     ) -> bool:
-        """创建并启动子进程，有阻塞
+        """创建并启动子进程，不阻塞。启动成功与否随后经由 `output` 信号的 STARTED 或 ERROR 输出得知
 
         :param mode: 设备打开的模式
-        :param time_out: 启动进程超时时间（单位为毫秒）
-        :return: 是否成功启动
+        :return: 是否已发起启动；上一个子进程尚未结束时返回 False
         """
 
-        if self._process is None:  # 防止在子进程运行结束前重复启动
-            self._process = QProcess(self)
-            self._connect_signals()
-            self._process.setWorkingDirectory(self._working_directory)
-            self._process.start(self.program, self._arguments, mode)
-            return self._process.waitForStarted(
-                time_out
-            )  # 阻塞，直到成功启动子进程或超时
-        return False
+        if self._process is not None:  # 防止在子进程运行结束前重复启动
+            return False
 
-    def abort_process(self, timeout: int = 5000) -> bool:
-        """尝试中止子进程，超时后杀死子进程。若子进程没有运行，则什么都不做。
+        self.merged_chunks = 0
+        self.dropped_chars = 0
+        self._reset_decoders()
+        self._pid = None
+        self._process = QProcess(self)
+        self._connect_signals()
+        self._process.setWorkingDirectory(self._working_directory)
+
+        # 在新会话中运行子进程，使其 ID 同时是进程组 ID，以便中止时结束整个进程树。
+        # QProcess.setUnixProcessParameters() 自 Qt 6.6 起提供，更早的版本只能结束子进程本身
+        self._new_session = RUNTIME_INFO.platform != Platform.windows and hasattr(
+            self._process, "setUnixProcessParameters"
+        )
+        if self._new_session:
+            self._process.setUnixProcessParameters(
+                QProcess.UnixProcessFlag.CreateNewSession
+            )
+
+        self.set_state(self.ProcessState.STARTING)
+        self._process.start(self.program, self._arguments, mode)
+        return True
+
+    def abort_process(self, timeout: int = 5000) -> None:
+        """请求中止子进程（及其全部子进程），超时仍未退出则杀死，不阻塞。
+        子进程未运行或已在中止过程中时什么也不做；子进程结束后同样会发出 FINISHED 输出
+
+        :param timeout: 超时时间，单位为毫秒，不大于 0 时立即杀死
+        """
+
+        if self._process is None or self._state in (
+            self.ProcessState.TERMINATING,
+            self.ProcessState.KILLED,
+        ):
+            return
+
+        self._pid = self._process.processId() or self._pid
+        self.set_state(self.ProcessState.TERMINATING)
+        if timeout <= 0:
+            self._kill_process()
+        else:
+            self._signal_process(force=False)
+            self._kill_timer.start(timeout)
+
+    def _kill_process(self) -> None:
+        """中止超时（或要求立即杀死），强制杀死子进程及其全部子进程"""
+
+        if self._process is not None:
+            self._signal_process(force=True)
+            self.set_state(self.ProcessState.KILLED)
 
-        :param timeout: 超时时间，单位为毫秒
-        :return: 子进程是否已结束
+    def _signal_process(self, force: bool) -> None:
+        """请求结束或强制杀死子进程；能够得知其进程树时结束整个进程树
+
+        :param force: 是否强制杀死
         """
 
-        if self._process:
-            self._process.terminate()
-            is_finished = self._process.waitForFinished(
-                timeout
-            )  # 阻塞，直到进程终止或超时
-            if not is_finished:
-                self._process.kill()  # 超时后杀死子进程
-            return is_finished
+        if self._pid is not None and (
+            self._new_session or RUNTIME_INFO.platform == Platform.windows
+        ):
+            signal_process_tree(self._pid, force=force)
+        elif force:
+            self._process.kill()  # type: ignore
         else:
-            # 如果子进程没有运行，则认为已结束
-            return True
+            self._process.terminate()  # type: ignore
 
     def set_program(self, program: str) -> None:
         """设置子进程程序
@@ -120,6 +243,17 @@ class SubProcessTool(QObject):
 
         self.program = program
 
+    def set_encoding(self, encoding: str) -> None:
+        """设置子进程输出的编码，从下一次启动子进程时起生效
+
+        :param encoding: 编码名称，如 "utf-8"、"gbk"；未知的编码将被忽略并给出警告
+        """
+
+        try:
+            self.encoding = codecs.lookup(encoding).name
+        except LookupError:
+            warn(f"Unknown output encoding: {encoding}", RuntimeWarning, stacklevel=2)
+
     def set_arguments(self, arguments: Sequence[str]) -> None:
         """设置子进程参数
 
@@ -142,10 +276,134 @@ class SubProcessTool(QObject):
         else:
             return False
 
+    def _reset_decoders(self) -> None:
+        """为标准输出与标准错误重新创建增量解码器，丢弃尚不完整的行"""
+
+        decoder_class = codecs.getincrementaldecoder(self.encoding)
+        for output_type in (self.OutputType.STDOUT, self.OutputType.STDERR):
+            # 无法解码的字节以替换字符表示，而不是中断输出
+            self._decoders[output_type] = decoder_class(errors="replace")
+            self._partial_lines[output_type] = ""
+
+    def feed_output_bytes(
+        self,
+        output_type: "SubProcessTool.OutputType",
+        data: Union[bytes, QByteArray, memoryview],
+    ) -> None:
+        """解码子进程某个输出流的一块原始数据，将其中完整的行经由 `forward_output()` 发出
+
+        :param output_type: 输出类型，STDOUT 或 STDERR
+        :param data: 原始数据，可为 bytes、QByteArray 或 memoryview 等支持缓冲区协议的对象
+        """
+
+        # 直接在缓冲区上解码，不先复制为 bytes
+        text = self._partial_lines[output_type] + self._decoders[output_type].decode(
+            memoryview(data)
+        )
+        line_end = text.rfind("\n") + 1
+        self._partial_lines[output_type] = text[line_end:]
+        if line_end:
+            self.forward_output(output_type, text[:line_end].replace("\r\n", "\n"))
+
+    def finish_output_streams(self) -> None:
+        """输出流已结束，解码剩余的字节并发出尚不完整的最后一行，随后重置解码器"""
+
+        for output_type, decoder in self._decoders.items():
+            text = self._partial_lines[output_type] + decoder.decode(b"", final=True)
+            if text:
+                self.forward_output(output_type, text.replace("\r\n", "\n"))
+        self._reset_decoders()
+
+    def forward_output(
+        self, output_type: "SubProcessTool.OutputType", output_text: str
+    ) -> None:
+        """发出一条输出。标准输出/标准错误进入待发送队列，合并后定时发射；
+        其他类型的输出会先发射所有待发送的输出再立即发射，以保持先后顺序。
+        `WarmWorker` 等代替 QProcess 运行作业的对象也通过此方法转发输出
+
+        :param output_type: 输出类型
+        :param output_text: 文本
+        """
+
+        if output_type not in (self.OutputType.STDOUT, self.OutputType.STDERR):
+            self.flush_output()
+            self.output.emit((output_type, output_text))
+            return
+        if not output_text:
+            return
+
+        if self._pending and self._pending[-1][0] == output_type:
+            self._pending[-1][1].append(output_text)
+            self.merged_chunks += 1
+        else:
+            self._pending.append([output_type, [output_text]])
+        self._pending_size += len(output_text)
+
+        if self._pending_size > self.MAX_PENDING:
+            self._drop_oldest(self._pending_size - self.MAX_PENDING)
+
+        if self._pending_size >= self.FLUSH_SIZE:
+            self.flush_output()
+            return
+
+        if not self._last_flush.isValid():
+            self._last_flush.start()
+        if not self._flush_timer.isActive():
+            elapsed = self._last_flush.elapsed()
+            self._flush_timer.start(max(0, self.FLUSH_INTERVAL - elapsed))
+
+    def _drop_oldest(self, count: int) -> None:
+        """从待发送队列的最早处丢弃输出（保留最新的输出，其中更可能包含错误信息）。
+        只丢弃整行，因此实际丢弃的字符数可能略多于 `count`；丢弃的字符数会在下次发射时以一行提示说明
+
+        :param count: 至少需要丢弃的字符数
+        """
+
+        dropped = 0
+        while dropped < count and self._pending:
+            chunks = self._pending[0][1]
+            chunk = chunks[0]
+            # 在第一个满足数量要求的换行符处截断，找不到换行符时丢弃整块
+            cut = chunk.find("\n", count - dropped - 1) + 1 or len(chunk)
+            if cut >= len(chunk):
+                chunks.pop(0)
+                if not chunks:
+                    self._pending.pop(0)
+            else:
+                chunks[0] = chunk[cut:]
+            dropped += cut
+
+        self.dropped_chars += dropped
+        self._dropped_since_flush += dropped
+        self._pending_size -= dropped
+
+    def flush_output(self) -> None:
+        """立即发射所有待发送的输出，每段连续的同类型输出发射一次"""
+
+        self._flush_timer.stop()
+        self._last_flush.start()
+        pending, self._pending, self._pending_size = self._pending, [], 0
+        if self._dropped_since_flush:
+            # 待发送的输出可能已被整体丢弃，此时提示行单独发射
+            marker = (
+                f"[{self._dropped_since_flush} characters of output were dropped]\n"
+            )
+            if pending:
+                pending[0][1].insert(0, marker)
+            else:
+                self.output.emit((self.OutputType.STDOUT, marker))
+            self._dropped_since_flush = 0
+        for output_type, chunks in pending:
+            self.output.emit((output_type, "".join(chunks)))
+
     def _process_started(self) -> None:
         """处理子进程开始的槽"""
 
-        self.output.emit((self.OutputType.STARTED, "started"))
+        if self._process is not None:
+            self._pid = self._process.processId() or None
+        if self._state == self.ProcessState.STARTING:  # 启动完成前可能已请求中止
+            self.set_state(self.ProcessState.RUNNING)
+        self.forward_output(self.OutputType.STARTED, "started")
 
     def _process_finished(self, code: int, status: QProcess.ExitStatus) -> None:
         """处理子进程结束的槽
@@ -154,26 +412,38 @@ class SubProcessTool(QObject):
         :param status: 退出状态
         """
 
+        self._handle_stdout()  # 确保全部输出都先于结束信息发出
+        self._handle_stderr()
+        self.finish_output_streams()
         self.exit_code = code
         self.exit_status = status
-        self.output.emit((self.OutputType.FINISHED, str(code)))
+        self._kill_timer.stop()
+        if (
+            self._state == self.ProcessState.TERMINATING
+            and self._new_session
+            and self._pid is not None
+        ):
+            # 子进程本身已退出，但其启动的孙进程可能仍在运行
+            signal_process_tree(self._pid, force=True)
         self._process = None
+        self._pid = None
+        if self._state != self.ProcessState.KILLED:
+            self.set_state(self.ProcessState.FINISHED)
+        self.forward_output(self.OutputType.FINISHED, str(code))
 
     def _handle_stdout(self) -> None:
         """处理标准输出的槽"""
 
         if self._process:
             data = self._process.readAllStandardOutput()
-            stdout = qba_to_str(data)
-            self.output.emit((self.OutputType.STDOUT, stdout))
+            self.feed_output_bytes(self.OutputType.STDOUT, data)
 
     def _handle_stderr(self) -> None:
         """处理标准错误的槽"""
 
         if self._process:
             data = self._process.readAllStandardError()
-            stderr = qba_to_str(data)
-            self.output.emit((self.OutputType.STDERR, stderr))
+            self.feed_output_bytes(self.OutputType.STDERR, data)
 
     def _handle_state(self, state: QProcess.ProcessState) -> None:
         """将子进程运行状态转换为易读形式
@@ -186,8 +456,13 @@ class SubProcessTool(QObject):
             QProcess.ProcessState.Starting: "The process is starting...",
             QProcess.ProcessState.Running: "The process is running...",
         }
+        if (
+            state == QProcess.ProcessState.Running
+            and self._state == self.ProcessState.TERMINATING
+        ):
+            return  # 启动完成前已请求中止，保留“正在中止”的状态提示
         state_name = states[state]
-        self.output.emit((self.OutputType.STATE, state_name))
+        self.forward_output(self.OutputType.STATE, state_name)
 
     def _handle_error(self, error: QProcess.ProcessError) -> None:
         """处理子进程错误
@@ -205,8 +480,17 @@ class SubProcessTool(QObject):
         }
         error_type = process_error[error]
 
-        if self._process:
+        if error == QProcess.ProcessError.Crashed and self._state in (
+            self.ProcessState.TERMINATING,
+            self.ProcessState.KILLED,
+        ):
+            return  # 由中止请求导致的“崩溃”，随后的 FINISHED 输出即可说明结果
+
+        if error == QProcess.ProcessError.FailedToStart:
+            # 无法启动时不会再收到 finished 信号，在此结束生命周期
+            self._process = None
+            self.set_state(self.ProcessState.FINISHED)
+        elif error != QProcess.ProcessError.Crashed:
             self.abort_process(0)
-        self.output.emit((self.OutputType.ERROR, error_type))
+        self.forward_output(self.OutputType.ERROR, error_type)
         warn(error_type, category=RuntimeWarning, stacklevel=3)
-        self._process = None
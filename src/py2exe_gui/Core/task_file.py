@@ -0,0 +1,263 @@
+# Licensed under the GPLv3 License: https://www.gnu.org/licenses/gpl-3.0.html
+# For details: https://github.com/muziing/Py2exe-GUI/blob/main/README.md#license
+
+"""此模块主要包含读取与保存打包任务文件的函数 `load_task_file()`、`dump_task_file()`
+
+任务文件可为 YAML 或 JSON 格式（以扩展名 .json 区分），描述一个或多个打包任务，结构形如：
+
+    python: /path/to/python3  # 可选，默认使用系统 Python
+    options:
+      script_path: app.py  # 相对路径（包括 add_data 等的源路径）以任务文件所在目录为基准
+      out_name: app
+      FD: --onefile
+      add_data: [[assets, assets]]
+      hidden_import: [pkg_resources]
+
+或者以 `tasks` 键包含多个上述结构的列表。`options` 中的键为 `PyInstOpt` 成员名，值与
+`PackagingTask.using_option` 中保存的值相同。
+
+--add-data/--add-binary 的条目可能多达数万个，读取时直接从文件流解析，源路径保持为字符串，需要时再转换为 Path。
+"""
+
+__all__ = [
+    "TaskFileError",
+    "options_from_data",
+    "options_to_data",
+    "load_task_file",
+    "dump_task_file",
+]
+
+import json
+import os
+import shutil
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import yaml
+
+from ..Constants import PyInstOpt
+
+# 值为路径的选项
+_PATH_OPTIONS = (PyInstOpt.script_path, PyInstOpt.icon_path)
+# 值为 (源路径, 目标路径) 列表的选项
+_PAIR_LIST_OPTIONS = (PyInstOpt.add_data, PyInstOpt.add_binary)
+
+
+class TaskFileError(ValueError):
+    """任务文件无法读取或格式有误"""
+
+
+def _absolute_path(value: Any, base_dir: Optional[str]) -> str:
+    """将任务文件中的路径转换为绝对路径字符串，相对路径以基准目录为起点
+
+    条目可能多达数万个，全程以字符串处理，不创建 Path 对象
+
+    :param value: 路径
+    :param base_dir: 基准目录，为 None 时保留相对路径
+    :return: 路径字符串
+    """
+
+    path = str(value)
+    if base_dir is not None and not os.path.isabs(path):
+        path = os.path.normpath(os.path.join(base_dir, path))
+    return path
+
+
+def options_from_data(
+    data: dict[str, Any], base_dir: Optional[Path] = None
+) -> dict[PyInstOpt, Any]:
+    """将任务文件中的选项字典转换为 `PackagingTask.using_option` 格式的选项字典
+
+    :param data: 选项字典，键为 `PyInstOpt` 成员名
+    :param base_dir: 相对路径的基准目录，为 None 时保留相对路径
+    :return: 选项字典，未出现的选项值为 None
+    :raise TaskFileError: 选项名未知或选项值类型有误时抛出
+    """
+
+    options: dict[PyInstOpt, Any] = {option: None for option in PyInstOpt}
+    base = None if base_dir is None else str(base_dir)
+
+    for key, value in data.items():
+        try:
+            option = PyInstOpt[key]
+        except KeyError:
+            raise TaskFileError(f"Unknown option: {key!r}") from None
+
+        if value is None:
+            continue
+        if option in _PATH_OPTIONS:
+            options[option] = Path(_absolute_path(value, base))
+        elif option in _PAIR_LIST_OPTIONS:
+            try:
+                # 源路径保持为字符串，条目很多时避免逐个创建 Path 对象
+                options[option] = [
+                    (_absolute_path(src, base), str(dest)) for src, dest in value
+                ]
+            except (TypeError, ValueError):
+                raise TaskFileError(
+                    f"Option {key!r} must be a list of [source, destination] pairs"
+                ) from None
+        elif option == PyInstOpt.hidden_import:
+            if not isinstance(value, list):
+                raise TaskFileError(f"Option {key!r} must be a list")
+            options[option] = [str(item) for item in value]
+        else:
+            options[option] = str(value)
+
+    return options
+
+
+def _relative_path(path: Path, base_dir: Optional[Path]) -> str:
+    """若路径位于基准目录中，则转换为相对路径，使任务文件可以随项目一同移动
+
+    :param path: 路径
+    :param base_dir: 基准目录，为 None 时不转换
+    :return: 路径字符串，统一使用 / 作为分隔符
+    """
+
+    if base_dir is not None:
+        try:
+            return Path(path).absolute().relative_to(base_dir).as_posix()
+        except ValueError:
+            pass
+    return Path(path).as_posix()
+
+
+def options_to_data(
+    options: Mapping[PyInstOpt, Any], base_dir: Optional[Path] = None
+) -> dict[str, Any]:
+    """将 `PackagingTask.using_option` 格式的选项字典转换为可写入任务文件的字典，是 `options_from_data()` 的逆操作
+
+    :param options: 选项字典
+    :param base_dir: 任务文件所在目录，位于其中的入口脚本与图标路径将保存为相对路径
+    :return: 键为 `PyInstOpt` 成员名的字典，值为空的选项会被省略
+    """
+
+    data: dict[str, Any] = {}
+    for option, value in options.items():
+        if value is None or value == "" or value == []:
+            continue
+        if option in _PATH_OPTIONS:
+            data[option.name] = _relative_path(value, base_dir)
+        elif option in _PAIR_LIST_OPTIONS:
+            data[option.name] = [
+                [_relative_path(src, base_dir), str(dest)] for src, dest in value
+            ]
+        elif option == PyInstOpt.hidden_import:
+            data[option.name] = list(value)
+        else:
+            data[option.name] = str(value)
+    return data
+
+
+def _load_data(task_file: Path) -> Any:
+    """读取任务文件中的原始数据
+
+    :param task_file: 任务文件路径
+    :return: 解析得到的数据
+    :raise TaskFileError: 无法读取或解析时抛出
+    """
+
+    try:
+        # 直接从文件流解析，不先将整个文件读入字符串
+        with open(task_file, encoding="utf-8") as f:
+            if task_file.suffix.lower() == ".json":
+                return json.load(f)
+            try:
+                # 优先使用性能更高的 CLoader 进行解析
+                loader = yaml.CSafeLoader
+            except AttributeError:
+                # 如果没有可用的 C 扩展，则使用纯 Python 解析
+                loader = yaml.SafeLoader
+            return yaml.load(f, Loader=loader)
+    except OSError as e:
+        raise TaskFileError(f"Cannot read task file {task_file}: {e}") from e
+    except (ValueError, yaml.YAMLError) as e:
+        raise TaskFileError(f"Cannot parse task file {task_file}: {e}") from e
+
+
+def _resolve_python(python: Optional[str], base_dir: Path) -> Optional[str]:
+    """解析任务文件中指定的 Python 解释器
+
+    :param python: 解释器路径或命令名（如 "python3.11"），None 表示未指定
+    :param base_dir: 相对路径的基准目录
+    :return: 解释器路径，未指定时为 None
+    :raise TaskFileError: 命令名在 PATH 中找不到时抛出
+    """
+
+    if python is None:
+        return None
+    if os.sep in python or (os.altsep and os.altsep in python):
+        return os.path.normpath(Path(base_dir, python))
+    python_path = shutil.which(python)
+    if python_path is None:
+        raise TaskFileError(f"Python interpreter not found in PATH: {python!r}")
+    return python_path
+
+
+def load_task_file(
+    task_file: Union[str, Path],
+) -> list[tuple[Optional[str], dict[PyInstOpt, Any]]]:
+    """读取任务文件
+
+    :param task_file: 任务文件路径，扩展名为 .json 时按 JSON 解析，否则按 YAML 解析
+    :return: 任务列表，每项为 (Python 解释器路径, 选项字典)，未指定解释器时为 None
+    :raise TaskFileError: 任务文件无法读取或格式有误时抛出
+    """
+
+    task_file = Path(task_file).absolute()
+    data = _load_data(task_file)
+
+    if not isinstance(data, dict):
+        raise TaskFileError("Task file must contain a mapping")
+    task_list = data["tasks"] if "tasks" in data else [data]
+    if not isinstance(task_list, list) or not task_list:
+        raise TaskFileError("'tasks' must be a non-empty list")
+
+    tasks: list[tuple[Optional[str], dict[PyInstOpt, Any]]] = []
+    for task_data in task_list:
+        if not isinstance(task_data, dict) or not isinstance(
+            task_data.get("options"), dict
+        ):
+            raise TaskFileError("Each task must contain an 'options' mapping")
+
+        options = options_from_data(task_data["options"], task_file.parent)
+        if options[PyInstOpt.script_path] is None:
+            raise TaskFileError("Each task must specify 'script_path'")
+
+        tasks.append(
+            (_resolve_python(task_data.get("python"), task_file.parent), options)
+        )
+
+    return tasks
+
+
+def dump_task_file(
+    task_file: Union[str, Path],
+    python_path: Optional[str],
+    options: Mapping[PyInstOpt, Any],
+) -> None:
+    """将一个打包任务保存为任务文件
+
+    :param task_file: 任务文件路径，扩展名为 .json 时保存为 JSON，否则保存为 YAML
+    :param python_path: 打包所用的 Python 解释器路径，为 None 时不保存
+    :param options: 选项字典，如 `PackagingTask.using_option`
+    :raise OSError: 写入失败时抛出
+    """
+
+    task_file = Path(task_file).absolute()
+    data: dict[str, Any] = {}
+    if python_path is not None:
+        data["python"] = python_path
+    data["options"] = options_to_data(options, task_file.parent)
+
+    with open(task_file, "w", encoding="utf-8") as f:
+        if task_file.suffix.lower() == ".json":
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            return
+        try:
+            dumper = yaml.CSafeDumper
+        except AttributeError:
+            dumper = yaml.SafeDumper
+        yaml.dump(data, f, Dumper=dumper, allow_unicode=True, sort_keys=False)
@@ -6,6 +6,7 @@
 `FilePathValidator.validate_script()` 用于验证用户给定的路径是否为有效的 Python 脚本；
 `FilePathValidator.validate_icon()` 用于验证用户给定的图标文件是否有效；
 `InterpreterValidator.validate()` 用于验证用户给定的路径是否为有效的 Python 解释器可执行文件；
+`InterpreterValidator.validate_batch()` 用于在后台并发验证大量候选解释器；
 """
 
 __all__ = [
@@ -14,13 +15,18 @@ __all__ = [
 ]
 
 import os
-import subprocess
-import warnings
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from importlib import util as importlib_util
 from pathlib import Path
-from typing import Union
+from typing import Any, Optional, Union
 
 from ..Constants import RUNTIME_INFO, Platform
+from ..Utilities import probe_interpreter
+
+# 批量验证时检查取消标志的时间间隔，单位为秒
+_BATCH_POLL_INTERVAL = 0.1
 
 
 class FilePathValidator:
@@ -80,33 +86,111 @@ class FilePathValidator:
 
 
 class InterpreterValidator:
-    """验证给定的可执行文件是否为有效的Python解释器"""
+    """验证给定的可执行文件是否为有效的Python解释器
+
+    验证方式为在其中运行一次内省脚本，内省结果可直接交给 `PyEnv.load_probe_result()`，
+    使验证与获取环境信息只需启动一次解释器
+    """
+
+    # 单个解释器的默认验证超时时间，单位为秒，避免已挂起或位于网络驱动器上的解释器导致无限等待
+    DEFAULT_TIMEOUT = 15
 
     @classmethod
-    def validate(cls, itp_path: Union[str, Path, os.PathLike[str]]) -> bool:
+    def validate(
+        cls,
+        itp_path: Union[str, Path, os.PathLike[str]],
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
+    ) -> bool:
         """验证 `path` 是否指向有效的Python解释器
 
         :param itp_path: 文件路径
+        :param timeout: 超时时间，单位为秒，None 表示不限制
         :return: 是否有效
         """
 
+        return cls.probe(itp_path, timeout) is not None
+
+    @classmethod
+    def validate_file(cls, itp_path: Union[str, Path, os.PathLike[str]]) -> bool:
+        """仅检查 `path` 是否为存在的可执行文件，不运行它
+
+        :param itp_path: 文件路径
+        :return: 是否为可执行文件
+        """
+
+        path = Path(itp_path)
+
+        return path.exists() and path.is_file() and os.access(path, os.X_OK)
+
+    @classmethod
+    def probe(
+        cls,
+        itp_path: Union[str, Path, os.PathLike[str]],
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> Optional[dict[str, Any]]:
+        """验证 `path` 是否指向有效的Python解释器，并返回验证时得到的内省信息
+
+        :param itp_path: 文件路径
+        :param timeout: 超时时间，单位为秒，None 表示不限制
+        :param cancel_event: 取消标志，在其他线程中设置后会尽快终止验证
+        :return: 内省信息，与 `probe_interpreter()` 的返回值一致；无效、超时或被取消时返回 None
+        """
+
         path = Path(itp_path).absolute()
 
-        if not (path.exists() and path.is_file() and os.access(path, os.X_OK)):
-            return False
+        if not cls.validate_file(path):
+            return None
 
         # 尝试将该文件作为Python解释器运行
-        subprocess_args = [str(path), "-c", "import sys"]
         try:
-            subprocess.run(args=subprocess_args, check=True)
-        except subprocess.SubprocessError:
-            return False
-        except OSError as e:
-            warnings.warn(
-                f"Failed to start the Python interpreter validation subprocess for {path}: {e}",
-                Warning,
-                stacklevel=2,
-            )
-            return False
-        else:
-            return True
+            return probe_interpreter(path, timeout=timeout, cancel_event=cancel_event)
+        except RuntimeError:
+            return None
+
+    @classmethod
+    def validate_batch(
+        cls,
+        itp_paths: Iterable[Union[str, Path, os.PathLike[str]]],
+        *,
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
+        cancel_event: Optional[threading.Event] = None,
+        max_workers: Optional[int] = None,
+    ) -> Iterator[tuple[str, Optional[dict[str, Any]]]]:
+        """并发验证多个候选路径，每验证完一个即产出其结果
+
+        返回的是生成器，应在工作线程中迭代；各候选项按完成的先后顺序产出，而非传入的顺序。
+        设置 `cancel_event` 或提前停止迭代后，正在运行的验证子进程会被终止，尚未开始的候选项不再验证。
+
+        :param itp_paths: 待验证的文件路径
+        :param timeout: 每个候选项的超时时间，单位为秒，None 表示不限制
+        :param cancel_event: 取消标志
+        :param max_workers: 同时验证的最大候选项数，默认为 CPU 核心数（至多 8）
+        :return: 生成器，产出 (传入的路径, 内省信息或 None)
+        """
+
+        paths = [str(itp_path) for itp_path in itp_paths]
+        if not paths:
+            return
+        if max_workers is None:
+            max_workers = min(8, os.cpu_count() or 2)
+
+        # 内部取消标志，既响应调用者的取消，也在迭代提前结束时终止剩余的验证
+        stop_event = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=min(max_workers, len(paths)))
+        try:
+            pending = {
+                executor.submit(cls.probe, path, timeout, stop_event): path
+                for path in paths
+            }
+            while pending:
+                if cancel_event is not None and cancel_event.is_set():
+                    return
+                done, _ = wait(
+                    pending, timeout=_BATCH_POLL_INTERVAL, return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    yield pending.pop(future), future.result()
+        finally:
+            stop_event.set()
+            executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,330 @@
+# Licensed under the GPLv3 License: https://www.gnu.org/licenses/gpl-3.0.html
+# For details: https://github.com/muziing/Py2exe-GUI/blob/main/README.md#license
+
+"""此模块主要包含常驻的 PyInstaller 预热工作进程类 `WarmWorker`
+
+每次打包都启动新的解释器并导入 `PyInstaller.__main__`（包括 hook 与模块依赖图等机制），
+在真正开始工作前就要耗费 1~3 秒。`WarmWorker` 为某个 Python 环境启动一个常驻进程，预先导入 PyInstaller，
+之后通过标准输入接收打包作业（每行一个 JSON 对象），并为每个作业 fork 出独立的子进程运行，保证作业之间状态隔离。
+作业的输出与结果经由调用者提供的 `SubProcessTool.forward_output()` 发出，与冷启动时完全相同。
+
+每个作业子进程自成一个进程组，中止作业时结束整个进程组（包括 PyInstaller 启动的孙进程），工作进程本身不受影响。
+
+fork 仅在 POSIX 系统上可用；Windows 上不使用预热进程，始终冷启动。
+"""
+
+__all__ = ["WarmWorker"]
+
+import json
+import os
+from collections.abc import Sequence
+from typing import Optional, Union
+
+from PySide6.QtCore import QByteArray, QObject, QProcess, QTimer
+
+from ..Constants import RUNTIME_INFO, Platform
+from ..Utilities import signal_process_tree
+from .subprocess_tool import SubProcessTool
+
+# 工作进程输出的控制行前缀，以 ASCII 记录分隔符开头，不会与 PyInstaller 的正常输出混淆
+_MARK = "\x1epy2exe-gui:"
+_MARK_BYTES = _MARK.encode("ascii")
+
+# 在工作进程中运行的代码
+_WORKER_CODE = f"""
+import json, os, sys, traceback
+import PyInstaller.__main__
+
+MARK = {_MARK!r}
+print(MARK + "ready", flush=True)
+
+for line in sys.stdin:
+    if not line.strip():
+        continue
+    job = json.loads(line)
+    sys.stdout.flush()
+    sys.stderr.flush()
+    pid = os.fork()
+    if pid == 0:
+        code = 1
+        try:
+            os.setpgid(0, 0)
+            os.chdir(job["cwd"])
+            sys.path.insert(0, job["cwd"])
+            PyInstaller.__main__.run(job["args"])
+            code = 0
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except BaseException:
+            traceback.print_exc()
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(code)
+    print(MARK + "started " + str(pid), flush=True)
+    _, status = os.waitpid(pid, 0)
+    # 被信号结束时 waitstatus_to_exitcode() 返回负的信号值，QProcess 则报告正的信号值，与冷启动保持一致
+    print(MARK + "done " + str(abs(os.waitstatus_to_exitcode(status))), flush=True)
+"""
+
+
+class WarmWorker(QObject):
+    """常驻的 PyInstaller 预热工作进程，同一时间只运行一个打包作业"""
+
+    def __init__(self, python_path: str, parent: Optional[QObject] = None) -> None:
+        """
+        :param python_path: 运行工作进程的 Python 解释器路径，该环境中应已安装 PyInstaller
+        :param parent: 父对象
+        """
+
+        super().__init__(parent)
+
+        self.python_path = python_path
+        self._process: Optional[QProcess] = None
+        self._ready = False  # 是否已完成 PyInstaller 的预先导入
+        self._stopping = False  # 是否已请求结束工作进程
+        # 工作进程是否未能就绪即退出（如环境中未安装 PyInstaller），此后不再重新启动
+        self._start_failed = False
+        self._tool: Optional[SubProcessTool] = None  # 当前作业的输出目标
+        self._job_pid: Optional[int] = None  # 当前作业子进程的 pid，也是其进程组 ID
+        # 收到作业 pid 前就请求了中止时的超时时间
+        self._abort_timeout: Optional[int] = None
+        self._stdout_buffer = b""  # 可能包含未接收完整的控制行
+
+        # 中止作业时，超时仍未退出则杀死其进程组
+        self._kill_timer = QTimer(self)
+        self._kill_timer.setSingleShot(True)
+        self._kill_timer.timeout.connect(self._kill_job)
+
+    @staticmethod
+    def is_supported() -> bool:
+        """当前平台是否支持预热工作进程（需要 fork）
+
+        :return: 是否支持
+        """
+
+        return RUNTIME_INFO.platform != Platform.windows and hasattr(os, "fork")
+
+    @property
+    def is_ready(self) -> bool:
+        """工作进程是否已就绪且空闲，可以立即接收作业"""
+
+        return self._ready and self._tool is None
+
+    @property
+    def start_failed(self) -> bool:
+        """工作进程是否未能就绪即退出（如环境中未安装 PyInstaller），此时 `start()` 不再重新启动，打包应冷启动"""
+
+        return self._start_failed
+
+    @property
+    def is_busy(self) -> bool:
+        """是否有作业正在运行"""
+
+        return self._tool is not None
+
+    def start(self) -> None:
+        """启动工作进程（不阻塞），预先导入 PyInstaller；已启动或曾启动失败时什么也不做"""
+
+        if self._process is not None or self._start_failed or not self.is_supported():
+            return
+
+        self._stopping = False
+
+        self._process = QProcess(self)
+        self._process.readyReadStandardOutput.connect(self._handle_stdout)
+        self._process.readyReadStandardError.connect(self._handle_stderr)
+        self._process.finished.connect(self._handle_finished)
+        self._process.errorOccurred.connect(self._handle_error)
+        self._process.start(self.python_path, ["-u", "-c", _WORKER_CODE])
+
+    def stop(self) -> None:
+        """立即杀死正在运行的作业，并结束工作进程，不阻塞"""
+
+        self.abort_job(0)
+        if self._process is not None:
+            self._process.closeWriteChannel()  # 工作进程读到 EOF 后自行退出
+            self._ready = False
+            self._stopping = True
+            # 1 秒后仍未退出则杀死；已退出时 kill() 什么也不做
+            QTimer.singleShot(1000, self._process.kill)
+
+    def run_job(
+        self, pyinstaller_args: Sequence[str], working_dir: str, tool: SubProcessTool
+    ) -> bool:
+        """在工作进程中运行一个打包作业，输出与结果经由 `tool.forward_output()` 发出
+
+        :param pyinstaller_args: PyInstaller 命令参数
+        :param working_dir: 作业的工作目录
+        :param tool: 接收输出的 SubProcessTool，其 `output` 信号的发射顺序与冷启动子进程时相同
+        :return: 是否已提交作业；工作进程未就绪或忙碌时返回 False，调用者应改为冷启动
+        """
+
+        if not self.is_ready or self._process is None:
+            return False
+
+        self._tool = tool
+        self._job_pid = None
+        self._abort_timeout = None
+        job = {"args": list(pyinstaller_args), "cwd": working_dir}
+        self._process.write((json.dumps(job) + "\n").encode("utf-8"))
+
+        tool.merged_chunks = 0
+        tool.dropped_chars = 0
+        tool.set_state(SubProcessTool.ProcessState.RUNNING)
+        tool.forward_output(
+            SubProcessTool.OutputType.STATE, "The process is running..."
+        )
+        tool.forward_output(SubProcessTool.OutputType.STARTED, "started")
+        return True
+
+    def abort_job(self, timeout: int = 5000) -> None:
+        """请求中止正在运行的作业（结束其整个进程组），超时仍未退出则杀死，不阻塞。
+        工作进程本身继续保留
+
+        :param timeout: 超时时间，单位为毫秒，不大于 0 时立即杀死
+        """
+
+        if self._tool is None or self._kill_timer.isActive():
+            return
+        if self._job_pid is None:
+            # 作业已提交但尚未收到其 pid，待收到后再中止
+            self._abort_timeout = timeout
+            return
+
+        self._tool.set_state(SubProcessTool.ProcessState.TERMINATING)
+        if timeout <= 0:
+            self._kill_job()
+        else:
+            signal_process_tree(self._job_pid)
+            self._kill_timer.start(timeout)
+
+    def _kill_job(self) -> None:
+        """中止作业超时（或要求立即杀死），强制杀死其整个进程组"""
+
+        if self._tool is not None and self._job_pid is not None:
+            signal_process_tree(self._job_pid, force=True)
+            self._tool.set_state(SubProcessTool.ProcessState.KILLED)
+
+    def _finish_job(self, exit_code: int) -> None:
+        """当前作业结束，通知输出目标
+
+        :param exit_code: 作业退出码
+        """
+
+        self._kill_timer.stop()
+        tool, self._tool = self._tool, None
+        job_pid, self._job_pid = self._job_pid, None
+        if tool is not None:
+            if (
+                tool.process_state == SubProcessTool.ProcessState.TERMINATING
+                and job_pid is not None
+            ):
+                # 作业子进程本身已退出，但其启动的孙进程可能仍在运行
+                signal_process_tree(job_pid, force=True)
+            if tool.process_state != SubProcessTool.ProcessState.KILLED:
+                tool.set_state(SubProcessTool.ProcessState.FINISHED)
+            tool.finish_output_streams()
+            tool.exit_code = exit_code
+            tool.forward_output(SubProcessTool.OutputType.FINISHED, str(exit_code))
+
+    def _handle_control(self, command: str) -> None:
+        """处理工作进程发出的控制行
+
+        :param command: 去掉前缀后的控制命令，如 "ready"、"started 1234"、"done 0"
+        """
+
+        name, _, value = command.partition(" ")
+        if name == "ready":
+            self._ready = True
+        elif name == "started":
+            self._job_pid = int(value)
+            if self._abort_timeout is not None:
+                timeout, self._abort_timeout = self._abort_timeout, None
+                self.abort_job(timeout)
+        elif name == "done":
+            self._finish_job(int(value))
+
+    def _handle_stdout(self) -> None:
+        """处理工作进程的标准输出，分离控制行，其余的原始数据交给当前作业的 SubProcessTool 解码"""
+
+        if self._process is None:
+            return
+        # 控制行前缀为 ASCII 字符，在原始字节中查找即可，作业输出的解码完全交由 SubProcessTool 进行
+        self._stdout_buffer += self._process.readAllStandardOutput().data()
+
+        *lines, last_line = self._stdout_buffer.split(b"\n")
+        self._stdout_buffer = b""
+        if _MARK_BYTES in last_line:
+            self._stdout_buffer = last_line  # 控制行尚未接收完整
+            last_line = b""
+
+        output = bytearray()
+        for line in lines:
+            # 作业的最后一行输出可能没有换行符，与随后的控制行连在一起
+            index = line.find(_MARK_BYTES)
+            if index == -1:
+                output += line + b"\n"
+                continue
+            output += line[:index]
+            if output:
+                self._feed_output(SubProcessTool.OutputType.STDOUT, output)
+                output = bytearray()
+            command = line[index + len(_MARK_BYTES) :].decode("ascii").strip()
+            self._handle_control(command)
+        output += last_line
+        if output:
+            self._feed_output(SubProcessTool.OutputType.STDOUT, output)
+
+    def _handle_stderr(self) -> None:
+        """处理工作进程的标准错误，交给当前作业的 SubProcessTool 解码"""
+
+        if self._process is not None:
+            data = self._process.readAllStandardError()
+            self._feed_output(SubProcessTool.OutputType.STDERR, data)
+
+    def _feed_output(
+        self,
+        output_type: SubProcessTool.OutputType,
+        data: Union[bytes, bytearray, QByteArray],
+    ) -> None:
+        """将输出的原始数据转发给当前作业的 SubProcessTool；没有作业时（如预热阶段的警告）丢弃
+
+        :param output_type: 输出类型
+        :param data: 原始数据
+        """
+
+        if self._tool is not None:
+            self._tool.feed_output_bytes(output_type, data)
+
+    def _handle_finished(self, code: int, _: QProcess.ExitStatus) -> None:
+        """工作进程退出。未就绪即意外退出（如 PyInstaller 导入失败）时记为启动失败；正在运行的作业视为失败
+
+        :param code: 工作进程退出码
+        """
+
+        if not self._ready and not self._stopping:
+            self._start_failed = True
+        self._ready = False
+        self._release_process()
+        self._stdout_buffer = b""
+        if self._tool is not None:
+            self._finish_job(code or -1)
+
+    def _handle_error(self, error: QProcess.ProcessError) -> None:
+        """工作进程无法启动
+
+        :param error: 错误类型
+        """
+
+        if error == QProcess.ProcessError.FailedToStart:
+            self._ready = False
+            self._start_failed = True
+            self._release_process()
+
+    def _release_process(self) -> None:
+        """工作进程已退出（或未能启动），释放其 QProcess 对象"""
+
+        if self._process is not None:
+            self._process.deleteLater()
+            self._process = None
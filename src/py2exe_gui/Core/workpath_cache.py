@@ -0,0 +1,377 @@
+# Licensed under the GPLv3 License: https://www.gnu.org/licenses/gpl-3.0.html
+# For details: https://github.com/muziing/Py2exe-GUI/blob/main/README.md#license
+
+"""此模块主要包含由 Py2exe-GUI 管理的 PyInstaller 临时文件目录（--workpath）缓存类 `WorkpathCache`
+与全局变量 `WORKPATH_CACHE`
+
+PyInstaller 默认在工作目录（入口脚本所在目录）下创建 build/ 并在其中缓存分析结果，用户常常通过 --clean 将其丢弃。
+Py2exe-GUI 改为在用户缓存目录中为每个项目（入口脚本，批量打包时另以作业名称区分）分配一个独立的 --workpath，
+使重复打包能够复用 PyInstaller 缓存的分析结果；同时按总大小与最近使用时间淘汰（LRU）旧条目，避免无限增长。
+
+`WorkpathCache.acquire()` 与 `release()` 为每个条目维护使用计数，正在被任何打包进程（主窗口或批量打包队列）使用的条目不会被淘汰。
+遍历整个缓存计算大小较为耗时，打包前应使用 `evict_in_background()` 在线程池中淘汰，不阻塞界面；
+界面中列出与清理条目则通过 `WorkpathCacheService` 在线程池中进行，完成后以信号传回结果。
+"""
+
+__all__ = [
+    "dir_size",
+    "WorkpathCacheEntry",
+    "WorkpathCache",
+    "WorkpathCacheService",
+    "WORKPATH_CACHE",
+]
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+import warnings
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Optional, Union
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from ..Constants import AppConstant
+from ..Utilities import get_user_cache_dir
+
+# 每个缓存条目目录中保存元信息的文件名
+_META_FILE_NAME = ".py2exe-gui-workpath.json"
+# 待删除的条目先改名为以此开头的目录，再在锁外删除
+_TRASH_PREFIX = ".trash-"
+
+
+def dir_size(path: Path) -> int:
+    """计算目录中所有文件的总大小，不跟随符号链接
+
+    :param path: 目录路径
+    :return: 总字节数，目录不存在时为 0
+    """
+
+    total = 0
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    total += dir_size(Path(entry.path))
+                elif entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+    except OSError:
+        pass
+    return total
+
+
+class WorkpathCacheEntry:
+    """workpath 缓存中的一个条目，即某个项目的 --workpath 目录"""
+
+    def __init__(self, path: Path, script: str, variant: str, last_used: float) -> None:
+        """
+        :param path: 条目目录路径
+        :param script: 入口脚本路径
+        :param variant: 区分同一脚本不同构建的标签，如解释器路径、作业名称
+        :param last_used: 最近使用时间（时间戳）
+        """
+
+        self.path = path
+        self.script = script
+        self.variant = variant
+        self.last_used = last_used
+        self.size = dir_size(path)
+
+    def __repr__(self) -> str:
+        return f"WorkpathCacheEntry object (script={self.script}, size={self.size})"
+
+
+class WorkpathCache:
+    """由 Py2exe-GUI 管理的 PyInstaller --workpath 缓存
+
+    缓存根目录下每个子目录为一个条目，以脚本名与哈希值命名，其中的元信息文件记录了入口脚本、标签与最近使用时间。
+    """
+
+    DEFAULT_MAX_SIZE = 2 * 1024**3  # 默认总大小上限，2 GiB
+    DEFAULT_MAX_AGE = 30 * 24 * 3600  # 默认最长保留时间，30 天（秒）
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        *,
+        max_size: int = DEFAULT_MAX_SIZE,
+        max_age: float = DEFAULT_MAX_AGE,
+    ) -> None:
+        """
+        :param root: 缓存根目录
+        :param max_size: 总大小上限（字节），超出时淘汰最久未使用的条目
+        :param max_age: 最长保留时间（秒），超过此时间未使用的条目会被淘汰
+        """
+
+        self.root = Path(root)
+        self.max_size = max_size
+        self.max_age = max_age
+        self._in_use: dict[Path, int] = {}  # {条目目录: 使用计数}
+        self._lock = threading.Lock()  # 保护使用计数，及检查计数后移走条目的操作
+        self._evict_lock = threading.Lock()  # 同一时间只进行一次后台淘汰
+
+    def path_for(self, script_path: Union[str, Path], variant: str = "") -> Path:
+        """获取某个项目的 workpath 目录路径，不会创建目录
+
+        :param script_path: 入口脚本路径
+        :param variant: 区分同一脚本不同构建的标签，如解释器路径、作业名称
+        :return: workpath 目录路径，如 <缓存根目录>/app-1a2b3c4d5e6f
+        """
+
+        script = Path(script_path).absolute()
+        key = f"{os.path.normcase(str(script))}|{variant}"
+        digest = hashlib.sha1(key.encode(), usedforsecurity=False).hexdigest()[:12]
+        return self.root / f"{script.stem}-{digest}"
+
+    def acquire(self, script_path: Union[str, Path], variant: str = "") -> Path:
+        """获取某个项目的 workpath 目录，创建目录、更新其最近使用时间，并将其使用计数加一。
+        使用计数不为零的条目不会被淘汰，打包结束后应调用 `release()`
+
+        :param script_path: 入口脚本路径
+        :param variant: 区分同一脚本不同构建的标签
+        :return: workpath 目录路径
+        """
+
+        path = self.path_for(script_path, variant)
+        with self._lock:
+            self._in_use[path] = self._in_use.get(path, 0) + 1
+        meta = {
+            "script": str(Path(script_path).absolute()),
+            "variant": variant,
+            "last_used": time.time(),
+        }
+        try:
+            path.mkdir(parents=True, exist_ok=True)
+            with open(path / _META_FILE_NAME, "w", encoding="utf-8") as f:
+                json.dump(meta, f, ensure_ascii=False)
+        except OSError as e:
+            warnings.warn(
+                f"Failed to update workpath cache entry {path}: {e}",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+        return path
+
+    def release(self, path: Path) -> None:
+        """打包结束，将条目的使用计数减一；未被使用的条目什么也不做
+
+        :param path: `acquire()` 返回的 workpath 目录路径
+        """
+
+        with self._lock:
+            count = self._in_use.get(path, 0) - 1
+            if count > 0:
+                self._in_use[path] = count
+            else:
+                self._in_use.pop(path, None)
+
+    def is_in_use(self, path: Path) -> bool:
+        """条目是否正在被打包进程使用
+
+        :param path: 条目目录路径
+        :return: 是否正在使用
+        """
+
+        with self._lock:
+            return Path(path) in self._in_use
+
+    def entries(self) -> list[WorkpathCacheEntry]:
+        """列出缓存中的所有条目，会计算每个条目的大小
+
+        :return: 条目列表，按最近使用时间从新到旧排列
+        """
+
+        entries: list[WorkpathCacheEntry] = []
+        try:
+            paths = [
+                path
+                for path in self.root.iterdir()
+                if path.is_dir() and not path.name.startswith(_TRASH_PREFIX)
+            ]
+        except OSError:
+            return entries
+
+        for path in paths:
+            try:
+                with open(path / _META_FILE_NAME, encoding="utf-8") as f:
+                    meta = json.load(f)
+                script, variant = meta["script"], meta.get("variant", "")
+                last_used = float(meta["last_used"])
+            except (OSError, ValueError, KeyError, TypeError):
+                # 元信息缺失或损坏，以目录修改时间作为最近使用时间
+                script, variant = "", ""
+                try:
+                    last_used = path.stat().st_mtime
+                except OSError:
+                    continue
+            entries.append(WorkpathCacheEntry(path, script, variant, last_used))
+
+        entries.sort(key=lambda entry: entry.last_used, reverse=True)
+        return entries
+
+    def total_size(self) -> int:
+        """缓存的总大小
+
+        :return: 总字节数
+        """
+
+        return dir_size(self.root)
+
+    def purge(self, paths: Optional[Iterable[Path]] = None) -> list[Path]:
+        """删除缓存条目，正在被打包进程使用的条目会被跳过
+
+        :param paths: 待删除的条目目录，为 None 时删除所有条目
+        :return: 实际删除的条目目录列表
+        """
+
+        if paths is None:
+            paths = [entry.path for entry in self.entries()]
+
+        purged: list[Path] = []
+        for path in paths:
+            path = Path(path)
+            if path.parent != self.root:
+                continue  # 只删除缓存根目录下的条目，防止误删
+            # 在锁内检查使用计数并将条目改名移走，之后即使再次 acquire() 也只会创建新的目录
+            trash_path = self.root / f"{_TRASH_PREFIX}{uuid.uuid4().hex}"
+            with self._lock:
+                if path in self._in_use:
+                    continue
+                try:
+                    path.rename(trash_path)
+                except OSError:
+                    continue
+            shutil.rmtree(trash_path, ignore_errors=True)
+            purged.append(path)
+        return purged
+
+    def evict(self, keep: Iterable[Path] = ()) -> list[Path]:
+        """淘汰超过保留时间的条目，然后按最近使用时间从旧到新淘汰条目，直至总大小不超过上限。
+        正在被打包进程使用的条目（见 `acquire()`）不会被淘汰
+
+        需要计算每个条目的大小，耗时较长，在界面中应使用 `evict_in_background()`
+
+        :param keep: 额外指定的不可淘汰的条目目录
+        :return: 被淘汰的条目目录列表
+        """
+
+        keep_paths = {Path(path) for path in keep}
+        now = time.time()
+        entries = self.entries()
+        total = sum(entry.size for entry in entries)
+
+        candidates: list[Path] = []
+        for entry in reversed(entries):  # 从最久未使用的条目开始
+            if entry.path in keep_paths or self.is_in_use(entry.path):
+                continue
+            if now - entry.last_used > self.max_age or total > self.max_size:
+                candidates.append(entry.path)
+                total -= entry.size
+
+        self._remove_trash()
+        return self.purge(candidates)
+
+    def evict_in_background(self) -> None:
+        """在全局线程池中执行 `evict()`，立即返回；上一次淘汰尚未结束时什么也不做"""
+
+        if not self._evict_lock.acquire(blocking=False):
+            return
+
+        def run() -> None:
+            try:
+                self.evict()
+            finally:
+                self._evict_lock.release()
+
+        QThreadPool.globalInstance().start(run)
+
+    def _remove_trash(self) -> None:
+        """删除上次未能删除完的条目（如程序在删除过程中退出）"""
+
+        try:
+            trash_paths = list(self.root.glob(f"{_TRASH_PREFIX}*"))
+        except OSError:
+            return
+        for trash_path in trash_paths:
+            shutil.rmtree(trash_path, ignore_errors=True)
+
+
+class _CacheRunnable(QRunnable):
+    """在线程池中（清理并）列出缓存条目的任务"""
+
+    def __init__(
+        self,
+        service: "WorkpathCacheService",
+        purge: bool,
+        paths: Optional[list[Path]],
+    ) -> None:
+        """
+        :param service: 发起任务的 WorkpathCacheService 对象，用于回传结果
+        :param purge: 是否先清理条目
+        :param paths: 待清理的条目目录，为 None 时清理所有条目；purge 为 False 时忽略
+        """
+
+        super().__init__()
+
+        self._service = service
+        self._purge = purge
+        self._paths = paths
+
+    def run(self) -> None:
+        """在工作线程中清理条目，再重新列出所有条目（需计算每个条目的大小）"""
+
+        cache = self._service.cache
+        if self._purge:
+            cache.purge(self._paths)
+        entries = cache.entries()
+
+        try:
+            self._service.entries_loaded.emit(entries)
+        except RuntimeError:
+            # 应用程序退出时 WorkpathCacheService 可能已先于工作线程被销毁，此时结果已无人接收
+            pass
+
+
+class WorkpathCacheService(QObject):
+    """在后台线程中列出与清理 workpath 缓存条目的服务类
+
+    调用 `load()` 或 `purge()` 后立即返回，不阻塞 GUI 线程；完成后发射 `entries_loaded` 信号，
+    携带缓存中当前的所有条目。各任务在单个线程中依次执行，结果的先后顺序与请求一致。
+    """
+
+    # 自定义信号，缓存条目已列出，实际类型为 list[WorkpathCacheEntry]
+    entries_loaded = Signal(list)
+
+    def __init__(self, cache: WorkpathCache, parent: Optional[QObject] = None) -> None:
+        """
+        :param cache: 该服务管理的 workpath 缓存
+        :param parent: 父对象
+        """
+
+        super().__init__(parent)
+
+        self.cache = cache
+        self._thread_pool = QThreadPool(self)
+        self._thread_pool.setMaxThreadCount(1)
+
+    def load(self) -> None:
+        """请求在后台列出缓存中的所有条目"""
+
+        self._thread_pool.start(_CacheRunnable(self, False, None))
+
+    def purge(self, paths: Optional[Iterable[Path]] = None) -> None:
+        """请求在后台删除缓存条目（正在被打包进程使用的条目会被跳过），完成后重新列出所有条目
+
+        :param paths: 待删除的条目目录，为 None 时删除所有条目
+        """
+
+        paths = None if paths is None else [Path(path) for path in paths]
+        self._thread_pool.start(_CacheRunnable(self, True, paths))
+
+
+# 全局变量，Py2exe-GUI 管理的 PyInstaller --workpath 缓存
+WORKPATH_CACHE = WorkpathCache(get_user_cache_dir() / AppConstant.NAME / "workpath")
@@ -1,155 +1,216 @@
 # Resource object code (Python 3)
 # Created by: object code
-# Created by: The Resource Compiler for Qt version 6.6.3
+# Created by: The Resource Compiler for Qt version 6.12.0
 # WARNING! All changes made in this file will be lost!
 
 from PySide6 import QtCore
 
 qt_resource_data = b"\
-\x00\x00\x1d^\
+\x00\x003i\
 <\
 \xb8d\x18\xca\xef\x9c\x95\xcd!\x1c\xbf`\xa1\xbd\xdd\xa7\
-\x00\x00\x00\x05zh_CNB\x00\x00\x03\x00\x00\x00\
-+;\x00\x00\x01\x82\x00\x00+;\x00\x00\x11\xbd\x00\x02\
-\xb4\xc7\x00\x00\x01P\x00\x02\xb4\xc7\x00\x00\x11\x85\x00\x04\
-\xa6y\x00\x00\x02&\x00\x05H5\x00\x00\x12w\x00\x05\
-f\xbe\x00\x00\x0b\xc1\x00\x05f\xbe\x00\x00\x13\xa8\x00\x10\
-\xcan\x00\x00\x04h\x00\x13U\xee\x00\x00\x0a;\x00*\
-\xcf\x04\x00\x00\x0eN\x00*\xd0%\x00\x00\x0e~\x00*\
-\xec0\x00\x00\x0e\xae\x00G\x96\xc4\x00\x00\x00\x00\x00I\
-l\x0e\x00\x00\x03L\x00J+~\x00\x00\x05\x02\x00J\
-6\x95\x00\x00\x14\xf0\x00Kdq\x00\x00\x15\x1b\x00L\
-\x99b\x00\x00\x05\xa0\x00L\x99b\x00\x00\x17\xc3\x01*\
-\xbc^\x00\x00\x04\xb4\x01\x8a\xa33\x00\x00\x11\xf4\x01\xdb\
-\xb2\x8f\x00\x00\x07B\x01\xf3(\xfe\x00\x00\x15\xfd\x02$\
-\x06\xee\x00\x00\x19E\x02TK\xfa\x00\x00\x03\x98\x02o\
-\xeej\x00\x00\x17X\x02r\xf7\xfe\x00\x00\x05,\x02\xa7\
-\x96\xc4\x00\x00\x0e\x1d\x02\xa7\xdeU\x00\x00\x0f\x81\x02\xb6\
-\xee\xd3\x00\x00\x10\x7f\x03\x8aRY\x00\x00\x0bb\x03\xbc\
-\xb9r\x00\x00\x01\xe6\x04\x13\xa2*\x00\x00\x08\x93\x04a\
-\xc9p\x00\x00\x18T\x04t\xcbE\x00\x00\x06G\x04\x98\
-I\xbc\x00\x00\x0b\x07\x04\x98I\xbc\x00\x00\x13|\x04\x98\
-I\xbc\x00\x00\x14\xc4\x04\x99n\x95\x00\x00\x03\xcc\x04\x99\
-n\x95\x00\x00\x17\x92\x04\xcfv\x94\x00\x00\x02S\x04\xd1\
-N\xb2\x00\x00\x06~\x05g\xb0^\x00\x00\x13\x08\x05\x8b\
-{\xbe\x00\x00\x0d\xf5\x06\x04\x81\x85\x00\x00\x0b1\x06L\
-\xc5c\x00\x00\x01\xb3\x06\x5c\xc6\xd5\x00\x00\x14\x19\x06m\
-\x81M\x00\x00\x0fF\x06\xc6l\x14\x00\x00\x0f\x12\x07$\
-\xfe\xde\x00\x00\x0a\xdb\x07?\xfd\xfe\x00\x00\x18\xdf\x07\xca\
-r\x11\x00\x00\x09x\x08\x05\x1f\xb0\x00\x00\x06\xfd\x08\xa1\
-\x96\xd9\x00\x00\x0cm\x09\x07[\x85\x00\x00\x0f\xd4\x09\x08\
-b\x8a\x00\x00\x08X\x09 \x93N\x00\x00\x10+\x09(\
-n\x13\x00\x00\x02\xc1\x09<\x5c\x83\x00\x00\x10\xd9\x09M\
-g\xfe\x00\x00\x12\xce\x09pU\x99\x00\x00\x14X\x09\xc4\
-\xb21\x00\x00\x03\xf7\x09\xd8%U\x00\x00\x0c-\x09\xf2\
-5X\x00\x00\x08\x05\x0a\x0f\xec\x8e\x00\x00\x00&\x0a\x1e\
-\xda\xd4\x00\x00\x05\xca\x0ae\xa8\xe3\x00\x00\x15L\x0a\x98\
-I\x9c\x00\x00\x00\xe6\x0a\x98I\x9c\x00\x00\x11\x0f\x0a\xac\
-,\x85\x00\x00\x01\x1b\x0a\xac,\x85\x00\x00\x11J\x0a\xb8\
-\xc2\xa1\x00\x00\x08\xe3\x0a\xebf\x09\x00\x00\x0a\x9e\x0a\xeb\
-f\x09\x00\x00\x0b\xe9\x0a\xebf\x09\x00\x00\x13=\x0b\x05\
-MN\x00\x00\x06\x00\x0b\xab\x22\xae\x00\x00\x02\xfc\x0b\xd4\
-\xbf\xa1\x00\x00\x16\xa2\x0b\xddZ\xc5\x00\x00\x00\xa8\x0b\xe1\
-gZ\x00\x00\x16\xf4\x0c\x05\x06\xc4\x00\x00\x15\xc6\x0c\x0a\
-\xbe\xf5\x00\x00\x04%\x0c\x1b\xd1\xa1\x00\x00\x19\xb1\x0cP\
-\xa0*\x00\x00\x06\xb7\x0c~`9\x00\x00\x0d\x87\x0c\xa8\
-?b\x00\x00\x0c\xc6\x0c\xba\xefs\x00\x00\x0e\xde\x0c\xc9\
-\xa0\x0e\x00\x00\x12\xa1\x0d\x89P\x17\x00\x00\x0a\x0f\x0e\x01\
-+e\x00\x00\x18\x9f\x0ef\xfa\x7f\x00\x00\x17\xf3\x0e\x81\
-2\x09\x00\x00\x0d\x13\x0f\xc0\xd03\x00\x00\x02\x82\x0f\xcf\
-\xb2#\x00\x00\x129\x0f\xe8\x01e\x00\x00\x13\xd2i\x00\
-\x00\x1a:\x03\x00\x00\x00\x04QsN\x8e\x08\x00\x00\x00\
-\x00\x06\x00\x00\x00\x05About\x07\x00\x00\x00\x08\
-AboutDlg\x01\x03\x00\x00\x00(e\xe0\
-l\xd5bS_\x00QsN\x8ee\x87hc\xff\x0c\
-\x8b\xf7\x5c\x1d\x8b\xd5\x91\xcde\xb0\x83\xb7S\xd6g,\
-z\x0b^\x8f0\x02\x08\x00\x00\x00\x00\x06\x00\x00\x00=\
-Can't open the A\
-bout document, t\
-ry to reinstall \
-this program.\x07\x00\x00\
-\x00\x08AboutDlg\x01\x03\x00\x00\x00\x10\
-mO\x89\xc8e\x87N\xf6\x00(\x00&\x00B\x00)\
-\x08\x00\x00\x00\x00\x06\x00\x00\x00\x0c&Brows\
-e File\x07\x00\x00\x00\x0dAddDa\
-taWindow\x01\x03\x00\x00\x00\x0cS\xd6\
-m\x88\x00(\x00&\x00C\x00)\x08\x00\x00\x00\x00\x06\
-\x00\x00\x00\x07&Cancel\x07\x00\x00\x00\x0d\
+\x00\x00\x00\x05zh_CNB\x00\x00\x058\x00\x00\
++;\x00\x00\x01\x82\x00\x00+;\x00\x00\x19\x90\x00\x02\
+\xb4\xc7\x00\x00\x01P\x00\x02\xb4\xc7\x00\x00\x19X\x00\x04\
+\xa6y\x00\x00\x02&\x00\x05H5\x00\x00\x1cR\x00\x05\
+H5\x00\x00 {\x00\x05f\xbe\x00\x00\x0dY\x00\x05\
+f\xbe\x00\x00#\x88\x00\x05\xa1\x05\x00\x00,\xe9\x00\x10\
+\xcan\x00\x00\x05#\x00\x13U\xee\x00\x00\x0b\xd3\x00*\
+\xcf\x04\x00\x00\x15Y\x00*\xd0%\x00\x00\x15\x89\x00*\
+\xec0\x00\x00\x15\xb9\x00G\x96\xc4\x00\x00\x00\x00\x00I\
+l\x0e\x00\x00\x04\x07\x00J+~\x00\x00\x061\x00J\
+6\x95\x00\x00\x02\xb4\x00J6\x95\x00\x00$\xd0\x00J\
+6\x95\x00\x00*\xa6\x00Kdq\x00\x00$\xfb\x00L\
+\x99b\x00\x00\x02\xdd\x00L\x99b\x00\x00\x06\xcf\x00L\
+\x99b\x00\x00\x11\xd5\x00L\x99b\x00\x00'\xa3\x00Z\
+\xa8\x94\x00\x00\x1e\xc1\x00d\xe9U\x00\x00\x1b\xb6\x01*\
+\xbc^\x00\x00\x05o\x01\x8a\xa33\x00\x00\x19\xc7\x01\x92\
+\x9f\xfa\x00\x00!\xf4\x01\xcdJ{\x00\x00\x1a\x0c\x01\xdb\
+\xb2\x8f\x00\x00\x08\xda\x01\xf3(\xfe\x00\x00%\xdd\x01\xf8\
+]\x0e\x00\x00\x17\xb6\x02\x09C\x9e\x00\x00\x13\xcb\x02$\
+\x06\xee\x00\x00)%\x02TK\xfa\x00\x00\x04S\x02a\
+\xc9\xe3\x00\x00\x02\x82\x02g\x83~\x00\x00*R\x02o\
+\xeej\x00\x00'8\x02r\xf7\xfe\x00\x00\x06[\x02\x7f\
+\x0f?\x00\x00\x12\xe6\x02\xa7\x96\xc4\x00\x00\x14\xe4\x02\xb6\
+\xee\xd3\x00\x00\x18R\x03O6\x85\x00\x00\x1c\xb9\x03W\
+\xc4\x1e\x00\x00\x11\x8a\x03\x8aRY\x00\x00\x0c\xfa\x03\xbc\
+\xb9r\x00\x00\x01\xe6\x04\x13\xa2*\x00\x00\x0a+\x04B\
+\x04I\x00\x00\x0f\xbb\x04N\x9b\xee\x00\x00*\xd4\x04a\
+\xc9p\x00\x00(4\x04t\xcbE\x00\x00\x07\xdf\x04\x91\
+}\xd0\x00\x00!\x12\x04\x98I\xbc\x00\x00\x0c\x9f\x04\x98\
+I\xbc\x00\x00\x1a\xdb\x04\x98I\xbc\x00\x00#\x5c\x04\x98\
+I\xbc\x00\x00$\xa4\x04\x99n\x95\x00\x00\x04\x87\x04\x99\
+n\x95\x00\x00'r\x04\x9c{4\x00\x00\x1b\x0b\x04\xa4\
+F\xc2\x00\x00\x03\x06\x04\xa4F\xc2\x00\x00+\xd0\x04\xc8\
+\x02\xb4\x00\x00\x1b\xeb\x04\xcfv\x94\x00\x00\x02S\x04\xd1\
+N\xb2\x00\x00\x08\x16\x04\xf6\xf2e\x00\x00\x0f\xef\x05(\
+J\xd3\x00\x00\x0f\x8d\x05H\x91G\x00\x00\x10)\x05I\
+\x1a\xad\x00\x00\x12\x9e\x05Jy~\x00\x00-F\x05g\
+\xb0^\x00\x00\x22\xe8\x05\x8b{\xbe\x00\x00\x14\x1e\x05\x9a\
+\x90t\x00\x00,\xba\x05\xaa\x8b\xc3\x00\x00\x1e\xf0\x05\xbd\
+\x95n\x00\x00\x16\xcf\x06\x00\xb9\xc5\x00\x00*\x1a\x06\x04\
+\x81\x85\x00\x00\x0c\xc9\x06L\xc5c\x00\x00\x01\xb3\x06\x5c\
+\xc6\xd5\x00\x00#\xf9\x06m\x81M\x00\x00\x16Q\x06\xc4\
+\xb0\x17\x00\x00\x1d6\x06\xc6l\x14\x00\x00\x16\x1d\x06\xf9\
+n\xba\x00\x00\x1c\xf6\x07$\xfe\xde\x00\x00\x0cs\x07?\
+\xfd\xfe\x00\x00(\xbf\x07R\xc4.\x00\x00\x1d\x9b\x07\x9e\
+1\xe5\x00\x00!\xc1\x07\xcar\x11\x00\x00\x0b\x10\x07\xd4\
+\xa8^\x00\x00\x1aN\x08\x05\x1f\xb0\x00\x00\x08\x95\x085\
+\x97\xa5\x00\x00\x10i\x08M}\xb3\x00\x00\x10\xdb\x08\xa1\
+\x96\xd9\x00\x00\x0e\x05\x08\xa6\xdaT\x00\x00,B\x08\xd7\
+\x11\xec\x00\x00,\x0c\x09\x08b\x8a\x00\x00\x09\xf0\x09 \
+\x93N\x00\x00\x17\xfe\x09(n\x13\x00\x00\x03|\x09(\
+\x90\x02\x00\x00\x1c\x1b\x09)_\xfb\x00\x00\x11\xfa\x09-\
+\x95~\x00\x00\x17\x13\x095\xef\xfb\x00\x00\x12o\x09<\
+\x5c\x83\x00\x00\x18\xac\x09Mg\xfe\x00\x00\x22\xae\x09^\
+\x89\xd3\x00\x00\x1di\x09pU\x99\x00\x00$8\x09\x9b\
+\xe0\x04\x00\x00\x1f \x09\xb0\xad\x9e\x00\x00\x1f\x8b\x09\xc2\
+\x07\xb9\x00\x00\x14F\x09\xc4\xb21\x00\x00\x04\xb2\x09\xc5\
+P\x17\x00\x00\x1e\x8e\x09\xd0\xae\xfe\x00\x00\x11\x1d\x09\xd8\
+%U\x00\x00\x0d\xc5\x09\xf25X\x00\x00\x09\x9d\x0a\x0f\
+\xec\x8e\x00\x00\x00&\x0a\x1e\xda\xd4\x00\x00\x07b\x0a\x1e\
+\xe0\x0e\x00\x00\x1a\x99\x0ae\x9b4\x00\x00+\x9a\x0ae\
+\xa8\xe3\x00\x00%,\x0a\x98I\x9c\x00\x00\x00\xe6\x0a\x98\
+I\x9c\x00\x00\x18\xe2\x0a\xac,\x85\x00\x00\x01\x1b\x0a\xac\
+,\x85\x00\x00\x19\x1d\x0a\xb8\xc2\xa1\x00\x00\x0a{\x0a\xeb\
+f\x09\x00\x00\x0c6\x0a\xebf\x09\x00\x00\x0d\x81\x0a\xeb\
+f\x09\x00\x00#\x1d\x0b\x03\xb6~\x00\x00!\x89\x0b\x05\
+MN\x00\x00\x07\x98\x0b\x11j\xd5\x00\x00\x14\xb6\x0b\x11\
+j\xd5\x00\x00\x1fS\x0b\x14\x14N\x00\x00 $\x0b\x9c\
+O\x0e\x00\x00\x15\x15\x0b\xab\x22\xae\x00\x00\x03\xb7\x0b\xd4\
+\xbf\xa1\x00\x00&\x82\x0b\xddZ\xc5\x00\x00\x00\xa8\x0b\xe1\
+gZ\x00\x00&\xd4\x0c\x05\x06\xc4\x00\x00%\xa6\x0c\x0a\
+\xbe\xf5\x00\x00\x04\xe0\x0c\x1b\xd1\xa1\x00\x00)\x91\x0c3\
+lu\x00\x00\x1c\x80\x0cP\xa0*\x00\x00\x08O\x0c~\
+`9\x00\x00\x0f\x1f\x0c\x88\xac\xee\x00\x00\x1b\x84\x0c\x88\
+\xf8\x04\x00\x00-\x16\x0c\xa8?b\x00\x00\x0e^\x0c\xb8\
+z\x0e\x00\x00\x05\xbd\x0c\xba\xefs\x00\x00\x15\xe9\x0c\xc9\
+\xa0\x0e\x00\x00 \xa5\x0c\xdd/\xdd\x00\x00\x17W\x0d\x89\
+P\x17\x00\x00\x0b\xa7\x0e\x01+e\x00\x00(\x7f\x0e\x01\
+\xfd\x8e\x00\x00,}\x0eJn\xc0\x00\x00\x06\xf9\x0eJ\
+\xcb$\x00\x00 \xd2\x0ef\xfa\x7f\x00\x00'\xd3\x0e\x81\
+2\x09\x00\x00\x0e\xab\x0e\xbdi\xdd\x00\x00\x12)\x0e\xf7\
+\x22\xe3\x00\x00\x22Y\x0f\x08\xde\xd4\x00\x00\x1b@\x0f\x5c\
+GN\x00\x00\x16\x8c\x0fr\x9a\xb3\x00\x00\x10\xac\x0f\xc0\
+\xd03\x00\x00\x03=\x0f\xcf\xb2#\x00\x00\x1f\xe6\x0f\xe8\
+\x01e\x00\x00#\xb2i\x00\x00.\x0d\x03\x00\x00\x00\x04\
+QsN\x8e\x08\x00\x00\x00\x00\x06\x00\x00\x00\x05Ab\
+out\x07\x00\x00\x00\x08AboutDlg\
+\x01\x03\x00\x00\x00(e\xe0l\xd5bS_\x00Qs\
+N\x8ee\x87hc\xff\x0c\x8b\xf7\x5c\x1d\x8b\xd5\x91\xcd\
+e\xb0\x83\xb7S\xd6g,z\x0b^\x8f0\x02\x08\x00\
+\x00\x00\x00\x06\x00\x00\x00=Can't op\
+en the About doc\
+ument, try to re\
+install this pro\
+gram.\x07\x00\x00\x00\x08AboutD\
+lg\x01\x03\x00\x00\x00\x10mO\x89\xc8e\x87N\xf6\
+\x00(\x00&\x00B\x00)\x08\x00\x00\x00\x00\x06\x00\x00\
+\x00\x0c&Browse File\x07\x00\
+\x00\x00\x0dAddDataWindow\
+\x01\x03\x00\x00\x00\x0cS\xd6m\x88\x00(\x00&\x00C\
+\x00)\x08\x00\x00\x00\x00\x06\x00\x00\x00\x07&Can\
+cel\x07\x00\x00\x00\x0dAddDataW\
+indow\x01\x03\x00\x00\x00\x0cR \x96d\x00\
+(\x00&\x00D\x00)\x08\x00\x00\x00\x00\x06\x00\x00\x00\
+\x07&Delete\x07\x00\x00\x00\x0dAdd\
+DataWindow\x01\x03\x00\x00\x00\x0c\
+e\xb0^\xfa\x00(\x00&\x00N\x00)\x08\x00\x00\x00\
+\x00\x06\x00\x00\x00\x04&New\x07\x00\x00\x00\x0dA\
+ddDataWindow\x01\x03\x00\x00\
+\x00\x0cxn\x8b\xa4\x00(\x00&\x00O\x00)\x08\x00\
+\x00\x00\x00\x06\x00\x00\x00\x03&OK\x07\x00\x00\x00\x0d\
 AddDataWindow\x01\x03\x00\
-\x00\x00\x0cR \x96d\x00(\x00&\x00D\x00)\x08\
-\x00\x00\x00\x00\x06\x00\x00\x00\x07&Delete\
-\x07\x00\x00\x00\x0dAddDataWind\
-ow\x01\x03\x00\x00\x00\x0ce\xb0^\xfa\x00(\x00&\
-\x00N\x00)\x08\x00\x00\x00\x00\x06\x00\x00\x00\x04&N\
-ew\x07\x00\x00\x00\x0dAddDataWi\
-ndow\x01\x03\x00\x00\x00\x0cxn\x8b\xa4\x00(\
-\x00&\x00O\x00)\x08\x00\x00\x00\x00\x06\x00\x00\x00\x03\
-&OK\x07\x00\x00\x00\x0dAddDataW\
-indow\x01\x03\x00\x00\x00\x08m\xfbR\xa0e\
-\x87N\xf6\x08\x00\x00\x00\x00\x06\x00\x00\x00\x09Add\
- Files\x07\x00\x00\x00\x0dAddDa\
-taWindow\x01\x03\x00\x00\x00\x10mO\
-\x89\xc8v\xee_U\x00(\x00&\x00F\x00)\x08\x00\
-\x00\x00\x00\x06\x00\x00\x00\x0eBrowse &\
-Folder\x07\x00\x00\x00\x0dAddDa\
-taWindow\x01\x03\x00\x00\x00\x04Y\x0d\
-R6\x08\x00\x00\x00\x00\x06\x00\x00\x00\x04Copy\
-\x07\x00\x00\x00\x10ArgumentsBr\
-owser\x01\x03\x00\x00\x00\x04[\xfcQ\xfa\x08\
-\x00\x00\x00\x00\x06\x00\x00\x00\x06Export\x07\
-\x00\x00\x00\x10ArgumentsBro\
-wser\x01\x03\x00\x00\x00\x0em\xfbR\xa0N\x8c\
-\x8f\xdbR6e\x87N\xf6\x08\x00\x00\x00\x00\x06\x00\x00\
-\x00\x10Add Binary Fil\
-es\x07\x00\x00\x00\x0cCenterWid\
-get\x01\x03\x00\x00\x00\x0cm\xfbR\xa0epc\
-ne\x87N\xf6\x08\x00\x00\x00\x00\x06\x00\x00\x00\x0eA\
-dd Data Files\x07\x00\x00\
-\x00\x0cCenterWidget\x01\x03\
-\x00\x00\x00\x16m\xfbR\xa0N\x8c\x8f\xdbR6e\x87\
-N\xf6]\xf2f\xf4e\xb00\x02\x08\x00\x00\x00\x00\x06\
-\x00\x00\x00\x19Add binary f\
-iles updated.\x07\x00\x00\
-\x00\x0cCenterWidget\x01\x03\
-\x00\x00\x00\x14m\xfbR\xa0epcne\x87N\xf6\
-]\xf2f\xf4e\xb00\x02\x08\x00\x00\x00\x00\x06\x00\x00\
-\x00\x17Add data files\
- updated.\x07\x00\x00\x00\x0cCe\
-nterWidget\x01\x03\x00\x00\x00\x0a\
-\x98yv\xeeT\x0dy\xf0\xff\x1a\x08\x00\x00\x00\x00\x06\
-\x00\x00\x00\x09App Name:\x07\x00\x00\
-\x00\x0cCenterWidget\x01\x03\
-\x00\x00\x00\x04mO\x89\xc8\x08\x00\x00\x00\x00\x06\x00\x00\
-\x00\x06Browse\x07\x00\x00\x00\x0cCen\
-terWidget\x01\x03\x00\x00\x00\x06b\
-SS\x05\xff\x01\x08\x00\x00\x00\x00\x06\x00\x00\x00\x07B\
-undle!\x07\x00\x00\x00\x0cCente\
-rWidget\x01\x03\x00\x00\x00\x12bSS\
-\x05v\x84^\x94u(z\x0b^\x8fT\x0dy\xf0\x08\
-\x00\x00\x00\x00\x06\x00\x00\x00\x10Bundled\
- app name\x07\x00\x00\x00\x0cCe\
-nterWidget\x01\x03\x00\x00\x00\x14\
-\x5c\x06bSS\x05\x81\xf3SUN*e\x87N\xf6\
-N-0\x02\x08\x00\x00\x00\x00\x06\x00\x00\x00\x17Bu\
-ndling into one \
-file.\x07\x00\x00\x00\x0cCenter\
-Widget\x01\x03\x00\x00\x00\x14\x5c\x06bS\
-S\x05\x81\xf3SUN*v\xee_UN-0\x02\
-\x08\x00\x00\x00\x00\x06\x00\x00\x00\x19Bundli\
-ng into one fold\
-er.\x07\x00\x00\x00\x0cCenterWi\
-dget\x01\x03\x00\x00\x00\x04n\x05t\x06\x08\x00\
-\x00\x00\x00\x06\x00\x00\x00\x05Clean\x07\x00\x00\
-\x00\x0cCenterWidget\x01\x03\
-\x00\x00\x00\x1cg\x84^\xfaRM\x5c\x06n\x05\x96d\
-\x7f\x13[XN\x0eN4e\xf6v\xee_U0\x02\
-\x08\x00\x00\x00\x00\x06\x00\x00\x007Clean \
-cache and remove\
- temporary files\
- before building\
-.\x07\x00\x00\x00\x0cCenterWidg\
-et\x01\x03\x00\x00\x00\x04\x95\x19\x8b\xef\x08\x00\x00\x00\
-\x00\x06\x00\x00\x00\x05Error\x07\x00\x00\x00\x0c\
+\x00\x00\x08m\xfbR\xa0e\x87N\xf6\x08\x00\x00\x00\x00\
+\x06\x00\x00\x00\x09Add Files\x07\x00\
+\x00\x00\x0dAddDataWindow\
+\x01\x03\x00\x00\x00\x10mO\x89\xc8v\xee_U\x00(\
+\x00&\x00F\x00)\x08\x00\x00\x00\x00\x06\x00\x00\x00\x0e\
+Browse &Folder\x07\x00\
+\x00\x00\x0dAddDataWindow\
+\x01\x03\x00\x00\x00\x04Y\x0dR6\x08\x00\x00\x00\x00\x06\
+\x00\x00\x00\x04Copy\x07\x00\x00\x00\x10Arg\
+umentsBrowser\x01\x03\x00\
+\x00\x00\x04[\xfcQ\xfa\x08\x00\x00\x00\x00\x06\x00\x00\x00\
+\x06Export\x07\x00\x00\x00\x10Argu\
+mentsBrowser\x01\x03\x00\x00\
+\x00\x08g\x84^\xfae\xe5_\xd7\x08\x00\x00\x00\x00\x06\
+\x00\x00\x00\x0aBuild Logs\x07\x00\
+\x00\x00\x0bBuildLogDlg\x01\x03\
+\x00\x00\x00\x04Qs\x95\xed\x08\x00\x00\x00\x00\x06\x00\x00\
+\x00\x05Close\x07\x00\x00\x00\x0bBuil\
+dLogDlg\x01\x03\x00\x00\x00\x04\x95\x19\x8b\
+\xef\x08\x00\x00\x00\x00\x06\x00\x00\x00\x05Error\
+\x07\x00\x00\x00\x0bBuildLogDlg\
+\x01\x03\x00\x00\x00\x0cbS_\x00b@W(v\xee\
+_U\x08\x00\x00\x00\x00\x06\x00\x00\x00\x0bOpen\
+ Folder\x07\x00\x00\x00\x0bBuil\
+dLogDlg\x01\x03\x00\x00\x00\x0em\xfbR\
+\xa0N\x8c\x8f\xdbR6e\x87N\xf6\x08\x00\x00\x00\x00\
+\x06\x00\x00\x00\x10Add Binary \
+Files\x07\x00\x00\x00\x0cCenter\
+Widget\x01\x03\x00\x00\x00\x0cm\xfbR\xa0\
+epcne\x87N\xf6\x08\x00\x00\x00\x00\x06\x00\x00\
+\x00\x0eAdd Data Files\
+\x07\x00\x00\x00\x0cCenterWidge\
+t\x01\x03\x00\x00\x00\x16m\xfbR\xa0N\x8c\x8f\xdbR\
+6e\x87N\xf6]\xf2f\xf4e\xb00\x02\x08\x00\x00\
+\x00\x00\x06\x00\x00\x00\x19Add binar\
+y files updated.\
+\x07\x00\x00\x00\x0cCenterWidge\
+t\x01\x03\x00\x00\x00\x14m\xfbR\xa0epcne\
+\x87N\xf6]\xf2f\xf4e\xb00\x02\x08\x00\x00\x00\x00\
+\x06\x00\x00\x00\x17Add data fi\
+les updated.\x07\x00\x00\x00\
+\x0cCenterWidget\x01\x03\x00\
+\x00\x00\x0a\x98yv\xeeT\x0dy\xf0\xff\x1a\x08\x00\x00\
+\x00\x00\x06\x00\x00\x00\x09App Name:\
+\x07\x00\x00\x00\x0cCenterWidge\
+t\x01\x03\x00\x00\x00\x04mO\x89\xc8\x08\x00\x00\x00\x00\
+\x06\x00\x00\x00\x06Browse\x07\x00\x00\x00\x0c\
+CenterWidget\x01\x03\x00\x00\
+\x00\x06bSS\x05\xff\x01\x08\x00\x00\x00\x00\x06\x00\x00\
+\x00\x07Bundle!\x07\x00\x00\x00\x0cCe\
+nterWidget\x01\x03\x00\x00\x00\x12\
+bSS\x05v\x84^\x94u(z\x0b^\x8fT\x0d\
+y\xf0\x08\x00\x00\x00\x00\x06\x00\x00\x00\x10Bund\
+led app name\x07\x00\x00\x00\
+\x0cCenterWidget\x01\x03\x00\
+\x00\x00\x14\x5c\x06bSS\x05\x81\xf3SUN*e\
+\x87N\xf6N-0\x02\x08\x00\x00\x00\x00\x06\x00\x00\x00\
+\x17Bundling into o\
+ne file.\x07\x00\x00\x00\x0cCen\
+terWidget\x01\x03\x00\x00\x00\x14\x5c\
+\x06bSS\x05\x81\xf3SUN*v\xee_UN\
+-0\x02\x08\x00\x00\x00\x00\x06\x00\x00\x00\x19Bun\
+dling into one f\
+older.\x07\x00\x00\x00\x0cCente\
+rWidget\x01\x03\x00\x00\x00(kcW\
+(h\xc0g\xe5b@\x90\x09v\x84\x00 \x00P\x00\
+y\x00t\x00h\x00o\x00n\x00 s\xafX\x83\x00\
+.\x00.\x00.\x08\x00\x00\x00\x00\x06\x00\x00\x00+C\
+hecking the sele\
+cted Python envi\
+ronment...\x07\x00\x00\x00\x0cC\
+enterWidget\x01\x03\x00\x00\x00\
+\x04n\x05t\x06\x08\x00\x00\x00\x00\x06\x00\x00\x00\x05C\
+lean\x07\x00\x00\x00\x0cCenterW\
+idget\x01\x03\x00\x00\x00\x1cg\x84^\xfaR\
+M\x5c\x06n\x05\x96d\x7f\x13[XN\x0eN4e\
+\xf6v\xee_U0\x02\x08\x00\x00\x00\x00\x06\x00\x00\x00\
+7Clean cache and\
+ remove temporar\
+y files before b\
+uilding.\x07\x00\x00\x00\x0cCen\
+terWidget\x01\x03\x00\x00\x00\x04\x95\
+\x19\x8b\xef\x08\x00\x00\x00\x00\x06\x00\x00\x00\x05Err\
+or\x07\x00\x00\x00\x0cCenterWid\
+get\x01\x03\x00\x00\x00 h\xc0g\xe5\x00 \x00\
+P\x00y\x00t\x00h\x00o\x00n\x00 s\xafX\
+\x83Y1\x8d%\xff\x1a\x00 \x08\x00\x00\x00\x00\x06\x00\
+\x00\x00(Failed to che\
+ck the Python en\
+vironment: \x07\x00\x00\x00\x0c\
 CenterWidget\x01\x03\x00\x00\
 \x00\x08\x96\x90_\x0f[\xfcQe\x08\x00\x00\x00\x00\x06\
 \x00\x00\x00\x0dHidden Impor\
@@ -281,203 +342,495 @@ o\x00n\x003\x00*\x00)\x08\x00\x00\x00\x00\x06\x00\
 \x00\x00\x1dPython Interp\
 reter (python3*)\
 \x07\x00\x00\x00\x12Interpreter\
-FileDlg\x01\x03\x00\x00\x00\x06\x5c1~\
-\xea0\x02\x08\x00\x00\x00\x00\x06\x00\x00\x00\x06Rea\
-dy.\x07\x00\x00\x00\x07MainApp\x01\
-\x03\x00\x00\x00\x0cQsN\x8e\x00(\x00&\x00A\x00\
-)\x08\x00\x00\x00\x00\x06\x00\x00\x00\x06&Abou\
-t\x07\x00\x00\x00\x0aMainWindow\
-\x01\x03\x00\x00\x00\x0c\x90\x00Q\xfa\x00(\x00&\x00E\
-\x00)\x08\x00\x00\x00\x00\x06\x00\x00\x00\x05&Exi\
-t\x07\x00\x00\x00\x0aMainWindow\
-\x01\x03\x00\x00\x00\x0ce\x87N\xf6\x00(\x00&\x00F\
-\x00)\x08\x00\x00\x00\x00\x06\x00\x00\x00\x05&Fil\
-e\x07\x00\x00\x00\x0aMainWindow\
-\x01\x03\x00\x00\x00\x0c^.R\xa9\x00(\x00&\x00H\
-\x00)\x08\x00\x00\x00\x00\x06\x00\x00\x00\x05&Hel\
-p\x07\x00\x00\x00\x0aMainWindow\
-\x01\x03\x00\x00\x00\x0c\x8b\xbe\x7fn\x00(\x00&\x00S\
-\x00)\x08\x00\x00\x00\x00\x06\x00\x00\x00\x09&Set\
-tings\x07\x00\x00\x00\x0aMainWi\
-ndow\x01\x03\x00\x00\x00\x0cQsN\x8e\x00 \
-\x00&\x00Q\x00t\x08\x00\x00\x00\x00\x06\x00\x00\x00\x09\
-About &Qt\x07\x00\x00\x00\x0aMa\
-inWindow\x01\x03\x00\x00\x00\x0aQs\
-N\x8ekdz\x0b^\x8f\x08\x00\x00\x00\x00\x06\x00\x00\
-\x00\x12About This Pro\
-gram\x07\x00\x00\x00\x0aMainWin\
-dow\x01\x03\x00\x00\x00\x1a[\xfcQ\xfa\x91M\x7f\
-n\x81\xf3\x00 \x00J\x00S\x00O\x00N\x00 e\
-\x87N\xf6\x08\x00\x00\x00\x00\x06\x00\x00\x00\x1aExp\
-ort Config To JS\
-ON File\x07\x00\x00\x00\x0aMain\
-Window\x01\x03\x00\x00\x00\x1cN\xce\x00 \
-\x00J\x00S\x00O\x00N\x00 e\x87N\xf6N-\
-[\xfcQe\x91M\x7fn\x08\x00\x00\x00\x00\x06\x00\x00\
-\x00\x1cImport Config \
-From JSON File\x07\x00\
-\x00\x00\x0aMainWindow\x01\x03\x00\
-\x00\x00\x1c\x00P\x00y\x00I\x00n\x00s\x00t\x00\
-a\x00l\x00l\x00e\x00r\x00 e\x87hc\x08\
-\x00\x00\x00\x00\x06\x00\x00\x00\x19PyInsta\
-ller Documentati\
-on\x07\x00\x00\x00\x0aMainWindo\
-w\x01\x03\x00\x00\x00 \x00P\x00y\x00I\x00n\x00\
-s\x00t\x00a\x00l\x00l\x00e\x00r\x00 \x90\
-\x09\x98y\x8b\xe6`\xc5\x08\x00\x00\x00\x00\x06\x00\x00\x00\
-\x1bPyInstaller Opt\
-ions Details\x07\x00\x00\x00\
+FileDlg\x01\x03\x00\x00\x00\x08b@g\
+\x09~\xa7R+\x08\x00\x00\x00\x00\x06\x00\x00\x00\x0aA\
+ll Levels\x07\x00\x00\x00\x07Lo\
+gView\x01\x03\x00\x00\x00\x0eN\xc5\x00 \x00\
+E\x00R\x00R\x00O\x00R\x08\x00\x00\x00\x00\x06\x00\
+\x00\x00\x0aERROR Only\x07\x00\x00\
+\x00\x07LogView\x01\x03\x00\x00\x00\x10\x00\
+I\x00N\x00F\x00O\x00 S\xcaN\xe5N\x0a\x08\
+\x00\x00\x00\x00\x06\x00\x00\x00\x0eINFO an\
+d Above\x07\x00\x00\x00\x07LogV\
+iew\x01\x03\x00\x00\x00\x10W(etN*e\
+\xe5_\xd7N-d\x1c}\x22\x08\x00\x00\x00\x00\x06\x00\
+\x00\x00\x14Search the wh\
+ole log\x07\x00\x00\x00\x07LogV\
+iew\x01\x03\x00\x00\x00\x16\x00W\x00A\x00R\x00\
+N\x00I\x00N\x00G\x00 S\xcaN\xe5N\x0a\x08\
+\x00\x00\x00\x00\x06\x00\x00\x00\x11WARNING\
+ and Above\x07\x00\x00\x00\x07L\
+ogView\x01\x03\x00\x00\x00\x0a\x00{\x000\
+\x00}\x00 \x88L\x08\x00\x00\x00\x00\x06\x00\x00\x00\x09\
+{0} lines\x07\x00\x00\x00\x07Lo\
+gView\x01\x03\x00\x00\x00\x16\x00{\x000\x00\
+}\x00 \x00/\x00 \x00{\x001\x00}\x00 \x88\
+L\x08\x00\x00\x00\x00\x06\x00\x00\x00\x10{0} o\
+f {1} lines\x07\x00\x00\x00\x07\
+LogView\x01\x03\x00\x00\x00 ]\xf2\x8d\
+\xf3\x8f\xc7g\x84^\xfa\xff\x0cN\x0ak!v\x84\x8f\
+\x93Q\xfa]\xf2f/g\x00e\xb00\x02\x08\x00\x00\
+\x00\x00\x06\x00\x00\x001Build ski\
+pped, the previo\
+us output is up \
+to date.\x07\x00\x00\x00\x07Mai\
+nApp\x01\x03\x00\x00\x00\x18kcW(h\xc0\
+g\xe5f/T&g\x09e9R\xa8\x00.\x00.\
+\x00.\x08\x00\x00\x00\x00\x06\x00\x00\x00\x17Chec\
+king for changes\
+...\x07\x00\x00\x00\x07MainApp\x01\
+\x03\x00\x00\x00\x04\x95\x19\x8b\xef\x08\x00\x00\x00\x00\x06\x00\
+\x00\x00\x05Error\x07\x00\x00\x00\x07Mai\
+nApp\x01\x03\x00\x00\x00\x08[\xfcQ\xfaN\xfb\
+R\xa1\x08\x00\x00\x00\x00\x06\x00\x00\x00\x0bExpo\
+rt Task\x07\x00\x00\x00\x07Main\
+App\x01\x03\x00\x00\x00\x16]\xf2\x5c\x06N\xfbR\
+\xa1[\xfcQ\xfa\x81\xf3\x00 \x00{\x000\x00}\x08\
+\x00\x00\x00\x00\x06\x00\x00\x00\x14Exporte\
+d task to {0}\x07\x00\x00\
+\x00\x07MainApp\x01\x03\x00\x00\x00\x08[\
+\xfcQeN\xfbR\xa1\x08\x00\x00\x00\x00\x06\x00\x00\x00\
+\x0bImport Task\x07\x00\x00\x00\
+\x07MainApp\x01\x03\x00\x00\x00\x16]\xf2\
+N\xce\x00 \x00{\x000\x00}\x00 [\xfcQe\
+N\xfbR\xa1\x08\x00\x00\x00\x00\x06\x00\x00\x00\x16Im\
+ported task from\
+ {0}\x07\x00\x00\x00\x07MainApp\
+\x01\x03\x00\x00\x00X\x81\xeaN\x0ak!b\x10R\x9f\
+g\x84^\xfaN\xe5gel\xa1g\x09N\xfbOU\
+e9R\xa8\xff\x0cN\x14\x00 \x00d\x00i\x00s\
+\x00t\x00 v\xee_UN-v\x84\x8f\x93Q\xfa\
+[\x8cY}e\xe0c_0\x02\x00\x0af/T&\
+N\xcd\x89\x81\x91\xcde\xb0g\x84^\xfa\xff\x1f\x08\x00\
+\x00\x00\x00\x06\x00\x00\x00qNothing \
+has changed sinc\
+e the last succe\
+ssful build, and\
+ its output in t\
+he dist folder i\
+s intact.\x0aRebuil\
+d anyway?\x07\x00\x00\x00\x07Ma\
+inApp\x01\x03\x00\x00\x00\x12\x8b\xf7QH\x90\
+\x09b\xe9QeS\xe3\x81\x1ag,0\x02\x08\x00\x00\
+\x00\x00\x06\x00\x00\x00%Please se\
+lect the entry s\
+cript first.\x07\x00\x00\x00\
+\x07MainApp\x01\x03\x00\x00\x00\x06\x5c1\
+~\xea0\x02\x08\x00\x00\x00\x00\x06\x00\x00\x00\x06Re\
+ady.\x07\x00\x00\x00\x07MainApp\
+\x01\x03\x00\x00\x004N\xfbR\xa1e\x87N\xf6\x00 \
+\x00(\x00*\x00.\x00y\x00a\x00m\x00l\x00 \
+\x00*\x00.\x00y\x00m\x00l\x00 \x00*\x00.\
+\x00j\x00s\x00o\x00n\x00)\x08\x00\x00\x00\x00\x06\
+\x00\x00\x00 Task Files (\
+*.yaml *.yml *.j\
+son)\x07\x00\x00\x00\x07MainApp\
+\x01\x03\x00\x00\x00\x08]\xf2f/g\x00e\xb0\x08\x00\
+\x00\x00\x00\x06\x00\x00\x00\x0aUp to Da\
+te\x07\x00\x00\x00\x07MainApp\x01\x03\
+\x00\x00\x00\x0cQsN\x8e\x00(\x00&\x00A\x00)\
+\x08\x00\x00\x00\x00\x06\x00\x00\x00\x06&About\
+\x07\x00\x00\x00\x0aMainWindow\x01\
+\x03\x00\x00\x00\x16g\x84^\xfa\x7f\x13[X\x00(\x00\
+&\x00B\x00)\x00.\x00.\x00.\x08\x00\x00\x00\x00\
+\x06\x00\x00\x00\x0f&Build Cach\
+e...\x07\x00\x00\x00\x0aMainWin\
+dow\x01\x03\x00\x00\x00\x0c\x90\x00Q\xfa\x00(\x00\
+&\x00E\x00)\x08\x00\x00\x00\x00\x06\x00\x00\x00\x05&\
+Exit\x07\x00\x00\x00\x0aMainWin\
+dow\x01\x03\x00\x00\x00\x0ce\x87N\xf6\x00(\x00\
+&\x00F\x00)\x08\x00\x00\x00\x00\x06\x00\x00\x00\x05&\
+File\x07\x00\x00\x00\x0aMainWin\
+dow\x01\x03\x00\x00\x00\x0c^.R\xa9\x00(\x00\
+&\x00H\x00)\x08\x00\x00\x00\x00\x06\x00\x00\x00\x05&\
+Help\x07\x00\x00\x00\x0aMainWin\
+dow\x01\x03\x00\x00\x00\x0c\x8b\xbe\x7fn\x00(\x00\
+&\x00S\x00)\x08\x00\x00\x00\x00\x06\x00\x00\x00\x09&\
+Settings\x07\x00\x00\x00\x0aMai\
+nWindow\x01\x03\x00\x00\x00\x0cQsN\
+\x8e\x00 \x00&\x00Q\x00t\x08\x00\x00\x00\x00\x06\x00\
+\x00\x00\x09About &Qt\x07\x00\x00\x00\
 \x0aMainWindow\x01\x03\x00\x00\x00\
-\x0cb\xa5TJ\x00 \x00B\x00u\x00g\x08\x00\x00\
-\x00\x00\x06\x00\x00\x00\x0bReport Bu\
-gs\x07\x00\x00\x00\x0aMainWindo\
-w\x01\x03\x00\x00\x00\x0cS\xd6m\x88\x00(\x00&\x00\
-C\x00)\x08\x00\x00\x00\x00\x06\x00\x00\x00\x07&Ca\
-ncel\x07\x00\x00\x00\x13MultiIt\
-emEditWindow\x01\x03\x00\x00\
-\x00\x0cR \x96d\x00(\x00&\x00D\x00)\x08\x00\
-\x00\x00\x00\x06\x00\x00\x00\x07&Delete\x07\
+\x0aQsN\x8ekdz\x0b^\x8f\x08\x00\x00\x00\x00\
+\x06\x00\x00\x00\x12About This \
+Program\x07\x00\x00\x00\x0aMain\
+Window\x01\x03\x00\x00\x00\x16g\x84^\xfa\
+e\xe5_\xd7\x00(\x00&\x00L\x00)\x00.\x00.\
+\x00.\x08\x00\x00\x00\x00\x06\x00\x00\x00\x0eBuil\
+d &Logs...\x07\x00\x00\x00\x0aM\
+ainWindow\x01\x03\x00\x00\x00\x12[\
+\xfcQ\xfaN\xfbR\xa1e\x87N\xf6\x00.\x00.\x00\
+.\x08\x00\x00\x00\x00\x06\x00\x00\x00\x13Expor\
+t Task File...\x07\x00\
+\x00\x00\x0aMainWindow\x01\x03\x00\
+\x00\x00\x12[\xfcQeN\xfbR\xa1e\x87N\xf6\x00\
+.\x00.\x00.\x08\x00\x00\x00\x00\x06\x00\x00\x00\x13I\
+mport Task File.\
+..\x07\x00\x00\x00\x0aMainWindo\
+w\x01\x03\x00\x00\x00*O\xddc\x01\x00 \x00P\x00\
+y\x00I\x00n\x00s\x00t\x00a\x00l\x00l\x00\
+e\x00r\x00 \x98\x84p\xed\x00(\x00&\x00W\x00\
+)\x08\x00\x00\x00\x00\x06\x00\x00\x00\x16Keep \
+PyInstaller &War\
+m\x07\x00\x00\x00\x0aMainWindow\
+\x01\x03\x00\x00\x00\x16bSS\x05\x96\x1fR\x17\x00(\
+\x00&\x00Q\x00)\x00.\x00.\x00.\x08\x00\x00\x00\
+\x00\x06\x00\x00\x00\x13Packaging \
+&Queue...\x07\x00\x00\x00\x0aMa\
+inWindow\x01\x03\x00\x00\x00\x1c\x00P\
+\x00y\x00I\x00n\x00s\x00t\x00a\x00l\x00l\
+\x00e\x00r\x00 e\x87hc\x08\x00\x00\x00\x00\x06\
+\x00\x00\x00\x19PyInstaller \
+Documentation\x07\x00\x00\
+\x00\x0aMainWindow\x01\x03\x00\x00\
+\x00 \x00P\x00y\x00I\x00n\x00s\x00t\x00a\
+\x00l\x00l\x00e\x00r\x00 \x90\x09\x98y\x8b\xe6\
+`\xc5\x08\x00\x00\x00\x00\x06\x00\x00\x00\x1bPyIn\
+staller Options \
+Details\x07\x00\x00\x00\x0aMain\
+Window\x01\x03\x00\x00\x00\x0cb\xa5TJ\
+\x00 \x00B\x00u\x00g\x08\x00\x00\x00\x00\x06\x00\x00\
+\x00\x0bReport Bugs\x07\x00\x00\
+\x00\x0aMainWindow\x01\x03\x00\x00\
+\x00\x0cS\xd6m\x88\x00(\x00&\x00C\x00)\x08\x00\
+\x00\x00\x00\x06\x00\x00\x00\x07&Cancel\x07\
 \x00\x00\x00\x13MultiItemEdi\
-tWindow\x01\x03\x00\x00\x00\x0ce\xb0^\
-\xfa\x00(\x00&\x00N\x00)\x08\x00\x00\x00\x00\x06\x00\
-\x00\x00\x04&New\x07\x00\x00\x00\x13Mult\
-iItemEditWindow\x01\
-\x03\x00\x00\x00\x0cxn\x8b\xa4\x00(\x00&\x00O\x00\
-)\x08\x00\x00\x00\x00\x06\x00\x00\x00\x03&OK\x07\x00\
-\x00\x00\x13MultiItemEdit\
-Window\x01\x03\x00\x00\x00\x0emO\x89\xc8\
-S\x05\x00(\x00&\x00B\x00)\x08\x00\x00\x00\x00\x06\
-\x00\x00\x00\x10&Browse pack\
-ages\x07\x00\x00\x00\x12MultiPk\
-gEditWindow\x01\x03\x00\x00\x00\
-\x0a]\xf2[\x89\x88\xc5v\x84S\x05\x08\x00\x00\x00\x00\
-\x06\x00\x00\x00\x12Installed P\
-ackages\x07\x00\x00\x00\x0dPkgB\
-rowserDlg\x01\x03\x00\x00\x00\x04S\
-\x05T\x0d\x08\x00\x00\x00\x00\x06\x00\x00\x00\x04Nam\
-e\x07\x00\x00\x00\x0dPkgBrowser\
-Dlg\x01\x03\x00\x00\x00\x04rHg,\x08\x00\x00\
-\x00\x00\x06\x00\x00\x00\x07Version\x07\x00\
+tWindow\x01\x03\x00\x00\x00\x0cR \x96\
+d\x00(\x00&\x00D\x00)\x08\x00\x00\x00\x00\x06\x00\
+\x00\x00\x07&Delete\x07\x00\x00\x00\x13M\
+ultiItemEditWind\
+ow\x01\x03\x00\x00\x00\x0ce\xb0^\xfa\x00(\x00&\
+\x00N\x00)\x08\x00\x00\x00\x00\x06\x00\x00\x00\x04&N\
+ew\x07\x00\x00\x00\x13MultiItem\
+EditWindow\x01\x03\x00\x00\x00\x0c\
+xn\x8b\xa4\x00(\x00&\x00O\x00)\x08\x00\x00\x00\
+\x00\x06\x00\x00\x00\x03&OK\x07\x00\x00\x00\x13Mu\
+ltiItemEditWindo\
+w\x01\x03\x00\x00\x00\x0emO\x89\xc8S\x05\x00(\x00\
+&\x00B\x00)\x08\x00\x00\x00\x00\x06\x00\x00\x00\x10&\
+Browse packages\x07\
+\x00\x00\x00\x12MultiPkgEdit\
+Window\x01\x03\x00\x00\x00\x0cm\xfbR\xa0\
+_SRMN\xfbR\xa1\x08\x00\x00\x00\x00\x06\x00\x00\
+\x00\x10Add Current Ta\
+sk\x07\x00\x00\x00\x11Packaging\
+QueueDlg\x01\x03\x00\x00\x00\x12m\xfb\
+R\xa0w\xe9\x965g\x84^\xfa\x00.\x00.\x00.\
+\x08\x00\x00\x00\x00\x06\x00\x00\x00\x13Add Ma\
+trix Build...\x07\x00\x00\
+\x00\x11PackagingQueue\
+Dlg\x01\x03\x00\x00\x00\x0em\xfbR\xa0\x81\x1ag\
+,\x00.\x00.\x00.\x08\x00\x00\x00\x00\x06\x00\x00\x00\
+\x0eAdd Scripts...\x07\
+\x00\x00\x00\x11PackagingQue\
+ueDlg\x01\x03\x00\x00\x00\x04S\xd6m\x88\x08\
+\x00\x00\x00\x00\x06\x00\x00\x00\x06Cancel\x07\
+\x00\x00\x00\x11PackagingQue\
+ueDlg\x01\x03\x00\x00\x00\x06]\xf2S\xd6m\
+\x88\x08\x00\x00\x00\x00\x06\x00\x00\x00\x09Cance\
+lled\x07\x00\x00\x00\x11Packagi\
+ngQueueDlg\x01\x03\x00\x00\x00\x10\
+n\x05\x96d]\xf2~\xd3g_v\x84N\xfbR\xa1\
+\x08\x00\x00\x00\x00\x06\x00\x00\x00\x0eClear \
+Finished\x07\x00\x00\x00\x11Pac\
+kagingQueueDlg\x01\x03\
+\x00\x00\x00\x04\x80\x17e\xf6\x08\x00\x00\x00\x00\x06\x00\x00\
+\x00\x08Duration\x07\x00\x00\x00\x11P\
+ackagingQueueDlg\
+\x01\x03\x00\x00\x00\x06\x90\x00Q\xfax\x01\x08\x00\x00\x00\
+\x00\x06\x00\x00\x00\x09Exit Code\x07\
+\x00\x00\x00\x11PackagingQue\
+ueDlg\x01\x03\x00\x00\x00\x04Y1\x8d%\x08\
+\x00\x00\x00\x00\x06\x00\x00\x00\x06Failed\x07\
+\x00\x00\x00\x11PackagingQue\
+ueDlg\x01\x03\x00\x00\x00\x06\x89\xe3\x91\xcaV\
+h\x08\x00\x00\x00\x00\x06\x00\x00\x00\x0bInter\
+preter\x07\x00\x00\x00\x11Packa\
+gingQueueDlg\x01\x03\x00\x00\
+\x00\x04T\x0dy\xf0\x08\x00\x00\x00\x00\x06\x00\x00\x00\x04\
+Name\x07\x00\x00\x00\x11Packagi\
+ngQueueDlg\x01\x03\x00\x00\x00\x08\
+\x8f\x93Q\xfaY'\x5c\x0f\x08\x00\x00\x00\x00\x06\x00\x00\
+\x00\x0bOutput Size\x07\x00\x00\
+\x00\x11PackagingQueue\
+Dlg\x01\x03\x00\x00\x00\x08bSS\x05\x96\x1fR\
+\x17\x08\x00\x00\x00\x00\x06\x00\x00\x00\x0fPacka\
+ging Queue\x07\x00\x00\x00\x11P\
+ackagingQueueDlg\
+\x01\x03\x00\x00\x00\x0c^v\x88LN\xfbR\xa1ep\
+\xff\x1a\x08\x00\x00\x00\x00\x06\x00\x00\x00\x0ePara\
+llel jobs:\x07\x00\x00\x00\x11P\
+ackagingQueueDlg\
+\x01\x03\x00\x00\x00\x06{I_\x85N-\x08\x00\x00\x00\
+\x00\x06\x00\x00\x00\x07Pending\x07\x00\x00\
+\x00\x11PackagingQueue\
+Dlg\x01\x03\x00\x00\x00\x04\x8f\xdb^\xa6\x08\x00\x00\
+\x00\x00\x06\x00\x00\x00\x08Progress\x07\
+\x00\x00\x00\x11PackagingQue\
+ueDlg\x01\x03\x00\x00\x00n\x96\x1fR\x17]\
+\xf2[\x8cb\x10\xff\x1a\x00{\x000\x00}\x00 N\
+*b\x10R\x9f\xff\x0c\x00{\x001\x00}\x00 N\
+*Y1\x8d%\xff\x0c\x00{\x002\x00}\x00 N\
+*]\xf2S\xd6m\x88\xff\x0c\x00{\x003\x00}\x00\
+ N*]\xf2f/g\x00e\xb0\xff\x0c`;\x80\
+\x17e\xf6\x00 \x00{\x004\x00:\x00.\x001\x00\
+f\x00}\x00 y\xd20\x02\x08\x00\x00\x00\x00\x06\x00\
+\x00\x00_Queue finishe\
+d: {0} succeeded\
+, {1} failed, {2\
+} cancelled, {3}\
+ up to date, tot\
+al time {4:.1f} \
+s.\x07\x00\x00\x00\x11Packaging\
+QueueDlg\x01\x03\x00\x00\x00\x06\x8f\xd0\
+\x88LN-\x08\x00\x00\x00\x00\x06\x00\x00\x00\x07Ru\
+nning\x07\x00\x00\x00\x11Packag\
+ingQueueDlg\x01\x03\x00\x00\x00\
+\x04_\x00Y\xcb\x08\x00\x00\x00\x00\x06\x00\x00\x00\x05S\
+tart\x07\x00\x00\x00\x11Packagi\
+ngQueueDlg\x01\x03\x00\x00\x00\x04\
+r\xb6`\x01\x08\x00\x00\x00\x00\x06\x00\x00\x00\x06St\
+atus\x07\x00\x00\x00\x11Packagi\
+ngQueueDlg\x01\x03\x00\x00\x00\x04\
+b\x10R\x9f\x08\x00\x00\x00\x00\x06\x00\x00\x00\x09Su\
+cceeded\x07\x00\x00\x00\x11Pack\
+agingQueueDlg\x01\x03\x00\
+\x00\x00\x08]\xf2f/g\x00e\xb0\x08\x00\x00\x00\x00\
+\x06\x00\x00\x00\x0aUp to Date\x07\
+\x00\x00\x00\x11PackagingQue\
+ueDlg\x01\x03\x00\x00\x00\x14\x83\xb7S\xd6]\
+\xf2[\x89\x88\xc5v\x84S\x05Y1\x8d%0\x02\x08\
+\x00\x00\x00\x00\x06\x00\x00\x00%Failed \
+to get the insta\
+lled packages.\x07\x00\
 \x00\x00\x0dPkgBrowserDlg\
-\x01\x03\x00\x00\x00\x04c\xcf\x8f\xf0\x08\x00\x00\x00\x00\x06\
-\x00\x00\x00\x0bDescription\x07\
-\x00\x00\x00\x16PyinstallerO\
-ptionTable\x01\x03\x00\x00\x00\x04\
-\x90\x09\x98y\x08\x00\x00\x00\x00\x06\x00\x00\x00\x06Op\
-tion\x07\x00\x00\x00\x16Pyinsta\
-llerOptionTable\x01\
-\x03\x00\x00\x00\x10b@g\x09e\x87N\xf6\x00 \x00\
-(\x00*\x00)\x08\x00\x00\x00\x00\x06\x00\x00\x00\x0dA\
-ll Files (*)\x07\x00\x00\x00\
-\x0dScriptFileDlg\x01\x03\
-\x00\x00\x00\x04S\xd6m\x88\x08\x00\x00\x00\x00\x06\x00\x00\
-\x00\x06Cancel\x07\x00\x00\x00\x0dScr\
-iptFileDlg\x01\x03\x00\x00\x00\x04\
-bS_\x00\x08\x00\x00\x00\x00\x06\x00\x00\x00\x04Op\
-en\x07\x00\x00\x00\x0dScriptFil\
-eDlg\x01\x03\x00\x00\x00\x14\x00P\x00y\x00t\
-\x00h\x00o\x00nQeS\xe3e\x87N\xf6\x08\x00\
-\x00\x00\x00\x06\x00\x00\x00\x11Python E\
-ntry File\x07\x00\x00\x00\x0dSc\
-riptFileDlg\x01\x03\x00\x00\x00\
-\x12\x00P\x00y\x00t\x00h\x00o\x00n\x00 e\
-\x87N\xf6\x08\x00\x00\x00\x00\x06\x00\x00\x00\x0bPyt\
-hon File\x07\x00\x00\x00\x0dScr\
-iptFileDlg\x01\x03\x00\x00\x000\
-\x00P\x00y\x00t\x00h\x00o\x00n\x00 \x81\x1a\
-g,e\x87N\xf6\x00 \x00(\x00*\x00.\x00p\
-\x00y\x00 \x00*\x00.\x00p\x00y\x00w\x00)\
-\x08\x00\x00\x00\x00\x06\x00\x00\x00\x1aPython\
- Script (*.py *.\
-pyw)\x07\x00\x00\x00\x0dScriptF\
+\x01\x03\x00\x00\x00\x0a]\xf2[\x89\x88\xc5v\x84S\x05\
+\x08\x00\x00\x00\x00\x06\x00\x00\x00\x12Instal\
+led Packages\x07\x00\x00\x00\
+\x0dPkgBrowserDlg\x01\x03\
+\x00\x00\x00\x18kcW(R\xa0\x8f}]\xf2[\x89\
+\x88\xc5v\x84S\x05\x00.\x00.\x00.\x08\x00\x00\x00\
+\x00\x06\x00\x00\x00\x1dLoading in\
+stalled packages\
+...\x07\x00\x00\x00\x0dPkgBrows\
+erDlg\x01\x03\x00\x00\x00\x04S\x05T\x0d\x08\
+\x00\x00\x00\x00\x06\x00\x00\x00\x04Name\x07\x00\x00\
+\x00\x0dPkgBrowserDlg\x01\
+\x03\x00\x00\x00\x04rHg,\x08\x00\x00\x00\x00\x06\x00\
+\x00\x00\x07Version\x07\x00\x00\x00\x0dP\
+kgBrowserDlg\x01\x03\x00\x00\
+\x00\x0aV\xfa[\x9akds\xafX\x83\x08\x00\x00\x00\
+\x00\x06\x00\x00\x00\x14Pin this e\
+nvironment\x07\x00\x00\x00\x0dP\
+yEnvComboBox\x01\x03\x00\x00\
+\x00\x1e]\xf2V\xfa[\x9av\x84s\xafX\x83O\x1a\
+W(T/R\xa8e\xf6\x81\xeaR\xa8R\xa0\x8f}\
+\x08\x00\x00\x00\x00\x06\x00\x00\x007Pinned\
+ environments ar\
+e loaded automat\
+ically at startu\
+p\x07\x00\x00\x00\x0dPyEnvCombo\
+Box\x01\x03\x00\x00\x00\x0cR\xa0\x8f}N-\x00\
+.\x00.\x00.\x08\x00\x00\x00\x00\x06\x00\x00\x00\x0al\
+oading...\x07\x00\x00\x00\x0dPy\
+EnvComboBox\x01\x03\x00\x00\x00\
+\x06N\x0dS\xefu(\x08\x00\x00\x00\x00\x06\x00\x00\x00\
+\x0bunavailable\x07\x00\x00\x00\
+\x0dPyEnvComboBox\x01\x03\
+\x00\x00\x00\x1eR\x06R+O\x7fu(N\xe5N\x0b\
+s\xafX\x83g\x84^\xfa_SRMN\xfbR\xa1\
+\xff\x1a\x08\x00\x00\x00\x00\x06\x00\x00\x00$Buil\
+d the current ta\
+sk with each of:\
+\x07\x00\x00\x00\x0ePyEnvSelect\
+Dlg\x01\x03\x00\x00\x00\x18\x90\x09b\xe9\x00 \x00\
+P\x00y\x00t\x00h\x00o\x00n\x00 s\xafX\
+\x83\x08\x00\x00\x00\x00\x06\x00\x00\x00\x1aSelec\
+t Python Environ\
+ments\x07\x00\x00\x00\x0ePyEnvS\
+electDlg\x01\x03\x00\x00\x00\x04c\xcf\
+\x8f\xf0\x08\x00\x00\x00\x00\x06\x00\x00\x00\x0bDesc\
+ription\x07\x00\x00\x00\x16Pyin\
+stallerOptionTab\
+le\x01\x03\x00\x00\x00\x04\x90\x09\x98y\x08\x00\x00\x00\
+\x00\x06\x00\x00\x00\x06Option\x07\x00\x00\x00\
+\x16PyinstallerOpti\
+onTable\x01\x03\x00\x00\x00\x10b@g\
+\x09e\x87N\xf6\x00 \x00(\x00*\x00)\x08\x00\x00\
+\x00\x00\x06\x00\x00\x00\x0dAll Files\
+ (*)\x07\x00\x00\x00\x0dScriptF\
 ileDlg\x01\x03\x00\x00\x00\x04S\xd6m\x88\
 \x08\x00\x00\x00\x00\x06\x00\x00\x00\x06Cancel\
-\x07\x00\x00\x00\x0dSubProcessD\
-lg\x01\x03\x00\x00\x00\x04Qs\x95\xed\x08\x00\x00\x00\
-\x00\x06\x00\x00\x00\x05Close\x07\x00\x00\x00\x0d\
-SubProcessDlg\x01\x03\x00\
-\x00\x00\x0abSS\x05[\x8cb\x10\xff\x01\x08\x00\x00\
-\x00\x00\x06\x00\x00\x00\x05Done!\x07\x00\x00\x00\
+\x07\x00\x00\x00\x0dScriptFileD\
+lg\x01\x03\x00\x00\x00\x04bS_\x00\x08\x00\x00\x00\
+\x00\x06\x00\x00\x00\x04Open\x07\x00\x00\x00\x0dS\
+criptFileDlg\x01\x03\x00\x00\
+\x00\x14\x00P\x00y\x00t\x00h\x00o\x00nQe\
+S\xe3e\x87N\xf6\x08\x00\x00\x00\x00\x06\x00\x00\x00\x11\
+Python Entry Fil\
+e\x07\x00\x00\x00\x0dScriptFile\
+Dlg\x01\x03\x00\x00\x00\x12\x00P\x00y\x00t\x00\
+h\x00o\x00n\x00 e\x87N\xf6\x08\x00\x00\x00\x00\
+\x06\x00\x00\x00\x0bPython File\
+\x07\x00\x00\x00\x0dScriptFileD\
+lg\x01\x03\x00\x00\x000\x00P\x00y\x00t\x00h\
+\x00o\x00n\x00 \x81\x1ag,e\x87N\xf6\x00 \
+\x00(\x00*\x00.\x00p\x00y\x00 \x00*\x00.\
+\x00p\x00y\x00w\x00)\x08\x00\x00\x00\x00\x06\x00\x00\
+\x00\x1aPython Script \
+(*.py *.pyw)\x07\x00\x00\x00\
+\x0dScriptFileDlg\x01\x03\
+\x00\x00\x00\x04S\xd6m\x88\x08\x00\x00\x00\x00\x06\x00\x00\
+\x00\x06Cancel\x07\x00\x00\x00\x0dSub\
+ProcessDlg\x01\x03\x00\x00\x00\x04\
+Qs\x95\xed\x08\x00\x00\x00\x00\x06\x00\x00\x00\x05Cl\
+ose\x07\x00\x00\x00\x0dSubProce\
+ssDlg\x01\x03\x00\x00\x00\x0abSS\x05[\
+\x8cb\x10\xff\x01\x08\x00\x00\x00\x00\x06\x00\x00\x00\x05D\
+one!\x07\x00\x00\x00\x0dSubProc\
+essDlg\x01\x03\x00\x00\x00 \x8f\xd0\x88L\
+~\xd3g_\xff\x0cOFg\x09\x95\x19\x8b\xefS\xd1\
+u\x1f\xff\x0c\x90\x00Q\xfax\x01N:\x08\x00\x00\x00\
+\x00\x06\x00\x00\x008Execution \
+ends, but an err\
+or occurs and th\
+e exit code is\x07\x00\
+\x00\x00\x0dSubProcessDlg\
+\x01\x03\x00\x00\x00\x0cbS_\x00\x8f\x93Q\xfaOM\
+\x7fn\x08\x00\x00\x00\x00\x06\x00\x00\x00\x09Open\
+ Dist\x07\x00\x00\x00\x0dSubPro\
+cessDlg\x01\x03\x00\x00\x006\x8b\xf7h\
+\xc0g\xe5f/T&]\xf2~\xcf[\x89\x88\xc5k\
+cxnrHg,v\x84\x00 \x00P\x00y\x00\
+I\x00n\x00s\x00t\x00a\x00l\x00l\x00e\x00\
+r0\x02\x08\x00\x00\x00\x00\x06\x00\x00\x00MPle\
+ase check if you\
+ have installed \
+the correct vers\
+ion of PyInstall\
+er or not.\x07\x00\x00\x00\x0dS\
+ubProcessDlg\x01\x03\x00\x00\
+\x00\x1e\x00P\x00y\x00I\x00n\x00s\x00t\x00a\
+\x00l\x00l\x00e\x00r\x00 \x95\x19\x8b\xef\xff\x01\
+\x08\x00\x00\x00\x00\x06\x00\x00\x00\x12PyInst\
+aller Error!\x07\x00\x00\x00\
 \x0dSubProcessDlg\x01\x03\
-\x00\x00\x00 \x8f\xd0\x88L~\xd3g_\xff\x0cOF\
-g\x09\x95\x19\x8b\xefS\xd1u\x1f\xff\x0c\x90\x00Q\xfa\
-x\x01N:\x08\x00\x00\x00\x00\x06\x00\x00\x008Ex\
-ecution ends, bu\
-t an error occur\
-s and the exit c\
-ode is\x07\x00\x00\x00\x0dSubPr\
-ocessDlg\x01\x03\x00\x00\x00\x0cbS\
-_\x00\x8f\x93Q\xfaOM\x7fn\x08\x00\x00\x00\x00\x06\
-\x00\x00\x00\x09Open Dist\x07\x00\x00\
-\x00\x0dSubProcessDlg\x01\
-\x03\x00\x00\x006\x8b\xf7h\xc0g\xe5f/T&]\
-\xf2~\xcf[\x89\x88\xc5kcxnrHg,v\
-\x84\x00 \x00P\x00y\x00I\x00n\x00s\x00t\x00\
-a\x00l\x00l\x00e\x00r0\x02\x08\x00\x00\x00\x00\
-\x06\x00\x00\x00MPlease chec\
-k if you have in\
-stalled the corr\
-ect version of P\
-yInstaller or no\
-t.\x07\x00\x00\x00\x0dSubProces\
-sDlg\x01\x03\x00\x00\x00\x1e\x00P\x00y\x00I\
-\x00n\x00s\x00t\x00a\x00l\x00l\x00e\x00r\
-\x00 \x95\x19\x8b\xef\xff\x01\x08\x00\x00\x00\x00\x06\x00\x00\
-\x00\x12PyInstaller Er\
-ror!\x07\x00\x00\x00\x0dSubProc\
-essDlg\x01\x03\x00\x00\x00$\x00P\x00y\
-\x00I\x00n\x00s\x00t\x00a\x00l\x00l\x00e\
-\x00r\x00 [P\x8f\xdbz\x0b\x8f\x93Q\xfa\xff\x1a\
-\x08\x00\x00\x00\x00\x06\x00\x00\x00\x1ePyInst\
-aller subprocess\
- output:\x07\x00\x00\x00\x0dSub\
-ProcessDlg\x01\x03\x00\x00\x00\x0a\
-^\x94u(V\xfeh\x07\xff\x1a\x08\x00\x00\x00\x00\x06\
-\x00\x00\x00\x09App icon:\x07\x00\x00\
-\x00\x12WinMacCenterWi\
-dget\x01\x03\x00\x00\x00\x04mO\x89\xc8\x08\x00\
-\x00\x00\x00\x06\x00\x00\x00\x06Browse\x07\x00\
-\x00\x00\x12WinMacCenterW\
-idget\x01\x03\x00\x00\x00\x04\x95\x19\x8b\xef\x08\
-\x00\x00\x00\x00\x06\x00\x00\x00\x05Error\x07\x00\
-\x00\x00\x12WinMacCenterW\
-idget\x01\x03\x00\x00\x00\x14N:h\x07Q\
-\xc6\x00I\x00/\x00OT/u(~\xc8z\xef\x08\
-\x00\x00\x00\x00\x06\x00\x00\x00&Open a \
-console window f\
-or standard I/O\x07\
-\x00\x00\x00\x12WinMacCenter\
-Widget\x01\x03\x00\x00\x00\x12bS_\x00\
-v\x84V\xfeh\x07\x8d\xef_\x84\xff\x1a\x00 \x08\x00\
-\x00\x00\x00\x06\x00\x00\x00\x12Opened i\
-con path: \x07\x00\x00\x00\x12W\
-inMacCenterWidge\
-t\x01\x03\x00\x00\x00\x08V\xfeh\x07\x8d\xef_\x84\x08\
-\x00\x00\x00\x00\x06\x00\x00\x00\x11Path to\
- icon file\x07\x00\x00\x00\x12W\
-inMacCenterWidge\
-t\x01\x03\x00\x00\x00&\x5c\x06N:bSS\x05z\
+\x00\x00\x00$\x00P\x00y\x00I\x00n\x00s\x00t\
+\x00a\x00l\x00l\x00e\x00r\x00 [P\x8f\xdb\
+z\x0b\x8f\x93Q\xfa\xff\x1a\x08\x00\x00\x00\x00\x06\x00\x00\
+\x00\x1ePyInstaller su\
+bprocess output:\
+\x07\x00\x00\x00\x0dSubProcessD\
+lg\x01\x03\x00\x00\x00\x0a^\x94u(V\xfeh\x07\
+\xff\x1a\x08\x00\x00\x00\x00\x06\x00\x00\x00\x09App \
+icon:\x07\x00\x00\x00\x12WinMac\
+CenterWidget\x01\x03\x00\x00\
+\x00\x04mO\x89\xc8\x08\x00\x00\x00\x00\x06\x00\x00\x00\x06\
+Browse\x07\x00\x00\x00\x12WinMa\
+cCenterWidget\x01\x03\x00\
+\x00\x00\x04\x95\x19\x8b\xef\x08\x00\x00\x00\x00\x06\x00\x00\x00\
+\x05Error\x07\x00\x00\x00\x12WinMa\
+cCenterWidget\x01\x03\x00\
+\x00\x00\x14N:h\x07Q\xc6\x00I\x00/\x00OT\
+/u(~\xc8z\xef\x08\x00\x00\x00\x00\x06\x00\x00\x00\
+&Open a console \
+window for stand\
+ard I/O\x07\x00\x00\x00\x12WinM\
+acCenterWidget\x01\x03\
+\x00\x00\x00\x12bS_\x00v\x84V\xfeh\x07\x8d\xef\
+_\x84\xff\x1a\x00 \x08\x00\x00\x00\x00\x06\x00\x00\x00\x12\
+Opened icon path\
+: \x07\x00\x00\x00\x12WinMacCen\
+terWidget\x01\x03\x00\x00\x00\x08V\
+\xfeh\x07\x8d\xef_\x84\x08\x00\x00\x00\x00\x06\x00\x00\x00\
+\x11Path to icon fi\
+le\x07\x00\x00\x00\x12WinMacCen\
+terWidget\x01\x03\x00\x00\x00&\x5c\
+\x06N:bSS\x05z\x0b^\x8fv\x84\x00 \x00\
+s\x00t\x00d\x00i\x00o\x00 T/u(~\
+\xc8z\xef0\x02\x08\x00\x00\x00\x00\x06\x00\x00\x00\x19T\
+erminal will be \
+enabled.\x07\x00\x00\x00\x12Win\
+MacCenterWidget\x01\
+\x03\x00\x00\x00(N\x0dO\x1aN:bSS\x05z\
 \x0b^\x8fv\x84\x00 \x00s\x00t\x00d\x00i\x00\
 o\x00 T/u(~\xc8z\xef0\x02\x08\x00\x00\
-\x00\x00\x06\x00\x00\x00\x19Terminal \
-will be enabled.\
-\x07\x00\x00\x00\x12WinMacCente\
-rWidget\x01\x03\x00\x00\x00(N\x0dO\
-\x1aN:bSS\x05z\x0b^\x8fv\x84\x00 \x00\
-s\x00t\x00d\x00i\x00o\x00 T/u(~\
-\xc8z\xef0\x02\x08\x00\x00\x00\x00\x06\x00\x00\x00\x1dT\
-erminal will not\
- be enabled.\x07\x00\x00\x00\
-\x12WinMacCenterWid\
-get\x01\x03\x00\x00\x00&\x90\x09b\xe9v\x84N\
-\x0df/g\x09eHv\x84V\xfeh\x07e\x87N\
-\xf6\xff\x0c\x8b\xf7\x91\xcde\xb0\x90\x09b\xe9\xff\x01\x08\
-\x00\x00\x00\x00\x06\x00\x00\x00<The sel\
-ection is not a \
-valid icon file,\
- please re-selec\
-t it!\x07\x00\x00\x00\x12WinMac\
-CenterWidget\x01\
+\x00\x00\x06\x00\x00\x00\x1dTerminal \
+will not be enab\
+led.\x07\x00\x00\x00\x12WinMacC\
+enterWidget\x01\x03\x00\x00\x00\
+&\x90\x09b\xe9v\x84N\x0df/g\x09eHv\
+\x84V\xfeh\x07e\x87N\xf6\xff\x0c\x8b\xf7\x91\xcde\
+\xb0\x90\x09b\xe9\xff\x01\x08\x00\x00\x00\x00\x06\x00\x00\x00\
+<The selection i\
+s not a valid ic\
+on file, please \
+re-select it!\x07\x00\x00\
+\x00\x12WinMacCenterWi\
+dget\x01\x03\x00\x00\x00\x08g\x84^\xfa\x7f\x13\
+[X\x08\x00\x00\x00\x00\x06\x00\x00\x00\x0bBuil\
+d Cache\x07\x00\x00\x00\x10Work\
+pathCacheDlg\x01\x03\x00\x00\
+\x00\x16kcW(\x8b\xa1{\x97\x7f\x13[XY'\
+\x5c\x0f\x00.\x00.\x00.\x08\x00\x00\x00\x00\x06\x00\x00\
+\x00\x19Calculating ca\
+che size...\x07\x00\x00\x00\x10\
+WorkpathCacheDlg\
+\x01\x03\x00\x00\x00\x04Qs\x95\xed\x08\x00\x00\x00\x00\x06\
+\x00\x00\x00\x05Close\x07\x00\x00\x00\x10Wo\
+rkpathCacheDlg\x01\x03\
+\x00\x00\x00Bf/T&R \x96db@g\x09\
+\x7f\x13[Xv\x84g\x84^\xfae\x87N\xf6\xff\x1f\
+kdT\x0ek\xcfN*\x98yv\xeev\x84N\x0b\
+N\x00k!g\x84^\xfa\x90\xfd\x5c\x06N\xceY4\
+_\x00Y\xcb0\x02\x08\x00\x00\x00\x00\x06\x00\x00\x00_\
+Delete all cache\
+d build files? T\
+he next build of\
+ every project w\
+ill have to star\
+t from scratch.\x07\
+\x00\x00\x00\x10WorkpathCach\
+eDlg\x01\x03\x00\x00\x00\x08g\x00\x8f\xd1O\x7f\
+u(\x08\x00\x00\x00\x00\x06\x00\x00\x00\x09Last\
+ Used\x07\x00\x00\x00\x10Workpa\
+thCacheDlg\x01\x03\x00\x00\x00\x0c\
+bS_\x00b@W(v\xee_U\x08\x00\x00\x00\
+\x00\x06\x00\x00\x00\x0bOpen Folde\
+r\x07\x00\x00\x00\x10WorkpathCa\
+cheDlg\x01\x03\x00\x00\x00\x08Qh\x90\xe8\
+n\x05\x96d\x08\x00\x00\x00\x00\x06\x00\x00\x00\x09Pu\
+rge All\x07\x00\x00\x00\x10Work\
+pathCacheDlg\x01\x03\x00\x00\
+\x00\x08n\x05\x96db@\x90\x09\x08\x00\x00\x00\x00\x06\
+\x00\x00\x00\x0ePurge Select\
+ed\x07\x00\x00\x00\x10WorkpathC\
+acheDlg\x01\x03\x00\x00\x00\x0ekcW\
+(n\x05\x96d\x00.\x00.\x00.\x08\x00\x00\x00\x00\
+\x06\x00\x00\x00\x0aPurging...\x07\
+\x00\x00\x00\x10WorkpathCach\
+eDlg\x01\x03\x00\x00\x00\x04\x81\x1ag,\x08\x00\
+\x00\x00\x00\x06\x00\x00\x00\x06Script\x07\x00\
+\x00\x00\x10WorkpathCache\
+Dlg\x01\x03\x00\x00\x00\x04Y'\x5c\x0f\x08\x00\x00\
+\x00\x00\x06\x00\x00\x00\x04Size\x07\x00\x00\x00\x10\
+WorkpathCacheDlg\
+\x01\x03\x00\x00\x00\x04S\xd8OS\x08\x00\x00\x00\x00\x06\
+\x00\x00\x00\x07Variant\x07\x00\x00\x00\x10\
+WorkpathCacheDlg\
+\x01\x03\x00\x00\x00VQq\x00 \x00{\x000\x00}\
+\x00 N*gav\xee\xff\x0c`;\x8b\xa1\x00 \
+\x00{\x001\x00}\xff\x08N\x0a\x96P\x00 \x00{\
+\x002\x00}\xff\x0cg*O\x7fu(v\x84ga\
+v\xee\x5c\x06W(\x00 \x00{\x003\x00}\x00 \
+Y)T\x0e\x8f\xc7g\x1f\xff\x090\x02\x08\x00\x00\x00\
+\x00\x06\x00\x00\x00L{0} entrie\
+s, {1} in total \
+(limit {2}, unus\
+ed entries expir\
+e after {3} days\
+).\x07\x00\x00\x00\x10WorkpathC\
+acheDlg\x01\
 \x00\x00\x0c\xf9\
 \x89\
 PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
@@ -4267,41 +4620,34 @@ qt_resource_struct = b"\
 \x00\x00\x00\x00\x00\x00\x00\x00\
 \x00\x00\x00\x00\x00\x02\x00\x00\x00\x04\x00\x00\x00\x04\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\xea\x00\x00\x00\x00\x00K\x00\x00\x9e\x0c\
-\x00\x00\x01\x8f\xa8c\xb0\xc3\
-\x00\x00\x00\xea\x00\x00\x002\x00:\x00\x00\xcf\xa3\
-\x00\x00\x01\x8f\xa8c\xb0\xc3\
-\x00\x00\x01\x16\x00\x00\x00\x00\x00K\x00\x00\xfe\xff\
-\x00\x00\x01\x8f\xa8c\xb0\xc2\
-\x00\x00\x01\x16\x00\x00\x002\x00:\x00\x01\x02\x12\
-\x00\x00\x01\x8f\xa8c\xb0\xc2\
-\x00\x00\x00\xbe\x00\x00\x00\x00\x00\x01\x00\x00\x83\xf5\
-\x00\x00\x01\x8f\xa8c\xb0\xc0\
-\x00\x00\x00D\x00\x00\x00\x00\x00\x01\x00\x00\x1db\
-\x00\x00\x01\x8f\xa8c\xb0\xbf\
-\x00\x00\x00\x90\x00\x00\x00\x00\x00\x01\x00\x007\x18\
-\x00\x00\x01\x8f\xa8c\xb0\xc0\
-\x00\x00\x00\xce\x00\x00\x00\x00\x00\x01\x00\x00\x94\xc1\
-\x00\x00\x01\x8f\xa8c\xb0\xbf\
-\x00\x00\x00\xa2\x00\x00\x00\x00\x00\x01\x00\x00Yu\
-\x00\x00\x01\x8f\xa8c\xb0\xc0\
-\x00\x00\x00r\x00\x00\x00\x00\x00\x01\x00\x00*_\
-\x00\x00\x01\x8f\xa8c\xb0\xbf\
+\x00\x00\x00\xea\x00\x00\x00\x00\x00K\x00\x00\xb4\x17\
+\x00\x00\x01\x99J\xce\x9ap\
+\x00\x00\x00\xea\x00\x00\x002\x00:\x00\x00\xe5\xae\
+\x00\x00\x01\x99J\xce\x9ap\
+\x00\x00\x01\x16\x00\x00\x00\x00\x00K\x00\x01\x15\x0a\
+\x00\x00\x01\x99J\xce\x9ap\
+\x00\x00\x01\x16\x00\x00\x002\x00:\x00\x01\x18\x1d\
+\x00\x00\x01\x99J\xce\x9ap\
+\x00\x00\x00\xbe\x00\x00\x00\x00\x00\x01\x00\x00\x9a\x00\
+\x00\x00\x01\x99J\xce\x9ap\
+\x00\x00\x00D\x00\x00\x00\x00\x00\x01\x00\x003m\
+\x00\x00\x01\x99J\xce\x9ap\
+\x00\x00\x00\x90\x00\x00\x00\x00\x00\x01\x00\x00M#\
+\x00\x00\x01\x99J\xce\x9ap\
+\x00\x00\x00\xce\x00\x00\x00\x00\x00\x01\x00\x00\xaa\xcc\
+\x00\x00\x01\x99J\xce\x9ap\
+\x00\x00\x00\xa2\x00\x00\x00\x00\x00\x01\x00\x00o\x80\
+\x00\x00\x01\x99J\xce\x9ap\
+\x00\x00\x00r\x00\x00\x00\x00\x00\x01\x00\x00@j\
+\x00\x00\x01\x99J\xce\x9ap\
 \x00\x00\x00.\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x8f\xa8c\xb0\xc4\
+\x00\x00\x01\xa1P\x88\x18D\
 "
 
-
 def qInitResources():
-    QtCore.qRegisterResourceData(
-        0x03, qt_resource_struct, qt_resource_name, qt_resource_data
-    )
-
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
 
 def qCleanupResources():
-    QtCore.qUnregisterResourceData(
-        0x03, qt_resource_struct, qt_resource_name, qt_resource_data
-    )
-
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
 
 qInitResources()
@@ -4,12 +4,12 @@
 <context>
     <name>AboutDlg</name>
     <message>
-        <location filename="../../Widgets/dialog_widgets.py" line="138"/>
+        <location filename="../../Widgets/dialog_widgets.py" line="176"/>
         <source>About</source>
         <translation>关于</translation>
     </message>
     <message>
-        <location filename="../../Widgets/dialog_widgets.py" line="163"/>
+        <location filename="../../Widgets/dialog_widgets.py" line="198"/>
         <source>Can&apos;t open the About document, try to reinstall this program.</source>
         <translation>无法打开关于文档，请尝试重新获取本程序。</translation>
     </message>
@@ -55,154 +55,187 @@
 <context>
     <name>ArgumentsBrowser</name>
     <message>
-        <location filename="../../Widgets/arguments_browser.py" line="65"/>
+        <location filename="../../Widgets/arguments_browser.py" line="67"/>
         <source>Copy</source>
         <translation>复制</translation>
     </message>
     <message>
-        <location filename="../../Widgets/arguments_browser.py" line="67"/>
+        <location filename="../../Widgets/arguments_browser.py" line="69"/>
         <source>Export</source>
         <translation>导出</translation>
     </message>
 </context>
+<context>
+    <name>BuildLogDlg</name>
+    <message>
+        <location filename="../../Widgets/dialog_widgets.py" line="564"/>
+        <source>Build Logs</source>
+        <translation>构建日志</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/dialog_widgets.py" line="568"/>
+        <source>Open Folder</source>
+        <translation>打开所在目录</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/dialog_widgets.py" line="569"/>
+        <source>Close</source>
+        <translation>关闭</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/dialog_widgets.py" line="620"/>
+        <source>Error</source>
+        <translation>错误</translation>
+    </message>
+</context>
 <context>
     <name>CenterWidget</name>
     <message>
-        <location filename="../../Widgets/center_widget.py" line="128"/>
+        <location filename="../../Widgets/center_widget.py" line="130"/>
         <source>Python entry script path</source>
         <translation>Python 入口脚本路径</translation>
     </message>
     <message>
-        <location filename="../../Widgets/center_widget.py" line="129"/>
         <location filename="../../Widgets/center_widget.py" line="132"/>
+        <location filename="../../Widgets/center_widget.py" line="135"/>
         <source>Browse</source>
         <translation>浏览</translation>
     </message>
     <message>
-        <location filename="../../Widgets/center_widget.py" line="124"/>
+        <location filename="../../Widgets/center_widget.py" line="127"/>
         <source>Python script:</source>
         <translation>待打包脚本：</translation>
     </message>
     <message>
-        <location filename="../../Widgets/center_widget.py" line="135"/>
+        <location filename="../../Widgets/center_widget.py" line="138"/>
         <source>App Name:</source>
         <translation>项目名称：</translation>
     </message>
     <message>
-        <location filename="../../Widgets/center_widget.py" line="136"/>
+        <location filename="../../Widgets/center_widget.py" line="139"/>
         <source>Bundled app name</source>
         <translation>打包的应用程序名称</translation>
     </message>
     <message>
-        <location filename="../../Widgets/center_widget.py" line="138"/>
+        <location filename="../../Widgets/center_widget.py" line="141"/>
         <source>One Folder/ One File:</source>
         <translation>单目录/单文件：</translation>
     </message>
     <message>
-        <location filename="../../Widgets/center_widget.py" line="139"/>
+        <location filename="../../Widgets/center_widget.py" line="142"/>
         <source>One Folder</source>
         <translation>打包至单个目录</translation>
     </message>
     <message>
-        <location filename="../../Widgets/center_widget.py" line="141"/>
+        <location filename="../../Widgets/center_widget.py" line="144"/>
         <source>One File</source>
         <translation>打包至单个文件</translation>
     </message>
     <message>
-        <location filename="../../Widgets/center_widget.py" line="145"/>
-        <location filename="../../Widgets/center_widget.py" line="147"/>
+        <location filename="../../Widgets/center_widget.py" line="148"/>
+        <location filename="../../Widgets/center_widget.py" line="150"/>
         <source>Add Data Files</source>
         <translation>添加数据文件</translation>
     </message>
     <message>
-        <location filename="../../Widgets/center_widget.py" line="146"/>
-        <location filename="../../Widgets/center_widget.py" line="148"/>
+        <location filename="../../Widgets/center_widget.py" line="149"/>
+        <location filename="../../Widgets/center_widget.py" line="151"/>
         <source>Add Binary Files</source>
         <translation>添加二进制文件</translation>
     </message>
     <message>
-        <location filename="../../Widgets/center_widget.py" line="150"/>
+        <location filename="../../Widgets/center_widget.py" line="153"/>
         <source>Hidden Import</source>
         <translation>隐式导入</translation>
     </message>
     <message>
-        <location filename="../../Widgets/center_widget.py" line="153"/>
+        <location filename="../../Widgets/center_widget.py" line="156"/>
         <source>Clean</source>
         <translation>清理</translation>
     </message>
     <message>
-        <location filename="../../Widgets/center_widget.py" line="157"/>
+        <location filename="../../Widgets/center_widget.py" line="160"/>
         <source>Bundle!</source>
         <translation>打包！</translation>
     </message>
     <message>
-        <location filename="../../Widgets/center_widget.py" line="212"/>
+        <location filename="../../Widgets/center_widget.py" line="216"/>
         <source>Bundling into one folder.</source>
         <translation>将打包至单个目录中。</translation>
     </message>
     <message>
-        <location filename="../../Widgets/center_widget.py" line="215"/>
+        <location filename="../../Widgets/center_widget.py" line="219"/>
         <source>Bundling into one file.</source>
         <translation>将打包至单个文件中。</translation>
     </message>
     <message>
-        <location filename="../../Widgets/center_widget.py" line="229"/>
+        <location filename="../../Widgets/center_widget.py" line="233"/>
         <source>Add data files updated.</source>
         <translation>添加数据文件已更新。</translation>
     </message>
     <message>
-        <location filename="../../Widgets/center_widget.py" line="244"/>
+        <location filename="../../Widgets/center_widget.py" line="248"/>
         <source>Add binary files updated.</source>
         <translation>添加二进制文件已更新。</translation>
     </message>
     <message>
-        <location filename="../../Widgets/center_widget.py" line="261"/>
+        <location filename="../../Widgets/center_widget.py" line="265"/>
         <source>Hidden import updated.</source>
         <translation>隐式导入已更新。</translation>
     </message>
     <message>
-        <location filename="../../Widgets/center_widget.py" line="277"/>
+        <location filename="../../Widgets/center_widget.py" line="279"/>
         <source>Clean cache and remove temporary files before building.</source>
         <translation>构建前将清除缓存与临时目录。</translation>
     </message>
     <message>
-        <location filename="../../Widgets/center_widget.py" line="282"/>
+        <location filename="../../Widgets/center_widget.py" line="285"/>
         <source>Will not delete cache and temporary files.</source>
         <translation>不会删除缓存与临时文件。</translation>
     </message>
     <message>
-        <location filename="../../Widgets/center_widget.py" line="375"/>
+        <location filename="../../Widgets/center_widget.py" line="385"/>
         <source>Opened script path: </source>
         <translation>打开脚本路径： </translation>
     </message>
     <message>
-        <location filename="../../Widgets/center_widget.py" line="383"/>
+        <location filename="../../Widgets/center_widget.py" line="396"/>
         <source>The app name has been set to:</source>
         <translation>已将项目名设置为：</translation>
     </message>
     <message>
-        <location filename="../../Widgets/center_widget.py" line="399"/>
-        <location filename="../../Widgets/center_widget.py" line="472"/>
+        <location filename="../../Widgets/center_widget.py" line="453"/>
+        <location filename="../../Widgets/center_widget.py" line="512"/>
         <source>Error</source>
         <translation>错误</translation>
     </message>
     <message>
-        <location filename="../../Widgets/center_widget.py" line="403"/>
+        <location filename="../../Widgets/center_widget.py" line="455"/>
         <source>The selection is not a valid Python script file, please reselect it!</source>
         <translation>选择的不是有效的Python脚本文件，请重新选择！</translation>
     </message>
     <message>
-        <location filename="../../Widgets/center_widget.py" line="450"/>
+        <location filename="../../Widgets/center_widget.py" line="501"/>
+        <source>Checking the selected Python environment...</source>
+        <translation>正在检查所选的 Python 环境...</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/center_widget.py" line="563"/>
+        <source>Failed to check the Python environment: </source>
+        <translation>检查 Python 环境失败： </translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/center_widget.py" line="580"/>
         <source>Warning</source>
         <translation>警告</translation>
     </message>
     <message>
-        <location filename="../../Widgets/center_widget.py" line="454"/>
+        <location filename="../../Widgets/center_widget.py" line="582"/>
         <source>Pyinstaller doesn&apos;t seem to be installed in this Python environment, still continue?</source>
         <translation>在该 Python 环境中似乎没有安装 Pyinstaller，是否仍要继续？</translation>
     </message>
     <message>
-        <location filename="../../Widgets/center_widget.py" line="476"/>
+        <location filename="../../Widgets/center_widget.py" line="514"/>
         <source>The selection is not a valid Python interpreter, please reselect it!</source>
         <translation>选择的不是有效的Python解释器，请重新选择！</translation>
     </message>
@@ -210,32 +243,32 @@
 <context>
     <name>IconFileDlg</name>
     <message>
-        <location filename="../../Widgets/dialog_widgets.py" line="78"/>
+        <location filename="../../Widgets/dialog_widgets.py" line="116"/>
         <source>Icon Files (*.ico *.icns)</source>
         <translation>图标文件 (*.ico *.icns)</translation>
     </message>
     <message>
-        <location filename="../../Widgets/dialog_widgets.py" line="79"/>
+        <location filename="../../Widgets/dialog_widgets.py" line="117"/>
         <source>All Files (*)</source>
         <translation>所有文件 (*)</translation>
     </message>
     <message>
-        <location filename="../../Widgets/dialog_widgets.py" line="83"/>
+        <location filename="../../Widgets/dialog_widgets.py" line="121"/>
         <source>App Icon</source>
         <translation>图标</translation>
     </message>
     <message>
-        <location filename="../../Widgets/dialog_widgets.py" line="84"/>
+        <location filename="../../Widgets/dialog_widgets.py" line="122"/>
         <source>Icon File</source>
         <translation>图标文件</translation>
     </message>
     <message>
-        <location filename="../../Widgets/dialog_widgets.py" line="85"/>
+        <location filename="../../Widgets/dialog_widgets.py" line="123"/>
         <source>Open</source>
         <translation>打开</translation>
     </message>
     <message>
-        <location filename="../../Widgets/dialog_widgets.py" line="86"/>
+        <location filename="../../Widgets/dialog_widgets.py" line="124"/>
         <source>Cancel</source>
         <translation>取消</translation>
     </message>
@@ -243,44 +276,141 @@
 <context>
     <name>InterpreterFileDlg</name>
     <message>
-        <location filename="../../Widgets/dialog_widgets.py" line="104"/>
+        <location filename="../../Widgets/dialog_widgets.py" line="142"/>
         <source>Python Interpreter</source>
         <translation>Python 解释器</translation>
     </message>
     <message>
-        <location filename="../../Widgets/dialog_widgets.py" line="108"/>
+        <location filename="../../Widgets/dialog_widgets.py" line="145"/>
         <source>Executable File</source>
         <translation>可执行文件</translation>
     </message>
     <message>
-        <location filename="../../Widgets/dialog_widgets.py" line="113"/>
+        <location filename="../../Widgets/dialog_widgets.py" line="151"/>
         <source>Python Interpreter (python.exe)</source>
         <translation>Python 解释器 (python.exe)</translation>
     </message>
     <message>
-        <location filename="../../Widgets/dialog_widgets.py" line="114"/>
+        <location filename="../../Widgets/dialog_widgets.py" line="152"/>
         <source>Executable Files (*.exe)</source>
         <translation>可执行文件 (*.exe)</translation>
     </message>
     <message>
-        <location filename="../../Widgets/dialog_widgets.py" line="115"/>
-        <location filename="../../Widgets/dialog_widgets.py" line="122"/>
+        <location filename="../../Widgets/dialog_widgets.py" line="153"/>
+        <location filename="../../Widgets/dialog_widgets.py" line="160"/>
         <source>All Files (*)</source>
         <translation>所有文件 (*)</translation>
     </message>
     <message>
-        <location filename="../../Widgets/dialog_widgets.py" line="121"/>
+        <location filename="../../Widgets/dialog_widgets.py" line="159"/>
         <source>Python Interpreter (python3*)</source>
         <translation>Python 解释器 (python3*)</translation>
     </message>
 </context>
+<context>
+    <name>LogView</name>
+    <message>
+        <location filename="../../Widgets/log_view.py" line="61"/>
+        <source>Search the whole log</source>
+        <translation>在整个日志中搜索</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/log_view.py" line="65"/>
+        <source>All Levels</source>
+        <translation>所有级别</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/log_view.py" line="66"/>
+        <source>INFO and Above</source>
+        <translation>INFO 及以上</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/log_view.py" line="67"/>
+        <source>WARNING and Above</source>
+        <translation>WARNING 及以上</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/log_view.py" line="68"/>
+        <source>ERROR Only</source>
+        <translation>仅 ERROR</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/log_view.py" line="161"/>
+        <source>{0} of {1} lines</source>
+        <translation>{0} / {1} 行</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/log_view.py" line="164"/>
+        <source>{0} lines</source>
+        <translation>{0} 行</translation>
+    </message>
+</context>
 <context>
     <name>MainApp</name>
     <message>
-        <location filename="../../__main__.py" line="36"/>
+        <location filename="../../__main__.py" line="52"/>
         <source>Ready.</source>
         <translation>就绪。</translation>
     </message>
+    <message>
+        <location filename="../../__main__.py" line="104"/>
+        <source>Checking for changes...</source>
+        <translation>正在检查是否有改动...</translation>
+    </message>
+    <message>
+        <location filename="../../__main__.py" line="116"/>
+        <source>Up to Date</source>
+        <translation>已是最新</translation>
+    </message>
+    <message>
+        <location filename="../../__main__.py" line="118"/>
+        <source>Nothing has changed since the last successful build, and its output in the dist folder is intact.
+Rebuild anyway?</source>
+        <translation>自上次成功构建以来没有任何改动，且 dist 目录中的输出完好无损。
+是否仍要重新构建？</translation>
+    </message>
+    <message>
+        <location filename="../../__main__.py" line="125"/>
+        <source>Build skipped, the previous output is up to date.</source>
+        <translation>已跳过构建，上次的输出已是最新。</translation>
+    </message>
+    <message>
+        <location filename="../../__main__.py" line="166"/>
+        <location filename="../../__main__.py" line="198"/>
+        <source>Please select the entry script first.</source>
+        <translation>请先选择入口脚本。</translation>
+    </message>
+    <message>
+        <location filename="../../__main__.py" line="222"/>
+        <source>Task Files (*.yaml *.yml *.json)</source>
+        <translation>任务文件 (*.yaml *.yml *.json)</translation>
+    </message>
+    <message>
+        <location filename="../../__main__.py" line="229"/>
+        <source>Import Task</source>
+        <translation>导入任务</translation>
+    </message>
+    <message>
+        <location filename="../../__main__.py" line="237"/>
+        <location filename="../../__main__.py" line="265"/>
+        <source>Error</source>
+        <translation>错误</translation>
+    </message>
+    <message>
+        <location filename="../../__main__.py" line="246"/>
+        <source>Imported task from {0}</source>
+        <translation>已从 {0} 导入任务</translation>
+    </message>
+    <message>
+        <location filename="../../__main__.py" line="254"/>
+        <source>Export Task</source>
+        <translation>导出任务</translation>
+    </message>
+    <message>
+        <location filename="../../__main__.py" line="268"/>
+        <source>Exported task to {0}</source>
+        <translation>已将任务导出至 {0}</translation>
+    </message>
 </context>
 <context>
     <name>MainWindow</name>
@@ -290,57 +420,77 @@
         <translation>文件(&amp;F)</translation>
     </message>
     <message>
-        <location filename="../../Widgets/main_window.py" line="68"/>
-        <source>Import Config From JSON File</source>
-        <translation>从 JSON 文件中导入配置</translation>
+        <location filename="../../Widgets/main_window.py" line="70"/>
+        <source>Import Task File...</source>
+        <translation>导入任务文件...</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/main_window.py" line="73"/>
+        <source>Export Task File...</source>
+        <translation>导出任务文件...</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/main_window.py" line="78"/>
+        <source>Packaging &amp;Queue...</source>
+        <translation>打包队列(&amp;Q)...</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/main_window.py" line="81"/>
+        <source>&amp;Build Cache...</source>
+        <translation>构建缓存(&amp;B)...</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/main_window.py" line="83"/>
+        <source>Build &amp;Logs...</source>
+        <translation>构建日志(&amp;L)...</translation>
     </message>
     <message>
-        <location filename="../../Widgets/main_window.py" line="69"/>
-        <source>Export Config To JSON File</source>
-        <translation>导出配置至 JSON 文件</translation>
+        <location filename="../../Widgets/main_window.py" line="86"/>
+        <source>Keep PyInstaller &amp;Warm</source>
+        <translation>保持 PyInstaller 预热(&amp;W)</translation>
     </message>
     <message>
-        <location filename="../../Widgets/main_window.py" line="71"/>
+        <location filename="../../Widgets/main_window.py" line="90"/>
         <source>&amp;Settings</source>
         <translation>设置(&amp;S)</translation>
     </message>
     <message>
-        <location filename="../../Widgets/main_window.py" line="73"/>
+        <location filename="../../Widgets/main_window.py" line="92"/>
         <source>&amp;Exit</source>
         <translation>退出(&amp;E)</translation>
     </message>
     <message>
-        <location filename="../../Widgets/main_window.py" line="75"/>
+        <location filename="../../Widgets/main_window.py" line="94"/>
         <source>&amp;Help</source>
         <translation>帮助(&amp;H)</translation>
     </message>
     <message>
-        <location filename="../../Widgets/main_window.py" line="78"/>
+        <location filename="../../Widgets/main_window.py" line="97"/>
         <source>PyInstaller Documentation</source>
         <translation>PyInstaller 文档</translation>
     </message>
     <message>
-        <location filename="../../Widgets/main_window.py" line="82"/>
+        <location filename="../../Widgets/main_window.py" line="101"/>
         <source>PyInstaller Options Details</source>
         <translation>PyInstaller 选项详情</translation>
     </message>
     <message>
-        <location filename="../../Widgets/main_window.py" line="87"/>
+        <location filename="../../Widgets/main_window.py" line="106"/>
         <source>Report Bugs</source>
         <translation>报告 Bug</translation>
     </message>
     <message>
-        <location filename="../../Widgets/main_window.py" line="90"/>
+        <location filename="../../Widgets/main_window.py" line="109"/>
         <source>&amp;About</source>
         <translation>关于(&amp;A)</translation>
     </message>
     <message>
-        <location filename="../../Widgets/main_window.py" line="91"/>
+        <location filename="../../Widgets/main_window.py" line="110"/>
         <source>About This Program</source>
         <translation>关于此程序</translation>
     </message>
     <message>
-        <location filename="../../Widgets/main_window.py" line="92"/>
+        <location filename="../../Widgets/main_window.py" line="111"/>
         <source>About &amp;Qt</source>
         <translation>关于 &amp;Qt</translation>
     </message>
@@ -348,22 +498,22 @@
 <context>
     <name>MultiItemEditWindow</name>
     <message>
-        <location filename="../../Widgets/multi_item_edit_widget.py" line="72"/>
+        <location filename="../../Widgets/multi_item_edit_widget.py" line="73"/>
         <source>&amp;New</source>
         <translation>新建(&amp;N)</translation>
     </message>
     <message>
-        <location filename="../../Widgets/multi_item_edit_widget.py" line="73"/>
+        <location filename="../../Widgets/multi_item_edit_widget.py" line="74"/>
         <source>&amp;Delete</source>
         <translation>删除(&amp;D)</translation>
     </message>
     <message>
-        <location filename="../../Widgets/multi_item_edit_widget.py" line="75"/>
+        <location filename="../../Widgets/multi_item_edit_widget.py" line="76"/>
         <source>&amp;OK</source>
         <translation>确认(&amp;O)</translation>
     </message>
     <message>
-        <location filename="../../Widgets/multi_item_edit_widget.py" line="76"/>
+        <location filename="../../Widgets/multi_item_edit_widget.py" line="77"/>
         <source>&amp;Cancel</source>
         <translation>取消(&amp;C)</translation>
     </message>
@@ -371,29 +521,188 @@
 <context>
     <name>MultiPkgEditWindow</name>
     <message>
-        <location filename="../../Widgets/multi_item_edit_widget.py" line="192"/>
+        <location filename="../../Widgets/multi_item_edit_widget.py" line="193"/>
         <source>&amp;Browse packages</source>
         <translation>浏览包(&amp;B)</translation>
     </message>
 </context>
+<context>
+    <name>PackagingQueueDlg</name>
+    <message>
+        <location filename="../../Widgets/packaging_queue_widget.py" line="75"/>
+        <source>Packaging Queue</source>
+        <translation>打包队列</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/packaging_queue_widget.py" line="82"/>
+        <source>Name</source>
+        <translation>名称</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/packaging_queue_widget.py" line="83"/>
+        <source>Interpreter</source>
+        <translation>解释器</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/packaging_queue_widget.py" line="84"/>
+        <source>Status</source>
+        <translation>状态</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/packaging_queue_widget.py" line="85"/>
+        <source>Duration</source>
+        <translation>耗时</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/packaging_queue_widget.py" line="86"/>
+        <source>Exit Code</source>
+        <translation>退出码</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/packaging_queue_widget.py" line="87"/>
+        <source>Output Size</source>
+        <translation>输出大小</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/packaging_queue_widget.py" line="88"/>
+        <source>Progress</source>
+        <translation>进度</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/packaging_queue_widget.py" line="103"/>
+        <source>Add Current Task</source>
+        <translation>添加当前任务</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/packaging_queue_widget.py" line="104"/>
+        <source>Add Scripts...</source>
+        <translation>添加脚本...</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/packaging_queue_widget.py" line="105"/>
+        <source>Add Matrix Build...</source>
+        <translation>添加矩阵构建...</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/packaging_queue_widget.py" line="106"/>
+        <source>Start</source>
+        <translation>开始</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/packaging_queue_widget.py" line="107"/>
+        <source>Cancel</source>
+        <translation>取消</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/packaging_queue_widget.py" line="108"/>
+        <source>Clear Finished</source>
+        <translation>清除已结束的任务</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/packaging_queue_widget.py" line="116"/>
+        <source>Parallel jobs:</source>
+        <translation>并行任务数：</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/packaging_queue_widget.py" line="217"/>
+        <source>Queue finished: {0} succeeded, {1} failed, {2} cancelled, {3} up to date, total time {4:.1f} s.</source>
+        <translation>队列已完成：{0} 个成功，{1} 个失败，{2} 个已取消，{3} 个已是最新，总耗时 {4:.1f} 秒。</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/packaging_queue_widget.py" line="248"/>
+        <source>Pending</source>
+        <translation>等待中</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/packaging_queue_widget.py" line="249"/>
+        <source>Running</source>
+        <translation>运行中</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/packaging_queue_widget.py" line="250"/>
+        <source>Succeeded</source>
+        <translation>成功</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/packaging_queue_widget.py" line="251"/>
+        <source>Failed</source>
+        <translation>失败</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/packaging_queue_widget.py" line="252"/>
+        <source>Cancelled</source>
+        <translation>已取消</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/packaging_queue_widget.py" line="253"/>
+        <source>Up to Date</source>
+        <translation>已是最新</translation>
+    </message>
+</context>
 <context>
     <name>PkgBrowserDlg</name>
     <message>
-        <location filename="../../Widgets/dialog_widgets.py" line="184"/>
+        <location filename="../../Widgets/dialog_widgets.py" line="223"/>
         <source>Installed Packages</source>
         <translation>已安装的包</translation>
     </message>
     <message>
-        <location filename="../../Widgets/dialog_widgets.py" line="189"/>
+        <location filename="../../Widgets/dialog_widgets.py" line="228"/>
         <source>Name</source>
         <translatorcomment>这里专指软件包的名称</translatorcomment>
         <translation>包名</translation>
     </message>
     <message>
-        <location filename="../../Widgets/dialog_widgets.py" line="190"/>
+        <location filename="../../Widgets/dialog_widgets.py" line="228"/>
         <source>Version</source>
         <translation>版本</translation>
     </message>
+    <message>
+        <location filename="../../Widgets/dialog_widgets.py" line="252"/>
+        <source>Loading installed packages...</source>
+        <translation>正在加载已安装的包...</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/dialog_widgets.py" line="261"/>
+        <source>Failed to get the installed packages.</source>
+        <translation>获取已安装的包失败。</translation>
+    </message>
+</context>
+<context>
+    <name>PyEnvComboBox</name>
+    <message>
+        <location filename="../../Widgets/pyenv_combobox.py" line="139"/>
+        <source>unavailable</source>
+        <translation>不可用</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/pyenv_combobox.py" line="169"/>
+        <source>Pin this environment</source>
+        <translation>固定此环境</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/pyenv_combobox.py" line="173"/>
+        <source>Pinned environments are loaded automatically at startup</source>
+        <translation>已固定的环境会在启动时自动加载</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/pyenv_combobox.py" line="211"/>
+        <source>loading...</source>
+        <translation>加载中...</translation>
+    </message>
+</context>
+<context>
+    <name>PyEnvSelectDlg</name>
+    <message>
+        <location filename="../../Widgets/dialog_widgets.py" line="336"/>
+        <source>Select Python Environments</source>
+        <translation>选择 Python 环境</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/dialog_widgets.py" line="342"/>
+        <source>Build the current task with each of:</source>
+        <translation>分别使用以下环境构建当前任务：</translation>
+    </message>
 </context>
 <context>
     <name>PyinstallerOptionTable</name>
@@ -411,32 +720,32 @@
 <context>
     <name>ScriptFileDlg</name>
     <message>
-        <location filename="../../Widgets/dialog_widgets.py" line="49"/>
+        <location filename="../../Widgets/dialog_widgets.py" line="87"/>
         <source>Python Script (*.py *.pyw)</source>
         <translation>Python 脚本文件 (*.py *.pyw)</translation>
     </message>
     <message>
-        <location filename="../../Widgets/dialog_widgets.py" line="50"/>
+        <location filename="../../Widgets/dialog_widgets.py" line="88"/>
         <source>All Files (*)</source>
         <translation>所有文件 (*)</translation>
     </message>
     <message>
-        <location filename="../../Widgets/dialog_widgets.py" line="56"/>
+        <location filename="../../Widgets/dialog_widgets.py" line="93"/>
         <source>Python Entry File</source>
         <translation>Python入口文件</translation>
     </message>
     <message>
-        <location filename="../../Widgets/dialog_widgets.py" line="59"/>
+        <location filename="../../Widgets/dialog_widgets.py" line="96"/>
         <source>Python File</source>
         <translation>Python 文件</translation>
     </message>
     <message>
-        <location filename="../../Widgets/dialog_widgets.py" line="60"/>
+        <location filename="../../Widgets/dialog_widgets.py" line="98"/>
         <source>Open</source>
         <translation>打开</translation>
     </message>
     <message>
-        <location filename="../../Widgets/dialog_widgets.py" line="61"/>
+        <location filename="../../Widgets/dialog_widgets.py" line="99"/>
         <source>Cancel</source>
         <translation>取消</translation>
     </message>
@@ -444,47 +753,47 @@
 <context>
     <name>SubProcessDlg</name>
     <message>
-        <location filename="../../Widgets/subprocess_widget.py" line="78"/>
+        <location filename="../../Widgets/subprocess_widget.py" line="88"/>
         <source>Done!</source>
         <translatorcomment>此处专指PyInstaller运行完成。</translatorcomment>
         <translation>打包完成！</translation>
     </message>
     <message>
-        <location filename="../../Widgets/subprocess_widget.py" line="79"/>
-        <location filename="../../__main__.py" line="94"/>
+        <location filename="../../Widgets/subprocess_widget.py" line="89"/>
+        <location filename="../../__main__.py" line="146"/>
         <source>Open Dist</source>
         <translation>打开输出位置</translation>
     </message>
     <message>
-        <location filename="../../Widgets/subprocess_widget.py" line="85"/>
+        <location filename="../../Widgets/subprocess_widget.py" line="93"/>
         <source>Execution ends, but an error occurs and the exit code is</source>
         <translation>运行结束，但有错误发生，退出码为</translation>
     </message>
     <message>
-        <location filename="../../Widgets/subprocess_widget.py" line="68"/>
-        <location filename="../../Widgets/subprocess_widget.py" line="87"/>
-        <location filename="../../__main__.py" line="91"/>
+        <location filename="../../Widgets/subprocess_widget.py" line="76"/>
+        <location filename="../../Widgets/subprocess_widget.py" line="97"/>
+        <location filename="../../__main__.py" line="143"/>
         <source>Cancel</source>
         <translation>取消</translation>
     </message>
     <message>
-        <location filename="../../Widgets/subprocess_widget.py" line="90"/>
+        <location filename="../../Widgets/subprocess_widget.py" line="103"/>
         <source>PyInstaller Error!</source>
         <translation>PyInstaller 错误！</translation>
     </message>
     <message>
-        <location filename="../../Widgets/subprocess_widget.py" line="92"/>
+        <location filename="../../Widgets/subprocess_widget.py" line="105"/>
         <source>PyInstaller subprocess output:</source>
         <translation>PyInstaller 子进程输出：</translation>
     </message>
     <message>
-        <location filename="../../Widgets/subprocess_widget.py" line="99"/>
+        <location filename="../../Widgets/subprocess_widget.py" line="109"/>
         <source>Please check if you have installed the correct version of PyInstaller or not.</source>
         <translation>请检查是否已经安装正确版本的 PyInstaller。</translation>
     </message>
     <message>
-        <location filename="../../Widgets/subprocess_widget.py" line="100"/>
-        <location filename="../../__main__.py" line="100"/>
+        <location filename="../../Widgets/subprocess_widget.py" line="113"/>
+        <location filename="../../__main__.py" line="152"/>
         <source>Close</source>
         <translation>关闭</translation>
     </message>
@@ -492,49 +801,119 @@
 <context>
     <name>WinMacCenterWidget</name>
     <message>
-        <location filename="../../Widgets/center_widget.py" line="519"/>
+        <location filename="../../Widgets/center_widget.py" line="629"/>
         <source>App icon:</source>
         <translation>应用图标：</translation>
     </message>
     <message>
-        <location filename="../../Widgets/center_widget.py" line="521"/>
+        <location filename="../../Widgets/center_widget.py" line="631"/>
         <source>Path to icon file</source>
         <translation>图标路径</translation>
     </message>
     <message>
-        <location filename="../../Widgets/center_widget.py" line="522"/>
+        <location filename="../../Widgets/center_widget.py" line="632"/>
         <source>Browse</source>
         <translation>浏览</translation>
     </message>
     <message>
-        <location filename="../../Widgets/center_widget.py" line="527"/>
+        <location filename="../../Widgets/center_widget.py" line="636"/>
         <source>Open a console window for standard I/O</source>
         <translation>为标准I/O启用终端</translation>
     </message>
     <message>
-        <location filename="../../Widgets/center_widget.py" line="565"/>
+        <location filename="../../Widgets/center_widget.py" line="675"/>
         <source>Terminal will be enabled.</source>
         <translation>将为打包程序的 stdio 启用终端。</translation>
     </message>
     <message>
-        <location filename="../../Widgets/center_widget.py" line="570"/>
+        <location filename="../../Widgets/center_widget.py" line="679"/>
         <source>Terminal will not be enabled.</source>
         <translation>不会为打包程序的 stdio 启用终端。</translation>
     </message>
     <message>
-        <location filename="../../Widgets/center_widget.py" line="615"/>
+        <location filename="../../Widgets/center_widget.py" line="724"/>
         <source>Opened icon path: </source>
         <translation>打开的图标路径： </translation>
     </message>
     <message>
-        <location filename="../../Widgets/center_widget.py" line="632"/>
+        <location filename="../../Widgets/center_widget.py" line="760"/>
         <source>Error</source>
         <translation>错误</translation>
     </message>
     <message>
-        <location filename="../../Widgets/center_widget.py" line="635"/>
+        <location filename="../../Widgets/center_widget.py" line="762"/>
         <source>The selection is not a valid icon file, please re-select it!</source>
         <translation>选择的不是有效的图标文件，请重新选择！</translation>
     </message>
 </context>
+<context>
+    <name>WorkpathCacheDlg</name>
+    <message>
+        <location filename="../../Widgets/dialog_widgets.py" line="410"/>
+        <source>Build Cache</source>
+        <translation>构建缓存</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/dialog_widgets.py" line="417"/>
+        <source>Script</source>
+        <translation>脚本</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/dialog_widgets.py" line="418"/>
+        <source>Variant</source>
+        <translation>变体</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/dialog_widgets.py" line="419"/>
+        <source>Size</source>
+        <translation>大小</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/dialog_widgets.py" line="420"/>
+        <source>Last Used</source>
+        <translation>最近使用</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/dialog_widgets.py" line="431"/>
+        <source>Open Folder</source>
+        <translation>打开所在目录</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/dialog_widgets.py" line="432"/>
+        <source>Purge Selected</source>
+        <translation>清除所选</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/dialog_widgets.py" line="433"/>
+        <location filename="../../Widgets/dialog_widgets.py" line="529"/>
+        <source>Purge All</source>
+        <translation>全部清除</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/dialog_widgets.py" line="434"/>
+        <source>Close</source>
+        <translation>关闭</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/dialog_widgets.py" line="461"/>
+        <source>Calculating cache size...</source>
+        <translation>正在计算缓存大小...</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/dialog_widgets.py" line="494"/>
+        <source>{0} entries, {1} in total (limit {2}, unused entries expire after {3} days).</source>
+        <translation>共 {0} 个条目，总计 {1}（上限 {2}，未使用的条目将在 {3} 天后过期）。</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/dialog_widgets.py" line="521"/>
+        <location filename="../../Widgets/dialog_widgets.py" line="536"/>
+        <source>Purging...</source>
+        <translation>正在清除...</translation>
+    </message>
+    <message>
+        <location filename="../../Widgets/dialog_widgets.py" line="531"/>
+        <source>Delete all cached build files? The next build of every project will have to start from scratch.</source>
+        <translation>是否删除所有缓存的构建文件？此后每个项目的下一次构建都将从头开始。</translation>
+    </message>
+</context>
 </TS>
@@ -3,7 +3,11 @@
 
 """公共基础功能类与函数"""
 
+from .dist_info import normalize_pkg_name, scan_site_packages
 from .open_qfile import QtFileOpen
+from .pinned_pyenvs import PINNED_PY_ENVs, PinnedPyEnvRegistry
 from .platform_specific_funcs import *
+from .pyenv_cache import PYENV_CACHE, PyEnvCache
+from .pyenv_probe import probe_interpreter
 from .python_env import ALL_PY_ENVs, PyEnv
 from .qobject_tr import QObjTr
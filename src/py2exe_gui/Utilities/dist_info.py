@@ -0,0 +1,121 @@
+# Licensed under the GPLv3 License: https://www.gnu.org/licenses/gpl-3.0.html
+# For details: https://github.com/muziing/Py2exe-GUI/blob/main/README.md#license
+
+"""此模块包含直接读取 site-packages 中 `*.dist-info`、`*.egg-info` 元数据的函数
+
+在已知目标环境 site-packages 目录的情况下，无需启动任何子进程，
+仅通过 `os.scandir()` 遍历目录、读取 METADATA 文件头即可得到已安装的包列表，
+结果格式与 `pip list --format json` 一致，形如 [{"name": "black", "version": "23.12.1"}, ...]
+"""
+
+__all__ = [
+    "normalize_pkg_name",
+    "is_dist_entry",
+    "read_dist_entry",
+    "scan_site_packages",
+]
+
+import os
+import re
+from collections.abc import Iterable
+from typing import Optional
+
+_NORMALIZE_RE = re.compile(r"[-_.]+")
+_DIST_SUFFIXES = (".dist-info", ".egg-info")
+
+
+def normalize_pkg_name(name: str) -> str:
+    """按照 PEP 503 规则规范化包名，如 "PyInstaller" 与 "pyinstaller" 视为同一个包
+
+    https://peps.python.org/pep-0503/#normalized-names
+
+    :param name: 包名
+    :return: 规范化后的包名
+    """
+
+    return _NORMALIZE_RE.sub("-", name).lower()
+
+
+def is_dist_entry(entry_name: str) -> bool:
+    """判断目录项是否为包的元数据目录（或 egg-info 文件）
+
+    :param entry_name: 目录项名称
+    :return: 是否为 `*.dist-info` 或 `*.egg-info`
+    """
+
+    return entry_name.endswith(_DIST_SUFFIXES)
+
+
+def _read_metadata_headers(metadata_path: str) -> Optional[dict[str, str]]:
+    """读取元数据文件头部的 Name 与 Version 字段，读到空行（头部结束）即停止
+
+    :param metadata_path: METADATA 或 PKG-INFO 文件路径
+    :return: {"name": ..., "version": ...}，文件无法读取或缺少字段时返回 None
+    """
+
+    name = version = None
+    try:
+        with open(metadata_path, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                if not line.strip():
+                    break
+                if name is None and line.startswith("Name:"):
+                    name = line[5:].strip()
+                elif version is None and line.startswith("Version:"):
+                    version = line[8:].strip()
+                if name is not None and version is not None:
+                    break
+    except OSError:
+        return None
+
+    if not name or version is None:
+        return None
+    return {"name": name, "version": version}
+
+
+def read_dist_entry(site_dir: str, entry_name: str) -> Optional[dict[str, str]]:
+    """读取 site-packages 中单个 dist-info/egg-info 条目对应的包信息
+
+    :param site_dir: site-packages 目录
+    :param entry_name: 目录项名称，如 "black-23.12.1.dist-info"
+    :return: {"name": ..., "version": ...}，无法解析时返回 None
+    """
+
+    entry_path = os.path.join(site_dir, entry_name)
+    if entry_name.endswith(".dist-info"):
+        return _read_metadata_headers(os.path.join(entry_path, "METADATA"))
+    elif entry_name.endswith(".egg-info"):
+        if os.path.isdir(entry_path):
+            return _read_metadata_headers(os.path.join(entry_path, "PKG-INFO"))
+        # 旧式 distutils 安装的包，egg-info 本身即为 PKG-INFO 文件
+        return _read_metadata_headers(entry_path)
+    return None
+
+
+def scan_site_packages(search_paths: Iterable[str]) -> list[dict[str, str]]:
+    """遍历给定目录中的包元数据，获取已安装的包列表，不启动任何子进程
+
+    与 `importlib.metadata` 及 pip 的行为一致，同名的包以先出现的路径为准
+
+    :param search_paths: 待搜索的目录，通常为目标环境的 sys.path 或 site-packages 目录
+    :return: 按包名排序的包列表，形如 [{"name": "black", "version": "23.12.1"}, ...]
+    """
+
+    packages: dict[str, dict[str, str]] = {}
+    for search_path in search_paths:
+        try:
+            with os.scandir(search_path) as it:
+                entry_names = [entry.name for entry in it if is_dist_entry(entry.name)]
+        except OSError:
+            # 路径不存在、不是目录（如 zip 文件）或无权限访问
+            continue
+
+        for entry_name in entry_names:
+            pkg = read_dist_entry(search_path, entry_name)
+            if pkg is None:
+                continue
+            key = normalize_pkg_name(pkg["name"])
+            if key not in packages:
+                packages[key] = pkg
+
+    return sorted(packages.values(), key=lambda p: p["name"].lower())
@@ -0,0 +1,180 @@
+# Licensed under the GPLv3 License: https://www.gnu.org/licenses/gpl-3.0.html
+# For details: https://github.com/muziing/Py2exe-GUI/blob/main/README.md#license
+
+"""此模块主要包含已固定（pin）Python 环境的持久化注册表类 `PinnedPyEnvRegistry` 与全局变量 `PINNED_PY_ENVs`
+
+用户在解释器下拉框中固定的环境会连同其最近一次的内省信息保存到用户配置目录中。
+下次启动时直接根据这份快照创建 `PyEnv` 并填充下拉框，无需启动任何子进程；
+只有解释器可执行文件的“指纹”发生变化的条目，才需要在后台重新验证。
+"""
+
+__all__ = [
+    "PinnedPyEnvRegistry",
+    "PINNED_PY_ENVs",
+]
+
+import json
+import os
+import warnings
+from pathlib import Path
+from typing import Any, Union
+
+from ..Constants import AppConstant, PyEnvType
+from .platform_specific_funcs import get_user_config_dir
+from .pyenv_cache import PyEnvCache
+from .python_env import PyEnv
+
+
+class PinnedPyEnvRegistry:
+    """已固定 Python 环境的持久化注册表
+
+    注册表文件为 json 格式，结构形如：
+    [{"exe_path": "/path/to/python3", "type": "venv", "exe_fp": [...], "probe_info": {...}}, ...]
+
+    与 `PyEnvCache` 不同，注册表保存在用户配置目录而非缓存目录中，清理缓存不会丢失用户固定的环境。
+    """
+
+    def __init__(self, registry_file: Union[str, Path]) -> None:
+        """
+        :param registry_file: 注册表文件路径
+        """
+
+        self._registry_file = Path(registry_file)
+        self._entries: dict[str, dict[str, Any]] = {}  # {可执行文件路径: 条目}
+        self._loaded = False
+
+    def _load(self) -> None:
+        """从磁盘加载注册表文件，文件不存在或损坏时视为空注册表"""
+
+        self._loaded = True
+
+        try:
+            with open(self._registry_file, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            warnings.warn(
+                f"Failed to load pinned Python environments: {e}",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+            return
+
+        if isinstance(data, list):
+            self._entries = {
+                entry["exe_path"]: entry
+                for entry in data
+                if isinstance(entry, dict) and "exe_path" in entry
+            }
+
+    def _save(self) -> None:
+        """将注册表写入磁盘，先写入临时文件再替换，避免写入中断导致文件损坏"""
+
+        tmp_file = self._registry_file.with_suffix(".tmp")
+        try:
+            self._registry_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(list(self._entries.values()), f, ensure_ascii=False, indent=2)
+            os.replace(tmp_file, self._registry_file)
+        except OSError as e:
+            warnings.warn(
+                f"Failed to save pinned Python environments: {e}",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+
+    def _ensure_loaded(self) -> None:
+        """首次使用时才读取注册表文件"""
+
+        if not self._loaded:
+            self._load()
+
+    def load_pyenvs(self) -> list[PyEnv]:
+        """根据注册表快照创建所有已固定的 Python 环境，不启动任何子进程
+
+        指纹未变化的条目会直接使用快照中的内省信息；指纹已变化的条目不恢复快照，
+        其 `is_probed` 取决于 `PYENV_CACHE` 中是否有有效缓存，若没有则需由调用者在后台重新验证
+
+        :return: PyEnv 列表，按固定的先后顺序排列
+        """
+
+        self._ensure_loaded()
+
+        pyenvs: list[PyEnv] = []
+        for exe_path, entry in self._entries.items():
+            try:
+                type_ = PyEnvType[entry.get("type", "unknown")]
+            except KeyError:
+                type_ = PyEnvType.unknown
+            pyenv = PyEnv(exe_path, type_)
+
+            probe_info = entry.get("probe_info")
+            unchanged = entry.get("exe_fp") == PyEnvCache.exe_fingerprint(exe_path)
+            if unchanged and isinstance(probe_info, dict):
+                pyenv.restore_probe_info(probe_info)
+            pyenvs.append(pyenv)
+
+        return pyenvs
+
+    def is_pinned(self, pyenv: PyEnv) -> bool:
+        """该环境是否已被固定
+
+        :param pyenv: Python 环境
+        :return: 是否已固定
+        """
+
+        self._ensure_loaded()
+        return pyenv.exe_path in self._entries
+
+    def pin(self, pyenv: PyEnv) -> None:
+        """固定该环境，并立即保存至磁盘
+
+        :param pyenv: Python 环境
+        """
+
+        self._ensure_loaded()
+        self._entries[pyenv.exe_path] = self._make_entry(pyenv)
+        self._save()
+
+    def unpin(self, pyenv: PyEnv) -> None:
+        """取消固定该环境，并立即保存至磁盘
+
+        :param pyenv: Python 环境
+        """
+
+        self._ensure_loaded()
+        if self._entries.pop(pyenv.exe_path, None) is not None:
+            self._save()
+
+    def update(self, pyenv: PyEnv) -> None:
+        """若该环境已被固定，则用其最新的内省信息刷新快照，并立即保存至磁盘
+
+        :param pyenv: 已完成重新验证的 Python 环境
+        """
+
+        if self.is_pinned(pyenv):
+            self.pin(pyenv)
+
+    @staticmethod
+    def _make_entry(pyenv: PyEnv) -> dict[str, Any]:
+        """生成该环境的注册表条目，不会触发内省
+
+        :param pyenv: Python 环境
+        :return: 注册表条目
+        """
+
+        entry: dict[str, Any] = {
+            "exe_path": pyenv.exe_path,
+            "type": pyenv.type.name,
+            "exe_fp": PyEnvCache.exe_fingerprint(pyenv.exe_path),
+        }
+        if pyenv.is_probed:
+            entry["probe_info"] = pyenv.probe_info
+        return entry
+
+
+# 全局变量，用户固定的 Python 环境
+PINNED_PY_ENVs = PinnedPyEnvRegistry(
+    get_user_config_dir() / AppConstant.NAME / "pinned_pyenvs.json"
+)
@@ -8,16 +8,25 @@
 
 __all__ = [
     "open_dir_in_explorer",
+    "signal_process_tree",
     "get_sys_python",
+    "get_sys_python_candidates",
     "get_user_config_dir",
     "get_user_cache_dir",
+    "get_poetry_virtualenvs_dir",
     "get_venv_python",
 ]
 
+import functools
+import itertools
+import os
+import re
+import shutil
+import signal
 import subprocess
 import warnings
 from pathlib import Path
-from typing import Union
+from typing import Any, Optional, Union
 
 from ..Constants import RUNTIME_INFO, Platform
 
@@ -31,7 +40,6 @@ def open_dir_in_explorer(dir_path: Union[str, Path]) -> None:
 
     try:
         if RUNTIME_INFO.platform == Platform.windows:
-            import os  # fmt: skip
             os.startfile(dir_path)  # type: ignore
         elif RUNTIME_INFO.platform == Platform.linux:
             subprocess.call(["xdg-open", dir_path])
@@ -47,36 +55,294 @@ def open_dir_in_explorer(dir_path: Union[str, Path]) -> None:
         )
 
 
+def signal_process_tree(pid: int, force: bool = False) -> None:
+    """请求结束进程及其全部子进程，不阻塞、不等待其退出
+
+    非 Windows 平台下向以 pid 为组长的进程组发送 SIGTERM（force 时为 SIGKILL），
+    若该进程不是进程组组长，则只向其本身发送；Windows 下在后台运行 `taskkill /T`。
+    进程已退出时什么也不做
+
+    :param pid: 进程 ID
+    :param force: 是否强制杀死，而非请求其自行退出
+    """
+
+    if RUNTIME_INFO.platform == Platform.windows:
+        taskkill_args = ["taskkill", "/T", "/PID", str(pid)]
+        if force:
+            taskkill_args.insert(1, "/F")
+        try:
+            subprocess.Popen(
+                taskkill_args,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                creationflags=subprocess.CREATE_NO_WINDOW,  # type: ignore
+            )
+        except OSError as e:
+            warnings.warn(f"Failed to run taskkill: {e}", RuntimeWarning, stacklevel=2)
+        return
+
+    sig = signal.SIGKILL if force else signal.SIGTERM
+    try:
+        os.killpg(pid, sig)
+    except ProcessLookupError:
+        # 不存在以 pid 为组长的进程组
+        try:
+            os.kill(pid, sig)
+        except OSError:
+            pass  # 进程已经退出
+    except OSError:
+        pass
+
+
+# 形如 python3.11、python3.7m 的带版本号的解释器名称，排除 python3.11-config 等辅助文件
+_VERSIONED_PYTHON_RE = re.compile(r"python3\.\d+m?")
+_VERSION_RE = re.compile(r"(\d+)\.(\d+)")
+
+
+def _parse_version(text: str) -> Optional[tuple[int, int]]:
+    """从解释器文件名或注册表版本字符串中解析出 (主版本号, 次版本号)
+
+    :param text: 如 "python3.11"、"3.12"
+    :return: 版本号元组，无法解析时返回 None
+    """
+
+    match = _VERSION_RE.search(text)
+    if match is None:
+        return None
+    return int(match.group(1)), int(match.group(2))
+
+
+def _path_python_candidates() -> list[tuple[str, Optional[tuple[int, int]]]]:
+    """在环境变量 PATH 的各目录中查找 Python 解释器，仅检查文件系统
+
+    :return: [(可执行文件路径, 版本号), ...]，按 PATH 中的先后顺序排列
+    """
+
+    candidates: list[tuple[str, Optional[tuple[int, int]]]] = []
+    for path_dir in os.environ.get("PATH", "").split(os.pathsep):
+        if not path_dir:
+            continue
+        if RUNTIME_INFO.platform == Platform.windows:
+            # 跳过 Microsoft Store 的“应用执行别名”，运行它可能会打开商店页面
+            if "WindowsApps" in Path(path_dir).parts:
+                continue
+            names = ["python.exe", "python3.exe"]
+        else:
+            names = ["python3", "python"]
+            try:
+                names.extend(
+                    sorted(
+                        name
+                        for name in os.listdir(path_dir)
+                        if _VERSIONED_PYTHON_RE.fullmatch(name)
+                    )
+                )
+            except OSError:
+                continue
+
+        for name in names:
+            exe_path = shutil.which(name, path=path_dir)
+            if exe_path is None:
+                continue
+            # python3 等通常是指向 python3.11 的符号链接，由真实文件名得到版本号
+            version = _parse_version(os.path.basename(os.path.realpath(exe_path)))
+            candidates.append((exe_path, version))
+
+    return candidates
+
+
+def _registry_python_candidates() -> list[tuple[str, Optional[tuple[int, int]]]]:
+    """按照 PEP 514 从 Windows 注册表中读取已安装的 Python 解释器，py 启动器也使用这些信息
+
+    https://peps.python.org/pep-0514/
+
+    :return: [(可执行文件路径, 版本号), ...]，非 Windows 平台返回空列表
+    """
+
+    if RUNTIME_INFO.platform != Platform.windows:
+        return []
+
+    import winreg  # fmt: skip
+
+    candidates: list[tuple[str, Optional[tuple[int, int]]]] = []
+    roots = (
+        (winreg.HKEY_CURRENT_USER, 0),
+        (winreg.HKEY_LOCAL_MACHINE, winreg.KEY_WOW64_64KEY),
+        (winreg.HKEY_LOCAL_MACHINE, winreg.KEY_WOW64_32KEY),
+    )
+    for hive, view_flag in roots:
+        try:
+            python_key = winreg.OpenKey(
+                hive, r"Software\Python", 0, winreg.KEY_READ | view_flag
+            )
+        except OSError:
+            continue
+
+        with python_key:
+            for company_index in itertools.count():
+                try:
+                    company = winreg.EnumKey(python_key, company_index)
+                except OSError:
+                    break
+                if company == "PyLauncher":
+                    continue
+                with winreg.OpenKey(python_key, company) as company_key:
+                    for tag_index in itertools.count():
+                        try:
+                            tag = winreg.EnumKey(company_key, tag_index)
+                        except OSError:
+                            break
+                        candidate = _read_registry_tag(company_key, tag)
+                        if candidate is not None:
+                            candidates.append(candidate)
+
+    return candidates
+
+
+def _read_registry_tag(
+    company_key: Any, tag: str
+) -> Optional[tuple[str, Optional[tuple[int, int]]]]:
+    """读取注册表中单个 Python 安装（Tag）的可执行文件路径与版本号
+
+    :param company_key: 已打开的 Software\\Python\\<Company> 注册表键
+    :param tag: Tag 名称，如 "3.12"
+    :return: (可执行文件路径, 版本号)，信息不完整或文件不存在时返回 None
+    """
+
+    import winreg  # fmt: skip
+
+    try:
+        with winreg.OpenKey(company_key, tag) as tag_key:
+            try:
+                sys_version = winreg.QueryValueEx(tag_key, "SysVersion")[0]
+            except OSError:
+                sys_version = tag
+            with winreg.OpenKey(tag_key, "InstallPath") as install_key:
+                try:
+                    exe_path = winreg.QueryValueEx(install_key, "ExecutablePath")[0]
+                except OSError:
+                    install_dir = winreg.QueryValueEx(install_key, "")[0]
+                    exe_path = os.path.join(install_dir, "python.exe")
+    except OSError:
+        return None
+
+    if not os.path.isfile(exe_path):
+        return None
+    return exe_path, _parse_version(str(sys_version))
+
+
+def _in_env_dir(exe_path: str) -> bool:
+    """解释器是否位于虚拟环境或 conda 环境中（如激活环境后 PATH 中最靠前的 python），这类解释器不是系统解释器
+
+    :param exe_path: 解释器路径，不解析符号链接
+    :return: 环境根目录（解释器所在目录或其上一级）中是否存在 `pyvenv.cfg` 或 `conda-meta/`
+    """
+
+    exe_dir = Path(exe_path).absolute().parent
+    return any(
+        (prefix / "pyvenv.cfg").is_file() or (prefix / "conda-meta").is_dir()
+        for prefix in (exe_dir, exe_dir.parent)
+    )
+
+
+def _sys_python_fingerprint() -> list[Any]:
+    """计算系统解释器候选列表的“指纹”：PATH 的值与其中各目录的修改时间，
+    Windows 下还包括 PEP 514 注册表项的最后修改时间
+
+    在 PATH 目录中安装或删除解释器会改变目录的修改时间，从而使磁盘缓存失效
+
+    :return: 指纹
+    """
+
+    path_value = os.environ.get("PATH", "")
+    mtimes: list[Optional[int]] = []
+    for path_dir in path_value.split(os.pathsep):
+        try:
+            mtimes.append(os.stat(path_dir).st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+
+    if RUNTIME_INFO.platform == Platform.windows:
+        import winreg  # fmt: skip
+
+        for hive in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+            try:
+                with winreg.OpenKey(hive, r"Software\Python") as python_key:
+                    mtimes.append(winreg.QueryInfoKey(python_key)[2])
+            except OSError:
+                mtimes.append(None)
+
+    return [path_value, mtimes]
+
+
+@functools.cache
+def get_sys_python_candidates() -> tuple[str, ...]:
+    """获取本机所有系统 Python 解释器的可执行文件位置，按版本号从高到低排列
+
+    仅通过 `shutil.which()` 检查 PATH 中的各目录，Windows 下还会读取 PEP 514 注册表项，不启动任何子进程。
+    结果在进程生命周期内缓存，并持久化到磁盘缓存中，PATH 未发生变化时下次启动可直接读取。
+
+    :return: 解释器路径元组，指向同一文件的多个路径只保留 PATH 中最靠前的一个；无法得知版本号的排在最后。
+        位于虚拟环境或 conda 环境中的解释器（通常是指向基础解释器的符号链接）不计入
+    """
+
+    from .pyenv_cache import PYENV_CACHE  # 避免循环导入
+
+    fingerprint = _sys_python_fingerprint()
+    cached = PYENV_CACHE.get_global("sys_python_candidates", fingerprint)
+    if cached is not None:
+        return tuple(cached)
+
+    seen: set[str] = set()
+    found: list[tuple[str, Optional[tuple[int, int]]]] = []
+    for exe_path, version in _path_python_candidates() + _registry_python_candidates():
+        if _in_env_dir(exe_path):
+            # 激活的环境排在 PATH 最前，若不跳过，其 python 会顶替实际的系统解释器
+            continue
+        real_path = os.path.normcase(os.path.realpath(exe_path))
+        if real_path in seen:
+            continue
+        seen.add(real_path)
+        found.append((exe_path, version))
+
+    # sorted() 是稳定排序，同版本的解释器保持 PATH 中的先后顺序
+    found.sort(key=lambda item: (item[1] is None, [-v for v in item[1] or (0, 0)]))
+    candidates = tuple(exe_path for exe_path, _ in found)
+
+    PYENV_CACHE.set_global("sys_python_candidates", list(candidates), fingerprint)
+    return candidates
+
+
+@functools.cache
 def get_sys_python() -> str:
     """获取系统默认 Python 解释器的可执行文件位置
 
+    即在命令行中输入 `python3`（Windows 下为 `python`）时运行的解释器；若 PATH 中没有，
+    则返回 `get_sys_python_candidates()` 中版本号最高的一个。结果在进程生命周期内缓存。
+
     :return: Python 可执行文件路径
     :raise RuntimeError: 当前操作系统不受支持时抛出
     :raise FileNotFoundError: 未找到 Python 解释器抛出
     """
 
     if RUNTIME_INFO.platform == Platform.windows:
-        cmd = ["powershell.exe", "(Get-Command python).Path"]  # PowerShell
+        default_names = ["python"]
     elif RUNTIME_INFO.platform in (Platform.linux, Platform.macos):
-        cmd = ["which", "python3"]
+        default_names = ["python3", "python"]
     else:
         raise RuntimeError("Current OS is not supported.")
 
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        python_path = result.stdout.strip()
-    except subprocess.CalledProcessError as e:
-        warnings.warn(
-            f"Error occurred while trying to get system default Python interpreter: {e.output}",
-            RuntimeWarning,
-            stacklevel=2,
-        )
-        raise
+    for name in default_names:
+        exe_path = shutil.which(name)
+        # 跳过 Microsoft Store 的“应用执行别名”，运行它可能会打开商店页面
+        if exe_path is not None and "WindowsApps" not in Path(exe_path).parts:
+            return exe_path
 
-    if not Path(python_path).exists():
-        raise FileNotFoundError(f"Python interpreter not found: {python_path}")
+    candidates = get_sys_python_candidates()
+    if candidates:
+        return candidates[0]
 
-    return python_path
+    raise FileNotFoundError("Python interpreter not found.")
 
 
 def get_user_config_dir() -> Path:
@@ -113,6 +379,23 @@ def get_user_cache_dir() -> Path:
         raise RuntimeError("Current OS is not supported.")
 
 
+def get_poetry_virtualenvs_dir() -> Path:
+    """获取当前平台 Poetry 存放虚拟环境的缓存目录
+
+    https://python-poetry.org/docs/configuration/#virtualenvspath
+
+    :return: Poetry 虚拟环境缓存目录路径
+    :raise RuntimeError: 当前操作系统不受支持时抛出
+    """
+
+    if os.environ.get("POETRY_VIRTUALENVS_PATH"):
+        return Path(os.environ["POETRY_VIRTUALENVS_PATH"])
+    elif RUNTIME_INFO.platform == Platform.windows:
+        return get_user_cache_dir() / "pypoetry" / "Cache" / "virtualenvs"
+    else:
+        return get_user_cache_dir() / "pypoetry" / "virtualenvs"
+
+
 def get_venv_python(root_path: Union[str, Path]) -> Path:
     """获取当前平台 venv 虚拟环境中 Python 解释器的可执行文件位置
 
@@ -0,0 +1,308 @@
+# Licensed under the GPLv3 License: https://www.gnu.org/licenses/gpl-3.0.html
+# For details: https://github.com/muziing/Py2exe-GUI/blob/main/README.md#license
+
+"""此模块主要包含 Python 环境探测结果的磁盘缓存类 `PyEnvCache` 与全局变量 `PYENV_CACHE`
+
+获取 Python 版本、已安装的包等信息需要运行子进程，耗时较长。将这些结果以解释器路径为键持久化到
+用户缓存目录中，并记录解释器可执行文件与 site-packages 目录的“指纹”（修改时间与大小），
+下次启动时若指纹未变化则可直接读取缓存，一旦环境发生变化则缓存自动失效。
+
+写入缓存项后不会立即保存，而是在 `PyEnvCache.SAVE_DELAY` 秒后于后台线程中将期间的全部写入合并保存一次，
+程序退出时会保存尚未写入磁盘的改动。
+"""
+
+__all__ = [
+    "PyEnvCache",
+    "PYENV_CACHE",
+]
+
+import atexit
+import json
+import os
+import threading
+import warnings
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from ..Constants import AppConstant
+from .platform_specific_funcs import get_user_cache_dir
+
+
+def _stat_fingerprint(path: Union[str, Path]) -> Optional[list[int]]:
+    """获取文件或目录的“指纹”，即 [修改时间（纳秒）, 大小]
+
+    :param path: 文件或目录路径
+    :return: 指纹，路径不存在时返回 None
+    """
+
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        return None
+    return [stat_result.st_mtime_ns, stat_result.st_size]
+
+
+def guess_site_dirs(executable_path: Union[str, Path]) -> list[str]:
+    """根据解释器可执行文件位置，在文件系统中推测其 site-packages 目录，不运行子进程
+
+    :param executable_path: Python 可执行文件路径
+    :return: 存在的 site-packages 目录列表
+    """
+
+    exe_path = Path(executable_path).absolute()
+    # Windows 下解释器通常位于环境根目录或 Scripts 目录中，其他平台则位于 bin 目录中
+    prefixes = [exe_path.parent, exe_path.parent.parent]
+
+    site_dirs: list[str] = []
+    for prefix in prefixes:
+        candidates = [prefix / "Lib" / "site-packages"]
+        candidates.extend((prefix / "lib").glob("python3*/site-packages"))
+        candidates.extend((prefix / "lib").glob("python3*/dist-packages"))
+        for candidate in candidates:
+            if candidate.is_dir() and str(candidate) not in site_dirs:
+                site_dirs.append(str(candidate))
+
+    return site_dirs
+
+
+class PyEnvCache:
+    """Python 环境探测结果的磁盘缓存
+
+    缓存文件为 json 格式，结构形如：
+    {"/path/to/python3": {"exe_fp": [...], "site_fp": {...}, "probe_info": {...}, ...}, ...}
+
+    其中 `exe_fp` 为解释器可执行文件的指纹，`site_fp` 为各 site-packages 目录的指纹。
+    内省信息（版本、prefix 等）只依赖于可执行文件本身，已安装的包列表还依赖于 site-packages 目录内容。
+
+    不属于单个解释器的缓存项（如系统解释器候选列表）存放在 `GLOBAL_KEY` 条目中，由调用者提供指纹。
+
+    环境探测可能在后台线程中进行，所有读写操作均由内部的锁保护。
+    写入缓存项只修改内存中的数据并安排一次延迟保存，一次内省产生的多次写入只需保存一次。
+    """
+
+    # 依赖于 site-packages 目录内容的缓存项
+    SITE_DEPENDENT_KEYS = frozenset({"installed_packages"})
+    # 存放全局缓存项的条目名称，不是合法的可执行文件路径，不会与解释器条目冲突
+    GLOBAL_KEY = "<global>"
+    # 写入缓存项后延迟保存的时间，单位为秒，期间的多次写入合并为一次保存
+    SAVE_DELAY = 1.0
+
+    def __init__(self, cache_file: Union[str, Path]) -> None:
+        """
+        :param cache_file: 缓存文件路径
+        """
+
+        self._cache_file = Path(cache_file)
+        self._data: dict[str, dict[str, Any]] = {}
+        self._loaded = False
+        self._lock = threading.RLock()
+        self._dirty = False  # 是否有尚未保存至磁盘的写入
+        self._save_timer: Optional[threading.Timer] = None
+
+    def load(self) -> None:
+        """从磁盘加载缓存文件，文件不存在或损坏时视为空缓存"""
+
+        with self._lock:
+            self._load()
+
+    def _load(self) -> None:
+        """`load()` 的实际实现，调用者应持有锁"""
+
+        self._loaded = True
+
+        try:
+            with open(self._cache_file, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            warnings.warn(
+                f"Failed to load Python environment cache: {e}",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+            return
+
+        if isinstance(data, dict):
+            self._data = data
+
+    def save(self) -> None:
+        """将缓存写入磁盘，先写入临时文件再替换，避免写入中断导致缓存文件损坏"""
+
+        with self._lock:
+            self._save()
+
+    def flush(self) -> None:
+        """若有尚未保存的写入，立即保存至磁盘，不再等待延迟保存"""
+
+        with self._lock:
+            if self._dirty:
+                self._save()
+
+    def _schedule_save(self) -> None:
+        """标记有尚未保存的写入，并在 `SAVE_DELAY` 秒后于后台线程中保存，调用者应持有锁"""
+
+        self._dirty = True
+        if self._save_timer is None:
+            self._save_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def _save(self) -> None:
+        """`save()` 的实际实现，调用者应持有锁"""
+
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+            self._save_timer = None
+        self._dirty = False
+
+        tmp_file = self._cache_file.with_suffix(".tmp")
+        try:
+            self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(self._data, f, ensure_ascii=False)
+            os.replace(tmp_file, self._cache_file)
+        except OSError as e:
+            warnings.warn(
+                f"Failed to save Python environment cache: {e}",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+
+    @staticmethod
+    def exe_fingerprint(executable_path: Union[str, Path]) -> Optional[list[int]]:
+        """计算解释器可执行文件的指纹
+
+        :param executable_path: Python 可执行文件路径
+        :return: 指纹
+        """
+
+        return _stat_fingerprint(executable_path)
+
+    @staticmethod
+    def site_fingerprint(site_dirs: list[str]) -> dict[str, Optional[list[int]]]:
+        """计算各 site-packages 目录的指纹
+
+        安装或卸载包时会在 site-packages 中增删 dist-info 目录，从而改变目录的修改时间
+
+        :param site_dirs: site-packages 目录列表
+        :return: 指纹，{目录: 指纹}
+        """
+
+        return {site_dir: _stat_fingerprint(site_dir) for site_dir in site_dirs}
+
+    def _valid_entry(self, executable_path: str) -> Optional[dict[str, Any]]:
+        """获取指纹仍然有效的缓存条目，调用者应持有锁
+
+        :param executable_path: Python 可执行文件路径
+        :return: 缓存条目，不存在或可执行文件已变化时返回 None
+        """
+
+        if not self._loaded:
+            self._load()
+
+        entry = self._data.get(executable_path)
+        if entry is None:
+            return None
+        if entry.get("exe_fp") != self.exe_fingerprint(executable_path):
+            # 解释器本身已变化（如升级、删除），整个条目失效
+            del self._data[executable_path]
+            return None
+        return entry
+
+    def get(self, executable_path: Union[str, Path], key: str) -> Optional[Any]:
+        """读取缓存项，若环境已发生变化则返回 None
+
+        :param executable_path: Python 可执行文件路径
+        :param key: 缓存项名称，如 "probe_info"、"installed_packages"
+        :return: 缓存值，无有效缓存时返回 None
+        """
+
+        with self._lock:
+            entry = self._valid_entry(str(executable_path))
+            if entry is None or key not in entry:
+                return None
+
+            if key in self.SITE_DEPENDENT_KEYS:
+                site_fp = entry.get("site_fp", {})
+                if site_fp != self.site_fingerprint(list(site_fp)):
+                    return None
+
+            return entry[key]
+
+    def set(
+        self,
+        executable_path: Union[str, Path],
+        key: str,
+        value: Any,
+        *,
+        site_dirs: Optional[list[str]] = None,
+    ) -> None:
+        """写入缓存项，稍后与其他写入合并保存至磁盘
+
+        :param executable_path: Python 可执行文件路径
+        :param key: 缓存项名称
+        :param value: 缓存值，必须可被 json 序列化
+        :param site_dirs: 该环境的 site-packages 目录，仅对依赖其内容的缓存项有意义；
+            为 None 时根据可执行文件位置推测
+        """
+
+        exe_path = str(executable_path)
+        with self._lock:
+            entry = self._valid_entry(exe_path)
+            if entry is None:
+                entry = {"exe_fp": self.exe_fingerprint(exe_path)}
+                self._data[exe_path] = entry
+
+            if key in self.SITE_DEPENDENT_KEYS:
+                if site_dirs is None:
+                    site_dirs = guess_site_dirs(exe_path)
+                site_fp = self.site_fingerprint(site_dirs)
+                if entry.get("site_fp") != site_fp:
+                    # site-packages 已变化，丢弃所有依赖其内容的旧缓存项
+                    for site_key in self.SITE_DEPENDENT_KEYS:
+                        entry.pop(site_key, None)
+                    entry["site_fp"] = site_fp
+
+            entry[key] = value
+            self._schedule_save()
+
+    def get_global(self, key: str, fingerprint: Any) -> Optional[Any]:
+        """读取不属于单个解释器的全局缓存项
+
+        :param key: 缓存项名称
+        :param fingerprint: 调用者计算的当前指纹，应只包含列表、字典等经 json 往返后不变的类型，
+            与写入时不同则缓存无效
+        :return: 缓存值，无有效缓存时返回 None
+        """
+
+        with self._lock:
+            if not self._loaded:
+                self._load()
+
+            item = self._data.get(self.GLOBAL_KEY, {}).get(key)
+            if not isinstance(item, dict) or item.get("fp") != fingerprint:
+                return None
+            return item.get("value")
+
+    def set_global(self, key: str, value: Any, fingerprint: Any) -> None:
+        """写入全局缓存项，稍后与其他写入合并保存至磁盘
+
+        :param key: 缓存项名称
+        :param value: 缓存值，必须可被 json 序列化
+        :param fingerprint: 写入时的指纹，须可被 json 序列化
+        """
+
+        with self._lock:
+            if not self._loaded:
+                self._load()
+
+            global_entry = self._data.setdefault(self.GLOBAL_KEY, {})
+            global_entry[key] = {"fp": fingerprint, "value": value}
+            self._schedule_save()
+
+
+# 全局变量，Py2exe-GUI 使用的 Python 环境缓存
+PYENV_CACHE = PyEnvCache(get_user_cache_dir() / AppConstant.NAME / "pyenv_cache.json")
+# 程序退出时保存尚未写入磁盘的改动
+atexit.register(PYENV_CACHE.flush)
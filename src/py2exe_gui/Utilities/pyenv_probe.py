@@ -0,0 +1,187 @@
+# Licensed under the GPLv3 License: https://www.gnu.org/licenses/gpl-3.0.html
+# For details: https://github.com/muziing/Py2exe-GUI/blob/main/README.md#license
+
+"""此模块包含 Python 解释器内省脚本 `PROBE_SCRIPT` 与运行该脚本的函数 `probe_interpreter()`
+
+只需启动一次目标解释器，即可以 json 形式获得其版本、实现、prefix/base_prefix、sys.path、
+site-packages 目录、是否为 venv/conda 环境、已安装的包（通过 `importlib.metadata` 获取，不依赖 pip）
+以及 PyInstaller 版本等全部信息。
+
+内省脚本以字符串常量形式保存，以便在 Py2exe-GUI 被 PyInstaller 打包后同样可用。
+脚本在目标解释器中运行，不能使用目标解释器可能不支持的新语法。
+"""
+
+__all__ = [
+    "PROBE_SCRIPT",
+    "probe_interpreter",
+    "run_interpreter",
+]
+
+import json
+import os
+import signal
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from ..Constants import RUNTIME_INFO, Platform
+
+PROBE_SCRIPT = r"""
+import json, os, platform, re, site, sys
+
+sys_path = [p for p in sys.path if p]
+info = {
+    "version": platform.python_version(),
+    "implementation": platform.python_implementation(),
+    "executable": sys.executable,
+    "prefix": sys.prefix,
+    "base_prefix": getattr(sys, "base_prefix", getattr(sys, "real_prefix", sys.prefix)),
+    "sys_path": sys_path,
+}
+info["is_venv"] = info["prefix"] != info["base_prefix"] or hasattr(sys, "real_prefix")
+info["is_conda"] = os.path.isdir(os.path.join(sys.prefix, "conda-meta"))
+# 标准输出为管道时所用的编码，与打包子进程输出的编码一致
+info["stdout_encoding"] = getattr(sys.stdout, "encoding", None)
+
+site_dirs = []
+try:
+    site_dirs.extend(site.getsitepackages())
+except AttributeError:
+    pass
+if site.ENABLE_USER_SITE:
+    site_dirs.append(site.getusersitepackages())
+info["site_packages"] = [
+    d for i, d in enumerate(site_dirs) if d not in site_dirs[:i] and os.path.isdir(d)
+]
+
+packages = None
+try:
+    from importlib import metadata
+except ImportError:
+    metadata = None
+if metadata is not None:
+    seen = {}
+    for dist in metadata.distributions(path=sys_path):
+        name = dist.metadata["Name"]
+        if not name:
+            continue
+        key = re.sub(r"[-_.]+", "-", name).lower()
+        if key not in seen:
+            seen[key] = {"name": name, "version": dist.version}
+    packages = sorted(seen.values(), key=lambda pkg: pkg["name"].lower())
+    info["pyinstaller_version"] = seen.get("pyinstaller", {}).get("version")
+else:
+    info["pyinstaller_version"] = None
+info["packages"] = packages
+
+sys.stdout.write(json.dumps(info))
+"""
+
+# 检查取消标志的时间间隔，单位为秒
+_CANCEL_POLL_INTERVAL = 0.1
+
+
+def _kill_process(process: subprocess.Popen) -> None:
+    """终止内省子进程（非 Windows 平台下为整个进程组）并等待其退出
+
+    不再读取输出，因为残留的孙进程可能仍持有管道，导致读取一直阻塞
+
+    :param process: 内省子进程
+    """
+
+    try:
+        if RUNTIME_INFO.platform != Platform.windows:
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except OSError:
+        # 进程已经退出
+        pass
+    process.wait()
+
+
+def run_interpreter(
+    cmd: list[str],
+    timeout: Optional[float] = None,
+    cancel_event: Optional[threading.Event] = None,
+) -> tuple[int, str, str]:
+    """运行解释器子进程并等待其结束，超时或被取消时终止子进程（非 Windows 平台下为整个进程组）
+
+    :param cmd: 命令，首项为 Python 可执行文件路径
+    :param timeout: 超时时间，单位为秒，None 表示不限制
+    :param cancel_event: 取消标志，在其他线程中设置后会尽快终止子进程
+    :return: (退出码, 标准输出, 标准错误)
+    :raise RuntimeError: 无法运行解释器、超时或被取消时抛出
+    """
+
+    try:
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            # 非 Windows 平台下在新会话中运行，以便超时或取消时终止整个进程组
+            start_new_session=RUNTIME_INFO.platform != Platform.windows,
+        )
+    except OSError as e:
+        raise RuntimeError(f"Failed to start Python interpreter: {e}") from e
+
+    deadline = None if timeout is None else time.monotonic() + timeout
+    # 没有取消标志时无需轮询，直接等待至超时
+    poll_interval = None if cancel_event is None else _CANCEL_POLL_INTERVAL
+    with process:
+        while True:
+            if cancel_event is not None and cancel_event.is_set():
+                _kill_process(process)
+                raise RuntimeError("Running Python interpreter was cancelled.")
+
+            wait_time = poll_interval
+            if deadline is not None:
+                remaining = max(deadline - time.monotonic(), 0)
+                wait_time = (
+                    remaining if wait_time is None else min(wait_time, remaining)
+                )
+
+            try:
+                stdout, stderr = process.communicate(timeout=wait_time)
+                break
+            except subprocess.TimeoutExpired as e:
+                if deadline is not None and time.monotonic() >= deadline:
+                    _kill_process(process)
+                    raise RuntimeError(
+                        f"Running Python interpreter timed out: {e}"
+                    ) from e
+
+    return process.returncode, stdout, stderr
+
+
+def probe_interpreter(
+    executable_path: Union[str, Path],
+    timeout: Optional[float] = None,
+    cancel_event: Optional[threading.Event] = None,
+) -> dict[str, Any]:
+    """在目标解释器中运行内省脚本，获取该环境的全部信息
+
+    由于需要运行子进程，此函数耗时较长，应尽量减少调用次数
+
+    :param executable_path: Python 可执行文件路径
+    :param timeout: 超时时间，单位为秒，None 表示不限制
+    :param cancel_event: 取消标志，在其他线程中设置后会尽快终止子进程
+    :return: 环境信息字典，键与 `PROBE_SCRIPT` 输出一致；
+        若目标解释器缺少 `importlib.metadata`（Python < 3.8），其中的 "packages" 为 None
+    :raise RuntimeError: 无法运行解释器、超时、被取消或无法解析其输出时抛出
+    """
+
+    cmd = [str(executable_path), "-c", PROBE_SCRIPT]
+    returncode, stdout, stderr = run_interpreter(cmd, timeout, cancel_event)
+    if returncode != 0:
+        raise RuntimeError(f"Failed to probe Python interpreter: {stderr}")
+
+    try:
+        info: dict[str, Any] = json.loads(stdout)
+    except json.decoder.JSONDecodeError as e:
+        raise RuntimeError(f"Failed to parse interpreter probe output: {e}") from e
+
+    return info
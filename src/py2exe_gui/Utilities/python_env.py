@@ -12,21 +12,75 @@ __all__ = [
 ]
 
 import json
+import locale
+import os
+import re
 import subprocess
+import threading
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
-from ..Constants import PyEnvType
-from ..Utilities import get_sys_python
+from ..Constants import RUNTIME_INFO, Platform, PyEnvType
+from .dist_info import normalize_pkg_name, scan_site_packages
+from .platform_specific_funcs import (
+    get_poetry_virtualenvs_dir,
+    get_sys_python_candidates,
+)
+from .pyenv_cache import PYENV_CACHE
+from .pyenv_probe import probe_interpreter, run_interpreter
+
+# Poetry 在缓存目录中创建的虚拟环境的命名规则，形如 "py2exe-gui-0wN5hrbW-py3.11"
+_POETRY_VENV_NAME_RE = re.compile(r".+-[A-Za-z0-9_-]{8}-py\d+\.\d+")
+
+
+def _is_poetry_venv(venv_root: Path) -> bool:
+    """判断一个虚拟环境是否由 Poetry 创建
+
+    :param venv_root: 虚拟环境根目录（pyvenv.cfg 所在目录）
+    :return: 是否为 Poetry 环境
+    """
+
+    poetry_dir = get_poetry_virtualenvs_dir()
+    if os.path.normcase(str(venv_root.parent)) == os.path.normcase(str(poetry_dir)):
+        return True
+    if _POETRY_VENV_NAME_RE.fullmatch(venv_root.name) and "pypoetry" in venv_root.parts:
+        return True
+    # 项目内虚拟环境（virtualenvs.in-project = true），由项目目录中的 poetry.lock 判断
+    return venv_root.name == ".venv" and (venv_root.parent / "poetry.lock").is_file()
+
+
+def _is_base_install(exe_path: Path) -> bool:
+    """按照解释器启动时确定 prefix 的方式，在文件系统中检查标准库的标志文件 os.py，
+    判断解释器（解析符号链接后）是否位于一个独立安装的基础环境中，即其 prefix 与 base prefix 相同
+
+    :param exe_path: Python 可执行文件路径
+    :return: 是否为独立安装的基础解释器
+    """
+
+    real_exe = Path(os.path.realpath(exe_path))
+    if RUNTIME_INFO.platform == Platform.windows:
+        # <prefix>\python.exe 与 <prefix>\Lib\os.py
+        return (real_exe.parent / "Lib" / "os.py").is_file()
+    # <prefix>/bin/python3 与 <prefix>/lib/python3.X/os.py
+    lib_dir = real_exe.parent.parent / "lib"
+    try:
+        return any(
+            (lib_dir / name / "os.py").is_file()
+            for name in os.listdir(lib_dir)
+            if name.startswith("python3")
+        )
+    except OSError:
+        return False
 
 
 class PyEnv:
     """Python 解释器环境类，存储某个 Python 解释器对应的环境中的各种信息，如
     解释器可执行文件路径、Python 版本、已安装的包等
 
+    环境信息通过 `PyEnv.probe()` 运行一次内省脚本全部获取，并缓存至磁盘。
+
     静态方法：
-    `PyEnv.get_py_version()` 用于获取 Python 版本号，返回 "3.11.7" 形式的字符串；
-    `PyEnv.get_installed_packages()` 用于获取已安装的包，返回一个包含包名和版本的列表；
+    `PyEnv.get_installed_packages()` 通过 `pip list` 获取已安装的包，返回一个包含包名和版本的列表；
     `PyEnv.infer_type()` 用于推断 Python 解释器类型，返回 PyEnvType 枚举类的成员；
     """
 
@@ -43,12 +97,20 @@ class PyEnv:
         self.__exe_path = str(Path(executable_path).absolute())
 
         # 懒加载，如果没有请求访问，则不会运行耗时的get操作；一旦运行过，将结果缓存到这些私有属性中，下次可直接使用
-        self.__pyversion: Optional[str] = None
+        # 同时结果也会保存至磁盘缓存 PYENV_CACHE 中，只要环境未发生变化，下次启动时同样可直接使用
+        self.__probe_info: Optional[dict[str, Any]] = None
         self.__installed_packages: Optional[list[dict]] = None
+        # 以 PEP 503 规范化包名为键的索引，随包列表一同建立，用于 O(1) 查询
+        self.__pkg_index: dict[str, dict] = {}
+        self.__pkg_names: frozenset[str] = frozenset()
+        # 后台线程可能同时请求同一环境的不同信息，确保只运行一次内省
+        self.__probe_lock = threading.Lock()
+        # 只保护包列表与索引的替换，持有时间极短，界面线程可放心获取，不必等待内省结束
+        self.__pkg_lock = threading.Lock()
 
         if type_ is None:
             # type_ 为 None 表示特殊含义“待推断”
-            self.__type = self.infer_type(self.__exe_path)
+            self.__type = self.infer_type(self.__exe_path, self.__known_probe_info())
         else:
             self.__type = type_
 
@@ -61,65 +123,255 @@ class PyEnv:
 
         return self.__exe_path
 
+    @property
+    def probe_info(self) -> dict[str, Any]:
+        """解释器内省信息（实例属性，只读），不包含已安装的包列表
+
+        :return: 形如 {"version": "3.11.7", "prefix": "...", "site_packages": [...], ...} 的字典，
+            各键含义参见 `PROBE_SCRIPT`
+        """
+
+        if self.__probe_info is None:
+            with self.__probe_lock:
+                if self.__probe_info is None:
+                    cached_info = PYENV_CACHE.get(self.__exe_path, "probe_info")
+                    if cached_info is not None:
+                        self.__probe_info = cached_info
+                    else:
+                        self.probe()
+        return self.__probe_info  # type: ignore
+
     @property
     def pyversion(self) -> str:
         """Python 版本（实例属性，只读）"""
 
-        if self.__pyversion is None:
-            self.__pyversion = self.get_py_version(self.__exe_path)
-        return self.__pyversion
+        return self.probe_info["version"]
+
+    @property
+    def output_encoding(self) -> str:
+        """该解释器输出至管道时使用的编码（实例属性，只读），用于解码打包子进程的输出。
+        仅从已知的内省信息中获取，不会触发内省；未知时返回本机的首选编码
+        """
+
+        info = self.__known_probe_info()
+        if info is not None and info.get("stdout_encoding"):
+            return info["stdout_encoding"]
+        return locale.getpreferredencoding(False)
+
+    @property
+    def site_dirs(self) -> list[str]:
+        """该环境的 site-packages 目录列表（实例属性，只读）"""
+
+        return self.probe_info.get("site_packages", [])
 
     @property
     def installed_packages(self) -> list[dict]:
         """已安装的包列表（实例属性，只读）
 
-        对于每个 PyEnv 实例，首次访问此属性耗时会很长
+        对于每个 PyEnv 实例，若没有有效的磁盘缓存，首次访问此属性耗时会很长
 
         :return: 包列表，形如 [{'name': 'aiohttp', 'version': '3.9.1'}, {'name': 'aiosignal', 'version': '1.3.1'}, ...]
         """
 
         if self.__installed_packages is None:
-            self.__installed_packages = self.get_installed_packages(self.__exe_path)
+            with self.__probe_lock:
+                if self.__installed_packages is None:
+                    cached_packages = PYENV_CACHE.get(
+                        self.__exe_path, "installed_packages"
+                    )
+                    if cached_packages is not None:
+                        self.__set_installed_packages(cached_packages)
+                    elif self.__known_probe_info() is not None:
+                        # 解释器本身未变化，只是 site-packages 有变动，直接重新扫描，无需子进程
+                        self.rescan_packages()
+                    else:
+                        # 尚未内省过该环境，运行一次内省脚本
+                        self.probe()
+        return self.__installed_packages  # type: ignore
+
+    @property
+    def known_installed_packages(self) -> Optional[list[dict]]:
+        """已知的已安装包列表（实例属性，只读），仅从内存或磁盘缓存中获取，不会触发内省或扫描
+
+        :return: 包列表，未知时返回 None
+        """
+
+        if self.__installed_packages is None:
+            return PYENV_CACHE.get(self.__exe_path, "installed_packages")
         return self.__installed_packages
 
+    @property
+    def is_probed(self) -> bool:
+        """是否已有该环境的内省信息（实例属性，只读），访问此属性不会触发内省"""
+
+        return self.__known_probe_info() is not None
+
     @property
     def type(self) -> PyEnvType:
         """Python 解释器类型（实例属性，只读）"""
 
         return self.__type
 
-    @staticmethod
-    def get_py_version(executable_path: Union[str, Path]) -> str:
-        """获取Python解释器的版本，以形如 "3.11.7" 的字符串形式返回
+    def __set_installed_packages(self, packages: list[dict]) -> None:
+        """设置已安装的包列表，并同时建立规范化包名索引
 
-        由于需要运行子进程，此函数耗时较长，应尽量减少调用次数
+        :param packages: 包列表
+        """
 
-        :param executable_path: Python 可执行文件路径
-        :return: Version of the Python interpreter, such as "3.11.7".
+        pkg_index = {
+            normalize_pkg_name(pkg["name"]): pkg for pkg in packages if "name" in pkg
+        }
+        with self.__pkg_lock:
+            self.__pkg_index = pkg_index
+            self.__pkg_names = frozenset(pkg_index)
+            self.__installed_packages = packages
+
+    def __known_probe_info(self) -> Optional[dict[str, Any]]:
+        """获取已知的内省信息（内存或磁盘缓存中），不会触发内省子进程
+
+        :return: 内省信息，未知时返回 None
         """
 
-        cmd = [
-            f"{executable_path}",
-            "-c",
-            "import platform;print(platform.python_version(), end='')",
-        ]
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            version = result.stdout
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Failed to get Python version: {e.output}") from e
-        return version
+        if self.__probe_info is None:
+            self.__probe_info = PYENV_CACHE.get(self.__exe_path, "probe_info")
+        return self.__probe_info
+
+    def restore_probe_info(self, info: dict[str, Any]) -> None:
+        """使用此前保存的内省信息（如已固定环境的快照）恢复该环境，不启动子进程，也不写入磁盘缓存
+
+        调用者应自行确认解释器在此期间未发生变化
+
+        :param info: 内省信息，不包含已安装的包列表
+        """
+
+        self.__probe_info = info
+
+    def rescan_packages(self) -> None:
+        """在当前进程中直接扫描该环境的包元数据，刷新已安装的包列表并写入磁盘缓存
+
+        需要已知该环境的 sys.path，即已经内省过
+        """
+
+        info = self.probe_info
+        packages = self.get_installed_packages(
+            self.__exe_path, search_paths=info.get("sys_path")
+        )
+        self.__set_installed_packages(packages)
+        PYENV_CACHE.set(
+            self.__exe_path,
+            "installed_packages",
+            packages,
+            site_dirs=info.get("site_packages"),
+        )
+
+    def update_packages(self, added: list[dict], removed: list[str]) -> None:
+        """增量更新已安装的包列表，如用户在外部通过 pip 安装、卸载或升级了包，并写入磁盘缓存
+
+        若包列表尚未加载，则什么都不做，下次访问时会自动获取最新的列表。
+        不等待正在后台进行的内省（其结果本身已是最新的），可在界面线程中调用
+
+        :param added: 新增的包，形如 [{'name': 'black', 'version': '23.12.1'}, ...]
+        :param removed: 被移除的包的规范化名称；升级的包会同时出现在两个列表中
+        """
+
+        with self.__pkg_lock:
+            if self.__installed_packages is None:
+                return
+
+            pkg_index = dict(self.__pkg_index)
+            for key in removed:
+                pkg_index.pop(key, None)
+            for pkg in added:
+                pkg_index[normalize_pkg_name(pkg["name"])] = pkg
+            packages = sorted(pkg_index.values(), key=lambda p: p["name"].lower())
+            self.__pkg_index = pkg_index
+            self.__pkg_names = frozenset(pkg_index)
+            self.__installed_packages = packages
+
+        info = self.__known_probe_info() or {}
+        PYENV_CACHE.set(
+            self.__exe_path,
+            "installed_packages",
+            packages,
+            site_dirs=info.get("site_packages"),
+        )
+
+    def probe(
+        self,
+        timeout: Optional[float] = None,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> None:
+        """运行一次内省脚本，刷新该环境的全部信息，并写入磁盘缓存
+
+        仅需启动一次解释器子进程，即可同时获得版本、site-packages 目录、已安装的包等信息；
+        若目标解释器过旧、无法通过 `importlib.metadata` 获取已安装的包，则回退至 `pip list`
+
+        :param timeout: 内省超时时间，单位为秒，None 表示不限制
+        :param cancel_event: 取消标志，在其他线程中设置后会尽快终止内省
+        :raise RuntimeError: 内省失败、超时或被取消时抛出
+        """
+
+        info = probe_interpreter(
+            self.__exe_path, timeout=timeout, cancel_event=cancel_event
+        )
+        self.load_probe_result(info, timeout=timeout, cancel_event=cancel_event)
+
+    def load_probe_result(
+        self,
+        info: dict[str, Any],
+        timeout: Optional[float] = None,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> None:
+        """使用已有的内省脚本输出填充该环境的全部信息，并写入磁盘缓存
+
+        如 `InterpreterValidator` 在验证解释器时已经运行过内省脚本，可直接使用其结果，无需再次启动解释器
+
+        :param info: `probe_interpreter()` 的返回值
+        :param timeout: 内省结果中没有包列表、需要回退至 `pip list` 时的超时时间，单位为秒，None 表示不限制
+        :param cancel_event: 取消标志，在其他线程中设置后会尽快终止 `pip list`
+        :raise RuntimeError: 回退至 `pip list` 失败、超时或被取消时抛出
+        """
+
+        info = dict(info)
+        packages = info.pop("packages", None)
+        if packages is None:
+            packages = self.get_installed_packages(
+                self.__exe_path, timeout=timeout, cancel_event=cancel_event
+            )
+
+        self.__probe_info = info
+        self.__set_installed_packages(packages)
+        PYENV_CACHE.set(self.__exe_path, "probe_info", info)
+        PYENV_CACHE.set(
+            self.__exe_path,
+            "installed_packages",
+            packages,
+            site_dirs=info.get("site_packages"),
+        )
 
     @staticmethod
-    def get_installed_packages(executable_path: Union[str, Path]) -> list[dict]:
+    def get_installed_packages(
+        executable_path: Union[str, Path],
+        search_paths: Optional[list[str]] = None,
+        timeout: Optional[float] = None,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> list[dict]:
         """获取该 Python 环境中已安装的包信息
 
-        由于需要运行子进程与解析json，此函数耗时极长，应尽量减少调用次数
+        若已知该环境的 sys.path 或 site-packages 目录，则直接扫描其中的包元数据，不启动子进程，耗时极短；
+        否则回退至 `pip list`，由于需要运行子进程与解析json，耗时极长，应尽量避免
 
         :param executable_path: Python 解释器可执行文件路径
+        :param search_paths: 该环境的 sys.path 或 site-packages 目录列表
+        :param timeout: `pip list` 的超时时间，单位为秒，None 表示不限制
+        :param cancel_event: 取消标志，在其他线程中设置后会尽快终止 `pip list`
         :return: 包列表，形如 [{'name': 'aiohttp', 'version': '3.9.1'}, {'name': 'aiosignal', 'version': '1.3.1'}, ...]
+        :raise RuntimeError: `pip list` 失败、超时、被取消或无法解析其输出时抛出
         """
 
+        if search_paths:
+            return scan_site_packages(search_paths)
+
         cmd = [
             f"{executable_path}",
             "-m",
@@ -132,14 +384,10 @@ class PyEnv:
             "--no-python-version-warning",
         ]
 
-        try:
-            # 运行 pip list 命令，获取输出
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            pip_list = result.stdout
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Failed to get installed packages: {e.output}") from e
-        except Exception as e:
-            raise RuntimeError(f"An error occurred: {e}") from e
+        # 运行 pip list 命令，获取输出；无法运行、超时或被取消时抛出 RuntimeError
+        returncode, pip_list, stderr = run_interpreter(cmd, timeout, cancel_event)
+        if returncode != 0:
+            raise RuntimeError(f"Failed to get installed packages: {stderr}")
 
         try:
             # json 解析
@@ -150,55 +398,94 @@ class PyEnv:
         return installed_packages
 
     @staticmethod
-    def infer_type(executable_path: Union[str, Path]) -> PyEnvType:
+    def infer_type(
+        executable_path: Union[str, Path],
+        probe_info: Optional[dict[str, Any]] = None,
+    ) -> PyEnvType:
         """推断 Python 环境类型，如 system venv Poetry Conda 等
 
-        暂时仅通过解析解释器绝对路径，字符串正则匹配来判断，有待改进
+        仅检查文件系统中的环境标志，不启动任何子进程，也不依赖目录命名习惯：
+        1. 环境根目录中存在 `conda-meta/` 目录，为 conda 环境；
+        2. 环境根目录中存在 `pyvenv.cfg` 文件，为虚拟环境，若其位于 Poetry 虚拟环境缓存目录中、
+           符合 Poetry 的命名规则或所在项目由 Poetry 管理，则为 Poetry 环境，否则为 venv；
+        3. 解释器的 prefix 与 base prefix 相同，即独立安装的基础解释器，为 system。
+           已知内省信息时直接比较两者，否则由解释器（解析符号链接后）旁的标准库标志文件判断；
+           `get_sys_python_candidates()` 找到的系统解释器（PATH 或 Windows 注册表）同样为 system；
+        4. 以上均不满足，为 unknown
 
         :param executable_path: Python 可执行文件路径
+        :param probe_info: 该解释器已知的内省信息，可选
         :return: PyEnvType 枚举类的成员
         """
 
-        # 确保路径为 POSIX 风格的绝对路径
-        exe_path = Path(executable_path).absolute().as_posix()
-
-        # # 使用正则表达式匹配来检测不同的环境类型
-        # regexes = [
-        #     (r"^.*venv.*", PyEnvType.venv),
-        #     (r"^.*pypoetry.*", PyEnvType.poetry),
-        #     (r"^.*conda.*", PyEnvType.conda),
-        #     (
-        #         re.escape(f"{Path(get_sys_python()).absolute().as_posix()}"),
-        #         PyEnvType.system
-        #     )]
-        # for regex, env_type in regexes:
-        #     match = re.search(regex, str(__exe_path))
-        #     if match:
-        #         return env_type
-
-        # 简单的字符串 in 方法，效率应该远高于正则匹配
-        match_pair = [
-            ("venv", PyEnvType.venv),
-            ("pypoetry", PyEnvType.poetry),
-            ("conda", PyEnvType.conda),
-            (f"{Path(get_sys_python()).absolute().as_posix()}", PyEnvType.system),
-        ]
-
-        for patten, env_type in match_pair:
-            if patten in exe_path:
-                return env_type
+        # 不解析可执行文件本身的符号链接，虚拟环境中的 python 通常链接至基础解释器
+        exe_path = Path(executable_path).absolute()
+        # Windows 下 conda 解释器位于环境根目录中，venv 解释器位于 Scripts 目录中；
+        # 其他平台下解释器均位于环境根目录的 bin 目录中
+        prefixes = (exe_path.parent, exe_path.parent.parent)
+
+        for prefix in prefixes:
+            if (prefix / "conda-meta").is_dir():
+                return PyEnvType.conda
+
+        for prefix in prefixes:
+            if (prefix / "pyvenv.cfg").is_file():
+                if _is_poetry_venv(prefix):
+                    return PyEnvType.poetry
+                return PyEnvType.venv
+
+        if probe_info is not None and probe_info.get("prefix"):
+            prefix = os.path.normcase(os.path.realpath(probe_info["prefix"]))
+            base_prefix = probe_info.get("base_prefix", probe_info["prefix"])
+            if prefix == os.path.normcase(os.path.realpath(base_prefix)):
+                return PyEnvType.system
+        elif _is_base_install(exe_path):
+            return PyEnvType.system
+
+        sys_pythons = {
+            os.path.normcase(os.path.realpath(sys_python))
+            for sys_python in get_sys_python_candidates()
+        }
+        if os.path.normcase(os.path.realpath(exe_path)) in sys_pythons:
+            return PyEnvType.system
 
-        # 如果没有匹配到，返回 unknown
         return PyEnvType.unknown
 
+    @property
+    def installed_pkg_names(self) -> frozenset[str]:
+        """已安装的所有包的规范化名称集合（实例属性，只读）"""
+
+        _ = self.installed_packages  # 确保包列表与索引已加载
+        return self.__pkg_names
+
+    def pkg_info(self, package_name: str) -> Optional[dict]:
+        """获取特定软件包的信息，包名按 PEP 503 规范化后比较，不区分大小写
+
+        :param package_name: 待检索的软件包名称
+        :return: 包信息，形如 {'name': 'PyInstaller', 'version': '6.3.0'}，未安装时返回 None
+        """
+
+        _ = self.installed_packages  # 确保包列表与索引已加载
+        return self.__pkg_index.get(normalize_pkg_name(package_name))
+
+    def pkg_version(self, package_name: str) -> Optional[str]:
+        """获取特定软件包的版本
+
+        :param package_name: 待检索的软件包名称
+        :return: 版本号，未安装时返回 None
+        """
+
+        pkg = self.pkg_info(package_name)
+        return None if pkg is None else pkg.get("version")
+
     def pkg_installed(self, package_name: str) -> bool:
-        """检查特定软件包是否已安装
+        """检查特定软件包是否已安装，包名按 PEP 503 规范化后比较，如 "PyInstaller" 与 "pyinstaller" 等价
 
         :param package_name: 待检索的软件包名称
         :return: 是否已安装
         """
 
-        return any(pkg["name"] == package_name for pkg in self.installed_packages)
+        return normalize_pkg_name(package_name) in self.installed_pkg_names
 
     def install_package(self, package_name: str) -> int:
         """安装特定软件包
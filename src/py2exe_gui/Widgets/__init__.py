@@ -3,5 +3,7 @@
 
 """本 package 中包含所有控件类，集中处理界面（前端）相关功能"""
 
+from .dialog_widgets import BuildLogDlg, PyEnvSelectDlg, WorkpathCacheDlg
 from .main_window import MainWindow
+from .packaging_queue_widget import PackagingQueueDlg
 from .subprocess_widget import SubProcessDlg
@@ -6,7 +6,7 @@
 __all__ = ["AddDataWindow"]
 
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 from PySide6.QtCore import QItemSelectionModel, Qt, Signal, Slot
 from PySide6.QtGui import QIcon, QPixmap
@@ -28,8 +28,8 @@ class AddDataWindow(QObjTr, QWidget):
     """用于提供 PyInstaller --add-data 和 --add-binary 功能的窗口"""
 
     # 类型别名
-    # 数据条目，第一项为在文件系统中的路径，第二项为捆绑后环境中的路径
-    data_item = tuple[Path, str]
+    # 数据条目，第一项为在文件系统中的路径（从任务文件导入时为字符串），第二项为捆绑后环境中的路径
+    data_item = tuple[Union[str, Path], str]
 
     # 自定义信号
     data_selected = Signal(list)  # 用户在添加数据窗口完成所有编辑后，提交的信号
@@ -253,11 +253,15 @@ class AddDataWindow(QObjTr, QWidget):
         :param all_data_item_list: 保存数据条目的列表
         """
 
+        # 条目很多时（如从任务文件导入），暂停重绘以免逐行刷新
+        self.item_table.setUpdatesEnabled(False)
         self.item_table.setRowCount(len(all_data_item_list))
         for row, data_item in enumerate(all_data_item_list):
-            source_item = QTableWidgetItem(str(data_item[0].absolute()))
+            # 从任务文件导入的源路径为字符串，显示时才转换为 Path
+            source_item = QTableWidgetItem(str(Path(data_item[0]).absolute()))
             source_item.setFlags(
                 Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
             )
             self.item_table.setItem(row, 0, source_item)
             self.item_table.setItem(row, 1, QTableWidgetItem(data_item[1]))
+        self.item_table.setUpdatesEnabled(True)
@@ -52,6 +52,9 @@ def wrap_font_tag(raw_text: str, color: str, **kwargs):
 class ArgumentsBrowser(QObjTr, QTextBrowser):
     """针对命令行参数列表特别优化的文本浏览器"""
 
+    # 高亮显示的最大参数个数，超出时（如数万个 --add-data）以纯文本显示
+    MAX_RICH_ARGS = 1000
+
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         """
         :param parent: 父控件对象
@@ -87,11 +90,15 @@ class ArgumentsBrowser(QObjTr, QTextBrowser):
         pass
 
     def enrich_args_text(self, args_list: list[str]) -> None:
-        """对参数进行一定高亮美化后显示
+        """对参数进行一定高亮美化后显示；参数过多时改为以纯文本显示，避免解析大段富文本耗时过长
 
         :param args_list: 参数列表
         """
 
+        if len(args_list) > self.MAX_RICH_ARGS:
+            self._set_plain_args_text(args_list)
+            return
+
         # 不间断换行
         line_continuation = get_line_continuation() + "<br>" + ("&nbsp;" * 4)
 
@@ -107,3 +114,17 @@ class ArgumentsBrowser(QObjTr, QTextBrowser):
                 enriched_arg_texts.append(arg)
 
         self.setText("pyinstaller " + " ".join(enriched_arg_texts))
+
+    def _set_plain_args_text(self, args_list: list[str]) -> None:
+        """以纯文本显示参数，排版与 `enrich_args_text()` 相同，但不高亮
+
+        :param args_list: 参数列表
+        """
+
+        line_continuation = get_line_continuation() + "\n" + (" " * 4)
+        parts: list[str] = [args_list[0]]
+        for arg in args_list[1:]:
+            if arg.startswith("-"):
+                parts.append(line_continuation)
+            parts.append(arg)
+        self.setPlainText("pyinstaller " + " ".join(parts))
@@ -12,6 +12,7 @@ PyInstaller 功能所对应的控件及其槽函数
 __all__ = ["CenterWidget", "WinMacCenterWidget"]
 
 from pathlib import Path
+from typing import Any
 
 from PySide6 import QtCore
 from PySide6.QtWidgets import (
@@ -81,6 +82,8 @@ class CenterWidget(QObjTr, QWidget):
         self.pyenv_combobox = PyEnvComboBox()
         self.pyenv_browse_btn = QPushButton()
         self.itp_dlg = InterpreterFileDlg()
+        # 用户新选择、正在后台检查是否安装了 PyInstaller 的 Python 环境
+        self._pending_pyenvs: list[PyEnv] = []
 
         # 打包后输出的项目名称
         self.project_name_label = QLabel()
@@ -190,8 +193,9 @@ class CenterWidget(QObjTr, QWidget):
 
             current_pyenv = self.pyenv_combobox.get_current_pyenv()
 
-            # 首次调用 current_pyenv.installed_packages 为重大性能热点，优化时应首先考虑
-            self.pkg_browser_dlg.load_pkg_list(current_pyenv.installed_packages)
+            # 首次获取 current_pyenv.installed_packages 耗时很长，交由后台线程完成
+            self.pkg_browser_dlg.set_loading()
+            self.pyenv_combobox.prober.request_packages(current_pyenv)
 
         @QtCore.Slot()
         def handle_project_name_selected() -> None:
@@ -289,8 +293,15 @@ class CenterWidget(QObjTr, QWidget):
         # 添加与选择 Python 解释器
         self.pyenv_browse_btn.clicked.connect(self.itp_dlg.open)
         self.itp_dlg.fileSelected.connect(self._handle_itp_file_selected)
+        self.pyenv_combobox.prober.packages_ready.connect(self._handle_packages_ready)
+        self.pyenv_combobox.prober.probe_failed.connect(self._handle_probe_failed)
+        self.pyenv_combobox.watcher.packages_changed.connect(
+            self._handle_packages_changed
+        )
         handle_pyenv_change()  # 显式调用一次，为默认项设置相关内容
         self.pyenv_combobox.currentIndexChanged.connect(handle_pyenv_change)
+        # 界面显示后，在后台自动发现本机上的其他 Python 环境
+        QtCore.QTimer.singleShot(0, self.pyenv_combobox.discover)
 
         # 项目名称
         self.project_name_le.editingFinished.connect(handle_project_name_selected)
@@ -376,6 +387,8 @@ class CenterWidget(QObjTr, QWidget):
             )
             self.add_data_dlg.set_work_dir(script_path.parent)
             self.add_binary_dlg.set_work_dir(script_path.parent)
+            # 查找入口脚本旁的项目本地虚拟环境
+            self.pyenv_combobox.discover(script_path.parent)
 
         elif option_key == PyInstOpt.out_name:
             self.project_name_le.setText(option_value)
@@ -383,6 +396,47 @@ class CenterWidget(QObjTr, QWidget):
                 CenterWidget.tr("The app name has been set to:") + f"{option_value}"
             )
 
+    @QtCore.Slot(object)
+    def handle_options_applied(self, options: dict[PyInstOpt, Any]) -> None:
+        """处理options_applied信号的槽，根据一次性应用的全部选项刷新界面，不会再次发出 option_selected 信号
+
+        :param options: 全部选项，值为 None 表示未设置
+        """
+
+        script_path = options[PyInstOpt.script_path]
+        if script_path is not None:
+            self.handle_option_set((PyInstOpt.script_path, script_path))
+        else:
+            self.script_path_le.clear()
+        self.project_name_le.setText(options[PyInstOpt.out_name] or "")
+
+        if options[PyInstOpt.FD] == "--onefile":
+            self.one_file_btn.setChecked(True)
+        else:
+            self.one_dir_btn.setChecked(True)
+
+        self.data_item_list = list(options[PyInstOpt.add_data] or [])
+        self.binary_item_list = list(options[PyInstOpt.add_binary] or [])
+        self.hidden_import_list = list(options[PyInstOpt.hidden_import] or [])
+        self.hidden_import_dlg.load_items(self.hidden_import_list)
+
+        self.clean_checkbox.blockSignals(True)
+        self.clean_checkbox.setChecked(bool(options[PyInstOpt.clean]))
+        self.clean_checkbox.blockSignals(False)
+
+    def select_pyenv(self, exe_path: str) -> None:
+        """选中指定的 Python 解释器，若尚不在下拉框中，则先验证并添加
+
+        :param exe_path: Python 解释器可执行文件路径
+        """
+
+        itp_path = str(Path(exe_path).absolute())
+        for row in range(self.pyenv_combobox.count()):
+            if ALL_PY_ENVs[self.pyenv_combobox.itemData(row)].exe_path == itp_path:
+                self.pyenv_combobox.setCurrentIndex(row)
+                return
+        self._handle_itp_file_selected(itp_path)
+
     @QtCore.Slot(PyInstOpt)
     def handle_option_error(self, option: PyInstOpt) -> None:
         """处理option_error信号的槽，重置设置失败的选项对应的界面，并向用户发出警告
@@ -423,7 +477,7 @@ class CenterWidget(QObjTr, QWidget):
     def _handle_itp_file_selected(self, file_path: str) -> None:
         """Python解释器文件完成选择的槽函数
 
-        首先对用户选择的文件进行有效性判断：
+        首先检查用户选择的是否为可执行文件，再在后台运行内省脚本判断其是否为有效的 Python 解释器：
         若有效则以此创建新的 PyEnv 对象、设置到下拉框中并选中；
         若无效则弹出错误警告对话框，要求重新选择文件；
 
@@ -433,52 +487,108 @@ class CenterWidget(QObjTr, QWidget):
         itp_path = Path(file_path).absolute()
 
         # 首先判断用户选择的路径是否已在当前存储的列表中，如在则不添加直接返回
-        for pyenv in ALL_PY_ENVs:
+        for pyenv in ALL_PY_ENVs + self._pending_pyenvs:
             if str(itp_path) == pyenv.exe_path:
                 return
 
-        if InterpreterValidator.validate(itp_path):
-            # 用户选择的解释器有效
-
+        if InterpreterValidator.validate_file(itp_path):
+            # 在后台运行一次内省脚本，既验证解释器是否有效，也同时获取已安装的包；
+            # 完成后再检查是否安装了 PyInstaller，失败则提示重新选择
             new_pyenv = PyEnv(itp_path, type_=None)
+            self._pending_pyenvs.append(new_pyenv)
+            self.pyenv_combobox.prober.request_packages(new_pyenv)
+            self.show_status_msg(
+                CenterWidget.tr("Checking the selected Python environment...")
+            )
+        else:
+            self._handle_invalid_itp()
+
+    def _handle_invalid_itp(self) -> None:
+        """用户选择的解释器无效，弹出错误警告对话框，要求重新选择文件"""
+
+        self.itp_dlg.close()
+        result = QMessageBox.critical(
+            self,
+            CenterWidget.tr("Error"),
+            CenterWidget.tr(
+                "The selection is not a valid Python interpreter, "
+                "please reselect it!"
+            ),
+            QMessageBox.StandardButton.Cancel,
+            QMessageBox.StandardButton.Ok,
+        )
+        if result == QMessageBox.StandardButton.Ok:
+            self.itp_dlg.exec()
 
-            # 但在该环境中没有安装 PyInstaller，询问用户是否继续操作
-            if not new_pyenv.pkg_installed("pyinstaller"):
-                # TODO 自实现 MessageBox，包含"仍要使用"、"取消"、"尝试安装PyInstaller"三个按钮
-                result = QMessageBox.warning(
-                    self,
-                    CenterWidget.tr("Warning"),
-                    CenterWidget.tr(
-                        "Pyinstaller doesn't seem to be installed in this Python "
-                        "environment, still continue?"
-                    ),
-                    QMessageBox.StandardButton.Ok,
-                    QMessageBox.StandardButton.Cancel,
-                )
-                if result == QMessageBox.StandardButton.Cancel:
-                    return
+    @QtCore.Slot(object)
+    def _handle_packages_ready(self, pyenv: PyEnv) -> None:
+        """后台获取已安装的包完成的槽函数
 
-            # TODO 将 ALL_PY_ENVs.append() 和 pyenv_combobox.addItem() 统一管理
-            ALL_PY_ENVs.append(new_pyenv)
-            new_item = self.pyenv_combobox.gen_item(new_pyenv, len(ALL_PY_ENVs) - 1)
-            self.pyenv_combobox.addItem(*new_item)
-            self.pyenv_combobox.setCurrentIndex(self.pyenv_combobox.count() - 1)
+        若为当前选中的环境，则更新包浏览对话框；若为用户新选择的环境，则继续完成添加流程
 
-        else:
-            # 用户选择的解释器无效
-            self.itp_dlg.close()
-            result = QMessageBox.critical(
+        :param pyenv: 完成探测的 Python 环境
+        """
+
+        if pyenv in self._pending_pyenvs:
+            self._pending_pyenvs.remove(pyenv)
+            self._add_selected_pyenv(pyenv)
+        elif pyenv is self.pyenv_combobox.get_current_pyenv():
+            self.pkg_browser_dlg.load_pkg_list(pyenv.installed_packages)
+
+    @QtCore.Slot(object, list, list)
+    def _handle_packages_changed(
+        self, pyenv: PyEnv, added: list[dict], removed: list[str]
+    ) -> None:
+        """某环境中的包在外部被安装或卸载后的槽函数，若为当前选中的环境则就地更新包浏览对话框
+
+        :param pyenv: 发生变化的 Python 环境
+        :param added: 新增的包
+        :param removed: 被移除的包的规范化名称
+        """
+
+        if pyenv is self.pyenv_combobox.get_current_pyenv():
+            self.pkg_browser_dlg.update_pkg_list(added, removed)
+
+    @QtCore.Slot(object, str)
+    def _handle_probe_failed(self, pyenv: PyEnv, error: str) -> None:
+        """后台探测 Python 环境失败的槽函数
+
+        :param pyenv: 探测失败的 Python 环境
+        :param error: 错误信息
+        """
+
+        if pyenv in self._pending_pyenvs:
+            self._pending_pyenvs.remove(pyenv)
+            self.show_status_msg(
+                CenterWidget.tr("Failed to check the Python environment: ") + error
+            )
+            self._handle_invalid_itp()
+        elif pyenv is self.pyenv_combobox.get_current_pyenv():
+            self.pkg_browser_dlg.set_load_failed()
+
+    def _add_selected_pyenv(self, new_pyenv: PyEnv) -> None:
+        """将用户选择的、已完成探测的 Python 环境添加至下拉框并选中
+
+        :param new_pyenv: 用户选择的 Python 环境
+        """
+
+        # 在该环境中没有安装 PyInstaller，询问用户是否继续操作
+        if not new_pyenv.pkg_installed("pyinstaller"):
+            # TODO 自实现 MessageBox，包含"仍要使用"、"取消"、"尝试安装PyInstaller"三个按钮
+            result = QMessageBox.warning(
                 self,
-                CenterWidget.tr("Error"),
+                CenterWidget.tr("Warning"),
                 CenterWidget.tr(
-                    "The selection is not a valid Python interpreter, "
-                    "please reselect it!"
+                    "Pyinstaller doesn't seem to be installed in this Python "
+                    "environment, still continue?"
                 ),
-                QMessageBox.StandardButton.Cancel,
                 QMessageBox.StandardButton.Ok,
+                QMessageBox.StandardButton.Cancel,
             )
-            if result == QMessageBox.StandardButton.Ok:
-                self.itp_dlg.exec()
+            if result == QMessageBox.StandardButton.Cancel:
+                return
+
+        self.pyenv_combobox.add_pyenv(new_pyenv, select=True)
 
     def show_status_msg(self, msg: str) -> None:
         """向父控件（QMainWindow）的状态栏显示信息
@@ -616,6 +726,24 @@ class WinMacCenterWidget(CenterWidget):
             )
             self.show_status_msg(msg)
 
+    @QtCore.Slot(object)
+    def handle_options_applied(self, options: dict[PyInstOpt, Any]) -> None:
+        """处理options_applied信号的槽，根据一次性应用的全部选项刷新界面，不会再次发出 option_selected 信号
+
+        :param options: 全部选项，值为 None 表示未设置
+        """
+
+        super().handle_options_applied(options)
+
+        if options[PyInstOpt.icon_path] is not None:
+            self.handle_option_set((PyInstOpt.icon_path, options[PyInstOpt.icon_path]))
+        else:
+            self.icon_path_le.clear()
+
+        self.console_checkbox.blockSignals(True)
+        self.console_checkbox.setChecked(options[PyInstOpt.console] != "--windowed")
+        self.console_checkbox.blockSignals(False)
+
     @QtCore.Slot(PyInstOpt)
     def handle_option_error(self, option: PyInstOpt) -> None:
         """处理option_error信号的槽，重置设置失败的选项对应的界面，并向用户发出警告
@@ -4,23 +4,38 @@
 """此模块集中处理数个对话框(QDialog)控件"""
 
 __all__ = [
+    "format_size",
     "ScriptFileDlg",
     "IconFileDlg",
     "InterpreterFileDlg",
     "AboutDlg",
     "PkgBrowserDlg",
+    "PyEnvSelectDlg",
+    "WorkpathCacheDlg",
+    "BuildLogDlg",
 ]
 
+import bisect
+import time
 import warnings
+from pathlib import Path
 from typing import Optional
 
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QIcon, QPixmap
+from PySide6.QtGui import QCloseEvent, QIcon, QPixmap, QShowEvent
 from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QComboBox,
     QDialog,
+    QDialogButtonBox,
     QFileDialog,
+    QHBoxLayout,
     QHeaderView,
+    QLabel,
+    QListWidget,
+    QListWidgetItem,
     QMessageBox,
+    QPushButton,
     QTableWidget,
     QTableWidgetItem,
     QVBoxLayout,
@@ -28,7 +43,31 @@ from PySide6.QtWidgets import (
 )
 
 from ..Constants import RUNTIME_INFO, Platform
-from ..Utilities import QObjTr, QtFileOpen
+from ..Core.log_store import BuildLogArchive, LogLineStore
+from ..Core.workpath_cache import (
+    WorkpathCache,
+    WorkpathCacheEntry,
+    WorkpathCacheService,
+)
+from ..Utilities import QObjTr, QtFileOpen, normalize_pkg_name, open_dir_in_explorer
+from .log_view import LogView
+
+
+def format_size(size: int) -> str:
+    """将字节数格式化为易读形式
+
+    :param size: 字节数
+    :return: 如 "12.3 MiB"
+    """
+
+    if size < 1024:
+        return f"{size} B"
+    value = size / 1024
+    for unit in ("KiB", "MiB"):
+        if value < 1024:
+            return f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GiB"
 
 
 class ScriptFileDlg(QObjTr, QFileDialog):
@@ -174,6 +213,7 @@ class PkgBrowserDlg(QObjTr, QDialog):
 
         self.pkg_list: list[tuple[str, str]] = []  # [("black", "23.12.1"), ...]
         self.pkg_table = QTableWidget(self)
+        self.status_label = QLabel(self)  # 加载中、加载失败等状态提示
 
         self._setup_ui()
 
@@ -197,9 +237,31 @@ class PkgBrowserDlg(QObjTr, QDialog):
         main_layout = QVBoxLayout()
         main_layout.setSpacing(0)
         main_layout.setContentsMargins(0, 0, 0, 0)
+        main_layout.addWidget(self.status_label)
         main_layout.addWidget(self.pkg_table)
         self.setLayout(main_layout)
 
+        self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.status_label.hide()
+
+    def set_loading(self) -> None:
+        """进入加载状态，清空当前内容，直到 `load_pkg_list()` 被调用"""
+
+        self.pkg_list = []
+        self._pkg_table_update()
+        self.status_label.setText(PkgBrowserDlg.tr("Loading installed packages..."))
+        self.status_label.show()
+
+    def set_load_failed(self) -> None:
+        """显示加载失败状态"""
+
+        self.pkg_list = []
+        self._pkg_table_update()
+        self.status_label.setText(
+            PkgBrowserDlg.tr("Failed to get the installed packages.")
+        )
+        self.status_label.show()
+
     def load_pkg_list(self, pkg_list: list[dict[str, str]]) -> None:
         """从后端加载包数据，存储到实例属性 pkg_list 中，并更新界面
 
@@ -214,8 +276,33 @@ class PkgBrowserDlg(QObjTr, QDialog):
             pkg_version = pkg["version"]
             package_lists.append((pkg_name, pkg_version))
         self.pkg_list = package_lists
+        self.status_label.hide()
         self._pkg_table_update()
 
+    def update_pkg_list(self, added: list[dict[str, str]], removed: list[str]) -> None:
+        """就地增量更新包列表，只增删发生变化的行，不重建整个表格
+
+        :param added: 新增的包，形如 [{"name": "black", "version": "23.12.1"}, ...]
+        :param removed: 被移除的包的规范化名称
+        """
+
+        removed_keys = set(removed)
+        for row in range(len(self.pkg_list) - 1, -1, -1):
+            if normalize_pkg_name(self.pkg_list[row][0]) in removed_keys:
+                del self.pkg_list[row]
+                self.pkg_table.removeRow(row)
+
+        for pkg in added:
+            new_pkg = (pkg["name"], pkg["version"])
+            # 保持按包名排序，二分查找插入位置
+            row = bisect.bisect_left(
+                [name.lower() for name, _ in self.pkg_list], new_pkg[0].lower()
+            )
+            self.pkg_list.insert(row, new_pkg)
+            self.pkg_table.insertRow(row)
+            self.pkg_table.setItem(row, 0, QTableWidgetItem(new_pkg[0]))
+            self.pkg_table.setItem(row, 1, QTableWidgetItem(new_pkg[1]))
+
     def _pkg_table_update(self) -> None:
         """更新包列表控件显示内容"""
 
@@ -223,3 +310,331 @@ class PkgBrowserDlg(QObjTr, QDialog):
         for row, pkg in enumerate(self.pkg_list):
             self.pkg_table.setItem(row, 0, QTableWidgetItem(pkg[0]))
             self.pkg_table.setItem(row, 1, QTableWidgetItem(pkg[1]))
+
+
+class PyEnvSelectDlg(QObjTr, QDialog):
+    """从 Python 环境下拉框的条目中勾选多个环境的对话框，用于矩阵构建"""
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        """
+        :param parent: 父控件对象
+        """
+
+        super().__init__(parent)
+
+        self.env_list = QListWidget(self)
+        self.button_box = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel,
+            self,
+        )
+
+        self._setup_ui()
+
+    def _setup_ui(self) -> None:
+        """处理 UI"""
+
+        self.setWindowTitle(PyEnvSelectDlg.tr("Select Python Environments"))
+        self.setWindowIcon(QIcon(QPixmap(":/Icons/Python_128px")))
+        self.setMinimumWidth(360)
+
+        main_layout = QVBoxLayout()
+        main_layout.addWidget(
+            QLabel(PyEnvSelectDlg.tr("Build the current task with each of:"))
+        )
+        main_layout.addWidget(self.env_list)
+        main_layout.addWidget(self.button_box)
+        self.setLayout(main_layout)
+
+        self.button_box.accepted.connect(self.accept)
+        self.button_box.rejected.connect(self.reject)
+
+    def load_items(self, combobox: QComboBox) -> None:
+        """以下拉框中的各条目填充列表，默认勾选下拉框当前选中的条目
+
+        :param combobox: Python 环境下拉框，其条目数据为环境在 `ALL_PY_ENVs` 中的索引
+        """
+
+        self.env_list.clear()
+        for index in range(combobox.count()):
+            item = QListWidgetItem(combobox.itemIcon(index), combobox.itemText(index))
+            item.setData(Qt.ItemDataRole.UserRole, combobox.itemData(index))
+            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+            item.setCheckState(
+                Qt.CheckState.Checked
+                if index == combobox.currentIndex()
+                else Qt.CheckState.Unchecked
+            )
+            self.env_list.addItem(item)
+
+    def selected_data(self) -> list[int]:
+        """获取所有被勾选条目的数据
+
+        :return: 被勾选环境在 `ALL_PY_ENVs` 中的索引列表
+        """
+
+        return [
+            self.env_list.item(row).data(Qt.ItemDataRole.UserRole)
+            for row in range(self.env_list.count())
+            if self.env_list.item(row).checkState() == Qt.CheckState.Checked
+        ]
+
+
+class WorkpathCacheDlg(QObjTr, QDialog):
+    """查看与清理 PyInstaller 临时文件目录（--workpath）缓存的对话框"""
+
+    def __init__(self, parent: QWidget, cache: WorkpathCache) -> None:
+        """
+        :param parent: 父控件对象
+        :param cache: 该对话框管理的 workpath 缓存
+        """
+
+        super().__init__(parent)
+
+        self.cache = cache
+        self._entries: list[WorkpathCacheEntry] = []  # 表格中每一行对应的条目
+        # 在后台线程中列出与清理条目，遍历大量缓存文件时不阻塞界面
+        self._service = WorkpathCacheService(cache, self)
+
+        self.entry_table = QTableWidget(self)
+        self.summary_label = QLabel(self)
+        self.open_btn = QPushButton(self)
+        self.purge_selected_btn = QPushButton(self)
+        self.purge_all_btn = QPushButton(self)
+        self.close_btn = QPushButton(self)
+
+        self._setup_ui()
+
+    def _setup_ui(self) -> None:
+        """处理 UI"""
+
+        self.setWindowTitle(WorkpathCacheDlg.tr("Build Cache"))
+        self.setWindowIcon(QIcon(QPixmap(":/Icons/Py2exe-GUI_icon_72px")))
+        self.setMinimumSize(640, 360)
+
+        self.entry_table.setColumnCount(4)
+        self.entry_table.setHorizontalHeaderLabels(
+            [
+                WorkpathCacheDlg.tr("Script"),
+                WorkpathCacheDlg.tr("Variant"),
+                WorkpathCacheDlg.tr("Size"),
+                WorkpathCacheDlg.tr("Last Used"),
+            ]
+        )
+        self.entry_table.horizontalHeader().setSectionResizeMode(
+            0, QHeaderView.ResizeMode.Stretch
+        )
+        self.entry_table.setSelectionBehavior(
+            QAbstractItemView.SelectionBehavior.SelectRows
+        )
+        self.entry_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+
+        self.open_btn.setText(WorkpathCacheDlg.tr("Open Folder"))
+        self.purge_selected_btn.setText(WorkpathCacheDlg.tr("Purge Selected"))
+        self.purge_all_btn.setText(WorkpathCacheDlg.tr("Purge All"))
+        self.close_btn.setText(WorkpathCacheDlg.tr("Close"))
+
+        # 布局管理器
+        btn_layout = QHBoxLayout()
+        btn_layout.addWidget(self.open_btn)
+        btn_layout.addStretch()
+        btn_layout.addWidget(self.purge_selected_btn)
+        btn_layout.addWidget(self.purge_all_btn)
+        btn_layout.addWidget(self.close_btn)
+
+        main_layout = QVBoxLayout()
+        main_layout.addWidget(self.entry_table)
+        main_layout.addWidget(self.summary_label)
+        main_layout.addLayout(btn_layout)
+        self.setLayout(main_layout)
+
+        self.open_btn.clicked.connect(
+            lambda: open_dir_in_explorer(str(self.cache.root))
+        )
+        self.purge_selected_btn.clicked.connect(self._handle_purge_selected)
+        self.purge_all_btn.clicked.connect(self._handle_purge_all)
+        self.close_btn.clicked.connect(self.close)
+        self._service.entries_loaded.connect(self.handle_entries_loaded)
+
+    def load_entries(self) -> None:
+        """请求在后台读取缓存中的所有条目，完成后填充表格"""
+
+        self._set_busy(WorkpathCacheDlg.tr("Calculating cache size..."))
+        self._service.load()
+
+    def _set_busy(self, message: str) -> None:
+        """后台任务进行中，显示提示信息并禁用清理按钮
+
+        :param message: 提示信息
+        """
+
+        self.summary_label.setText(message)
+        self.purge_selected_btn.setEnabled(False)
+        self.purge_all_btn.setEnabled(False)
+
+    def handle_entries_loaded(self, entries: list[WorkpathCacheEntry]) -> None:
+        """后台已列出缓存中的所有条目，填充表格
+
+        :param entries: 缓存条目列表，按最近使用时间从新到旧排列
+        """
+
+        self._entries = entries
+
+        self.entry_table.setRowCount(len(self._entries))
+        for row, entry in enumerate(self._entries):
+            script_item = QTableWidgetItem(entry.script or entry.path.name)
+            script_item.setToolTip(str(entry.path))
+            last_used = time.strftime("%Y-%m-%d %H:%M", time.localtime(entry.last_used))
+            self.entry_table.setItem(row, 0, script_item)
+            self.entry_table.setItem(row, 1, QTableWidgetItem(entry.variant))
+            self.entry_table.setItem(row, 2, QTableWidgetItem(format_size(entry.size)))
+            self.entry_table.setItem(row, 3, QTableWidgetItem(last_used))
+
+        self.summary_label.setText(
+            WorkpathCacheDlg.tr(
+                "{0} entries, {1} in total (limit {2}, unused entries expire after "
+                "{3} days)."
+            ).format(
+                len(self._entries),
+                format_size(sum(entry.size for entry in self._entries)),
+                format_size(self.cache.max_size),
+                round(self.cache.max_age / 86400),
+            )
+        )
+        self.purge_selected_btn.setEnabled(True)
+        self.purge_all_btn.setEnabled(bool(self._entries))
+
+    def showEvent(self, event: QShowEvent) -> None:
+        """重写显示事件，每次显示时重新读取缓存条目
+
+        :param event: 显示事件
+        """
+
+        self.load_entries()
+        super().showEvent(event)
+
+    def _handle_purge_selected(self) -> None:
+        """“清理所选”按钮的槽函数"""
+
+        rows = {index.row() for index in self.entry_table.selectedIndexes()}
+        if not rows:
+            return
+        self._set_busy(WorkpathCacheDlg.tr("Purging..."))
+        self._service.purge(self._entries[row].path for row in rows)
+
+    def _handle_purge_all(self) -> None:
+        """“全部清理”按钮的槽函数，确认后删除所有缓存条目"""
+
+        reply = QMessageBox.question(
+            self,
+            WorkpathCacheDlg.tr("Purge All"),
+            WorkpathCacheDlg.tr(
+                "Delete all cached build files? The next build of every project "
+                "will have to start from scratch."
+            ),
+        )
+        if reply == QMessageBox.StandardButton.Yes:
+            self._set_busy(WorkpathCacheDlg.tr("Purging..."))
+            self._service.purge()
+
+
+class BuildLogDlg(QObjTr, QDialog):
+    """查看历次打包日志的对话框，左侧为日志列表，右侧可搜索与按级别过滤所选日志"""
+
+    def __init__(self, parent: QWidget, archive: BuildLogArchive) -> None:
+        """
+        :param parent: 父控件对象
+        :param archive: 该对话框查看的日志存档
+        """
+
+        super().__init__(parent)
+
+        self.archive = archive
+        self._paths: list[Path] = []  # 列表中每一项对应的日志文件
+
+        self.log_list = QListWidget(self)
+        self.log_view = LogView(self)
+        self.open_btn = QPushButton(self)
+        self.close_btn = QPushButton(self)
+
+        self._setup_ui()
+
+    def _setup_ui(self) -> None:
+        """处理 UI"""
+
+        self.setWindowTitle(BuildLogDlg.tr("Build Logs"))
+        self.setWindowIcon(QIcon(QPixmap(":/Icons/Py2exe-GUI_icon_72px")))
+        self.setMinimumSize(800, 480)
+
+        self.open_btn.setText(BuildLogDlg.tr("Open Folder"))
+        self.close_btn.setText(BuildLogDlg.tr("Close"))
+
+        # 布局管理器
+        content_layout = QHBoxLayout()
+        content_layout.addWidget(self.log_list, 1)
+        content_layout.addWidget(self.log_view, 3)
+
+        btn_layout = QHBoxLayout()
+        btn_layout.addWidget(self.open_btn)
+        btn_layout.addStretch()
+        btn_layout.addWidget(self.close_btn)
+
+        main_layout = QVBoxLayout()
+        main_layout.addLayout(content_layout)
+        main_layout.addLayout(btn_layout)
+        self.setLayout(main_layout)
+
+        self.log_list.currentRowChanged.connect(self._handle_current_row_changed)
+        self.open_btn.clicked.connect(
+            lambda: open_dir_in_explorer(str(self.archive.root))
+        )
+        self.close_btn.clicked.connect(self.close)
+
+    def load_logs(self) -> None:
+        """读取存档中的所有日志并填充列表，默认选中最新的日志"""
+
+        self._paths = self.archive.logs()
+        self.log_list.blockSignals(True)
+        self.log_list.clear()
+        for path in self._paths:
+            item = QListWidgetItem(path.stem)
+            item.setToolTip(str(path))
+            self.log_list.addItem(item)
+        self.log_list.blockSignals(False)
+
+        if self._paths:
+            self.log_list.setCurrentRow(0)
+        else:
+            self.log_view.clear()
+
+    def _handle_current_row_changed(self, row: int) -> None:
+        """打开所选日志；借助索引文件，无需读取整个日志即可显示其末尾部分
+
+        :param row: 所选行
+        """
+
+        if not 0 <= row < len(self._paths):
+            return
+        try:
+            store = LogLineStore(self._paths[row], mode="r")
+        except OSError as e:
+            QMessageBox.critical(self, BuildLogDlg.tr("Error"), str(e))
+            return
+        self.log_view.set_store(store)
+
+    def showEvent(self, event: QShowEvent) -> None:
+        """重写显示事件，每次显示时重新读取日志列表
+
+        :param event: 显示事件
+        """
+
+        self.load_logs()
+        super().showEvent(event)
+
+    def closeEvent(self, event: QCloseEvent) -> None:
+        """重写关闭事件，关闭当前打开的日志文件
+
+        :param event: 关闭事件
+        """
+
+        self.log_view.clear()
+        super().closeEvent(event)
@@ -0,0 +1,190 @@
+# Licensed under the GPLv3 License: https://www.gnu.org/licenses/gpl-3.0.html
+# For details: https://github.com/muziing/Py2exe-GUI/blob/main/README.md#license
+
+"""此模块主要包含用于显示大量子进程输出的日志控件 `LogView`
+
+完整的输出保存在磁盘上的 `LogLineStore`（临时文件，或由 `set_store()` 指定的打包日志文件）中，显示用的 `QPlainTextEdit` 只保留最近的 `MAX_VISIBLE_LINES` 行，
+且只绘制可见区域，因此即使输出多达数十万行，内存占用与滚动性能也不受影响。
+搜索与级别过滤在全部历史输出上进行，显示最后的 `MAX_VISIBLE_LINES` 个匹配行。
+"""
+
+__all__ = ["LogView"]
+
+from typing import Optional
+
+from PySide6.QtCore import QTimer, Slot
+from PySide6.QtGui import QFontDatabase
+from PySide6.QtWidgets import (
+    QComboBox,
+    QHBoxLayout,
+    QLabel,
+    QLineEdit,
+    QPlainTextEdit,
+    QVBoxLayout,
+    QWidget,
+)
+
+from ..Core.log_store import LogLevel, LogLineStore
+from ..Utilities import QObjTr
+
+
+class LogView(QObjTr, QWidget):
+    """带搜索与日志级别过滤功能的只读日志控件"""
+
+    MAX_VISIBLE_LINES = 10000  # 显示区域最多保留的行数，更早的行仍可通过搜索找到
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        """
+        :param parent: 父控件对象
+        """
+
+        super().__init__(parent)
+
+        self.store = LogLineStore()
+        self.search_edit = QLineEdit(self)
+        self.level_combobox = QComboBox(self)
+        self.count_label = QLabel(self)
+        self.text_edit = QPlainTextEdit(self)
+
+        # 输入搜索关键字时稍作延迟再搜索，避免每输入一个字符都遍历一次全部输出
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(200)
+        self._search_timer.timeout.connect(self._refresh)
+        self._match_count = 0  # 符合当前搜索与过滤条件的行数
+
+        self._setup()
+
+    def _setup(self) -> None:
+        """配置日志控件"""
+
+        self.search_edit.setPlaceholderText(LogView.tr("Search the whole log"))
+        self.search_edit.setClearButtonEnabled(True)
+        self.search_edit.textChanged.connect(self._search_timer.start)
+
+        self.level_combobox.addItem(LogView.tr("All Levels"), LogLevel.OTHER)
+        self.level_combobox.addItem(LogView.tr("INFO and Above"), LogLevel.INFO)
+        self.level_combobox.addItem(LogView.tr("WARNING and Above"), LogLevel.WARNING)
+        self.level_combobox.addItem(LogView.tr("ERROR Only"), LogLevel.ERROR)
+        self.level_combobox.currentIndexChanged.connect(self._refresh)
+
+        self.text_edit.setReadOnly(True)
+        self.text_edit.setUndoRedoEnabled(False)
+        self.text_edit.setMaximumBlockCount(self.MAX_VISIBLE_LINES)
+        self.text_edit.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        self.text_edit.setFont(
+            QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont)
+        )
+
+        # 布局管理器
+        filter_layout = QHBoxLayout()
+        filter_layout.addWidget(self.search_edit)
+        filter_layout.addWidget(self.level_combobox)
+        filter_layout.addWidget(self.count_label)
+        main_layout = QVBoxLayout()
+        main_layout.setContentsMargins(0, 0, 0, 0)
+        main_layout.addLayout(filter_layout)
+        main_layout.addWidget(self.text_edit)
+        self.setLayout(main_layout)
+
+        self._update_count_label(0)
+
+    @property
+    def _min_level(self) -> LogLevel:
+        """当前选择的最低日志级别"""
+
+        return LogLevel(self.level_combobox.currentData())
+
+    @property
+    def _filtering(self) -> bool:
+        """当前是否正在搜索或过滤"""
+
+        return bool(self.search_edit.text()) or self._min_level != LogLevel.OTHER
+
+    def append_text(self, text: str) -> None:
+        """追加一段输出，写入磁盘存储，并在显示区域中追加一次
+
+        :param text: 输出文本，可包含多行
+        """
+
+        start, end = self.store.append_text(text)
+        if start == end:
+            return
+        # appendPlainText() 本身会另起一段，去掉末尾的一个换行符
+        text = text[:-1] if text.endswith("\n") else text
+
+        if not self._filtering:
+            self.text_edit.appendPlainText(text)
+            self._update_count_label(len(self.store))
+            return
+
+        # 正在搜索或过滤时，只追加新增行中符合条件的行
+        keyword = self.search_edit.text().casefold()
+        min_level = self._min_level
+        new_lines = text.split("\n")
+        matched = [
+            line
+            for index, line in zip(range(start, end), new_lines)
+            if self.store.level(index) >= min_level and keyword in line.casefold()
+        ]
+        if matched:
+            self._match_count += len(matched)
+            self.text_edit.appendPlainText("\n".join(matched))
+        self._update_count_label(self._match_count)
+
+    @Slot()
+    def _refresh(self) -> None:
+        """按当前的搜索关键字与日志级别，从全部历史输出中重新生成显示内容"""
+
+        self._search_timer.stop()
+        indices = self.store.search(self.search_edit.text(), self._min_level)
+        self._match_count = len(indices)
+        visible = indices[-self.MAX_VISIBLE_LINES :]
+
+        self.text_edit.setUpdatesEnabled(False)
+        self.text_edit.setPlainText("\n".join(self.store.lines(visible)))
+        self.text_edit.setUpdatesEnabled(True)
+        self.text_edit.verticalScrollBar().setValue(
+            self.text_edit.verticalScrollBar().maximum()
+        )
+        self._update_count_label(self._match_count)
+
+    def _update_count_label(self, shown: int) -> None:
+        """更新行数标签
+
+        :param shown: 符合当前搜索与过滤条件的行数
+        """
+
+        total = len(self.store)
+        if self._filtering:
+            self.count_label.setText(
+                LogView.tr("{0} of {1} lines").format(shown, total)
+            )
+        else:
+            self.count_label.setText(LogView.tr("{0} lines").format(total))
+
+    def set_store(self, store: LogLineStore) -> None:
+        """改为显示另一个日志存储（如新一次打包的日志，或已保存的历史日志），此后追加的输出写入其中。
+        原先的存储会被关闭，即日志控件拥有其存储
+
+        :param store: 新的日志存储
+        """
+
+        self.store.close()
+        self.store = store
+        self._refresh()
+
+    def clear(self) -> None:
+        """清空显示与搜索条件，并改用新的临时存储（已保存至磁盘的日志不受影响）"""
+
+        self.store.close()
+        self.store = LogLineStore()
+        self.text_edit.clear()
+        self.search_edit.blockSignals(True)
+        self.search_edit.clear()
+        self.search_edit.blockSignals(False)
+        self.level_combobox.blockSignals(True)
+        self.level_combobox.setCurrentIndex(0)
+        self.level_combobox.blockSignals(False)
+        self._match_count = 0
+        self._update_count_label(0)
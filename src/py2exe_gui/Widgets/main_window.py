@@ -65,10 +65,27 @@ class MainWindow(QObjTr, QMainWindow):
         """配置主窗口菜单栏"""
 
         file_menu = self.menu_bar.addMenu(MainWindow.tr("&File"))
-        file_menu.addAction(
-            MainWindow.tr("Import Config From JSON File")
-        )  # 暂时只为占位
-        file_menu.addAction(MainWindow.tr("Export Config To JSON File"))  # 暂时只为占位
+        # 由 MainApp 连接，导入/导出打包任务文件（JSON 或 YAML）
+        self.import_task_action = file_menu.addAction(
+            MainWindow.tr("Import Task File...")
+        )
+        self.export_task_action = file_menu.addAction(
+            MainWindow.tr("Export Task File...")
+        )
+        file_menu.addSeparator()
+        # 由 MainApp 连接至批量打包队列对话框
+        self.packaging_queue_action = file_menu.addAction(
+            MainWindow.tr("Packaging &Queue...")
+        )
+        # 由 MainApp 连接至 PyInstaller 临时文件缓存对话框
+        self.build_cache_action = file_menu.addAction(MainWindow.tr("&Build Cache..."))
+        # 由 MainApp 连接至历次打包日志对话框
+        self.build_logs_action = file_menu.addAction(MainWindow.tr("Build &Logs..."))
+        # 由 MainApp 连接，是否使用预先导入了 PyInstaller 的常驻进程执行打包
+        self.warm_worker_action = file_menu.addAction(
+            MainWindow.tr("Keep PyInstaller &Warm")
+        )
+        self.warm_worker_action.setCheckable(True)
         file_menu.addSeparator()
         file_menu.addAction(MainWindow.tr("&Settings"))  # 暂时只为占位
         file_menu.addSeparator()
@@ -0,0 +1,333 @@
+# Licensed under the GPLv3 License: https://www.gnu.org/licenses/gpl-3.0.html
+# For details: https://github.com/muziing/Py2exe-GUI/blob/main/README.md#license
+
+"""此模块主要包含用于管理批量打包队列的对话框 `PackagingQueueDlg`
+
+以表格形式显示队列中每个作业的状态、耗时、退出码、输出大小与最新输出，选中某个作业可查看其完整输出；
+队列中所有作业结束后显示汇总信息。矩阵构建的各作业同样显示在此表格中，可直接比较各环境的结果
+"""
+
+__all__ = ["PackagingQueueDlg"]
+
+from PySide6.QtCore import QTimer, Signal, Slot
+from PySide6.QtGui import QIcon, QPixmap
+from PySide6.QtWidgets import (
+    QDialog,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QPushButton,
+    QSpinBox,
+    QTableWidget,
+    QTableWidgetItem,
+    QTextBrowser,
+    QVBoxLayout,
+    QWidget,
+)
+
+from ..Core.packaging_queue import PackagingJob, PackagingQueue
+from ..Core.subprocess_tool import SubProcessTool
+from ..Utilities import QObjTr
+from .dialog_widgets import ScriptFileDlg, format_size
+
+
+class PackagingQueueDlg(QObjTr, QDialog):
+    """批量打包队列对话框"""
+
+    # 自定义信号，用户选择了若干入口脚本，应以当前选项为每个脚本添加一个作业，实际类型为 list[str]
+    scripts_selected = Signal(list)
+
+    MAX_OUTPUT_LINES = 5000  # 输出框中显示的选中作业最后输出的行数
+
+    def __init__(self, parent: QWidget, queue: PackagingQueue) -> None:
+        """
+        :param parent: 父控件对象
+        :param queue: 该对话框管理的打包队列
+        """
+
+        super().__init__(parent)
+
+        self.queue = queue
+        self._rows: list[PackagingJob] = []  # 表格中每一行对应的作业
+
+        self.job_table = QTableWidget(self)
+        self.output_browser = QTextBrowser(self)  # 显示选中作业的最后若干行输出
+        self.summary_label = QLabel(self)
+        self.max_jobs_spinbox = QSpinBox(self)
+        self.add_current_btn = QPushButton(self)  # 由 MainApp 连接，添加当前打包任务
+        self.add_scripts_btn = QPushButton(self)
+        self.add_matrix_btn = QPushButton(self)  # 由 MainApp 连接，添加矩阵构建
+        self.start_btn = QPushButton(self)
+        self.cancel_btn = QPushButton(self)
+        self.clear_btn = QPushButton(self)
+        self.script_file_dlg = ScriptFileDlg(self)
+
+        # 定时刷新运行中作业的耗时
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setInterval(1000)
+
+        self._setup_ui()
+        self._connect_slots()
+
+    def _setup_ui(self) -> None:
+        """处理 UI"""
+
+        self.setWindowTitle(PackagingQueueDlg.tr("Packaging Queue"))
+        self.setWindowIcon(QIcon(QPixmap(":/Icons/Py2exe-GUI_icon_72px")))
+        self.setMinimumSize(720, 480)
+
+        self.job_table.setColumnCount(7)
+        self.job_table.setHorizontalHeaderLabels(
+            [
+                PackagingQueueDlg.tr("Name"),
+                PackagingQueueDlg.tr("Interpreter"),
+                PackagingQueueDlg.tr("Status"),
+                PackagingQueueDlg.tr("Duration"),
+                PackagingQueueDlg.tr("Exit Code"),
+                PackagingQueueDlg.tr("Output Size"),
+                PackagingQueueDlg.tr("Progress"),
+            ]
+        )
+        self.job_table.horizontalHeader().setSectionResizeMode(
+            6, QHeaderView.ResizeMode.Stretch
+        )
+        self.job_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.job_table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+        self.job_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+
+        # 限制输出框的行数，持续追加输出时自动丢弃最早的行，避免内存与渲染开销无限增长
+        self.output_browser.document().setMaximumBlockCount(self.MAX_OUTPUT_LINES)
+
+        self.max_jobs_spinbox.setRange(1, 64)
+        self.max_jobs_spinbox.setValue(self.queue.max_jobs)
+        self.add_current_btn.setText(PackagingQueueDlg.tr("Add Current Task"))
+        self.add_scripts_btn.setText(PackagingQueueDlg.tr("Add Scripts..."))
+        self.add_matrix_btn.setText(PackagingQueueDlg.tr("Add Matrix Build..."))
+        self.start_btn.setText(PackagingQueueDlg.tr("Start"))
+        self.cancel_btn.setText(PackagingQueueDlg.tr("Cancel"))
+        self.clear_btn.setText(PackagingQueueDlg.tr("Clear Finished"))
+
+        # 布局管理器
+        btn_layout = QHBoxLayout()
+        btn_layout.addWidget(self.add_current_btn)
+        btn_layout.addWidget(self.add_scripts_btn)
+        btn_layout.addWidget(self.add_matrix_btn)
+        btn_layout.addStretch()
+        btn_layout.addWidget(QLabel(PackagingQueueDlg.tr("Parallel jobs:")))
+        btn_layout.addWidget(self.max_jobs_spinbox)
+        btn_layout.addWidget(self.start_btn)
+        btn_layout.addWidget(self.cancel_btn)
+        btn_layout.addWidget(self.clear_btn)
+
+        main_layout = QVBoxLayout()
+        main_layout.addLayout(btn_layout)
+        main_layout.addWidget(self.job_table, 3)
+        main_layout.addWidget(self.output_browser, 2)
+        main_layout.addWidget(self.summary_label)
+        self.setLayout(main_layout)
+
+        self._update_buttons()
+
+    def _connect_slots(self) -> None:
+        """连接信号与槽"""
+
+        self.queue.job_added.connect(self.handle_job_added)
+        self.queue.job_started.connect(self.handle_job_updated)
+        self.queue.job_finished.connect(self.handle_job_updated)
+        self.queue.job_updated.connect(self.handle_job_updated)
+        self.queue.job_output.connect(self.handle_job_output)
+        self.queue.drained.connect(self.handle_drained)
+
+        self.max_jobs_spinbox.valueChanged.connect(self._handle_max_jobs_changed)
+        self.add_scripts_btn.clicked.connect(self.script_file_dlg.open)
+        self.script_file_dlg.filesSelected.connect(
+            lambda file_paths: self.scripts_selected.emit(list(file_paths))
+        )
+        self.start_btn.clicked.connect(self._handle_start)
+        self.cancel_btn.clicked.connect(lambda: self.queue.cancel())
+        self.clear_btn.clicked.connect(self._handle_clear)
+        self.job_table.itemSelectionChanged.connect(self._show_selected_output)
+        self._refresh_timer.timeout.connect(self._refresh_running_rows)
+
+    @Slot(object)
+    def handle_job_added(self, job: PackagingJob) -> None:
+        """队列中添加了新作业，在表格末尾添加一行
+
+        :param job: 新作业
+        """
+
+        self._rows.append(job)
+        row = self.job_table.rowCount()
+        self.job_table.insertRow(row)
+        for column in range(self.job_table.columnCount()):
+            self.job_table.setItem(row, column, QTableWidgetItem())
+        self._update_row(row)
+        self._update_buttons()
+
+    @Slot(object)
+    def handle_job_updated(self, job: PackagingJob) -> None:
+        """作业开始、结束或输出大小统计完成，更新对应行
+
+        :param job: 状态发生变化的作业
+        """
+
+        row = self._row_of(job)
+        if row != -1:
+            self._update_row(row)
+        self._update_buttons()
+
+    @Slot(object, tuple)
+    def handle_job_output(
+        self, job: PackagingJob, output: tuple[SubProcessTool.OutputType, str]
+    ) -> None:
+        """作业产生输出，更新进度列；若该作业正被选中，则同时追加至输出框
+
+        :param job: 产生输出的作业
+        :param output: 子进程输出，(输出类型, 文本)
+        """
+
+        row = self._row_of(job)
+        if row == -1:
+            return
+        self.job_table.item(row, 6).setText(job.last_message)
+
+        output_type, output_text = output
+        if row == self.job_table.currentRow() and output_type in (
+            SubProcessTool.OutputType.STDOUT,
+            SubProcessTool.OutputType.STDERR,
+        ):
+            self.output_browser.append(output_text.rstrip("\n"))
+
+    @Slot(list)
+    def handle_drained(self, jobs: list[PackagingJob]) -> None:
+        """队列中所有作业均已结束，显示汇总信息
+
+        :param jobs: 队列中的所有作业
+        """
+
+        self._update_buttons()
+
+        states = [job.state for job in jobs]
+        start_times = [job.start_time for job in jobs if job.start_time is not None]
+        end_times = [job.end_time for job in jobs if job.end_time is not None]
+        wall_time = max(end_times) - min(start_times) if start_times else 0.0
+
+        self.summary_label.setText(
+            PackagingQueueDlg.tr(
+                "Queue finished: {0} succeeded, {1} failed, {2} cancelled, "
+                "{3} up to date, total time {4:.1f} s."
+            ).format(
+                states.count(PackagingJob.State.SUCCEEDED),
+                states.count(PackagingJob.State.FAILED),
+                states.count(PackagingJob.State.CANCELLED),
+                states.count(PackagingJob.State.SKIPPED),
+                wall_time,
+            )
+        )
+
+    def _row_of(self, job: PackagingJob) -> int:
+        """获取作业在表格中的行号
+
+        :param job: 作业
+        :return: 行号，不在表格中时返回 -1
+        """
+
+        for row, row_job in enumerate(self._rows):
+            if row_job is job:
+                return row
+        return -1
+
+    def _update_row(self, row: int) -> None:
+        """根据作业的当前状态更新表格中的一行
+
+        :param row: 行号
+        """
+
+        job = self._rows[row]
+        state_texts = {
+            PackagingJob.State.PENDING: PackagingQueueDlg.tr("Pending"),
+            PackagingJob.State.RUNNING: PackagingQueueDlg.tr("Running"),
+            PackagingJob.State.SUCCEEDED: PackagingQueueDlg.tr("Succeeded"),
+            PackagingJob.State.FAILED: PackagingQueueDlg.tr("Failed"),
+            PackagingJob.State.CANCELLED: PackagingQueueDlg.tr("Cancelled"),
+            PackagingJob.State.SKIPPED: PackagingQueueDlg.tr("Up to Date"),
+        }
+        duration = job.duration
+
+        self.job_table.item(row, 0).setText(job.name)
+        self.job_table.item(row, 1).setText(job.python_path)
+        self.job_table.item(row, 2).setText(state_texts[job.state])
+        self.job_table.item(row, 3).setText(
+            "" if duration is None else f"{duration:.1f} s"
+        )
+        self.job_table.item(row, 4).setText(
+            "" if job.exit_code is None else str(job.exit_code)
+        )
+        self.job_table.item(row, 5).setText(
+            "" if job.output_size is None else format_size(job.output_size)
+        )
+        self.job_table.item(row, 6).setText(job.last_message)
+
+    def _refresh_running_rows(self) -> None:
+        """刷新所有运行中作业的耗时"""
+
+        for row, job in enumerate(self._rows):
+            if job.state == PackagingJob.State.RUNNING:
+                self._update_row(row)
+
+    def _update_buttons(self) -> None:
+        """根据队列状态更新各按钮的可用性，并控制耗时刷新定时器"""
+
+        has_pending = any(job.state == PackagingJob.State.PENDING for job in self._rows)
+        self.start_btn.setEnabled(has_pending)
+        self.cancel_btn.setEnabled(self.queue.is_running or has_pending)
+        self.clear_btn.setEnabled(any(job.is_done for job in self._rows))
+
+        if self.queue.is_running:
+            self._refresh_timer.start()
+        else:
+            self._refresh_timer.stop()
+
+    @Slot(int)
+    def _handle_max_jobs_changed(self, value: int) -> None:
+        """并发数调节框的槽函数
+
+        :param value: 新的最大并发作业数
+        """
+
+        self.queue.max_jobs = value
+
+    @Slot()
+    def _handle_start(self) -> None:
+        """“开始”按钮的槽函数"""
+
+        self.summary_label.clear()
+        self.queue.start()
+        self._update_buttons()
+
+    @Slot()
+    def _handle_clear(self) -> None:
+        """“清除已结束”按钮的槽函数，从队列与表格中移除已结束的作业"""
+
+        self.queue.clear_finished()
+        for row in range(len(self._rows) - 1, -1, -1):
+            if self._rows[row].is_done:
+                del self._rows[row]
+                self.job_table.removeRow(row)
+        self.output_browser.clear()
+        self.summary_label.clear()
+        self._update_buttons()
+
+    @Slot()
+    def _show_selected_output(self) -> None:
+        """在输出框中显示选中作业的完整输出"""
+
+        self.output_browser.clear()
+        row = self.job_table.currentRow()
+        if 0 <= row < len(self._rows) and self._rows[row].log is not None:
+            # 只显示最后若干行，完整输出可通过菜单“File > Build Logs”查看
+            log = self._rows[row].log
+            start = max(0, len(log) - self.MAX_OUTPUT_LINES)
+            self.output_browser.setPlainText(
+                "\n".join(log.lines(range(start, len(log))))
+            )
@@ -1,23 +1,30 @@
 # Licensed under the GPLv3 License: https://www.gnu.org/licenses/gpl-3.0.html
 # For details: https://github.com/muziing/Py2exe-GUI/blob/main/README.md#license
 
-"""本模块主要包含用于选择 Python 解释器环境的下拉框控件 `PyEnvComboBox`"""
+"""本模块主要包含用于选择 Python 解释器环境的下拉框控件 `PyEnvComboBox`
+
+获取 Python 版本需要运行子进程，由 `PyEnvProber` 在后台完成，完成前条目以占位文本显示。
+用户可通过右键菜单固定（pin）环境，启动时根据 `PINNED_PY_ENVs` 中的快照立即填充，
+只有解释器发生变化的已固定环境才会在后台重新验证。
+"""
 
 __all__ = ["PyEnvComboBox"]
 
 import sys
-from typing import Optional
+from pathlib import Path
+from typing import Optional, Union
 
-from PySide6.QtCore import QSize
+from PySide6.QtCore import QPoint, QSize, Qt, Slot
 from PySide6.QtGui import QIcon
-from PySide6.QtWidgets import QComboBox, QWidget
+from PySide6.QtWidgets import QComboBox, QMenu, QWidget
 
 from ..Constants import RUNTIME_INFO, PyEnvType
-from ..Utilities import ALL_PY_ENVs, PyEnv, get_sys_python
+from ..Core import PyEnvDiscovery, PyEnvProber, PyEnvWatcher
+from ..Utilities import ALL_PY_ENVs, PINNED_PY_ENVs, PyEnv, QObjTr, get_sys_python
 
 
-class PyEnvComboBox(QComboBox):
-    """用于选择解释器环境的下拉框"""
+class PyEnvComboBox(QObjTr, QComboBox):
+    """用于选择解释器环境的下拉框，与全局变量 `ALL_PY_ENVs` 联动"""
 
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         """
@@ -28,7 +35,24 @@ class PyEnvComboBox(QComboBox):
 
         self.setIconSize(QSize(18, 18))
         self.setMinimumHeight(24)  # 确保图标显示完整
+
+        # 在后台探测 Python 环境信息，其他控件也可共用
+        self.prober = PyEnvProber(self)
+        self.prober.pyversion_ready.connect(self._handle_pyversion_ready)
+        self.prober.packages_ready.connect(self._handle_packages_ready)
+        self.prober.probe_failed.connect(self._handle_probe_failed)
+        # 监视各环境的 site-packages 目录，外部安装或卸载包后增量刷新
+        self.watcher = PyEnvWatcher(self)
+        # 自动发现本机上的其他 Python 环境
+        self.discovery = PyEnvDiscovery(self)
+        self.discovery.pyenv_found.connect(self._handle_pyenv_found)
+
+        # 右键菜单，用于固定或取消固定当前环境
+        self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.customContextMenuRequested.connect(self._show_context_menu)
+
         self._add_default_item()
+        self._add_pinned_items()
 
     def _add_default_item(self) -> None:
         """添加默认解释器环境条目"""
@@ -40,15 +64,139 @@ class PyEnvComboBox(QComboBox):
             # 若已由 PyInstaller 捆绑成冻结应用程序，则第一项为系统 Python 环境
             default_pyenv = PyEnv(get_sys_python(), PyEnvType.system)
 
-        ALL_PY_ENVs.append(default_pyenv)
-        self.addItem(*self.gen_item(default_pyenv, 0))
+        self.add_pyenv(default_pyenv)
+
+    def _add_pinned_items(self) -> None:
+        """根据注册表快照添加所有已固定的环境，不启动子进程；解释器已变化的条目在后台重新验证"""
+
+        known_paths = {pyenv.exe_path for pyenv in ALL_PY_ENVs}
+        for pyenv in PINNED_PY_ENVs.load_pyenvs():
+            # 解释器已变化的条目没有恢复内省信息，add_pyenv() 会请求后台重新验证
+            if pyenv.exe_path not in known_paths:
+                self.add_pyenv(pyenv)
+
+    def add_pyenv(self, pyenv: PyEnv, select: bool = False) -> None:
+        """将 Python 环境添加至全局变量 `ALL_PY_ENVs` 与下拉框中，若版本未知则在后台获取
+
+        :param pyenv: Python 解释器环境
+        :param select: 添加后是否立即选中该条目
+        """
+
+        ALL_PY_ENVs.append(pyenv)
+        self.discovery.mark_known(pyenv)
+        version = pyenv.pyversion if pyenv.is_probed else None
+        self.addItem(*self.gen_item(pyenv, len(ALL_PY_ENVs) - 1, version))
+        if select:
+            self.setCurrentIndex(self.count() - 1)
+        if version is None:
+            self.prober.request_pyversion(pyenv)
+        else:
+            self.watcher.watch(pyenv)
+
+    def discover(self, project_dir: Optional[Union[str, Path]] = None) -> None:
+        """在后台自动发现本机上的 Python 环境，每发现一个即添加至下拉框中
+
+        :param project_dir: 项目目录，将额外查找其中的 .venv 等项目本地虚拟环境
+        """
+
+        self.discovery.start(project_dir)
+
+    @Slot(object)
+    def _handle_pyenv_found(self, pyenv: PyEnv) -> None:
+        """自动发现新环境的槽函数，与已有环境去重后添加至下拉框
+
+        :param pyenv: 新发现的、已完成内省的 Python 环境
+        """
+
+        key = self.discovery.env_key(pyenv)
+        for env in ALL_PY_ENVs:
+            if env.exe_path == pyenv.exe_path or (
+                env.is_probed and self.discovery.env_key(env) == key
+            ):
+                return
+        self.add_pyenv(pyenv)
+
+    @Slot(object)
+    def _handle_pyversion_ready(self, pyenv: PyEnv) -> None:
+        """Python 版本获取完成后，更新对应条目的显示文本
+
+        :param pyenv: Python 解释器环境
+        """
+
+        self.discovery.mark_known(pyenv)
+        # 已固定的环境重新验证完成，刷新注册表中的快照
+        PINNED_PY_ENVs.update(pyenv)
+        self._update_item(pyenv, pyenv.pyversion)
+
+    @Slot(object, str)
+    def _handle_probe_failed(self, pyenv: PyEnv, _: str) -> None:
+        """获取 Python 版本失败（如已固定的环境已被删除）后，将对应条目标记为不可用
+
+        :param pyenv: Python 解释器环境
+        """
+
+        if not pyenv.is_probed:
+            self._update_item(pyenv, PyEnvComboBox.tr("unavailable"))
+
+    def _update_item(self, pyenv: PyEnv, version: str) -> None:
+        """更新该环境对应条目的图标与显示文本
+
+        :param pyenv: Python 解释器环境
+        :param version: Python 版本或状态文本
+        """
+
+        for index, env in enumerate(ALL_PY_ENVs):
+            if env is pyenv:
+                item_index = self.findData(index)
+                if item_index != -1:
+                    icon, text, _ = self.gen_item(pyenv, index, version)
+                    self.setItemIcon(item_index, icon)
+                    self.setItemText(item_index, text)
+                return
+
+    @Slot(QPoint)
+    def _show_context_menu(self, pos: QPoint) -> None:
+        """显示右键菜单，可固定或取消固定当前选中的环境
+
+        :param pos: 右键点击位置（控件坐标）
+        """
+
+        if self.currentIndex() == -1:
+            return
+
+        pyenv = self.get_current_pyenv()
+        menu = QMenu(self)
+        pin_action = menu.addAction(PyEnvComboBox.tr("Pin this environment"))
+        pin_action.setCheckable(True)
+        pin_action.setChecked(PINNED_PY_ENVs.is_pinned(pyenv))
+        pin_action.setToolTip(
+            PyEnvComboBox.tr("Pinned environments are loaded automatically at startup")
+        )
+        menu.setToolTipsVisible(True)
+
+        if menu.exec(self.mapToGlobal(pos)) is pin_action:
+            if pin_action.isChecked():
+                PINNED_PY_ENVs.pin(pyenv)
+            else:
+                PINNED_PY_ENVs.unpin(pyenv)
+
+    @Slot(object)
+    def _handle_packages_ready(self, pyenv: PyEnv) -> None:
+        """已安装的包列表获取完成后，开始监视该环境的 site-packages 目录
+
+        :param pyenv: Python 解释器环境
+        """
+
+        if any(env is pyenv for env in ALL_PY_ENVs):
+            self.watcher.watch(pyenv)
 
     @staticmethod
-    def gen_item(pyenv: PyEnv, index: int) -> tuple:
+    def gen_item(pyenv: PyEnv, index: int, version: Optional[str] = None) -> tuple:
         """根据传入的 Python 环境，生成一个适用于 QComboBox.addItem() 参数的三元素元组
 
         :param pyenv: Python 解释器环境
         :param index: 该环境在全局变量 ALL_PY_ENVs 中的索引值
+        :param version: Python 版本，为 None 表示尚在获取中，以占位文本显示
         :return: (icon, text, data)
         :raise ValueError: PyEnv 类型无效时抛出
         """
@@ -59,7 +207,8 @@ class PyEnvComboBox(QComboBox):
             )
 
         data = index
-        version = pyenv.pyversion
+        if version is None:
+            version = PyEnvComboBox.tr("loading...")
 
         icon_map = {
             PyEnvType.system: QIcon(":/Icons/Python_128px"),
@@ -11,13 +11,14 @@ from PySide6.QtWidgets import (
     QDialog,
     QLabel,
     QPushButton,
-    QTextBrowser,
     QVBoxLayout,
     QWidget,
 )
 
+from ..Core.log_store import BUILD_LOGS, LogLineStore
 from ..Core.subprocess_tool import SubProcessTool
 from ..Utilities import QObjTr
+from .log_view import LogView
 
 
 class SubProcessDlg(QObjTr, QDialog):
@@ -31,7 +32,9 @@ class SubProcessDlg(QObjTr, QDialog):
         super().__init__(parent)
 
         self.info_label = QLabel(self)
-        self.text_browser = QTextBrowser(self)  # 用于显示子进程输出内容
+        self.log_view = LogView(self)  # 用于显示子进程输出内容，可搜索与按级别过滤
+        self.log_name = "build"  # 本次打包日志的名称，由 MainApp 在开始打包前设置
+        self._log_open = False  # 本次打包的日志是否仍在写入，收到 FINISHED 输出后关闭
         # 可用于“取消”“打开输出位置”等的多功能按钮
         self.multifunction_btn = QPushButton(self)
         self._setup()
@@ -40,13 +43,13 @@ class SubProcessDlg(QObjTr, QDialog):
         """配置子进程信息对话框"""
 
         self.setWindowTitle("PyInstaller")
-        self.setMinimumWidth(500)
+        self.setMinimumWidth(640)
         self.setModal(True)
 
         # 布局管理器
         main_layout = QVBoxLayout()
         main_layout.addWidget(self.info_label)
-        main_layout.addWidget(self.text_browser)
+        main_layout.addWidget(self.log_view)
         main_layout.addWidget(self.multifunction_btn)
         self.setLayout(main_layout)
 
@@ -62,7 +65,12 @@ class SubProcessDlg(QObjTr, QDialog):
 
         output_type, output_text = subprocess_output
 
-        if output_type == SubProcessTool.OutputType.STATE:
+        if output_type == SubProcessTool.OutputType.STARTED:
+            # 每次打包的输出在到达时直接写入 BUILD_LOGS 中的新日志文件
+            self.log_view.set_store(BUILD_LOGS.new_log(self.log_name))
+            self._log_open = True
+
+        elif output_type == SubProcessTool.OutputType.STATE:
             self.info_label.setText(output_text)
             if output_text == "The process is running...":
                 self.multifunction_btn.setText(SubProcessDlg.tr("Cancel"))
@@ -71,9 +79,11 @@ class SubProcessDlg(QObjTr, QDialog):
             output_type == SubProcessTool.OutputType.STDOUT
             or output_type == SubProcessTool.OutputType.STDERR
         ):
-            self.text_browser.append(output_text)
+            # SubProcessTool 已将输出合并为批次，每批只追加一次
+            self.log_view.append_text(output_text)
 
         elif output_type == SubProcessTool.OutputType.FINISHED:
+            self._finish_log()
             if output_text == "0":
                 self.info_label.setText(SubProcessDlg.tr("Done!"))
                 self.multifunction_btn.setText(SubProcessDlg.tr("Open Dist"))
@@ -87,21 +97,46 @@ class SubProcessDlg(QObjTr, QDialog):
                 self.multifunction_btn.setText(SubProcessDlg.tr("Cancel"))
 
         elif output_type == SubProcessTool.OutputType.ERROR:
+            if not self._log_open:
+                # 子进程未能启动，没有为本次打包创建日志，不再显示上一次打包的日志
+                self.log_view.clear()
             self.info_label.setText(SubProcessDlg.tr("PyInstaller Error!"))
-            self.text_browser.append(
+            self.log_view.append_text(
                 SubProcessDlg.tr("PyInstaller subprocess output:") + f"{output_text}"
             )
-            self.text_browser.append(
+            self.log_view.append_text(
                 SubProcessDlg.tr(
                     "Please check if you have installed "
                     "the correct version of PyInstaller or not."
                 )
             )
             self.multifunction_btn.setText(SubProcessDlg.tr("Close"))
+            # 子进程崩溃等错误之后仍会有剩余输出与 FINISHED 输出，届时再关闭日志
+            self.log_view.store.flush()
 
         elif not isinstance(output_type, SubProcessTool.OutputType):
             raise ValueError(f"Unsupported output type: {output_type}")
 
+    def _finish_log(self) -> None:
+        """本次打包结束，关闭日志文件并轮换旧日志；对话框仍在显示时，以只读方式重新打开日志供继续查看"""
+
+        if not self._log_open:
+            return
+        self._log_open = False
+
+        store = self.log_view.store
+        if store.path is None:
+            return  # 未能创建日志文件，使用的是匿名临时存储，无需保存
+        store.close()
+        if self.isVisible():
+            try:
+                self.log_view.set_store(LogLineStore(store.path, "r"))
+            except OSError:
+                self.log_view.clear()
+        else:
+            self.log_view.clear()
+        BUILD_LOGS.rotate()  # 仍在写入的日志（包括批量打包队列的）不会被删除
+
     def closeEvent(self, event: QCloseEvent) -> None:
         """重写关闭事件，进行收尾清理
 
@@ -111,5 +146,7 @@ class SubProcessDlg(QObjTr, QDialog):
         # 显式发送一次 finished 信号，外部接收到此信号后应主动中断 PyInstaller 进程
         self.finished.emit(-1)
 
-        self.text_browser.clear()
+        # 中止是异步的，进程退出前的剩余输出仍写入本次打包的日志，收到 FINISHED 输出后再关闭日志
+        if not self._log_open:
+            self.log_view.clear()
         super().closeEvent(event)
@@ -4,7 +4,7 @@
 """Py2exe-GUI 软件包入口
 
 主要包含 `MainApp` 类，将前端界面和后端功能在此结合。
-包含一个名为 `main()` 的入口函数
+包含一个名为 `main()` 的入口函数；以 `build` 子命令启动时进入无界面的命令行模式（见 `cli` 模块）
 """
 
 import sys
@@ -12,13 +12,24 @@ from pathlib import Path
 
 from PySide6.QtCore import QTranslator, Slot
 from PySide6.QtGui import QCloseEvent
-from PySide6.QtWidgets import QApplication
+from PySide6.QtWidgets import QApplication, QFileDialog, QMessageBox
 
 from .Constants import RUNTIME_INFO, PyInstOpt
-from .Core import Packaging, PackagingTask
+from .Core import FilePathValidator, Packaging, PackagingQueue, PackagingTask
+from .Core.log_store import BUILD_LOGS
+from .Core.task_file import TaskFileError, dump_task_file, load_task_file
+from .Core.warm_worker import WarmWorker
+from .Core.workpath_cache import WORKPATH_CACHE
 from .Resources import COMPILED_RESOURCES  # noqa
-from .Utilities import open_dir_in_explorer
-from .Widgets import MainWindow, SubProcessDlg
+from .Utilities import ALL_PY_ENVs, PyEnv, open_dir_in_explorer
+from .Widgets import (
+    BuildLogDlg,
+    MainWindow,
+    PackagingQueueDlg,
+    PyEnvSelectDlg,
+    SubProcessDlg,
+    WorkpathCacheDlg,
+)
 
 
 class MainApp(MainWindow):
@@ -30,6 +41,11 @@ class MainApp(MainWindow):
         self.packaging_task = PackagingTask(self)
         self.packager = Packaging(self)
         self.subprocess_dlg = SubProcessDlg(self)
+        self.packaging_queue = PackagingQueue(self)
+        self.packaging_queue_dlg = PackagingQueueDlg(self, self.packaging_queue)
+        self.pyenv_select_dlg = PyEnvSelectDlg(self.packaging_queue_dlg)
+        self.workpath_cache_dlg = WorkpathCacheDlg(self, WORKPATH_CACHE)
+        self.build_log_dlg = BuildLogDlg(self, BUILD_LOGS)
 
         self._connect_slots()
 
@@ -47,10 +63,21 @@ class MainApp(MainWindow):
 
         self._connect_run_pkg_btn_slot()
         self._connect_mul_btn_slot(self.subprocess_dlg)
+        self._connect_packaging_queue_slots()
+        self._connect_task_file_slots()
+        self.build_cache_action.triggered.connect(self.workpath_cache_dlg.show)
+        self.build_logs_action.triggered.connect(self.build_log_dlg.show)
+        self._connect_warm_worker_slots()
 
         self.center_widget.option_selected.connect(self.packaging_task.on_opt_selected)
         self.packaging_task.option_set.connect(self.packager.set_pyinstaller_args)
         self.packaging_task.option_set.connect(self.center_widget.handle_option_set)
+        self.packaging_task.options_applied.connect(
+            self.packager.set_pyinstaller_options
+        )
+        self.packaging_task.options_applied.connect(
+            self.center_widget.handle_options_applied
+        )
         self.packaging_task.option_error.connect(self.center_widget.handle_option_error)
         self.packaging_task.ready_to_pack.connect(
             self.center_widget.handle_ready_to_pack
@@ -61,9 +88,7 @@ class MainApp(MainWindow):
         self.packager.subprocess.output.connect(self.subprocess_dlg.handle_output)
 
         # 用户关闭子进程对话框时中止打包进程
-        self.subprocess_dlg.finished.connect(
-            lambda: self.packager.subprocess.abort_process(2000)
-        )
+        self.subprocess_dlg.finished.connect(lambda: self.packager.abort_process(2000))
 
     def _connect_run_pkg_btn_slot(self):
         @Slot()
@@ -75,11 +100,39 @@ class MainApp(MainWindow):
             self.packaging_task.pyenv = current_pyenv
             self.packager.set_python_path(current_pyenv.exe_path)
 
+            # 先在后台判断输入是否与上次成功打包时完全相同，完成后再决定是否打包
+            self.status_bar.showMessage(MainApp.tr("Checking for changes..."))
+            self.packager.check_up_to_date(current_pyenv.known_installed_packages)
+
+        @Slot(bool)
+        def handle_up_to_date_checked(up_to_date: bool) -> None:
+            """后台检查完成的槽函数，开始打包"""
+
+            self.status_bar.clearMessage()
+            # 输入与上次成功打包时完全相同、且输出完好时，询问用户是否仍要重新打包
+            if up_to_date:
+                reply = QMessageBox.question(
+                    self,
+                    MainApp.tr("Up to Date"),
+                    MainApp.tr(
+                        "Nothing has changed since the last successful build, "
+                        "and its output in the dist folder is intact.\n"
+                        "Rebuild anyway?"
+                    ),
+                )
+                if reply != QMessageBox.StandardButton.Yes:
+                    self.status_bar.showMessage(
+                        MainApp.tr("Build skipped, the previous output is up to date.")
+                    )
+                    return
+
             # 先显示对话框窗口，后运行子进程，确保调试信息/错误信息能被直观显示
+            self.subprocess_dlg.log_name = self.packager.dist_target()[1]
             self.subprocess_dlg.show()
             self.packager.run_packaging_process()
 
         self.center_widget.run_packaging_btn.clicked.connect(handle_run_pkg_btn_clicked)
+        self.packager.up_to_date_checked.connect(handle_up_to_date_checked)
 
     def _connect_mul_btn_slot(self, subprocess_dlg):
         @Slot()
@@ -88,7 +141,7 @@ class MainApp(MainWindow):
 
             btn_text = self.subprocess_dlg.multifunction_btn.text()
             if btn_text == SubProcessDlg.tr("Cancel"):
-                self.packager.subprocess.abort_process()
+                self.packager.abort_process()
                 self.subprocess_dlg.close()
             elif btn_text == SubProcessDlg.tr("Open Dist"):
                 script_path: Path = self.packaging_task.using_option[
@@ -101,19 +154,185 @@ class MainApp(MainWindow):
 
         subprocess_dlg.multifunction_btn.clicked.connect(handle_mul_btn_clicked)
 
+    def _connect_packaging_queue_slots(self) -> None:
+        """连接批量打包队列相关的信号与槽"""
+
+        @Slot()
+        def handle_add_current_task() -> None:
+            """将当前打包任务以当前选择的 Python 解释器添加至队列"""
+
+            if self.packaging_task.using_option[PyInstOpt.script_path] is None:
+                self.status_bar.showMessage(
+                    MainApp.tr("Please select the entry script first.")
+                )
+                return
+
+            current_pyenv = self.center_widget.pyenv_combobox.get_current_pyenv()
+            self.packaging_queue.add_job(
+                current_pyenv.exe_path, self.packaging_task.using_option
+            )
+
+        @Slot(list)
+        def handle_scripts_selected(file_paths: list[str]) -> None:
+            """以当前选项为每个选中的入口脚本添加一个作业，输出名称与脚本名相同
+
+            :param file_paths: 入口脚本路径列表
+            """
+
+            current_pyenv = self.center_widget.pyenv_combobox.get_current_pyenv()
+            for file_path in file_paths:
+                script_path = Path(file_path)
+                if not FilePathValidator.validate_script(script_path):
+                    continue
+                options = dict(self.packaging_task.using_option)
+                options[PyInstOpt.script_path] = script_path
+                options[PyInstOpt.out_name] = script_path.stem
+                self.packaging_queue.add_job(current_pyenv.exe_path, options)
+
+        @Slot()
+        def handle_add_matrix() -> None:
+            """勾选多个 Python 环境，以当前打包任务分别构建"""
+
+            if self.packaging_task.using_option[PyInstOpt.script_path] is None:
+                self.status_bar.showMessage(
+                    MainApp.tr("Please select the entry script first.")
+                )
+                return
+
+            self.pyenv_select_dlg.load_items(self.center_widget.pyenv_combobox)
+            if self.pyenv_select_dlg.exec() != PyEnvSelectDlg.DialogCode.Accepted:
+                return
+            pyenvs = [
+                ALL_PY_ENVs[index] for index in self.pyenv_select_dlg.selected_data()
+            ]
+            self.packaging_queue.add_matrix_jobs(
+                pyenvs, self.packaging_task.using_option
+            )
+
+        self.packaging_queue_action.triggered.connect(self.packaging_queue_dlg.show)
+        self.packaging_queue_dlg.add_matrix_btn.clicked.connect(handle_add_matrix)
+        self.packaging_queue_dlg.add_current_btn.clicked.connect(
+            handle_add_current_task
+        )
+        self.packaging_queue_dlg.scripts_selected.connect(handle_scripts_selected)
+
+    def _connect_task_file_slots(self) -> None:
+        """连接导入/导出打包任务文件相关的信号与槽"""
+
+        file_filter = MainApp.tr("Task Files (*.yaml *.yml *.json)")
+
+        @Slot()
+        def handle_import_task() -> None:
+            """从任务文件导入打包任务，一次性应用全部选项"""
+
+            file_path, _ = QFileDialog.getOpenFileName(
+                self, MainApp.tr("Import Task"), "", file_filter
+            )
+            if not file_path:
+                return
+
+            try:
+                tasks = load_task_file(file_path)
+            except TaskFileError as e:
+                QMessageBox.critical(self, MainApp.tr("Error"), str(e))
+                return
+
+            # 任务文件中包含多个任务时，图形界面只导入第一个，其余可通过命令行模式批量构建
+            python_path, options = tasks[0]
+            self.packaging_task.apply_options(options)
+            if python_path is not None:
+                self.center_widget.select_pyenv(python_path)
+            self.status_bar.showMessage(
+                MainApp.tr("Imported task from {0}").format(file_path)
+            )
+
+        @Slot()
+        def handle_export_task() -> None:
+            """将当前打包任务与所选解释器导出为任务文件"""
+
+            file_path, _ = QFileDialog.getSaveFileName(
+                self, MainApp.tr("Export Task"), "task.yaml", file_filter
+            )
+            if not file_path:
+                return
+
+            current_pyenv = self.center_widget.pyenv_combobox.get_current_pyenv()
+            try:
+                dump_task_file(
+                    file_path, current_pyenv.exe_path, self.packaging_task.using_option
+                )
+            except OSError as e:
+                QMessageBox.critical(self, MainApp.tr("Error"), str(e))
+                return
+            self.status_bar.showMessage(
+                MainApp.tr("Exported task to {0}").format(file_path)
+            )
+
+        self.import_task_action.triggered.connect(handle_import_task)
+        self.export_task_action.triggered.connect(handle_export_task)
+
+    def _connect_warm_worker_slots(self) -> None:
+        """连接“保持 PyInstaller 预热”菜单项相关的信号与槽"""
+
+        # 当前平台不支持（Windows 上无法 fork），始终冷启动
+        self.warm_worker_action.setEnabled(WarmWorker.is_supported())
+
+        @Slot(bool)
+        def handle_warm_worker_toggled(checked: bool) -> None:
+            """启用时立即为当前所选 Python 环境预热，关闭时结束所有工作进程"""
+
+            self.packager.use_warm_worker = checked
+            if not checked:
+                self.packager.stop_workers()
+            elif self.center_widget.pyenv_combobox.currentIndex() >= 0:
+                current_pyenv = self.center_widget.pyenv_combobox.get_current_pyenv()
+                self.packager.prewarm(current_pyenv.exe_path)
+
+        @Slot(int)
+        def handle_pyenv_changed(index: int) -> None:
+            """切换 Python 环境后为新环境预热（并结束旧环境的工作进程），使首次打包也无需等待 PyInstaller 导入"""
+
+            if self.packager.use_warm_worker and index >= 0:
+                current_pyenv = self.center_widget.pyenv_combobox.get_current_pyenv()
+                self.packager.prewarm(current_pyenv.exe_path)
+
+        @Slot(object, list, list)
+        def handle_packages_changed(pyenv: PyEnv, *_) -> None:
+            """环境中的包发生变化后重启其工作进程，避免继续使用已导入的旧版 PyInstaller"""
+
+            if self.packager.use_warm_worker:
+                self.packager.restart_worker(pyenv.exe_path)
+
+        self.warm_worker_action.toggled.connect(handle_warm_worker_toggled)
+        self.center_widget.pyenv_combobox.currentIndexChanged.connect(
+            handle_pyenv_changed
+        )
+        self.center_widget.pyenv_combobox.watcher.packages_changed.connect(
+            handle_packages_changed
+        )
+
     def closeEvent(self, event: QCloseEvent) -> None:
         """重写关闭事件，进行收尾清理
 
         :param event: 关闭事件
         """
 
-        # self.packager.subprocess.abort_process(3000)  # 不会访问到此行
+        # 程序即将退出，来不及等待打包进程自行退出，立即杀死其整个进程树（包括批量打包队列中的作业）
+        self.packager.abort_process(0)
+        self.packaging_queue.cancel(0)
+        self.packager.stop_workers()
         super().closeEvent(event)
 
 
 def main() -> None:
     """应用程序主入口函数，便于 Poetry 由此函数级入口构建启动脚本"""
 
+    if sys.argv[1:2] == ["build"]:
+        # 命令行模式，不创建 QApplication 与任何控件
+        from .cli import cli_main
+
+        sys.exit(cli_main(sys.argv[1:]))
+
     app = QApplication(sys.argv)
 
     # TODO 翻译机制待优化
@@ -0,0 +1,167 @@
+# Licensed under the GPLv3 License: https://www.gnu.org/licenses/gpl-3.0.html
+# For details: https://github.com/muziing/Py2exe-GUI/blob/main/README.md#license
+
+"""Py2exe-GUI 的无界面命令行模式
+
+`py2exe-gui build task.yaml [--jobs N]` 读取任务文件（格式见 `Core.task_file`），
+以 `QCoreApplication` 事件循环驱动 `PackagingQueue` 完成打包，不创建任何控件，也不需要图形界面环境。
+子进程输出实时转发至标准输出/标准错误，进程退出码即 PyInstaller 的退出码。
+"""
+
+__all__ = ["cli_main"]
+
+import argparse
+import signal
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+
+from PySide6.QtCore import QCoreApplication, QTimer
+
+from .Constants import AppConstant, PyInstOpt
+from .Core import FilePathValidator, PackagingJob, PackagingQueue
+from .Core.subprocess_tool import SubProcessTool
+from .Core.task_file import TaskFileError, load_task_file
+from .Utilities import get_sys_python
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """创建命令行参数解析器
+
+    :return: 参数解析器
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="py2exe-gui", description=f"{AppConstant.NAME} command line mode"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = subparsers.add_parser(
+        "build", help="build the task(s) described in a task file without GUI"
+    )
+    build_parser.add_argument("task_file", type=Path, help="YAML or JSON task file")
+    build_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="number of tasks to build in parallel (default: number of CPUs)",
+    )
+    build_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="build even if nothing has changed since the last successful build",
+    )
+    return parser
+
+
+def _exit_code(jobs: Sequence[PackagingJob]) -> int:
+    """根据所有作业的结果确定进程退出码
+
+    :param jobs: 所有作业
+    :return: 全部成功（或无需重新打包）时为 0，否则为第一个失败作业的 PyInstaller 退出码
+    """
+
+    for job in jobs:
+        if job.state == PackagingJob.State.FAILED:
+            return job.exit_code if job.exit_code and job.exit_code > 0 else 1
+        if job.state == PackagingJob.State.CANCELLED:
+            return 130
+    return 0
+
+
+def _build(task_file: Path, jobs: int, force: bool) -> int:
+    """执行 build 子命令
+
+    :param task_file: 任务文件路径
+    :param jobs: 最大并发作业数，0 表示使用默认值
+    :param force: 是否忽略构建指纹，总是重新打包
+    :return: 进程退出码
+    """
+
+    try:
+        tasks = load_task_file(task_file)
+    except TaskFileError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+
+    for _, options in tasks:
+        if not FilePathValidator.validate_script(options[PyInstOpt.script_path]):
+            print(
+                f"error: invalid script path: {options[PyInstOpt.script_path]}",
+                file=sys.stderr,
+            )
+            return 2
+
+    app = QCoreApplication([sys.argv[0]])
+    queue = PackagingQueue(max_jobs=jobs or None, skip_unchanged=not force)
+    show_prefix = len(tasks) > 1
+
+    def write_output(job: PackagingJob, output: tuple) -> None:
+        """将作业子进程的输出转发至标准输出/标准错误"""
+
+        output_type, output_text = output
+        if output_type == SubProcessTool.OutputType.STDOUT:
+            stream = sys.stdout
+        elif output_type in (
+            SubProcessTool.OutputType.STDERR,
+            SubProcessTool.OutputType.ERROR,
+        ):
+            stream = sys.stderr
+        else:
+            return
+
+        if show_prefix:
+            output_text = "".join(
+                f"[{job.name}] {line}" for line in output_text.splitlines(True)
+            )
+        if not output_text.endswith("\n"):
+            output_text += "\n"
+        stream.write(output_text)
+        stream.flush()
+
+    def report_finished(job: PackagingJob) -> None:
+        """作业结束时输出一行结果"""
+
+        if job.state == PackagingJob.State.SKIPPED:
+            print(f"{job.name}: up to date, reusing {job.distpath}", flush=True)
+        elif job.state == PackagingJob.State.SUCCEEDED:
+            print(f"{job.name}: built into {job.distpath}", flush=True)
+
+    queue.job_output.connect(write_output)
+    queue.job_finished.connect(report_finished)
+    queue.drained.connect(lambda finished: app.exit(_exit_code(finished)))
+
+    # Ctrl+C 时中止所有作业；Qt 事件循环中需定时回到 Python 解释器，信号处理函数才能得到执行
+    signal.signal(signal.SIGINT, lambda *_: queue.cancel())
+    interrupt_timer = QTimer()
+    interrupt_timer.timeout.connect(lambda: None)
+    interrupt_timer.start(200)
+
+    for python_path, options in tasks:
+        script_path = Path(options[PyInstOpt.script_path]).absolute()
+        # 与图形界面一致，输出至入口脚本所在目录下的 dist/
+        queue.add_job(
+            python_path or get_sys_python(),
+            options,
+            distpath=script_path.parent / "dist",
+        )
+
+    QTimer.singleShot(0, queue.start)
+    return app.exec()
+
+
+def cli_main(argv: Sequence[str]) -> int:
+    """命令行模式入口函数
+
+    :param argv: 命令行参数，不包括程序名，如 ["build", "task.yaml", "--jobs", "2"]
+    :return: 进程退出码
+    """
+
+    args = _build_parser().parse_args(argv)
+    if args.command == "build":
+        if args.jobs is not None and args.jobs < 1:
+            print("error: --jobs must be at least 1", file=sys.stderr)
+            return 2
+        return _build(args.task_file, args.jobs or 0, args.force)
+    return 2